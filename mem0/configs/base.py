@@ -27,6 +27,26 @@ class MemoryItem(BaseModel):
     updated_at: Optional[str] = Field(None, description="The timestamp when the memory was updated")
 
 
+class ConcurrencyConfig(BaseModel):
+    """
+    Bounds on the parallelism a single Memory instance applies to its backends.
+
+    A limit of ``None`` leaves the corresponding backend unbounded.
+    """
+
+    max_workers: Optional[int] = Field(
+        description="Maximum number of threads in the instance-wide executor (defaults to min(32, cpu + 4))",
+        default=None,
+        ge=1,
+    )
+    vector_store: Optional[int] = Field(
+        description="Maximum number of concurrent vector store calls", default=None, ge=1
+    )
+    graph_store: Optional[int] = Field(description="Maximum number of concurrent graph store calls", default=None, ge=1)
+    llm: Optional[int] = Field(description="Maximum number of concurrent LLM calls", default=None, ge=1)
+    embedder: Optional[int] = Field(description="Maximum number of concurrent embedding calls", default=None, ge=1)
+
+
 class MemoryConfig(BaseModel):
     vector_store: VectorStoreConfig = Field(
         description="Configuration for the vector store",
@@ -64,6 +84,10 @@ class MemoryConfig(BaseModel):
         description="Custom prompt for the update memory",
         default=None,
     )
+    concurrency: ConcurrencyConfig = Field(
+        description="Executor size and per-backend concurrency limits",
+        default_factory=ConcurrencyConfig,
+    )
 
 
 class AzureConfig(BaseModel):
@@ -40,6 +40,14 @@ class BaseEmbedderConfig(ABC):
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         aws_region: Optional[str] = None,
+        # Batch embedding
+        embedding_batch_size: Optional[int] = None,
+        embedding_batch_max_tokens: Optional[int] = None,
+        embedding_batch_concurrency: int = 4,
+        embedding_requests_per_minute: Optional[float] = None,
+        # Micro-batching of concurrent embed() calls (local models)
+        embedding_micro_batch_size: Optional[int] = None,
+        embedding_micro_batch_wait_ms: float = 5.0,
     ):
         """
         Initializes a configuration class instance for the Embeddings.
@@ -72,6 +80,18 @@ class BaseEmbedderConfig(ABC):
         :type memory_search_embedding_type: Optional[str], optional
         :param lmstudio_base_url: LM Studio base URL to be use, defaults to "http://localhost:1234/v1"
         :type lmstudio_base_url: Optional[str], optional
+        :param embedding_batch_size: Maximum texts per batch request, capped at the provider limit, defaults to None
+        :type embedding_batch_size: Optional[int], optional
+        :param embedding_batch_max_tokens: Estimated token budget per batch request, defaults to the provider limit
+        :type embedding_batch_max_tokens: Optional[int], optional
+        :param embedding_batch_concurrency: Number of batch requests sent concurrently, defaults to 4
+        :type embedding_batch_concurrency: int, optional
+        :param embedding_requests_per_minute: Rate limit applied to batch requests, defaults to None (unlimited)
+        :type embedding_requests_per_minute: Optional[float], optional
+        :param embedding_micro_batch_size: Coalesce concurrent embed() calls of local models into batches of up to this size, defaults to None (disabled)
+        :type embedding_micro_batch_size: Optional[int], optional
+        :param embedding_micro_batch_wait_ms: Longest time a queued embed() call waits for its batch to fill, defaults to 5.0
+        :type embedding_micro_batch_wait_ms: float, optional
         """
 
         self.model = model
@@ -108,3 +128,13 @@ class BaseEmbedderConfig(ABC):
         self.aws_secret_access_key = aws_secret_access_key
         self.aws_region = aws_region or os.environ.get("AWS_REGION") or "us-west-2"
 
+        # Batch embedding
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_batch_max_tokens = embedding_batch_max_tokens
+        self.embedding_batch_concurrency = embedding_batch_concurrency
+        self.embedding_requests_per_minute = embedding_requests_per_minute
+
+        # Micro-batching
+        self.embedding_micro_batch_size = embedding_micro_batch_size
+        self.embedding_micro_batch_wait_ms = embedding_micro_batch_wait_ms
+
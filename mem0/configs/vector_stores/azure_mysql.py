@@ -25,6 +25,21 @@ class AzureMySQLConfig(BaseModel):
         None,
         description="Pre-configured connection pool object (overrides other connection parameters)"
     )
+    vector_cache_size: int = Field(
+        64,
+        description="Number of filter scopes (e.g. users) whose vectors are cached in memory for search; 0 disables"
+    )
+    vector_cache_ttl: Optional[float] = Field(
+        5,
+        description=(
+            "Seconds before a cached scope is reloaded; the cache is per process, so writes from other workers "
+            "stay unseen for up to this long. None keeps a scope until a write through this process"
+        ),
+    )
+    vector_cache_dir: Optional[str] = Field(
+        None,
+        description="Directory for memory-mapped vector cache files instead of keeping matrices in process memory"
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -25,6 +25,11 @@ class CassandraConfig(BaseModel):
         None,
         description="Custom load balancing policy object"
     )
+    sai_index: bool = Field(
+        True,
+        description="Use a native vector column with Storage-Attached Indexes for server-side ANN search "
+        "(requires Cassandra 5.0+ or Astra DB)"
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -13,6 +13,13 @@ class FAISSConfig(BaseModel):
         False, description="Whether to normalize L2 vectors (only applicable for euclidean distance)"
     )
     embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    precision: Literal["float32", "float16", "int8", "binary"] = Field(
+        "float32", description="Storage precision of the index: 'float32', 'float16', 'int8' or 'binary'"
+    )
+    rescore: bool = Field(
+        False, description="Keep full-precision vectors and re-rank the top int8/binary candidates with them"
+    )
+    rescore_multiplier: int = Field(4, description="Candidate oversampling factor used when rescoring")
 
     @model_validator(mode="before")
     @classmethod
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -19,6 +19,11 @@ class PGVectorConfig(BaseModel):
     sslmode: Optional[str] = Field(None, description="SSL mode for PostgreSQL connection (e.g., 'require', 'prefer', 'disable')")
     connection_string: Optional[str] = Field(None, description="PostgreSQL connection string (overrides individual connection parameters)")
     connection_pool: Optional[Any] = Field(None, description="psycopg connection pool object (overrides connection string and individual parameters)")
+    precision: Literal["float32", "float16", "binary"] = Field(
+        "float32", description="Storage precision: 'float32' (vector), 'float16' (halfvec) or 'binary' (bit index)"
+    )
+    rescore: bool = Field(True, description="Re-rank binary Hamming candidates by exact cosine distance")
+    rescore_multiplier: int = Field(4, description="Candidate oversampling factor used when rescoring")
 
     @model_validator(mode="before")
     def check_auth_and_connection(cls, values):
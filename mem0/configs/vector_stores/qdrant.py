@@ -1,4 +1,4 @@
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -17,6 +17,11 @@ class QdrantConfig(BaseModel):
     url: Optional[str] = Field(None, description="Full URL for Qdrant server")
     api_key: Optional[str] = Field(None, description="API key for Qdrant server")
     on_disk: Optional[bool] = Field(False, description="Enables persistent storage")
+    precision: Literal["float32", "float16", "int8", "binary"] = Field(
+        "float32", description="Storage precision: 'float32', 'float16', 'int8' (scalar quantization) or 'binary'"
+    )
+    rescore: bool = Field(True, description="Re-rank quantized candidates with the original vectors")
+    rescore_multiplier: int = Field(4, description="Candidate oversampling factor used when rescoring")
 
     @model_validator(mode="before")
     @classmethod
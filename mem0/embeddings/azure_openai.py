@@ -1,5 +1,5 @@
 import os
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 from openai import AzureOpenAI
@@ -11,6 +11,10 @@ SCOPE = "https://cognitiveservices.azure.com/.default"
 
 
 class AzureOpenAIEmbedding(EmbeddingBase):
+    # Azure OpenAI embedding deployments accept up to 2048 inputs per request
+    max_batch_inputs = 2048
+    max_batch_tokens = 300_000
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -53,3 +57,9 @@ class AzureOpenAIEmbedding(EmbeddingBase):
         """
         text = text.replace("\n", " ")
         return self.client.embeddings.create(input=[text], model=self.config.model).data[0].embedding
+
+    def _embed_chunk(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        response = self.client.embeddings.create(
+            input=[text.replace("\n", " ") for text in texts], model=self.config.model
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
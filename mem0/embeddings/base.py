@@ -1,7 +1,10 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.batching import RateLimiter, async_embed_in_batches, embed_in_batches, plan_batches
+from mem0.embeddings.scheduler import EmbeddingScheduler
 
 
 class EmbeddingBase(ABC):
@@ -11,11 +14,22 @@ class EmbeddingBase(ABC):
     :type config: Optional[BaseEmbedderConfig], optional
     """
 
+    # Providers whose API embeds several inputs per request raise these to their limits and
+    # implement `_embed_chunk` (plus `_async_embed_chunk` when they have an async client).
+    max_batch_inputs: int = 1
+    max_batch_tokens: Optional[int] = None
+    # In-process models run one chunk at a time; parallel forward passes only contend for the same cores.
+    max_batch_concurrency: Optional[int] = None
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         if config is None:
             self.config = BaseEmbedderConfig()
         else:
             self.config = config
+        requests_per_minute = getattr(self.config, "embedding_requests_per_minute", None)
+        self._rate_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+        # Set by local-model providers that opt into micro-batching, see `_make_scheduler`
+        self._scheduler: Optional[EmbeddingScheduler] = None
 
     @abstractmethod
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]]):
@@ -29,3 +43,122 @@ class EmbeddingBase(ABC):
             list: The embedding vector.
         """
         pass
+
+    async def async_embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embedding for the given text.
+
+        Providers with a native async client override this. Providers with a micro-batching
+        scheduler queue the text for the next batch; otherwise `embed` runs in a worker thread.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        scheduler = getattr(self, "_scheduler", None)
+        if scheduler is not None:
+            return await scheduler.async_embed(text)
+        return await asyncio.to_thread(self.embed, text, memory_action)
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts.
+
+        Providers with a batch endpoint split the texts into chunks bounded by input count and
+        estimated tokens, and send the chunks concurrently under the configured rate limit.
+        Other providers embed each text in turn.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per input text, in input order.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        if self.max_batch_inputs <= 1:
+            return [self.embed(text, memory_action) for text in texts]
+        return embed_in_batches(
+            self._plan_batches(texts),
+            lambda chunk: self._embed_chunk(chunk, memory_action),
+            concurrency=self._batch_concurrency(),
+            rate_limiter=getattr(self, "_rate_limiter", None),
+        )
+
+    async def async_embed_batch(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ):
+        """
+        Asynchronously get the embeddings for a list of texts.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per input text, in input order.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        if self.max_batch_inputs <= 1:
+            return await asyncio.to_thread(self.embed_batch, texts, memory_action)
+        return await async_embed_in_batches(
+            self._plan_batches(texts),
+            lambda chunk: self._async_embed_chunk(chunk, memory_action),
+            concurrency=self._batch_concurrency(),
+            rate_limiter=getattr(self, "_rate_limiter", None),
+        )
+
+    def _embed_chunk(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """Embed one provider-sized chunk of texts in a single request. Required when `max_batch_inputs` > 1."""
+        raise NotImplementedError(f"{type(self).__name__} does not support batch embedding requests")
+
+    async def _async_embed_chunk(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ):
+        """Embed one chunk without blocking the event loop. The default runs `_embed_chunk` in a worker thread."""
+        return await asyncio.to_thread(self._embed_chunk, texts, memory_action)
+
+    def _plan_batches(self, texts: List[str]) -> List[List[str]]:
+        max_items = self.max_batch_inputs
+        configured_size = getattr(self.config, "embedding_batch_size", None)
+        if configured_size:
+            max_items = min(configured_size, max_items)
+        max_tokens = getattr(self.config, "embedding_batch_max_tokens", None) or self.max_batch_tokens
+        return plan_batches(texts, max_items=max_items, max_tokens=max_tokens)
+
+    def _batch_concurrency(self) -> int:
+        concurrency = getattr(self.config, "embedding_batch_concurrency", None) or 1
+        if self.max_batch_concurrency:
+            concurrency = min(concurrency, self.max_batch_concurrency)
+        return concurrency
+
+    def _make_scheduler(self) -> Optional[EmbeddingScheduler]:
+        """
+        Build a micro-batching scheduler over `_embed_chunk` when `embedding_micro_batch_size` is set.
+
+        Only meaningful for in-process models whose `embed` ignores `memory_action`: queued
+        texts from different callers are encoded together in one call.
+        """
+        batch_size = getattr(self.config, "embedding_micro_batch_size", None)
+        if not batch_size or batch_size <= 1:
+            return None
+        return EmbeddingScheduler(
+            self._embed_chunk,
+            max_batch_size=batch_size,
+            max_wait_ms=getattr(self.config, "embedding_micro_batch_wait_ms", 5.0),
+            name=f"mem0-{type(self).__name__}-scheduler",
+        )
+
+    def close(self) -> None:
+        """Stop the micro-batching scheduler, if any, after flushing queued requests."""
+        scheduler = getattr(self, "_scheduler", None)
+        if scheduler is not None:
+            scheduler.close()
+
+    async def async_close(self) -> None:
+        """Close the clients opened by the async embedding methods. No-op by default."""
+        return None
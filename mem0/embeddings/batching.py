@@ -0,0 +1,157 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+# Rough characters-per-token ratio of BPE tokenizers on English text. Good enough to keep
+# requests under provider token limits without loading a tokenizer.
+CHARS_PER_TOKEN = 4
+# Size of the process-wide pool that runs concurrent chunk requests for every embedder
+EMBED_POOL_MAX_WORKERS = 16
+
+_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap upper-leaning estimate of the number of tokens in ``text``."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def plan_batches(texts: Sequence[str], max_items: int, max_tokens: Optional[int] = None) -> List[List[str]]:
+    """
+    Split ``texts`` into contiguous chunks of at most ``max_items`` texts and, when given,
+    ``max_tokens`` estimated tokens. A single text over the token budget gets a chunk of its own.
+    """
+    batches: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+    for text in texts:
+        tokens = estimate_tokens(text)
+        if current and (len(current) >= max_items or (max_tokens and current_tokens + tokens > max_tokens)):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+class RateLimiter:
+    """
+    Spaces out requests so that at most ``requests_per_minute`` start in any minute.
+
+    Slots are reserved under a lock, so the limiter can be shared by threads and
+    coroutines alike; callers sleep outside the lock until their slot comes up.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.interval = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _flatten(batches: List[List[str]], results: List[List[list]]) -> List[list]:
+    embeddings = []
+    for batch, vectors in zip(batches, results):
+        if len(vectors) != len(batch):
+            raise ValueError(f"Embedding provider returned {len(vectors)} vectors for {len(batch)} inputs")
+        embeddings.extend(vectors)
+    return embeddings
+
+
+def _get_pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=EMBED_POOL_MAX_WORKERS, thread_name_prefix="mem0-embed"
+                )
+    return _pool
+
+
+def embed_in_batches(
+    batches: List[List[str]],
+    embed_chunk: Callable[[List[str]], List[list]],
+    concurrency: int = 1,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> List[list]:
+    """
+    Embed each chunk with ``embed_chunk``, up to ``concurrency`` at a time, and return vectors in input order.
+
+    Concurrent chunks run on a shared, bounded pool; each call submits at most ``concurrency``
+    workers that take the next chunk in turn, so calls never start threads of their own.
+    """
+
+    def run(batch):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        return embed_chunk(batch)
+
+    if len(batches) <= 1 or concurrency <= 1:
+        results = [run(batch) for batch in batches]
+        return _flatten(batches, results)
+
+    results: List[Optional[List[list]]] = [None] * len(batches)
+    remaining = iter(range(len(batches)))
+    lock = threading.Lock()
+    failed = threading.Event()
+
+    def worker():
+        while not failed.is_set():
+            with lock:
+                index = next(remaining, None)
+            if index is None:
+                return
+            try:
+                results[index] = run(batches[index])
+            except BaseException:
+                failed.set()
+                raise
+
+    pool = _get_pool()
+    futures = [pool.submit(worker) for _ in range(min(concurrency, len(batches)))]
+    for future in futures:
+        future.result()
+    return _flatten(batches, results)
+
+
+async def async_embed_in_batches(
+    batches: List[List[str]],
+    embed_chunk: Callable[[List[str]], Awaitable[List[list]]],
+    concurrency: int = 1,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> List[list]:
+    """Async counterpart of :func:`embed_in_batches`."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(batch):
+        async with semaphore:
+            if rate_limiter is not None:
+                await rate_limiter.async_acquire()
+            return await embed_chunk(batch)
+
+    results = await asyncio.gather(*(run(batch) for batch in batches))
+    return _flatten(batches, list(results))
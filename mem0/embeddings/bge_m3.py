@@ -7,12 +7,19 @@ Author: EvoMem Team
 License: Apache 2.0
 """
 
+import asyncio
 import logging
-from typing import List, Optional, cast
-from FlagEmbedding import BGEM3FlagModel  # type: ignore[import-untyped]
+from typing import List, Literal, Optional, cast
+
+try:
+    from FlagEmbedding import BGEM3FlagModel  # type: ignore[import-untyped]
+except ImportError:
+    # ONNX 後端不需要 FlagEmbedding
+    BGEM3FlagModel = None
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.bge_m3_onnx import BGEM3OnnxModel
 
 # 配置日誌
 logger = logging.getLogger(__name__)
@@ -25,6 +32,7 @@ class BGEM3Embedding(EmbeddingBase):
 
     Constants:
         DEFAULT_BATCH_SIZE: 默認批次大小 (256)
+        DEFAULT_BATCH_MAX_TOKENS: 每次 encode 的 token 預算 (批次大小 × 最長長度, 32768)
         CHAR_TO_TOKEN_RATIO: 中文字符到 token 的粗略轉換比例 (0.67)
                             基於假設: 1 token ≈ 1.5 個中文字 (1/1.5 = 0.67)
 
@@ -32,8 +40,9 @@ class BGEM3Embedding(EmbeddingBase):
     - 模型: BAAI/bge-m3
     - 向量維度: 1024
     - 最大序列長度: 8192 tokens (可配置)
-    - 精度: FP16 (可配置)
+    - 精度: FP16 (可配置，CPU 上默認 FP32)
     - 設備: CPU/GPU (可配置)
+    - 後端: PyTorch (FlagEmbedding) 或 ONNX Runtime (可選 int8 量化)
     - 中文優化: 針對中文語義理解進行優化
 
     範例:
@@ -42,12 +51,25 @@ class BGEM3Embedding(EmbeddingBase):
         >>> vector = embedder.embed("這是一個測試句子")
         >>> len(vector)
         1024
+
+    ONNX 後端 (CPU 部署):
+        >>> config = BaseEmbedderConfig(model_kwargs={
+        ...     "backend": "onnx",      # "torch" (默認) 或 "onnx"
+        ...     "quantize": True,       # 動態 int8 量化，默認 True
+        ...     "onnx_threads": 4,      # onnxruntime intra-op 線程數，默認自動
+        ...     "onnx_cache_dir": None, # 匯出模型快取目錄，默認 $MEM0_DIR/onnx
+        ... })
     """
 
     # 類常量
     DEFAULT_BATCH_SIZE = 256
+    DEFAULT_BATCH_MAX_TOKENS = 32768  # 每次 encode 的填充後 token 預算
     CHAR_TO_TOKEN_RATIO = 0.67  # 1 token ≈ 1.5 字
 
+    # 本地模型: embed_batch 單線程依序編碼
+    max_batch_inputs = DEFAULT_BATCH_SIZE
+    max_batch_concurrency = 1
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         """初始化 BGE-M3 Embedder
 
@@ -65,29 +87,51 @@ class BGEM3Embedding(EmbeddingBase):
 
         # 從 model_kwargs 讀取額外參數
         model_kwargs = self.config.model_kwargs or {}
-        use_fp16 = model_kwargs.get("use_fp16", True)
         device = model_kwargs.get("device", "cpu")
+        # FP16 在 CPU 上沒有加速，僅在 GPU 上默認啟用
+        use_fp16 = model_kwargs.get("use_fp16", device != "cpu")
         max_length = model_kwargs.get("max_length", 8192)
+        backend = model_kwargs.get("backend", "torch")
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"不支援的 backend: {backend} (可選 'torch' 或 'onnx')")
 
         self.model_name = self.config.model
         self.use_fp16 = use_fp16
         self.device = device
         self.max_length = max_length
+        self.backend = backend
 
         # 載入 BGE-M3 模型
-        logger.info(f"Loading {self.model_name} with FP16={use_fp16} on {device}")
         try:
-            # type: Any due to FlagEmbedding missing type stubs
-            self.model = BGEM3FlagModel(
-                self.model_name,
-                use_fp16=use_fp16,
-                device=device
-            )
+            if backend == "onnx":
+                quantize = model_kwargs.get("quantize", True)
+                logger.info(f"Loading {self.model_name} with ONNX Runtime (int8={quantize})")
+                self.model = BGEM3OnnxModel(
+                    self.model_name,
+                    quantize=quantize,
+                    num_threads=model_kwargs.get("onnx_threads"),
+                    cache_dir=model_kwargs.get("onnx_cache_dir")
+                )
+            else:
+                if BGEM3FlagModel is None:
+                    raise ImportError(
+                        "FlagEmbedding is not installed. Please install it using `pip install FlagEmbedding`"
+                    )
+                logger.info(f"Loading {self.model_name} with FP16={use_fp16} on {device}")
+                # type: Any due to FlagEmbedding missing type stubs
+                self.model = BGEM3FlagModel(
+                    self.model_name,
+                    use_fp16=use_fp16,
+                    device=device
+                )
             logger.info("BGE-M3 model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load BGE-M3 model: {e}")
             raise
 
+        # 微批次調度器 (embedding_micro_batch_size 未設定時為 None)
+        self._scheduler = self._make_scheduler()
+
     def _validate_texts(self, texts: List[str]) -> None:
         """驗證文本列表
 
@@ -113,11 +157,82 @@ class BGEM3Embedding(EmbeddingBase):
                     f"{self.max_length} tokens，將自動截斷"
                 )
 
-    def embed(self, text: str) -> List[float]:
+    def _estimate_token_lengths(self, texts: List[str]) -> List[int]:
+        """估算每個文本的 token 數 (含特殊 token，上限為 max_length)
+
+        優先使用模型的 tokenizer 取得精確長度；不可用時以字元數 + 2 作為保守上界
+        (XLM-R 分詞每個 token 至少對應一個字元)，確保動態 max_length 不會截斷文本。
+        """
+        tokenizer = getattr(self.model, "tokenizer", None)
+        if tokenizer is not None:
+            try:
+                input_ids = tokenizer(
+                    texts,
+                    add_special_tokens=True,
+                    truncation=True,
+                    max_length=self.max_length
+                )["input_ids"]
+                return [len(ids) for ids in input_ids]
+            except Exception as e:
+                logger.debug(f"Tokenizer length estimate failed, falling back to character count: {e}")
+        return [min(len(t) + 2, self.max_length) for t in texts]
+
+    def _plan_length_buckets(
+        self,
+        lengths: List[int],
+        batch_size: int,
+        max_tokens: int
+    ) -> List[List[int]]:
+        """依 token 長度排序並切分批次
+
+        同一批次會填充到其中最長的文本，因此以 (批次大小 × 最長長度) 作為 token 預算。
+        返回每個批次在原輸入中的索引。
+        """
+        buckets: List[List[int]] = []
+        current: List[int] = []
+        for i in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+            # 已排序，新加入的文本即為批次內最長者
+            padded_tokens = lengths[i] * (len(current) + 1)
+            if current and (len(current) >= batch_size or padded_tokens > max_tokens):
+                buckets.append(current)
+                current = []
+            current.append(i)
+        if current:
+            buckets.append(current)
+        return buckets
+
+    def _encode_bucketed(self, texts: List[str], batch_size: int) -> List[List[float]]:
+        """長度分桶編碼，每個桶的 max_length 取其實際最大長度，結果按輸入順序返回"""
+        lengths = self._estimate_token_lengths(texts)
+        max_tokens = self.config.embedding_batch_max_tokens or self.DEFAULT_BATCH_MAX_TOKENS
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+
+        for bucket in self._plan_length_buckets(lengths, batch_size, max_tokens):
+            bucket_max_length = min(self.max_length, max(lengths[i] for i in bucket))
+            try:
+                result = self.model.encode(
+                    [texts[i] for i in bucket],
+                    batch_size=len(bucket),
+                    max_length=bucket_max_length
+                )
+            except Exception as e:
+                logger.error(f"Batch embedding failed: {e}")
+                raise
+            for i, vec in zip(bucket, result['dense_vecs']):
+                vectors[i] = vec.tolist()
+
+        return cast(List[List[float]], vectors)
+
+    def embed(
+        self,
+        text: str,
+        memory_action: Optional[Literal["add", "search", "update"]] = None
+    ) -> List[float]:
         """嵌入單個文本為 1024 維向量
 
         Args:
             text: 待嵌入的文本
+            memory_action: 記憶操作類型 ("add"、"search" 或 "update")，BGE-M3 不區分，僅為介面相容
 
         Returns:
             1024 維向量 (List[float])
@@ -134,12 +249,16 @@ class BGEM3Embedding(EmbeddingBase):
         # 驗證輸入
         self._validate_texts([text])
 
-        # 嵌入文本
+        # 併發請求合併為同一次 encode
+        if self._scheduler is not None:
+            return cast(List[float], self._scheduler.embed(text))
+
+        # 嵌入文本 (max_length 取文本實際長度，避免填充到 8192)
         try:
             result = self.model.encode(
                 [text],
                 batch_size=1,
-                max_length=self.max_length
+                max_length=self._estimate_token_lengths([text])[0]
             )
         except Exception as e:
             logger.error(f"Embedding failed: {e}")
@@ -148,6 +267,26 @@ class BGEM3Embedding(EmbeddingBase):
         # 返回結果 (符合 List[float] 類型)
         return cast(List[float], result['dense_vecs'][0].tolist())
 
+    def _embed_chunk(self, texts: List[str], memory_action: Optional[str] = None) -> List[List[float]]:
+        """嵌入一批已驗證的文本 (供微批次調度器使用)"""
+        return self._encode_bucketed(texts, self.DEFAULT_BATCH_SIZE)
+
+    def embed_batch(
+        self,
+        texts: List[str],
+        memory_action: Optional[Literal["add", "search", "update"]] = None
+    ) -> List[List[float]]:
+        """EmbeddingBase 批次介面，委派給 batch_embed"""
+        return self.batch_embed(list(texts))
+
+    async def async_embed_batch(
+        self,
+        texts: List[str],
+        memory_action: Optional[Literal["add", "search", "update"]] = None
+    ) -> List[List[float]]:
+        """非同步批次介面，在工作線程中執行 batch_embed"""
+        return await asyncio.to_thread(self.batch_embed, list(texts))
+
     def batch_embed(
         self,
         texts: List[str],
@@ -155,9 +294,13 @@ class BGEM3Embedding(EmbeddingBase):
     ) -> List[List[float]]:
         """批次嵌入多個文本
 
+        文本按 token 長度排序分桶，每個桶以 token 預算 (embedding_batch_max_tokens，
+        默認 DEFAULT_BATCH_MAX_TOKENS) 決定大小，max_length 取桶內實際最大長度，
+        避免短文本被填充到長文檔的長度。結果按輸入順序返回。
+
         Args:
             texts: 待嵌入的文本列表
-            batch_size: 批次大小，默認 256
+            batch_size: 每個桶的最大文本數，默認 256
 
         Returns:
             向量列表，每個向量為 1024 維 (List[List[float]])
@@ -180,28 +323,15 @@ class BGEM3Embedding(EmbeddingBase):
         # 驗證輸入
         self._validate_texts(texts)
 
-        # 批次嵌入
-        try:
-            result = self.model.encode(
-                texts,
-                batch_size=batch_size,
-                max_length=self.max_length
-            )
-        except Exception as e:
-            logger.error(f"Batch embedding failed: {e}")
-            raise
-
-        # 返回結果 (符合 List[List[float]] 類型)
-        return cast(
-            List[List[float]],
-            [vec.tolist() for vec in result['dense_vecs']]
-        )
+        # 分桶批次嵌入
+        return self._encode_bucketed(texts, batch_size)
 
     def __repr__(self) -> str:
         """字串表示"""
         return (
             f"BGEM3Embedding("
             f"model={self.model_name}, "
-            f"dims={self.embedding_dims}, "
-            f"device={self.device})"
+            f"dims={self.config.embedding_dims}, "
+            f"device={self.device}, "
+            f"backend={self.backend})"
         )
@@ -0,0 +1,193 @@
+"""BGE-M3 ONNX Runtime 後端
+
+將 BAAI/bge-m3 的 dense 向量部分 (CLS 向量 + L2 正規化) 匯出為 ONNX，可選動態 int8 量化，
+並以 onnxruntime 在 CPU 上執行。匯出結果快取於磁碟，之後的載入不再需要 PyTorch。
+
+BGEM3OnnxModel 提供與 FlagEmbedding.BGEM3FlagModel 相同的 encode() 介面 (僅 dense_vecs)，
+由 BGEM3Embedding 透過 model_kwargs={"backend": "onnx"} 選用。
+
+Author: EvoMem Team
+License: Apache 2.0
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from mem0.configs.base import mem0_dir
+
+logger = logging.getLogger(__name__)
+
+ONNX_OPSET = 17
+MODEL_FILE = "model.onnx"
+
+
+def default_cache_dir() -> str:
+    """默認快取目錄: $MEM0_DIR/onnx"""
+    return os.path.join(mem0_dir, "onnx")
+
+
+def _model_dir(model_name: str, cache_dir: str, quantize: bool) -> str:
+    return os.path.join(cache_dir, model_name.replace("/", "--"), "int8" if quantize else "fp32")
+
+
+def _publish(tmp_dir: str, final_dir: str) -> None:
+    """以目錄改名原子地發布匯出結果；其他進程已先完成時丟棄本次結果"""
+    try:
+        os.replace(tmp_dir, final_dir)
+    except OSError:
+        if not os.path.exists(os.path.join(final_dir, MODEL_FILE)):
+            raise
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _export_fp32(model_name: str, target_dir: str) -> None:
+    """以 PyTorch 匯出 dense head 為 fp32 ONNX (權重超過 2GB 時寫入外部資料檔)"""
+    try:
+        import torch
+        from transformers import AutoModel
+    except ImportError:
+        raise ImportError(
+            "Exporting BGE-M3 to ONNX requires torch and transformers. "
+            "Please install them using `pip install torch transformers`"
+        )
+
+    class DenseHead(torch.nn.Module):
+        def __init__(self, encoder):
+            super().__init__()
+            self.encoder = encoder
+
+        def forward(self, input_ids, attention_mask):
+            cls = self.encoder(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state[:, 0]
+            return torch.nn.functional.normalize(cls, dim=-1)
+
+    encoder = AutoModel.from_pretrained(model_name)
+    encoder.eval()
+    dummy = torch.ones((1, 8), dtype=torch.long)
+    with torch.no_grad():
+        torch.onnx.export(
+            DenseHead(encoder),
+            (dummy, dummy),
+            os.path.join(target_dir, MODEL_FILE),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["dense_vecs"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "dense_vecs": {0: "batch"},
+            },
+            opset_version=ONNX_OPSET,
+        )
+
+
+def _quantize_int8(source_dir: str, target_dir: str) -> None:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(
+        os.path.join(source_dir, MODEL_FILE),
+        os.path.join(target_dir, MODEL_FILE),
+        weight_type=QuantType.QInt8,
+        use_external_data_format=True,
+    )
+
+
+def export_dense_model(model_name: str, quantize: bool = True, cache_dir: Optional[str] = None) -> str:
+    """取得 (必要時匯出) BGE-M3 dense head 的 ONNX 模型路徑
+
+    Args:
+        model_name: Hugging Face 模型名稱或本地路徑
+        quantize: 是否使用動態 int8 量化版本
+        cache_dir: 快取目錄，默認 $MEM0_DIR/onnx
+
+    Returns:
+        model.onnx 的路徑
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    final_dir = _model_dir(model_name, cache_dir, quantize)
+    model_path = os.path.join(final_dir, MODEL_FILE)
+    if os.path.exists(model_path):
+        return model_path
+
+    parent = os.path.dirname(final_dir)
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=parent, prefix=".export-")
+    try:
+        if quantize:
+            fp32_path = export_dense_model(model_name, quantize=False, cache_dir=cache_dir)
+            logger.info(f"Quantizing {model_name} ONNX model to int8")
+            _quantize_int8(os.path.dirname(fp32_path), tmp_dir)
+        else:
+            logger.info(f"Exporting {model_name} dense head to ONNX (one-off, cached in {final_dir})")
+            _export_fp32(model_name, tmp_dir)
+        _publish(tmp_dir, final_dir)
+    finally:
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return model_path
+
+
+def _load_tokenizer(model_name: str):
+    try:
+        from transformers import AutoTokenizer
+    except ImportError:
+        raise ImportError("The ONNX backend requires transformers. Please install it using `pip install transformers`")
+    return AutoTokenizer.from_pretrained(model_name)
+
+
+class BGEM3OnnxModel:
+    """以 onnxruntime 執行的 BGE-M3 dense 編碼器 (BGEM3FlagModel.encode 的相容替代)"""
+
+    def __init__(
+        self,
+        model_name: str,
+        quantize: bool = True,
+        num_threads: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+    ):
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            raise ImportError(
+                "The ONNX backend requires onnxruntime. Please install it using `pip install onnxruntime`"
+            )
+
+        self.model_path = export_dense_model(model_name, quantize=quantize, cache_dir=cache_dir)
+        self.tokenizer = _load_tokenizer(model_name)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(self.model_path, sess_options=options, providers=["CPUExecutionProvider"])
+        logger.info(f"Loaded ONNX model {self.model_path} (int8={quantize}, threads={num_threads or 'auto'})")
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 256,
+        max_length: int = 8192,
+        **kwargs: Any,
+    ) -> Dict[str, np.ndarray]:
+        """編碼文本，返回 {"dense_vecs": ndarray[n, 1024]} (已 L2 正規化)"""
+        if isinstance(sentences, str):
+            sentences = [sentences]
+        outputs = []
+        for start in range(0, len(sentences), batch_size):
+            encoded = self.tokenizer(
+                sentences[start : start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=max_length,
+                return_tensors="np",
+            )
+            feeds = {
+                "input_ids": encoded["input_ids"].astype(np.int64),
+                "attention_mask": encoded["attention_mask"].astype(np.int64),
+            }
+            outputs.append(self.session.run(["dense_vecs"], feeds)[0])
+        return {"dense_vecs": np.concatenate(outputs).astype(np.float32)}
@@ -1,4 +1,4 @@
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 
 from mem0.embeddings.base import EmbeddingBase
 from mem0.configs.embeddings.base import BaseEmbedderConfig
@@ -9,11 +9,15 @@ except ImportError:
     raise ImportError("FastEmbed is not installed.  Please install it using `pip install fastembed`")
 
 class FastEmbedEmbedding(EmbeddingBase):
+    max_batch_inputs = 256
+    max_batch_concurrency = 1
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
         self.config.model = self.config.model or "thenlper/gte-large"
         self.dense_model = TextEmbedding(model_name = self.config.model)
+        self._scheduler = self._make_scheduler()
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -25,5 +29,11 @@ class FastEmbedEmbedding(EmbeddingBase):
             list: The embedding vector.
         """
         text = text.replace("\n", " ")
+        if self._scheduler is not None:
+            return self._scheduler.embed(text)
         embeddings = list(self.dense_model.embed(text))
         return embeddings[0]
+
+    def _embed_chunk(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        texts = [text.replace("\n", " ") for text in texts]
+        return [embedding.tolist() for embedding in self.dense_model.embed(texts, batch_size=len(texts))]
@@ -1,5 +1,5 @@
 import os
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from google import genai
 from google.genai import types
@@ -9,6 +9,9 @@ from mem0.embeddings.base import EmbeddingBase
 
 
 class GoogleGenAIEmbedding(EmbeddingBase):
+    # batchEmbedContents accepts at most 100 requests per call
+    max_batch_inputs = 100
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -37,3 +40,10 @@ class GoogleGenAIEmbedding(EmbeddingBase):
         response = self.client.models.embed_content(model=self.config.model, contents=text, config=config)
 
         return response.embeddings[0].values
+
+    def _embed_chunk(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        config = types.EmbedContentConfig(output_dimensionality=self.config.embedding_dims)
+        response = self.client.models.embed_content(
+            model=self.config.model, contents=[text.replace("\n", " ") for text in texts], config=config
+        )
+        return [embedding.values for embedding in response.embeddings]
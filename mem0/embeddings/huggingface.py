@@ -1,5 +1,5 @@
 import logging
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from openai import OpenAI
 from sentence_transformers import SentenceTransformer
@@ -13,6 +13,9 @@ logging.getLogger("huggingface_hub").setLevel(logging.WARNING)
 
 
 class HuggingFaceEmbedding(EmbeddingBase):
+    max_batch_inputs = 256
+    max_batch_concurrency = 1
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -26,6 +29,8 @@ class HuggingFaceEmbedding(EmbeddingBase):
 
             self.config.embedding_dims = self.config.embedding_dims or self.model.get_sentence_embedding_dimension()
 
+            self._scheduler = self._make_scheduler()
+
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
         Get the embedding for the given text using Hugging Face.
@@ -40,5 +45,13 @@ class HuggingFaceEmbedding(EmbeddingBase):
             return self.client.embeddings.create(
                 input=text, model=self.config.model, **self.config.model_kwargs
             ).data[0].embedding
+        elif self._scheduler is not None:
+            return self._scheduler.embed(text)
         else:
             return self.model.encode(text, convert_to_numpy=True).tolist()
+
+    def _embed_chunk(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        if self.config.huggingface_base_url:
+            response = self.client.embeddings.create(input=texts, model=self.config.model, **self.config.model_kwargs)
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        return self.model.encode(texts, batch_size=len(texts), convert_to_numpy=True).tolist()
@@ -1,18 +1,21 @@
+import logging
+import math
 import subprocess
 import sys
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.memory.utils import LoopLocal
 
 try:
-    from ollama import Client
+    from ollama import AsyncClient, Client, ResponseError
 except ImportError:
     user_input = input("The 'ollama' library is required. Install it now? [y/N]: ")
     if user_input.lower() == "y":
         try:
             subprocess.check_call([sys.executable, "-m", "pip", "install", "ollama"])
-            from ollama import Client
+            from ollama import AsyncClient, Client, ResponseError
         except subprocess.CalledProcessError:
             print("Failed to install 'ollama'. Please install it manually using 'pip install ollama'.")
             sys.exit(1)
@@ -20,8 +23,18 @@ except ImportError:
         print("The required 'ollama' library is not installed.")
         sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else list(vector)
+
 
 class OllamaEmbedding(EmbeddingBase):
+    # /api/embed takes a list of inputs; keep requests small enough for local servers
+    max_batch_inputs = 256
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -29,6 +42,8 @@ class OllamaEmbedding(EmbeddingBase):
         self.config.embedding_dims = self.config.embedding_dims or 512
 
         self.client = Client(host=self.config.ollama_base_url)
+        self._async_client = LoopLocal(lambda: AsyncClient(host=self.config.ollama_base_url))
+        self._legacy_endpoint = False
         self._ensure_model_exists()
 
     def _ensure_model_exists(self):
@@ -49,5 +64,57 @@ class OllamaEmbedding(EmbeddingBase):
         Returns:
             list: The embedding vector.
         """
-        response = self.client.embeddings(model=self.config.model, prompt=text)
-        return response["embedding"]
+        return self._embed_chunk([text], memory_action)[0]
+
+    async def async_embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text using the async Ollama client.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        return (await self._async_embed_chunk([text], memory_action))[0]
+
+    # Single and batched embeddings both go through /api/embed, which returns unit-length
+    # vectors. Servers that predate it only have /api/embeddings (one unnormalized input per
+    # request); once one answers 404 the embedder switches to it and normalizes the results the
+    # same way.
+
+    def _embed_unavailable(self, error: ResponseError) -> bool:
+        # An unknown model is also a 404, but its message names the model
+        if error.status_code != 404 or "model" in str(error.error).lower():
+            return False
+        logger.warning("Ollama server has no /api/embed endpoint, falling back to /api/embeddings")
+        self._legacy_endpoint = True
+        return True
+
+    def _embed_chunk(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        if not self._legacy_endpoint:
+            try:
+                return list(self.client.embed(model=self.config.model, input=texts)["embeddings"])
+            except ResponseError as e:
+                if not self._embed_unavailable(e):
+                    raise
+        return [
+            _normalize(self.client.embeddings(model=self.config.model, prompt=text)["embedding"]) for text in texts
+        ]
+
+    async def _async_embed_chunk(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ):
+        client = self._async_client.get()
+        if not self._legacy_endpoint:
+            try:
+                return list((await client.embed(model=self.config.model, input=texts))["embeddings"])
+            except ResponseError as e:
+                if not self._embed_unavailable(e):
+                    raise
+        return [
+            _normalize((await client.embeddings(model=self.config.model, prompt=text))["embedding"]) for text in texts
+        ]
+
+    async def async_close(self) -> None:
+        await self._async_client.aclose()
@@ -1,14 +1,19 @@
 import os
 import warnings
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.memory.utils import LoopLocal
 
 
 class OpenAIEmbedding(EmbeddingBase):
+    # The embeddings endpoint accepts up to 2048 inputs and 300k tokens per request
+    max_batch_inputs = 2048
+    max_batch_tokens = 300_000
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -30,6 +35,7 @@ class OpenAIEmbedding(EmbeddingBase):
             )
 
         self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self._async_client = LoopLocal(lambda: AsyncOpenAI(api_key=api_key, base_url=base_url))
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -47,3 +53,40 @@ class OpenAIEmbedding(EmbeddingBase):
             .data[0]
             .embedding
         )
+
+    async def async_embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text using the async OpenAI client.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        text = text.replace("\n", " ")
+        response = await self._async_client.get().embeddings.create(
+            input=[text], model=self.config.model, dimensions=self.config.embedding_dims
+        )
+        return response.data[0].embedding
+
+    def _embed_chunk(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        response = self.client.embeddings.create(
+            input=[text.replace("\n", " ") for text in texts],
+            model=self.config.model,
+            dimensions=self.config.embedding_dims,
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def _async_embed_chunk(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ):
+        response = await self._async_client.get().embeddings.create(
+            input=[text.replace("\n", " ") for text in texts],
+            model=self.config.model,
+            dimensions=self.config.embedding_dims,
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def async_close(self) -> None:
+        await self._async_client.aclose()
@@ -0,0 +1,112 @@
+import asyncio
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class EmbeddingScheduler:
+    """
+    Coalesces concurrent single-text embedding requests into batched model calls.
+
+    Local models (SentenceTransformer, BGE-M3, FastEmbed) get most of their throughput from
+    larger batches, but `embed()` is called one text at a time from request threads. The
+    scheduler queues those calls and a single worker thread flushes them as one `encode`
+    call once `max_batch_size` texts are waiting or the oldest has waited `max_wait_ms`.
+    Each caller gets its vector back through a future, so it works from threads and
+    coroutines alike.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], List[list]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "mem0-embed-scheduler",
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._encode = encode
+        self.max_batch_size = max_batch_size
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._name = name
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, text: str) -> concurrent.futures.Future:
+        """Queue ``text`` for the next batch and return a future resolving to its vector."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Embedding scheduler is closed")
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._worker.start()
+            self._queue.put((text, future))
+        return future
+
+    def embed(self, text: str) -> list:
+        """Embed ``text`` as part of a batch, blocking until its vector is ready."""
+        return self.submit(text).result()
+
+    async def async_embed(self, text: str) -> list:
+        """Embed ``text`` as part of a batch without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting requests, flush what is queued and stop the worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+            self._queue.put(_STOP)
+        if worker is not None:
+            worker.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            stopping = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    # Past the deadline, still take whatever is already queued
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+            if stopping:
+                return
+
+    def _flush(self, batch) -> None:
+        pending = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not pending:
+            return
+        try:
+            vectors = self._encode([text for text, _ in pending])
+            if len(vectors) != len(pending):
+                raise ValueError(f"Embedding model returned {len(vectors)} vectors for {len(pending)} inputs")
+        except Exception as e:
+            logger.debug(f"Batched embedding of {len(pending)} texts failed: {e}")
+            for _, future in pending:
+                future.set_exception(e)
+            return
+        for (_, future), vector in zip(pending, vectors):
+            future.set_result(vector)
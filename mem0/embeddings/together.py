@@ -1,5 +1,5 @@
 import os
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from together import Together
 
@@ -8,6 +8,8 @@ from mem0.embeddings.base import EmbeddingBase
 
 
 class TogetherEmbedding(EmbeddingBase):
+    max_batch_inputs = 128
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -29,3 +31,7 @@ class TogetherEmbedding(EmbeddingBase):
         """
 
         return self.client.embeddings.create(model=self.config.model, input=text).data[0].embedding
+
+    def _embed_chunk(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        response = self.client.embeddings.create(model=self.config.model, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
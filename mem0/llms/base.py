@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Union
 
@@ -112,6 +113,32 @@ class LLMBase(ABC):
         """
         pass
 
+    async def async_generate_response(
+        self, messages: List[Dict[str, str]], tools: Optional[List[Dict]] = None, tool_choice: str = "auto", **kwargs
+    ):
+        """
+        Asynchronously generate a response based on the given messages.
+
+        Providers with a native async client override this. The default runs
+        `generate_response` in a worker thread.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            str or dict: The generated response.
+        """
+        return await asyncio.to_thread(
+            self.generate_response, messages=messages, tools=tools, tool_choice=tool_choice, **kwargs
+        )
+
+    async def async_close(self) -> None:
+        """Close the clients opened by `async_generate_response`. No-op by default."""
+        return None
+
     def _get_common_params(self, **kwargs) -> Dict:
         """
         Get common parameters that most providers use.
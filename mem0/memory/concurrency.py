@@ -0,0 +1,27 @@
+import threading
+from contextlib import nullcontext
+from typing import Optional
+
+from mem0.configs.base import ConcurrencyConfig
+
+
+def _limiter(limit: Optional[int]):
+    return threading.BoundedSemaphore(limit) if limit else nullcontext()
+
+
+class BackendLimits:
+    """
+    Per-backend concurrency guards for a Memory instance.
+
+    Each attribute is a context manager; backends without a configured limit get
+    a no-op guard so call sites can use ``with limits.<backend>:`` unconditionally.
+    """
+
+    __slots__ = ("vector_store", "graph_store", "llm", "embedder")
+
+    def __init__(self, config: Optional[ConcurrencyConfig] = None):
+        config = config or ConcurrencyConfig()
+        self.vector_store = _limiter(config.vector_store)
+        self.graph_store = _limiter(config.graph_store)
+        self.llm = _limiter(config.llm)
+        self.embedder = _limiter(config.embedder)
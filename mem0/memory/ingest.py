@@ -0,0 +1,219 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import uuid
+from copy import deepcopy
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pytz
+
+logger = logging.getLogger(__name__)
+
+# Number of messages embedded, inserted and recorded in history per round trip when
+# ingesting raw messages (infer=False). Keeps memory bounded for arbitrarily long inputs.
+RAW_INGEST_CHUNK_SIZE = 256
+
+# Keys checked, in order, for the memory text of an imported record
+IMPORT_TEXT_KEYS = ("memory", "data", "content")
+IMPORT_VECTOR_KEYS = ("vector", "embedding")
+IMPORT_SESSION_KEYS = ("user_id", "agent_id", "run_id", "actor_id", "role")
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_raw_messages(messages: Iterable[Any], metadata: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield ``(content, payload)`` for every message that should be stored verbatim.
+
+    System messages and malformed entries are skipped. Each payload is a shallow copy of
+    ``metadata`` extended with the message role and, when present, its actor name.
+    """
+    for message_dict in messages:
+        if (
+            not isinstance(message_dict, dict)
+            or message_dict.get("role") is None
+            or message_dict.get("content") is None
+        ):
+            logger.warning(f"Skipping invalid message format: {message_dict}")
+            continue
+
+        if message_dict["role"] == "system":
+            continue
+
+        payload = deepcopy(metadata)
+        payload["role"] = message_dict["role"]
+
+        actor_name = message_dict.get("name")
+        if actor_name:
+            payload["actor_id"] = actor_name
+
+        yield message_dict["content"], payload
+
+
+def stamp_memory_payload(data: str, payload: Dict[str, Any], created_at: str) -> Dict[str, Any]:
+    """Add the fields every stored memory carries to ``payload`` and return it."""
+    payload["data"] = data
+    payload["hash"] = hashlib.md5(data.encode()).hexdigest()
+    payload["created_at"] = created_at
+    return payload
+
+
+def build_raw_memories(
+    chunk: List[Tuple[str, Dict[str, Any]]], ids: List[str]
+) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """
+    Prepare the vector store payloads, history records and API results for a chunk of raw messages.
+
+    Returns:
+        tuple: ``(payloads, history_records, returned_memories)`` aligned with ``ids``.
+    """
+    created_at = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+    payloads, history_records, returned_memories = [], [], []
+    for memory_id, (content, payload) in zip(ids, chunk):
+        payloads.append(stamp_memory_payload(content, payload, created_at))
+        history_records.append(
+            {
+                "memory_id": memory_id,
+                "old_memory": None,
+                "new_memory": content,
+                "event": "ADD",
+                "created_at": created_at,
+                "actor_id": payload.get("actor_id"),
+                "role": payload["role"],
+            }
+        )
+        returned_memories.append(
+            {
+                "id": memory_id,
+                "memory": content,
+                "event": "ADD",
+                "actor_id": payload.get("actor_id"),
+                "role": payload["role"],
+            }
+        )
+    return payloads, history_records, returned_memories
+
+
+def _iter_parquet(path: str, batch_size: int = 4096) -> Iterator[Dict[str, Any]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "The 'pyarrow' library is required to import Parquet files. Please install it using 'pip install pyarrow'."
+        )
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield from batch.to_pylist()
+
+
+def iter_import_records(source: Union[str, os.PathLike, Iterable[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield import records from a JSONL file (optionally gzipped), a Parquet file or an iterable of dicts.
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        yield from source
+        return
+
+    path = os.fspath(source)
+    if path.endswith(".parquet"):
+        yield from _iter_parquet(path)
+        return
+
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def prepare_import_record(
+    record: Dict[str, Any], defaults: Dict[str, Any]
+) -> Tuple[str, str, Optional[List[float]], Dict[str, Any]]:
+    """
+    Normalise one import record into ``(memory_id, text, vector, payload)``.
+
+    ``vector`` is None when the record does not carry a precomputed embedding.
+    """
+    text = next((record[key] for key in IMPORT_TEXT_KEYS if record.get(key)), None)
+    if text is None:
+        raise ValueError(f"Import record has no memory text (expected one of {IMPORT_TEXT_KEYS}): {record}")
+
+    vector = next((record[key] for key in IMPORT_VECTOR_KEYS if record.get(key) is not None), None)
+    if vector is not None and not isinstance(vector, list):
+        vector = vector.tolist() if hasattr(vector, "tolist") else list(vector)
+
+    payload = dict(record.get("metadata") or {})
+    payload.update(defaults)
+    for key in IMPORT_SESSION_KEYS:
+        if record.get(key):
+            payload[key] = record[key]
+    if not any(payload.get(key) for key in ("user_id", "agent_id", "run_id")):
+        raise ValueError(f"Import record has no 'user_id', 'agent_id' or 'run_id': {record}")
+
+    created_at = record.get("created_at") or datetime.now(pytz.timezone("US/Pacific")).isoformat()
+    stamp_memory_payload(text, payload, str(created_at))
+    if record.get("updated_at"):
+        payload["updated_at"] = str(record["updated_at"])
+
+    memory_id = str(record["id"]) if record.get("id") else str(uuid.uuid4())
+    return memory_id, text, vector, payload
+
+
+class ImportCheckpoint:
+    """
+    Tracks how many leading records of an import have been fully written.
+
+    Batches may finish out of order; the persisted count only advances over a
+    contiguous prefix so that resuming never skips an unwritten record. The end of
+    the furthest batch handed to a writer is persisted too: records between the two
+    may have been written before an interruption and are checked again on resume.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.completed = 0
+        self.submitted = 0
+        self._finished: Dict[int, int] = {}
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.completed = int(state.get("completed", 0))
+            self.submitted = max(self.completed, int(state.get("submitted", 0)))
+
+    def mark_submitted(self, end: int) -> None:
+        """Record that records up to ``end`` are about to be written, before any of them is."""
+        if end > self.submitted:
+            self.submitted = end
+            self._save()
+
+    def mark_done(self, start: int, end: int) -> None:
+        """Record that records ``[start, end)`` were written and persist any progress."""
+        self._finished[start] = end
+        advanced = False
+        while self.completed in self._finished:
+            self.completed = self._finished.pop(self.completed)
+            advanced = True
+        if advanced:
+            self._save()
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"completed": self.completed, "submitted": self.submitted}, f)
+        os.replace(tmp_path, self.path)
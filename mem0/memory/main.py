@@ -1,20 +1,22 @@
 import asyncio
-import concurrent
+import concurrent.futures
 import gc
 import hashlib
 import json
 import logging
 import os
+import threading
 import uuid
 import warnings
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional
 
 import pytz
 from pydantic import ValidationError
 
-from mem0.configs.base import MemoryConfig, MemoryItem
+from mem0.configs.base import MemoryConfig
 from mem0.configs.enums import MemoryType
 from mem0.configs.prompts import (
     PROCEDURAL_MEMORY_SYSTEM_PROMPT,
@@ -22,11 +24,24 @@ from mem0.configs.prompts import (
 )
 from mem0.exceptions import ValidationError as Mem0ValidationError
 from mem0.memory.base import MemoryBase
+from mem0.memory.concurrency import BackendLimits
+from mem0.memory.ingest import (
+    RAW_INGEST_CHUNK_SIZE,
+    ImportCheckpoint,
+    build_raw_memories,
+    chunked,
+    iter_import_records,
+    iter_raw_messages,
+    prepare_import_record,
+)
+from mem0.memory.search_plan import SearchPlanCache, has_advanced_operators, process_metadata_filters
 from mem0.memory.setup import mem0_dir, setup_config
 from mem0.memory.storage import SQLiteManager
 from mem0.memory.telemetry import capture_event
 from mem0.memory.utils import (
+    call_async,
     extract_json,
+    format_memory_item,
     get_fact_retrieval_messages,
     parse_messages,
     parse_vision_messages,
@@ -165,12 +180,129 @@ def _build_filters_and_metadata(
     return base_metadata_template, effective_query_filters
 
 
+def _memory_ids_to_prefetch(actions, temp_uuid_mapping, metadata):
+    """
+    Collect the IDs of existing memories that the LLM's memory actions will read.
+
+    UPDATE and DELETE always read the current record; NONE only does when session
+    identifiers have to be copied onto it. Unknown (hallucinated) IDs are skipped.
+    """
+    refresh_session_ids = bool(metadata.get("agent_id") or metadata.get("run_id"))
+    memory_ids = []
+    for resp in actions:
+        if not isinstance(resp, dict) or not resp.get("text"):
+            continue
+        event_type = resp.get("event")
+        if event_type in ("UPDATE", "DELETE") or (event_type == "NONE" and refresh_session_ids):
+            memory_id = temp_uuid_mapping.get(resp.get("id"))
+            if memory_id and memory_id not in memory_ids:
+                memory_ids.append(memory_id)
+    return memory_ids
+
+
+def _action_texts_to_embed(actions, existing_embeddings):
+    """
+    Group the ADD and UPDATE texts that have no embedding yet by the memory action they are embedded for.
+    """
+    pending = {"add": [], "update": []}
+    for resp in actions:
+        if not isinstance(resp, dict):
+            continue
+        text = resp.get("text")
+        memory_action = {"ADD": "add", "UPDATE": "update"}.get(resp.get("event"))
+        if text and memory_action and text not in existing_embeddings and text not in pending[memory_action]:
+            pending[memory_action].append(text)
+    return pending
+
+
+def _add_history_record(memory_id, data, metadata):
+    return {
+        "memory_id": memory_id,
+        "new_memory": data,
+        "event": "ADD",
+        "created_at": metadata.get("created_at"),
+        "actor_id": metadata.get("actor_id"),
+        "role": metadata.get("role"),
+    }
+
+
+def _update_history_record(memory_id, prev_value, data, metadata):
+    return {
+        "memory_id": memory_id,
+        "old_memory": prev_value,
+        "new_memory": data,
+        "event": "UPDATE",
+        "created_at": metadata["created_at"],
+        "updated_at": metadata["updated_at"],
+        "actor_id": metadata.get("actor_id"),
+        "role": metadata.get("role"),
+    }
+
+
+def _delete_history_record(memory_id, payload):
+    return {
+        "memory_id": memory_id,
+        "old_memory": payload.get("data", ""),
+        "event": "DELETE",
+        "actor_id": payload.get("actor_id"),
+        "role": payload.get("role"),
+        "is_deleted": 1,
+    }
+
+
+class _ActionWrites:
+    """
+    Vector store writes queued by the memory actions of one add() turn.
+
+    `_create_memory`, `_update_memory` and `_delete_memory` queue their write and history
+    record here when given an instance, so that all inserts, updates and deletes of the turn
+    each go to the vector store in one call (`insert`, `update_many`, `delete_many`).
+    Entries are ``(memory_id, vector, payload, history_record)`` tuples.
+    """
+
+    def __init__(self):
+        self.inserts = []
+        self.updates = []
+        self.deletes = []
+
+    def calls(self):
+        """Yield ``(entries, method, kwargs)`` for each non-empty kind of write."""
+        if self.inserts:
+            yield self.inserts, "insert", self.call_kwargs("insert", self.inserts)
+        if self.updates:
+            yield self.updates, "update_many", self.call_kwargs("update_many", self.updates)
+        if self.deletes:
+            yield self.deletes, "delete_many", self.call_kwargs("delete_many", self.deletes)
+
+    @staticmethod
+    def call_kwargs(method, entries):
+        ids = [entry[0] for entry in entries]
+        if method == "delete_many":
+            return {"vector_ids": ids}
+        vectors = [entry[1] for entry in entries]
+        payloads = [entry[2] for entry in entries]
+        if method == "insert":
+            return {"vectors": vectors, "ids": ids, "payloads": payloads}
+        return {"vector_ids": ids, "vectors": vectors, "payloads": payloads}
+
+
 setup_config()
 logger = logging.getLogger(__name__)
 
 
 class Memory(MemoryBase):
-    def __init__(self, config: MemoryConfig = MemoryConfig()):
+    def __init__(
+        self,
+        config: MemoryConfig = MemoryConfig(),
+        executor: Optional[concurrent.futures.Executor] = None,
+    ):
+        """
+        Args:
+            config (MemoryConfig): Memory configuration.
+            executor (concurrent.futures.Executor, optional): Host-owned executor used to run vector and
+                graph operations in parallel. When omitted, the instance creates a bounded pool sized by
+                `config.concurrency.max_workers` and shuts it down in `close()`.
+        """
         self.config = config
 
         self.custom_fact_extraction_prompt = self.config.custom_fact_extraction_prompt
@@ -187,6 +319,11 @@ class Memory(MemoryBase):
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
+        self._search_plans = SearchPlanCache()
+        self._limits = BackendLimits(self.config.concurrency)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
         
         # Initialize reranker if configured
         self.reranker = None
@@ -233,14 +370,14 @@ class Memory(MemoryBase):
         capture_event("mem0.init", self, {"sync_type": "sync"})
 
     @classmethod
-    def from_config(cls, config_dict: Dict[str, Any]):
+    def from_config(cls, config_dict: Dict[str, Any], executor: Optional[concurrent.futures.Executor] = None):
         try:
             config = cls._process_config(config_dict)
             config = MemoryConfig(**config_dict)
         except ValidationError as e:
             logger.error(f"Configuration validation error: {e}")
             raise
-        return cls(config)
+        return cls(config, executor=executor)
 
     @staticmethod
     def _process_config(config_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -257,6 +394,29 @@ class Memory(MemoryBase):
             logger.error(f"Configuration validation error: {e}")
             raise
 
+    def _get_executor(self) -> concurrent.futures.Executor:
+        """Return the instance-wide worker pool used to run vector and graph operations in parallel."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.config.concurrency.max_workers, thread_name_prefix="mem0"
+                    )
+        return self._executor
+
+    def _shutdown_executor(self):
+        # An injected executor belongs to the caller: keep using it after reset() and never shut it down
+        if not self._owns_executor:
+            return
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _call_graph(self, method, *args):
+        with self._limits.graph_store:
+            return getattr(self.graph, method)(*args)
+
     def _should_use_agent_memory_extraction(self, messages, metadata):
         """Determine whether to use agent memory extraction based on the logic:
         - If agent_id is present and messages contain assistant role -> True
@@ -366,14 +526,15 @@ class Memory(MemoryBase):
         else:
             messages = parse_vision_messages(messages)
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
+        if self.enable_graph:
+            executor = self._get_executor()
             future1 = executor.submit(self._add_to_vector_store, messages, processed_metadata, effective_filters, infer)
             future2 = executor.submit(self._add_to_graph, messages, effective_filters)
-
-            concurrent.futures.wait([future1, future2])
-
             vector_store_result = future1.result()
             graph_result = future2.result()
+        else:
+            vector_store_result = self._add_to_vector_store(messages, processed_metadata, effective_filters, infer)
+            graph_result = self._add_to_graph(messages, effective_filters)
 
         if self.enable_graph:
             return {
@@ -385,40 +546,7 @@ class Memory(MemoryBase):
 
     def _add_to_vector_store(self, messages, metadata, filters, infer):
         if not infer:
-            returned_memories = []
-            for message_dict in messages:
-                if (
-                    not isinstance(message_dict, dict)
-                    or message_dict.get("role") is None
-                    or message_dict.get("content") is None
-                ):
-                    logger.warning(f"Skipping invalid message format: {message_dict}")
-                    continue
-
-                if message_dict["role"] == "system":
-                    continue
-
-                per_msg_meta = deepcopy(metadata)
-                per_msg_meta["role"] = message_dict["role"]
-
-                actor_name = message_dict.get("name")
-                if actor_name:
-                    per_msg_meta["actor_id"] = actor_name
-
-                msg_content = message_dict["content"]
-                msg_embeddings = self.embedding_model.embed(msg_content, "add")
-                mem_id = self._create_memory(msg_content, msg_embeddings, per_msg_meta)
-
-                returned_memories.append(
-                    {
-                        "id": mem_id,
-                        "memory": msg_content,
-                        "event": "ADD",
-                        "actor_id": actor_name if actor_name else None,
-                        "role": message_dict["role"],
-                    }
-                )
-            return returned_memories
+            return self._add_raw_messages(messages, metadata)
 
         parsed_messages = parse_messages(messages)
 
@@ -431,13 +559,14 @@ class Memory(MemoryBase):
             is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages, is_agent_memory)
 
-        response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
+        with self._limits.llm:
+            response = self.llm.generate_response(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_format={"type": "json_object"},
+            )
 
         try:
             response = remove_code_blocks(response)
@@ -469,17 +598,22 @@ class Memory(MemoryBase):
             search_filters["agent_id"] = filters["agent_id"]
         if filters.get("run_id"):
             search_filters["run_id"] = filters["run_id"]
-        for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
-            new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=new_mem,
-                vectors=messages_embeddings,
-                limit=5,
-                filters=search_filters,
-            )
-            for mem in existing_memories:
-                retrieved_old_memory.append({"id": mem.id, "text": mem.payload.get("data", "")})
+        if new_retrieved_facts:
+            unique_facts = list(dict.fromkeys(new_retrieved_facts))
+            with self._limits.embedder:
+                fact_embeddings = self.embedding_model.embed_batch(unique_facts, "add")
+            new_message_embeddings.update(zip(unique_facts, fact_embeddings))
+            # One batched lookup instead of a search round trip per fact; repeated facts are searched once
+            with self._limits.vector_store:
+                existing_memories_per_fact = self.vector_store.search_batch(
+                    queries=unique_facts,
+                    vectors_matrix=fact_embeddings,
+                    limit=5,
+                    filters=search_filters,
+                )
+            for existing_memories in existing_memories_per_fact:
+                for mem in existing_memories:
+                    retrieved_old_memory.append({"id": mem.id, "text": mem.payload.get("data", "")})
 
         unique_data = {}
         for item in retrieved_old_memory:
@@ -499,10 +633,11 @@ class Memory(MemoryBase):
             )
 
             try:
-                response: str = self.llm.generate_response(
-                    messages=[{"role": "user", "content": function_calling_prompt}],
-                    response_format={"type": "json_object"},
-                )
+                with self._limits.llm:
+                    response: str = self.llm.generate_response(
+                        messages=[{"role": "user", "content": function_calling_prompt}],
+                        response_format={"type": "json_object"},
+                    )
             except Exception as e:
                 logger.error(f"Error in new memory actions response: {e}")
                 response = ""
@@ -522,6 +657,11 @@ class Memory(MemoryBase):
 
         returned_memories = []
         try:
+            prefetched = self._prefetch_memories(
+                _memory_ids_to_prefetch(new_memories_with_actions.get("memory", []), temp_uuid_mapping, metadata)
+            )
+            self._embed_action_texts(new_memories_with_actions.get("memory", []), new_message_embeddings)
+            writes = _ActionWrites()
             for resp in new_memories_with_actions.get("memory", []):
                 logger.info(resp)
                 try:
@@ -536,6 +676,7 @@ class Memory(MemoryBase):
                             data=action_text,
                             existing_embeddings=new_message_embeddings,
                             metadata=deepcopy(metadata),
+                            writes=writes,
                         )
                         returned_memories.append({"id": memory_id, "memory": action_text, "event": event_type})
                     elif event_type == "UPDATE":
@@ -544,6 +685,8 @@ class Memory(MemoryBase):
                             data=action_text,
                             existing_embeddings=new_message_embeddings,
                             metadata=deepcopy(metadata),
+                            existing_memory=prefetched.get(temp_uuid_mapping[resp.get("id")]),
+                            writes=writes,
                         )
                         returned_memories.append(
                             {
@@ -554,7 +697,11 @@ class Memory(MemoryBase):
                             }
                         )
                     elif event_type == "DELETE":
-                        self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")])
+                        self._delete_memory(
+                            memory_id=temp_uuid_mapping[resp.get("id")],
+                            existing_memory=prefetched.get(temp_uuid_mapping[resp.get("id")]),
+                            writes=writes,
+                        )
                         returned_memories.append(
                             {
                                 "id": temp_uuid_mapping[resp.get("id")],
@@ -567,7 +714,10 @@ class Memory(MemoryBase):
                         memory_id = temp_uuid_mapping.get(resp.get("id"))
                         if memory_id and (metadata.get("agent_id") or metadata.get("run_id")):
                             # Update only the session identifiers, keep content the same
-                            existing_memory = self.vector_store.get(vector_id=memory_id)
+                            existing_memory = prefetched.get(memory_id)
+                            if existing_memory is None:
+                                with self._limits.vector_store:
+                                    existing_memory = self.vector_store.get(vector_id=memory_id)
                             updated_metadata = deepcopy(existing_memory.payload)
                             if metadata.get("agent_id"):
                                 updated_metadata["agent_id"] = metadata["agent_id"]
@@ -575,16 +725,19 @@ class Memory(MemoryBase):
                                 updated_metadata["run_id"] = metadata["run_id"]
                             updated_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-                            self.vector_store.update(
-                                vector_id=memory_id,
-                                vector=None,  # Keep same embeddings
-                                payload=updated_metadata,
-                            )
+                            with self._limits.vector_store:
+                                self.vector_store.update(
+                                    vector_id=memory_id,
+                                    vector=None,  # Keep same embeddings
+                                    payload=updated_metadata,
+                                )
                             logger.info(f"Updated session IDs for memory {memory_id}")
                         else:
                             logger.info("NOOP for Memory.")
                 except Exception as e:
                     logger.error(f"Error processing memory action: {resp}, Error: {e}")
+            failed = self._apply_action_writes(writes)
+            returned_memories = [memory for memory in returned_memories if memory["id"] not in failed]
         except Exception as e:
             logger.error(f"Error iterating new_memories_with_actions: {e}")
 
@@ -603,7 +756,8 @@ class Memory(MemoryBase):
                 filters["user_id"] = "user"
 
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
-            added_entities = self.graph.add(data, filters)
+            with self._limits.graph_store:
+                added_entities = self.graph.add(data, filters)
 
         return added_entities
 
@@ -618,37 +772,12 @@ class Memory(MemoryBase):
             dict: Retrieved memory.
         """
         capture_event("mem0.get", self, {"memory_id": memory_id, "sync_type": "sync"})
-        memory = self.vector_store.get(vector_id=memory_id)
+        with self._limits.vector_store:
+            memory = self.vector_store.get(vector_id=memory_id)
         if not memory:
             return None
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        result_item = MemoryItem(
-            id=memory.id,
-            memory=memory.payload.get("data", ""),
-            hash=memory.payload.get("hash"),
-            created_at=memory.payload.get("created_at"),
-            updated_at=memory.payload.get("updated_at"),
-        ).model_dump()
-
-        for key in promoted_payload_keys:
-            if key in memory.payload:
-                result_item[key] = memory.payload[key]
-
-        additional_metadata = {k: v for k, v in memory.payload.items() if k not in core_and_promoted_keys}
-        if additional_metadata:
-            result_item["metadata"] = additional_metadata
-
-        return result_item
+        return format_memory_item(memory)
 
     def get_all(
         self,
@@ -690,18 +819,15 @@ class Memory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"}
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
+        if self.enable_graph:
+            executor = self._get_executor()
             future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
-            future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
-            )
-
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
-            )
-
+            future_graph_entities = executor.submit(self._call_graph, "get_all", effective_filters, limit)
             all_memories_result = future_memories.result()
-            graph_entities_result = future_graph_entities.result() if future_graph_entities else None
+            graph_entities_result = future_graph_entities.result()
+        else:
+            all_memories_result = self._get_all_from_vector_store(effective_filters, limit)
+            graph_entities_result = None
 
         if self.enable_graph:
             return {"results": all_memories_result, "relations": graph_entities_result}
@@ -709,7 +835,8 @@ class Memory(MemoryBase):
         return {"results": all_memories_result}
 
     def _get_all_from_vector_store(self, filters, limit):
-        memories_result = self.vector_store.list(filters=filters, limit=limit)
+        with self._limits.vector_store:
+            memories_result = self.vector_store.list(filters=filters, limit=limit)
 
         # Handle different vector store return formats by inspecting first element
         if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0:
@@ -724,36 +851,7 @@ class Memory(MemoryBase):
         else:
             actual_memories = memories_result
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        formatted_memories = []
-        for mem in actual_memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload.get("data", ""),
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-            ).model_dump(exclude={"score"})
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
-
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
-
-            formatted_memories.append(memory_item_dict)
-
-        return formatted_memories
+        return [format_memory_item(mem, include_score=False) for mem in actual_memories]
 
     def search(
         self,
@@ -766,6 +864,7 @@ class Memory(MemoryBase):
         filters: Optional[Dict[str, Any]] = None,
         threshold: Optional[float] = None,
         rerank: bool = True,
+        query_embedding: Optional[List[float]] = None,
     ):
         """
         Searches for memories based on a query
@@ -777,6 +876,7 @@ class Memory(MemoryBase):
             limit (int, optional): Limit the number of results. Defaults to 100.
             filters (dict, optional): Legacy filters to apply to the search. Defaults to None.
             threshold (float, optional): Minimum score for a memory to be included in the results. Defaults to None.
+            query_embedding (list, optional): Precomputed search embedding of `query`, skips embedding it again. Defaults to None.
             filters (dict, optional): Enhanced metadata filtering with operators:
                 - {"key": "value"} - exact match
                 - {"key": {"eq": "value"}} - equals
@@ -799,48 +899,36 @@ class Memory(MemoryBase):
                   and potentially "relations" if graph store is enabled.
                   Example for v1.1+: `{"results": [{"id": "...", "memory": "...", "score": 0.8, ...}]}`
         """
-        _, effective_filters = _build_filters_and_metadata(
-            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
-        )
-
-        if not any(key in effective_filters for key in ("user_id", "agent_id", "run_id")):
-            raise ValueError("At least one of 'user_id', 'agent_id', or 'run_id' must be specified.")
+        # Filter resolution, operator expansion and telemetry hashing are compiled
+        # once per tenant/filter combination and reused on subsequent searches.
+        plan = self._search_plans.get(user_id=user_id, agent_id=agent_id, run_id=run_id, filters=filters)
+        effective_filters = plan.bind()
 
-        # Apply enhanced metadata filtering if advanced operators are detected
-        if filters and self._has_advanced_operators(filters):
-            processed_filters = self._process_metadata_filters(filters)
-            effective_filters.update(processed_filters)
-        elif filters:
-            # Simple filters, merge directly
-            effective_filters.update(filters)
-
-        keys, encoded_ids = process_telemetry_filters(effective_filters)
         capture_event(
             "mem0.search",
             self,
             {
                 "limit": limit,
                 "version": self.api_version,
-                "keys": keys,
-                "encoded_ids": encoded_ids,
+                "keys": plan.telemetry_keys,
+                "encoded_ids": plan.encoded_ids,
                 "sync_type": "sync",
                 "threshold": threshold,
-                "advanced_filters": bool(filters and self._has_advanced_operators(filters)),
+                "advanced_filters": plan.advanced_filters,
             },
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._search_vector_store, query, effective_filters, limit, threshold)
-            future_graph_entities = (
-                executor.submit(self.graph.search, query, effective_filters, limit) if self.enable_graph else None
-            )
-
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
+        if self.enable_graph:
+            executor = self._get_executor()
+            future_memories = executor.submit(
+                self._search_vector_store, query, effective_filters, limit, threshold, query_embedding
             )
-
+            future_graph_entities = executor.submit(self._call_graph, "search", query, plan.bind(), limit)
             original_memories = future_memories.result()
-            graph_entities = future_graph_entities.result() if future_graph_entities else None
+            graph_entities = future_graph_entities.result()
+        else:
+            original_memories = self._search_vector_store(query, effective_filters, limit, threshold, query_embedding)
+            graph_entities = None
 
         # Apply reranking if enabled and reranker is available
         if rerank and self.reranker and original_memories:
@@ -858,136 +946,56 @@ class Memory(MemoryBase):
     def _process_metadata_filters(self, metadata_filters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process enhanced metadata filters and convert them to vector store compatible format.
-        
+
         Args:
             metadata_filters: Enhanced metadata filters with operators
-            
+
         Returns:
             Dict of processed filters compatible with vector store
         """
-        processed_filters = {}
-        
-        def process_condition(key: str, condition: Any) -> Dict[str, Any]:
-            if not isinstance(condition, dict):
-                # Simple equality: {"key": "value"}
-                if condition == "*":
-                    # Wildcard: match everything for this field (implementation depends on vector store)
-                    return {key: "*"}
-                return {key: condition}
-            
-            result = {}
-            for operator, value in condition.items():
-                # Map platform operators to universal format that can be translated by each vector store
-                operator_map = {
-                    "eq": "eq", "ne": "ne", "gt": "gt", "gte": "gte", 
-                    "lt": "lt", "lte": "lte", "in": "in", "nin": "nin",
-                    "contains": "contains", "icontains": "icontains"
-                }
-                
-                if operator in operator_map:
-                    result[key] = {operator_map[operator]: value}
-                else:
-                    raise ValueError(f"Unsupported metadata filter operator: {operator}")
-            return result
-        
-        for key, value in metadata_filters.items():
-            if key == "AND":
-                # Logical AND: combine multiple conditions
-                if not isinstance(value, list):
-                    raise ValueError("AND operator requires a list of conditions")
-                for condition in value:
-                    for sub_key, sub_value in condition.items():
-                        processed_filters.update(process_condition(sub_key, sub_value))
-            elif key == "OR":
-                # Logical OR: Pass through to vector store for implementation-specific handling
-                if not isinstance(value, list) or not value:
-                    raise ValueError("OR operator requires a non-empty list of conditions")
-                # Store OR conditions in a way that vector stores can interpret
-                processed_filters["$or"] = []
-                for condition in value:
-                    or_condition = {}
-                    for sub_key, sub_value in condition.items():
-                        or_condition.update(process_condition(sub_key, sub_value))
-                    processed_filters["$or"].append(or_condition)
-            elif key == "NOT":
-                # Logical NOT: Pass through to vector store for implementation-specific handling
-                if not isinstance(value, list) or not value:
-                    raise ValueError("NOT operator requires a non-empty list of conditions")
-                processed_filters["$not"] = []
-                for condition in value:
-                    not_condition = {}
-                    for sub_key, sub_value in condition.items():
-                        not_condition.update(process_condition(sub_key, sub_value))
-                    processed_filters["$not"].append(not_condition)
-            else:
-                processed_filters.update(process_condition(key, value))
-        
-        return processed_filters
+        return process_metadata_filters(metadata_filters)
 
     def _has_advanced_operators(self, filters: Dict[str, Any]) -> bool:
         """
         Check if filters contain advanced operators that need special processing.
-        
+
         Args:
             filters: Dictionary of filters to check
-            
+
         Returns:
             bool: True if advanced operators are detected
         """
-        if not isinstance(filters, dict):
-            return False
-            
-        for key, value in filters.items():
-            # Check for platform-style logical operators
-            if key in ["AND", "OR", "NOT"]:
-                return True
-            # Check for comparison operators (without $ prefix for universal compatibility)
-            if isinstance(value, dict):
-                for op in value.keys():
-                    if op in ["eq", "ne", "gt", "gte", "lt", "lte", "in", "nin", "contains", "icontains"]:
-                        return True
-            # Check for wildcard values
-            if value == "*":
-                return True
-        return False
-
-    def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = self.embedding_model.embed(query, "search")
-        memories = self.vector_store.search(query=query, vectors=embeddings, limit=limit, filters=filters)
-
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        return has_advanced_operators(filters)
 
-        original_memories = []
-        for mem in memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload.get("data", ""),
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-                score=mem.score,
-            ).model_dump()
+    def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a search query, honouring the embedder concurrency limit.
 
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
+        The result can be passed to `search` as `query_embedding`.
 
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
+        Args:
+            query (str): Query to embed.
 
-            if threshold is None or mem.score >= threshold:
-                original_memories.append(memory_item_dict)
+        Returns:
+            list: Search embedding of the query.
+        """
+        with self._limits.embedder:
+            return self.embedding_model.embed(query, "search")
 
-        return original_memories
+    def _search_vector_store(
+        self, query, filters, limit, threshold: Optional[float] = None, query_embedding: Optional[List[float]] = None
+    ):
+        embeddings = query_embedding
+        if embeddings is None:
+            embeddings = self.embed_query(query)
+        with self._limits.vector_store:
+            memories = self.vector_store.search(query=query, vectors=embeddings, limit=limit, filters=filters)
+
+        return [
+            format_memory_item(mem, score=mem.score)
+            for mem in memories
+            if threshold is None or mem.score >= threshold
+        ]
 
     def update(self, memory_id, data):
         """
@@ -1006,7 +1014,8 @@ class Memory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "sync"})
 
-        existing_embeddings = {data: self.embedding_model.embed(data, "update")}
+        with self._limits.embedder:
+            existing_embeddings = {data: self.embedding_model.embed(data, "update")}
 
         self._update_memory(memory_id, data, existing_embeddings)
         return {"message": "Memory updated successfully!"}
@@ -1047,18 +1056,147 @@ class Memory(MemoryBase):
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"})
         # delete all vector memories and reset the collections
-        memories = self.vector_store.list(filters=filters)[0]
+        with self._limits.vector_store:
+            memories = self.vector_store.list(filters=filters)[0]
         for memory in memories:
             self._delete_memory(memory.id)
-        self.vector_store.reset()
+        with self._limits.vector_store:
+            self.vector_store.reset()
 
         logger.info(f"Deleted {len(memories)} memories")
 
         if self.enable_graph:
-            self.graph.delete_all(filters)
+            with self._limits.graph_store:
+                self.graph.delete_all(filters)
 
         return {"message": "Memories deleted successfully!"}
 
+    def bulk_import(
+        self,
+        records,
+        batch_size: int = 512,
+        workers: int = 1,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
+    ):
+        """
+        Import pre-extracted memories in batches, bypassing fact extraction.
+
+        Args:
+            records: Path to a JSONL (optionally gzipped) or Parquet file, or an iterable of dicts. Each record holds
+                the memory text under "memory", "data" or "content" and may carry "id", "vector" (or "embedding"),
+                "metadata", "created_at", "updated_at", "user_id", "agent_id", "run_id", "actor_id" and "role".
+                Records without a vector are embedded in batches.
+            batch_size (int, optional): Records embedded and written per round trip. Defaults to 512.
+            workers (int, optional): Batches processed concurrently on the shared executor. Defaults to 1.
+            user_id (str, optional): Default user ID for records that do not set one.
+            agent_id (str, optional): Default agent ID for records that do not set one.
+            run_id (str, optional): Default run ID for records that do not set one.
+            checkpoint_path (str, optional): File recording how many leading records have been written. Re-running
+                with the same input and checkpoint skips them, resuming an interrupted import. Records with an "id"
+                that were in flight when an import failed are looked up and skipped if they were written; records
+                without one may be written twice on resume.
+
+        Returns:
+            dict: Number of records imported by this call and the record offset it resumed from.
+        """
+        if batch_size < 1 or workers < 1:
+            raise ValueError("batch_size and workers must be positive integers")
+
+        checkpoint = ImportCheckpoint(checkpoint_path)
+        resumed_from = checkpoint.completed
+        # Batches that may have been partly written before the previous run stopped
+        recheck_until = checkpoint.submitted
+        defaults = {key: value for key, value in (("user_id", user_id), ("agent_id", agent_id), ("run_id", run_id)) if value}
+        batches = chunked(islice(iter_import_records(records), resumed_from, None), batch_size)
+
+        imported = 0
+        offset = resumed_from
+        if workers == 1:
+            for batch in batches:
+                checkpoint.mark_submitted(offset + len(batch))
+                imported += self._import_batch(batch, defaults, skip_existing=offset < recheck_until)
+                checkpoint.mark_done(offset, offset + len(batch))
+                offset += len(batch)
+        else:
+            executor = self._get_executor()
+            in_flight = {}
+
+            def _collect(futures):
+                nonlocal imported
+                for future in futures:
+                    span = in_flight.pop(future)
+                    imported += future.result()
+                    checkpoint.mark_done(*span)
+
+            try:
+                for batch in batches:
+                    if len(in_flight) >= workers:
+                        done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                        _collect(done)
+                    checkpoint.mark_submitted(offset + len(batch))
+                    future = executor.submit(self._import_batch, batch, defaults, offset < recheck_until)
+                    in_flight[future] = (offset, offset + len(batch))
+                    offset += len(batch)
+                _collect(list(concurrent.futures.as_completed(in_flight)))
+            except Exception:
+                # Let running batches settle so the checkpoint covers everything that was written
+                concurrent.futures.wait(in_flight)
+                for future, span in in_flight.items():
+                    if not future.cancelled() and future.exception() is None:
+                        imported += future.result()
+                        checkpoint.mark_done(*span)
+                raise
+
+        capture_event(
+            "mem0.bulk_import",
+            self,
+            {"imported": imported, "batch_size": batch_size, "workers": workers, "sync_type": "sync"},
+        )
+        return {"imported": imported, "resumed_from": resumed_from}
+
+    def _import_batch(self, batch, defaults, skip_existing=False):
+        prepared = [prepare_import_record(record, defaults) for record in batch]
+        if skip_existing:
+            explicit_ids = [str(record["id"]) for record in batch if record.get("id")]
+            if explicit_ids:
+                with self._limits.vector_store:
+                    existing = {str(record.id) for record in self.vector_store.get_many(explicit_ids)}
+                prepared = [entry for entry in prepared if entry[0] not in existing]
+                if not prepared:
+                    return 0
+        ids = [memory_id for memory_id, _, _, _ in prepared]
+        vectors = [vector for _, _, vector, _ in prepared]
+        payloads = [payload for _, _, _, payload in prepared]
+
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            with self._limits.embedder:
+                embedded = self.embedding_model.embed_batch([prepared[i][1] for i in missing], "add")
+            for i, vector in zip(missing, embedded):
+                vectors[i] = vector
+
+        with self._limits.vector_store:
+            self.vector_store.insert(vectors=vectors, ids=ids, payloads=payloads)
+        self.db.add_history_batch(
+            [
+                {
+                    "memory_id": memory_id,
+                    "new_memory": text,
+                    "event": "ADD",
+                    "created_at": payload.get("created_at"),
+                    "updated_at": payload.get("updated_at"),
+                    "actor_id": payload.get("actor_id"),
+                    "role": payload.get("role"),
+                }
+                for memory_id, text, _, payload in prepared
+            ]
+        )
+        return len(prepared)
+
     def history(self, memory_id):
         """
         Get the history of changes for a memory by ID.
@@ -1072,23 +1210,43 @@ class Memory(MemoryBase):
         capture_event("mem0.history", self, {"memory_id": memory_id, "sync_type": "sync"})
         return self.db.get_history(memory_id)
 
-    def _create_memory(self, data, existing_embeddings, metadata=None):
+    def _add_raw_messages(self, messages, metadata):
+        """Store messages verbatim, embedding and writing them in bounded batches."""
+        returned_memories = []
+        for chunk in chunked(iter_raw_messages(messages, metadata), RAW_INGEST_CHUNK_SIZE):
+            texts = [content for content, _ in chunk]
+            with self._limits.embedder:
+                vectors = self.embedding_model.embed_batch(texts, "add")
+            ids = [str(uuid.uuid4()) for _ in chunk]
+            payloads, history_records, memories = build_raw_memories(chunk, ids)
+            with self._limits.vector_store:
+                self.vector_store.insert(vectors=vectors, ids=ids, payloads=payloads)
+            self.db.add_history_batch(history_records)
+            returned_memories.extend(memories)
+        return returned_memories
+
+    def _create_memory(self, data, existing_embeddings, metadata=None, writes=None):
         logger.debug(f"Creating memory with {data=}")
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = self.embedding_model.embed(data, memory_action="add")
+            with self._limits.embedder:
+                embeddings = self.embedding_model.embed(data, memory_action="add")
         memory_id = str(uuid.uuid4())
         metadata = metadata or {}
         metadata["data"] = data
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        self.vector_store.insert(
-            vectors=[embeddings],
-            ids=[memory_id],
-            payloads=[metadata],
-        )
+        if writes is not None:
+            writes.inserts.append((memory_id, embeddings, metadata, _add_history_record(memory_id, data, metadata)))
+            return memory_id
+        with self._limits.vector_store:
+            self.vector_store.insert(
+                vectors=[embeddings],
+                ids=[memory_id],
+                payloads=[metadata],
+            )
         self.db.add_history(
             memory_id,
             None,
@@ -1121,7 +1279,8 @@ class Memory(MemoryBase):
         ]
 
         try:
-            procedural_memory = self.llm.generate_response(messages=parsed_messages)
+            with self._limits.llm:
+                procedural_memory = self.llm.generate_response(messages=parsed_messages)
             procedural_memory = remove_code_blocks(procedural_memory)
         except Exception as e:
             logger.error(f"Error generating procedural memory summary: {e}")
@@ -1131,7 +1290,8 @@ class Memory(MemoryBase):
             raise ValueError("Metadata cannot be done for procedural memory.")
 
         metadata["memory_type"] = MemoryType.PROCEDURAL.value
-        embeddings = self.embedding_model.embed(procedural_memory, memory_action="add")
+        with self._limits.embedder:
+            embeddings = self.embedding_model.embed(procedural_memory, memory_action="add")
         memory_id = self._create_memory(procedural_memory, {procedural_memory: embeddings}, metadata=metadata)
         capture_event("mem0._create_procedural_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
 
@@ -1139,14 +1299,83 @@ class Memory(MemoryBase):
 
         return result
 
-    def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
-        logger.info(f"Updating memory with {data=}")
+    def _prefetch_memories(self, memory_ids):
+        """
+        Fetch the memories an add() turn will update or delete in one round trip.
 
+        Returns a dict keyed by memory ID. On failure an empty dict is returned and each
+        action falls back to fetching its own record.
+        """
+        if not memory_ids:
+            return {}
         try:
-            existing_memory = self.vector_store.get(vector_id=memory_id)
-        except Exception:
-            logger.error(f"Error getting memory with ID {memory_id} during update.")
-            raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
+            with self._limits.vector_store:
+                records = self.vector_store.get_many(memory_ids)
+        except Exception as e:
+            logger.warning(f"Bulk fetch of {len(memory_ids)} memories failed, falling back to single gets: {e}")
+            return {}
+        return {str(record.id): record for record in records}
+
+    def _embed_action_texts(self, actions, existing_embeddings):
+        """
+        Embed the texts of new and updated memories in batches ahead of applying the actions.
+
+        Failures are logged and leave ``existing_embeddings`` untouched so each action embeds its own text.
+        """
+        for memory_action, texts in _action_texts_to_embed(actions, existing_embeddings).items():
+            if not texts:
+                continue
+            try:
+                with self._limits.embedder:
+                    embeddings = self.embedding_model.embed_batch(texts, memory_action)
+            except Exception as e:
+                logger.warning(f"Batch embedding of {len(texts)} memory texts failed, embedding one by one: {e}")
+                continue
+            existing_embeddings.update(zip(texts, embeddings))
+
+    def _apply_action_writes(self, writes):
+        """
+        Send the writes queued by an add() turn with one vector store call per kind of write
+        and record their history in one batch.
+
+        When a grouped call fails, its writes are retried one at a time so that only the
+        failing memories are left out. Returns the IDs of the memories that were not written.
+        """
+        failed = set()
+        history = []
+        for entries, method, kwargs in writes.calls():
+            try:
+                with self._limits.vector_store:
+                    getattr(self.vector_store, method)(**kwargs)
+                written = entries
+            except Exception as e:
+                logger.warning(f"Grouped {method} of {len(entries)} memories failed, writing them one by one: {e}")
+                written = []
+                for entry in entries:
+                    try:
+                        with self._limits.vector_store:
+                            getattr(self.vector_store, method)(**_ActionWrites.call_kwargs(method, [entry]))
+                        written.append(entry)
+                    except Exception as e:
+                        logger.error(f"Error writing memory {entry[0]}: {e}")
+                        failed.add(entry[0])
+            history.extend(entry[3] for entry in written)
+        try:
+            self.db.add_history_batch(history)
+        except Exception as e:
+            logger.error(f"Error recording history of {len(history)} memory changes: {e}")
+        return failed
+
+    def _update_memory(self, memory_id, data, existing_embeddings, metadata=None, existing_memory=None, writes=None):
+        logger.info(f"Updating memory with {data=}")
+
+        if existing_memory is None:
+            try:
+                with self._limits.vector_store:
+                    existing_memory = self.vector_store.get(vector_id=memory_id)
+            except Exception:
+                logger.error(f"Error getting memory with ID {memory_id} during update.")
+                raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
 
         prev_value = existing_memory.payload.get("data")
 
@@ -1172,13 +1401,20 @@ class Memory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = self.embedding_model.embed(data, "update")
+            with self._limits.embedder:
+                embeddings = self.embedding_model.embed(data, "update")
 
-        self.vector_store.update(
-            vector_id=memory_id,
-            vector=embeddings,
-            payload=new_metadata,
-        )
+        if writes is not None:
+            writes.updates.append(
+                (memory_id, embeddings, new_metadata, _update_history_record(memory_id, prev_value, data, new_metadata))
+            )
+            return memory_id
+        with self._limits.vector_store:
+            self.vector_store.update(
+                vector_id=memory_id,
+                vector=embeddings,
+                payload=new_metadata,
+            )
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
 
         self.db.add_history(
@@ -1193,11 +1429,17 @@ class Memory(MemoryBase):
         )
         return memory_id
 
-    def _delete_memory(self, memory_id):
+    def _delete_memory(self, memory_id, existing_memory=None, writes=None):
         logger.info(f"Deleting memory with {memory_id=}")
-        existing_memory = self.vector_store.get(vector_id=memory_id)
+        if existing_memory is None:
+            with self._limits.vector_store:
+                existing_memory = self.vector_store.get(vector_id=memory_id)
         prev_value = existing_memory.payload.get("data", "")
-        self.vector_store.delete(vector_id=memory_id)
+        if writes is not None:
+            writes.deletes.append((memory_id, None, None, _delete_history_record(memory_id, existing_memory.payload)))
+            return memory_id
+        with self._limits.vector_store:
+            self.vector_store.delete(vector_id=memory_id)
         self.db.add_history(
             memory_id,
             prev_value,
@@ -1217,6 +1459,7 @@ class Memory(MemoryBase):
             Recreates the vector store with a new client
         """
         logger.warning("Resetting all memories")
+        self._shutdown_executor()
 
         if hasattr(self.db, "connection") and self.db.connection:
             self.db.connection.execute("DROP TABLE IF EXISTS history")
@@ -1232,8 +1475,29 @@ class Memory(MemoryBase):
             self.vector_store = VectorStoreFactory.create(
                 self.config.vector_store.provider, self.config.vector_store.config
             )
+        self._search_plans.clear()
         capture_event("mem0.reset", self, {"sync_type": "sync"})
 
+    def close(self):
+        """
+        Release the resources held by this instance.
+
+        Waits for in-flight background operations, shuts down the owned executor
+        (an injected executor is left running for its owner), stops the embedder's
+        micro-batching scheduler and closes the history database connection. The
+        instance must not be used after it is closed.
+        """
+        self._shutdown_executor()
+        self.embedding_model.close()
+        if self.db is not None:
+            self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def chat(self, query):
         raise NotImplementedError("Chat function not implemented yet.")
 
@@ -1254,6 +1518,7 @@ class AsyncMemory(MemoryBase):
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
+        self._search_plans = SearchPlanCache()
         
         # Initialize reranker if configured
         self.reranker = None
@@ -1415,40 +1680,7 @@ class AsyncMemory(MemoryBase):
         infer: bool,
     ):
         if not infer:
-            returned_memories = []
-            for message_dict in messages:
-                if (
-                    not isinstance(message_dict, dict)
-                    or message_dict.get("role") is None
-                    or message_dict.get("content") is None
-                ):
-                    logger.warning(f"Skipping invalid message format (async): {message_dict}")
-                    continue
-
-                if message_dict["role"] == "system":
-                    continue
-
-                per_msg_meta = deepcopy(metadata)
-                per_msg_meta["role"] = message_dict["role"]
-
-                actor_name = message_dict.get("name")
-                if actor_name:
-                    per_msg_meta["actor_id"] = actor_name
-
-                msg_content = message_dict["content"]
-                msg_embeddings = await asyncio.to_thread(self.embedding_model.embed, msg_content, "add")
-                mem_id = await self._create_memory(msg_content, msg_embeddings, per_msg_meta)
-
-                returned_memories.append(
-                    {
-                        "id": mem_id,
-                        "memory": msg_content,
-                        "event": "ADD",
-                        "actor_id": actor_name if actor_name else None,
-                        "role": message_dict["role"],
-                    }
-                )
-            return returned_memories
+            return await self._add_raw_messages(messages, metadata)
 
         parsed_messages = parse_messages(messages)
         if self.config.custom_fact_extraction_prompt:
@@ -1460,8 +1692,9 @@ class AsyncMemory(MemoryBase):
             is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages, is_agent_memory)
 
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
+        response = await call_async(
+            self.llm,
+            "generate_response",
             messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
             response_format={"type": "json_object"},
         )
@@ -1496,22 +1729,21 @@ class AsyncMemory(MemoryBase):
         if effective_filters.get("run_id"):
             search_filters["run_id"] = effective_filters["run_id"]
 
-        async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
-            new_message_embeddings[new_mem_content] = embeddings
-            existing_mems = await asyncio.to_thread(
-                self.vector_store.search,
-                query=new_mem_content,
-                vectors=embeddings,
+        if new_retrieved_facts:
+            unique_facts = list(dict.fromkeys(new_retrieved_facts))
+            fact_embeddings = await call_async(self.embedding_model, "embed_batch", unique_facts, "add")
+            new_message_embeddings.update(zip(unique_facts, fact_embeddings))
+            # One batched lookup instead of a search round trip per fact; repeated facts are searched once
+            existing_memories_per_fact = await call_async(
+                self.vector_store,
+                "search_batch",
+                queries=unique_facts,
+                vectors_matrix=fact_embeddings,
                 limit=5,
                 filters=search_filters,
             )
-            return [{"id": mem.id, "text": mem.payload.get("data", "")} for mem in existing_mems]
-
-        search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
-        search_results_list = await asyncio.gather(*search_tasks)
-        for result_group in search_results_list:
-            retrieved_old_memory.extend(result_group)
+            for existing_mems in existing_memories_per_fact:
+                retrieved_old_memory.extend({"id": mem.id, "text": mem.payload.get("data", "")} for mem in existing_mems)
 
         unique_data = {}
         for item in retrieved_old_memory:
@@ -1528,8 +1760,9 @@ class AsyncMemory(MemoryBase):
                 retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
             )
             try:
-                response = await asyncio.to_thread(
-                    self.llm.generate_response,
+                response = await call_async(
+                    self.llm,
+                    "generate_response",
                     messages=[{"role": "user", "content": function_calling_prompt}],
                     response_format={"type": "json_object"},
                 )
@@ -1552,6 +1785,11 @@ class AsyncMemory(MemoryBase):
         returned_memories = []
         try:
             memory_tasks = []
+            prefetched = await self._prefetch_memories(
+                _memory_ids_to_prefetch(new_memories_with_actions.get("memory", []), temp_uuid_mapping, metadata)
+            )
+            await self._embed_action_texts(new_memories_with_actions.get("memory", []), new_message_embeddings)
+            writes = _ActionWrites()
             for resp in new_memories_with_actions.get("memory", []):
                 logger.info(resp)
                 try:
@@ -1566,6 +1804,7 @@ class AsyncMemory(MemoryBase):
                                 data=action_text,
                                 existing_embeddings=new_message_embeddings,
                                 metadata=deepcopy(metadata),
+                                writes=writes,
                             )
                         )
                         memory_tasks.append((task, resp, "ADD", None))
@@ -1576,11 +1815,19 @@ class AsyncMemory(MemoryBase):
                                 data=action_text,
                                 existing_embeddings=new_message_embeddings,
                                 metadata=deepcopy(metadata),
+                                existing_memory=prefetched.get(temp_uuid_mapping[resp["id"]]),
+                                writes=writes,
                             )
                         )
                         memory_tasks.append((task, resp, "UPDATE", temp_uuid_mapping[resp["id"]]))
                     elif event_type == "DELETE":
-                        task = asyncio.create_task(self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")]))
+                        task = asyncio.create_task(
+                            self._delete_memory(
+                                memory_id=temp_uuid_mapping[resp.get("id")],
+                                existing_memory=prefetched.get(temp_uuid_mapping[resp.get("id")]),
+                                writes=writes,
+                            )
+                        )
                         memory_tasks.append((task, resp, "DELETE", temp_uuid_mapping[resp.get("id")]))
                     elif event_type == "NONE":
                         # Even if content doesn't need updating, update session IDs if provided
@@ -1588,7 +1835,9 @@ class AsyncMemory(MemoryBase):
                         if memory_id and (metadata.get("agent_id") or metadata.get("run_id")):
                             # Create async task to update only the session identifiers
                             async def update_session_ids(mem_id, meta):
-                                existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=mem_id)
+                                existing_memory = prefetched.get(mem_id)
+                                if existing_memory is None:
+                                    existing_memory = await call_async(self.vector_store, "get", vector_id=mem_id)
                                 updated_metadata = deepcopy(existing_memory.payload)
                                 if meta.get("agent_id"):
                                     updated_metadata["agent_id"] = meta["agent_id"]
@@ -1596,8 +1845,9 @@ class AsyncMemory(MemoryBase):
                                     updated_metadata["run_id"] = meta["run_id"]
                                 updated_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-                                await asyncio.to_thread(
-                                    self.vector_store.update,
+                                await call_async(
+                                    self.vector_store,
+                                    "update",
                                     vector_id=mem_id,
                                     vector=None,  # Keep same embeddings
                                     payload=updated_metadata,
@@ -1629,6 +1879,8 @@ class AsyncMemory(MemoryBase):
                         returned_memories.append({"id": mem_id, "memory": resp.get("text"), "event": event_type})
                 except Exception as e:
                     logger.error(f"Error awaiting memory task (async): {e}")
+            failed = await self._apply_action_writes(writes)
+            returned_memories = [memory for memory in returned_memories if memory["id"] not in failed]
         except Exception as e:
             logger.error(f"Error in memory processing loop (async): {e}")
 
@@ -1662,37 +1914,11 @@ class AsyncMemory(MemoryBase):
             dict: Retrieved memory.
         """
         capture_event("mem0.get", self, {"memory_id": memory_id, "sync_type": "async"})
-        memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        memory = await call_async(self.vector_store, "get", vector_id=memory_id)
         if not memory:
             return None
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        result_item = MemoryItem(
-            id=memory.id,
-            memory=memory.payload.get("data", ""),
-            hash=memory.payload.get("hash"),
-            created_at=memory.payload.get("created_at"),
-            updated_at=memory.payload.get("updated_at"),
-        ).model_dump()
-
-        for key in promoted_payload_keys:
-            if key in memory.payload:
-                result_item[key] = memory.payload[key]
-
-        additional_metadata = {k: v for k, v in memory.payload.items() if k not in core_and_promoted_keys}
-        if additional_metadata:
-            result_item["metadata"] = additional_metadata
-
-        return result_item
+        return format_memory_item(memory)
 
     async def get_all(
         self,
@@ -1758,7 +1984,7 @@ class AsyncMemory(MemoryBase):
         return results_dict
 
     async def _get_all_from_vector_store(self, filters, limit):
-        memories_result = await asyncio.to_thread(self.vector_store.list, filters=filters, limit=limit)
+        memories_result = await call_async(self.vector_store, "list", filters=filters, limit=limit)
 
         # Handle different vector store return formats by inspecting first element
         if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0:
@@ -1773,36 +1999,7 @@ class AsyncMemory(MemoryBase):
         else:
             actual_memories = memories_result
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        formatted_memories = []
-        for mem in actual_memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload.get("data", ""),
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-            ).model_dump(exclude={"score"})
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
-
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
-
-            formatted_memories.append(memory_item_dict)
-
-        return formatted_memories
+        return [format_memory_item(mem, include_score=False) for mem in actual_memories]
 
     async def search(
         self,
@@ -1816,6 +2013,7 @@ class AsyncMemory(MemoryBase):
         threshold: Optional[float] = None,
         metadata_filters: Optional[Dict[str, Any]] = None,
         rerank: bool = True,
+        query_embedding: Optional[List[float]] = None,
     ):
         """
         Searches for memories based on a query
@@ -1827,6 +2025,7 @@ class AsyncMemory(MemoryBase):
             limit (int, optional): Limit the number of results. Defaults to 100.
             filters (dict, optional): Legacy filters to apply to the search. Defaults to None.
             threshold (float, optional): Minimum score for a memory to be included in the results. Defaults to None.
+            query_embedding (list, optional): Precomputed search embedding of `query`, skips embedding it again. Defaults to None.
             filters (dict, optional): Enhanced metadata filtering with operators:
                 - {"key": "value"} - exact match
                 - {"key": {"eq": "value"}} - equals
@@ -1850,37 +2049,28 @@ class AsyncMemory(MemoryBase):
                   Example for v1.1+: `{"results": [{"id": "...", "memory": "...", "score": 0.8, ...}]}`
         """
 
-        _, effective_filters = _build_filters_and_metadata(
-            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
-        )
-
-        if not any(key in effective_filters for key in ("user_id", "agent_id", "run_id")):
-            raise ValueError("at least one of 'user_id', 'agent_id', or 'run_id' must be specified ")
-
-        # Apply enhanced metadata filtering if advanced operators are detected
-        if filters and self._has_advanced_operators(filters):
-            processed_filters = self._process_metadata_filters(filters)
-            effective_filters.update(processed_filters)
-        elif filters:
-            # Simple filters, merge directly
-            effective_filters.update(filters)
+        # Filter resolution, operator expansion and telemetry hashing are compiled
+        # once per tenant/filter combination and reused on subsequent searches.
+        plan = self._search_plans.get(user_id=user_id, agent_id=agent_id, run_id=run_id, filters=filters)
+        effective_filters = plan.bind()
 
-        keys, encoded_ids = process_telemetry_filters(effective_filters)
         capture_event(
             "mem0.search",
             self,
             {
                 "limit": limit,
                 "version": self.api_version,
-                "keys": keys,
-                "encoded_ids": encoded_ids,
+                "keys": plan.telemetry_keys,
+                "encoded_ids": plan.encoded_ids,
                 "sync_type": "async",
                 "threshold": threshold,
-                "advanced_filters": bool(filters and self._has_advanced_operators(filters)),
+                "advanced_filters": plan.advanced_filters,
             },
         )
 
-        vector_store_task = asyncio.create_task(self._search_vector_store(query, effective_filters, limit, threshold))
+        vector_store_task = asyncio.create_task(
+            self._search_vector_store(query, effective_filters, limit, threshold, query_embedding)
+        )
 
         graph_task = None
         if self.enable_graph:
@@ -1921,64 +2111,7 @@ class AsyncMemory(MemoryBase):
         Returns:
             Dict of processed filters compatible with vector store
         """
-        processed_filters = {}
-
-        def process_condition(key: str, condition: Any) -> Dict[str, Any]:
-            if not isinstance(condition, dict):
-                # Simple equality: {"key": "value"}
-                if condition == "*":
-                    # Wildcard: match everything for this field (implementation depends on vector store)
-                    return {key: "*"}
-                return {key: condition}
-
-            result = {}
-            for operator, value in condition.items():
-                # Map platform operators to universal format that can be translated by each vector store
-                operator_map = {
-                    "eq": "eq", "ne": "ne", "gt": "gt", "gte": "gte",
-                    "lt": "lt", "lte": "lte", "in": "in", "nin": "nin",
-                    "contains": "contains", "icontains": "icontains"
-                }
-
-                if operator in operator_map:
-                    result[key] = {operator_map[operator]: value}
-                else:
-                    raise ValueError(f"Unsupported metadata filter operator: {operator}")
-            return result
-
-        for key, value in metadata_filters.items():
-            if key == "AND":
-                # Logical AND: combine multiple conditions
-                if not isinstance(value, list):
-                    raise ValueError("AND operator requires a list of conditions")
-                for condition in value:
-                    for sub_key, sub_value in condition.items():
-                        processed_filters.update(process_condition(sub_key, sub_value))
-            elif key == "OR":
-                # Logical OR: Pass through to vector store for implementation-specific handling
-                if not isinstance(value, list) or not value:
-                    raise ValueError("OR operator requires a non-empty list of conditions")
-                # Store OR conditions in a way that vector stores can interpret
-                processed_filters["$or"] = []
-                for condition in value:
-                    or_condition = {}
-                    for sub_key, sub_value in condition.items():
-                        or_condition.update(process_condition(sub_key, sub_value))
-                    processed_filters["$or"].append(or_condition)
-            elif key == "NOT":
-                # Logical NOT: Pass through to vector store for implementation-specific handling
-                if not isinstance(value, list) or not value:
-                    raise ValueError("NOT operator requires a non-empty list of conditions")
-                processed_filters["$not"] = []
-                for condition in value:
-                    not_condition = {}
-                    for sub_key, sub_value in condition.items():
-                        not_condition.update(process_condition(sub_key, sub_value))
-                    processed_filters["$not"].append(not_condition)
-            else:
-                processed_filters.update(process_condition(key, value))
-
-        return processed_filters
+        return process_metadata_filters(metadata_filters)
 
     def _has_advanced_operators(self, filters: Dict[str, Any]) -> bool:
         """
@@ -1990,63 +2123,24 @@ class AsyncMemory(MemoryBase):
         Returns:
             bool: True if advanced operators are detected
         """
-        if not isinstance(filters, dict):
-            return False
-
-        for key, value in filters.items():
-            # Check for platform-style logical operators
-            if key in ["AND", "OR", "NOT"]:
-                return True
-            # Check for comparison operators (without $ prefix for universal compatibility)
-            if isinstance(value, dict):
-                for op in value.keys():
-                    if op in ["eq", "ne", "gt", "gte", "lt", "lte", "in", "nin", "contains", "icontains"]:
-                        return True
-            # Check for wildcard values
-            if value == "*":
-                return True
-        return False
-
-    async def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
-        memories = await asyncio.to_thread(
-            self.vector_store.search, query=query, vectors=embeddings, limit=limit, filters=filters
+        return has_advanced_operators(filters)
+
+    async def _search_vector_store(
+        self, query, filters, limit, threshold: Optional[float] = None, query_embedding: Optional[List[float]] = None
+    ):
+        embeddings = query_embedding
+        if embeddings is None:
+            embeddings = await call_async(self.embedding_model, "embed", query, "search")
+        memories = await call_async(
+            self.vector_store, "search", query=query, vectors=embeddings, limit=limit, filters=filters
         )
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
+        return [
+            format_memory_item(mem, score=mem.score)
+            for mem in memories
+            if threshold is None or mem.score >= threshold
         ]
 
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        original_memories = []
-        for mem in memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload.get("data", ""),
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-                score=mem.score,
-            ).model_dump()
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
-
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
-
-            if threshold is None or mem.score >= threshold:
-                original_memories.append(memory_item_dict)
-
-        return original_memories
-
     async def update(self, memory_id, data):
         """
         Update a memory by ID asynchronously.
@@ -2064,7 +2158,7 @@ class AsyncMemory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "async"})
 
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+        embeddings = await call_async(self.embedding_model, "embed", data, "update")
         existing_embeddings = {data: embeddings}
 
         await self._update_memory(memory_id, data, existing_embeddings)
@@ -2105,7 +2199,7 @@ class AsyncMemory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"})
-        memories = await asyncio.to_thread(self.vector_store.list, filters=filters)
+        memories = await call_async(self.vector_store, "list", filters=filters)
 
         delete_tasks = []
         for memory in memories[0]:
@@ -2133,12 +2227,25 @@ class AsyncMemory(MemoryBase):
         capture_event("mem0.history", self, {"memory_id": memory_id, "sync_type": "async"})
         return await asyncio.to_thread(self.db.get_history, memory_id)
 
-    async def _create_memory(self, data, existing_embeddings, metadata=None):
+    async def _add_raw_messages(self, messages, metadata):
+        """Store messages verbatim, embedding and writing them in bounded batches."""
+        returned_memories = []
+        for chunk in chunked(iter_raw_messages(messages, metadata), RAW_INGEST_CHUNK_SIZE):
+            texts = [content for content, _ in chunk]
+            vectors = await call_async(self.embedding_model, "embed_batch", texts, "add")
+            ids = [str(uuid.uuid4()) for _ in chunk]
+            payloads, history_records, memories = build_raw_memories(chunk, ids)
+            await call_async(self.vector_store, "insert", vectors=vectors, ids=ids, payloads=payloads)
+            await asyncio.to_thread(self.db.add_history_batch, history_records)
+            returned_memories.extend(memories)
+        return returned_memories
+
+    async def _create_memory(self, data, existing_embeddings, metadata=None, writes=None):
         logger.debug(f"Creating memory with {data=}")
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, memory_action="add")
+            embeddings = await call_async(self.embedding_model, "embed", data, memory_action="add")
 
         memory_id = str(uuid.uuid4())
         metadata = metadata or {}
@@ -2146,8 +2253,12 @@ class AsyncMemory(MemoryBase):
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        await asyncio.to_thread(
-            self.vector_store.insert,
+        if writes is not None:
+            writes.inserts.append((memory_id, embeddings, metadata, _add_history_record(memory_id, data, metadata)))
+            return memory_id
+        await call_async(
+            self.vector_store,
+            "insert",
             vectors=[embeddings],
             ids=[memory_id],
             payloads=[metadata],
@@ -2200,7 +2311,7 @@ class AsyncMemory(MemoryBase):
                 response = await asyncio.to_thread(llm.invoke, input=parsed_messages)
                 procedural_memory = response.content
             else:
-                procedural_memory = await asyncio.to_thread(self.llm.generate_response, messages=parsed_messages)
+                procedural_memory = await call_async(self.llm, "generate_response", messages=parsed_messages)
                 procedural_memory = remove_code_blocks(procedural_memory)
         
         except Exception as e:
@@ -2211,7 +2322,7 @@ class AsyncMemory(MemoryBase):
             raise ValueError("Metadata cannot be done for procedural memory.")
 
         metadata["memory_type"] = MemoryType.PROCEDURAL.value
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, procedural_memory, memory_action="add")
+        embeddings = await call_async(self.embedding_model, "embed", procedural_memory, memory_action="add")
         memory_id = await self._create_memory(procedural_memory, {procedural_memory: embeddings}, metadata=metadata)
         capture_event("mem0._create_procedural_memory", self, {"memory_id": memory_id, "sync_type": "async"})
 
@@ -2219,14 +2330,80 @@ class AsyncMemory(MemoryBase):
 
         return result
 
-    async def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
-        logger.info(f"Updating memory with {data=}")
+    async def _prefetch_memories(self, memory_ids):
+        """
+        Fetch the memories an add() turn will update or delete in one round trip.
 
+        Returns a dict keyed by memory ID. On failure an empty dict is returned and each
+        action falls back to fetching its own record.
+        """
+        if not memory_ids:
+            return {}
         try:
-            existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
-        except Exception:
-            logger.error(f"Error getting memory with ID {memory_id} during update.")
-            raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
+            records = await call_async(self.vector_store, "get_many", memory_ids)
+        except Exception as e:
+            logger.warning(f"Bulk fetch of {len(memory_ids)} memories failed, falling back to single gets: {e}")
+            return {}
+        return {str(record.id): record for record in records}
+
+    async def _embed_action_texts(self, actions, existing_embeddings):
+        """
+        Embed the texts of new and updated memories in batches ahead of applying the actions.
+
+        Failures are logged and leave ``existing_embeddings`` untouched so each action embeds its own text.
+        """
+        for memory_action, texts in _action_texts_to_embed(actions, existing_embeddings).items():
+            if not texts:
+                continue
+            try:
+                embeddings = await call_async(self.embedding_model, "embed_batch", texts, memory_action)
+            except Exception as e:
+                logger.warning(f"Batch embedding of {len(texts)} memory texts failed, embedding one by one: {e}")
+                continue
+            existing_embeddings.update(zip(texts, embeddings))
+
+    async def _apply_action_writes(self, writes):
+        """
+        Send the writes queued by an add() turn with one vector store call per kind of write
+        and record their history in one batch.
+
+        When a grouped call fails, its writes are retried one at a time so that only the
+        failing memories are left out. Returns the IDs of the memories that were not written.
+        """
+        failed = set()
+        history = []
+        for entries, method, kwargs in writes.calls():
+            try:
+                await call_async(self.vector_store, method, **kwargs)
+                written = entries
+            except Exception as e:
+                logger.warning(f"Grouped {method} of {len(entries)} memories failed, writing them one by one: {e}")
+                written = []
+                for entry in entries:
+                    try:
+                        await call_async(self.vector_store, method, **_ActionWrites.call_kwargs(method, [entry]))
+                        written.append(entry)
+                    except Exception as e:
+                        logger.error(f"Error writing memory {entry[0]}: {e}")
+                        failed.add(entry[0])
+            history.extend(entry[3] for entry in written)
+        try:
+            await asyncio.to_thread(self.db.add_history_batch, history)
+        except Exception as e:
+            logger.error(f"Error recording history of {len(history)} memory changes: {e}")
+        return failed
+
+    async def _update_memory(
+        self, memory_id, data, existing_embeddings, metadata=None, existing_memory=None, writes=None
+    ):
+        logger.info(f"Updating memory with {data=}")
+
+        if existing_memory is None:
+            try:
+                existing_memory = await call_async(self.vector_store, "get", vector_id=memory_id)
+            except Exception:
+                logger.error(f"Error getting memory with ID {memory_id} during update.")
+                raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
 
         prev_value = existing_memory.payload.get("data")
 
@@ -2253,10 +2430,16 @@ class AsyncMemory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+            embeddings = await call_async(self.embedding_model, "embed", data, "update")
 
-        await asyncio.to_thread(
-            self.vector_store.update,
+        if writes is not None:
+            writes.updates.append(
+                (memory_id, embeddings, new_metadata, _update_history_record(memory_id, prev_value, data, new_metadata))
+            )
+            return memory_id
+        await call_async(
+            self.vector_store,
+            "update",
             vector_id=memory_id,
             vector=embeddings,
             payload=new_metadata,
@@ -2276,12 +2459,16 @@ class AsyncMemory(MemoryBase):
         )
         return memory_id
 
-    async def _delete_memory(self, memory_id):
+    async def _delete_memory(self, memory_id, existing_memory=None, writes=None):
         logger.info(f"Deleting memory with {memory_id=}")
-        existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        if existing_memory is None:
+            existing_memory = await call_async(self.vector_store, "get", vector_id=memory_id)
         prev_value = existing_memory.payload.get("data", "")
+        if writes is not None:
+            writes.deletes.append((memory_id, None, None, _delete_history_record(memory_id, existing_memory.payload)))
+            return memory_id
 
-        await asyncio.to_thread(self.vector_store.delete, vector_id=memory_id)
+        await call_async(self.vector_store, "delete", vector_id=memory_id)
         await asyncio.to_thread(
             self.db.add_history,
             memory_id,
@@ -2321,5 +2508,37 @@ class AsyncMemory(MemoryBase):
         )
         capture_event("mem0.reset", self, {"sync_type": "async"})
 
+    def close(self):
+        """
+        Release the synchronous resources held by this instance.
+
+        Stops the embedder's micro-batching scheduler and closes the history database
+        connection. Clients and pools opened by the native async vector store methods
+        belong to an event loop and are released by :meth:`aclose`, which should be
+        preferred from async code.
+        """
+        self.embedding_model.close()
+        if self.db is not None:
+            self.db.close()
+
+    async def aclose(self):
+        """
+        Release all resources held by this instance, including the async clients and
+        pools of the vector stores, the embedder and the LLM. The instance must not be used
+        after it is closed.
+        """
+        for provider in (self.vector_store, self._telemetry_vector_store, self.embedding_model, self.llm):
+            try:
+                await provider.async_close()
+            except Exception as e:
+                logger.warning(f"Error closing async client of {type(provider).__name__}: {e}")
+        await asyncio.to_thread(self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
     async def chat(self, query):
         raise NotImplementedError("Chat function not implemented yet.")
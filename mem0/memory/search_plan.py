@@ -0,0 +1,217 @@
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from mem0.memory.utils import process_telemetry_filters
+
+# Operators understood by the vector store filter translators
+FILTER_OPERATORS = frozenset(["eq", "ne", "gt", "gte", "lt", "lte", "in", "nin", "contains", "icontains"])
+LOGICAL_OPERATORS = frozenset(["AND", "OR", "NOT"])
+SESSION_ID_KEYS = ("user_id", "agent_id", "run_id")
+
+
+def has_advanced_operators(filters: Dict[str, Any]) -> bool:
+    """
+    Check if filters contain advanced operators that need special processing.
+
+    Args:
+        filters: Dictionary of filters to check
+
+    Returns:
+        bool: True if advanced operators are detected
+    """
+    if not isinstance(filters, dict):
+        return False
+
+    for key, value in filters.items():
+        # Check for platform-style logical operators
+        if key in LOGICAL_OPERATORS:
+            return True
+        # Check for comparison operators (without $ prefix for universal compatibility)
+        if isinstance(value, dict):
+            for op in value.keys():
+                if op in FILTER_OPERATORS:
+                    return True
+        # Check for wildcard values
+        if value == "*":
+            return True
+    return False
+
+
+def _process_condition(key: str, condition: Any) -> Dict[str, Any]:
+    if not isinstance(condition, dict):
+        # Simple equality: {"key": "value"}. A "*" wildcard is passed through and
+        # interpreted by each vector store.
+        return {key: condition}
+
+    result = {}
+    for operator, value in condition.items():
+        if operator not in FILTER_OPERATORS:
+            raise ValueError(f"Unsupported metadata filter operator: {operator}")
+        result[key] = {operator: value}
+    return result
+
+
+def process_metadata_filters(metadata_filters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Process enhanced metadata filters and convert them to vector store compatible format.
+
+    Args:
+        metadata_filters: Enhanced metadata filters with operators
+
+    Returns:
+        Dict of processed filters compatible with vector store
+    """
+    processed_filters = {}
+
+    for key, value in metadata_filters.items():
+        if key == "AND":
+            # Logical AND: combine multiple conditions
+            if not isinstance(value, list):
+                raise ValueError("AND operator requires a list of conditions")
+            for condition in value:
+                for sub_key, sub_value in condition.items():
+                    processed_filters.update(_process_condition(sub_key, sub_value))
+        elif key == "OR":
+            # Logical OR: Pass through to vector store for implementation-specific handling
+            if not isinstance(value, list) or not value:
+                raise ValueError("OR operator requires a non-empty list of conditions")
+            processed_filters["$or"] = []
+            for condition in value:
+                or_condition = {}
+                for sub_key, sub_value in condition.items():
+                    or_condition.update(_process_condition(sub_key, sub_value))
+                processed_filters["$or"].append(or_condition)
+        elif key == "NOT":
+            # Logical NOT: Pass through to vector store for implementation-specific handling
+            if not isinstance(value, list) or not value:
+                raise ValueError("NOT operator requires a non-empty list of conditions")
+            processed_filters["$not"] = []
+            for condition in value:
+                not_condition = {}
+                for sub_key, sub_value in condition.items():
+                    not_condition.update(_process_condition(sub_key, sub_value))
+                processed_filters["$not"].append(not_condition)
+        else:
+            processed_filters.update(_process_condition(key, value))
+
+    return processed_filters
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a filter value into a hashable cache key, raising TypeError if impossible."""
+    if isinstance(value, dict):
+        return ("__dict__",) + tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return ("__list__",) + tuple(_freeze(v) for v in value)
+    hash(value)
+    return (type(value).__name__, value)
+
+
+class SearchPlan:
+    """
+    A compiled, immutable description of how to query the vector store for one
+    combination of session identifiers and caller supplied filters.
+
+    Compiling a plan resolves actor filtering, expands advanced operators and
+    pre-computes the telemetry fields, so repeated searches from the same tenant
+    only pay for copying the filters. Plans own a deep copy of the caller's
+    filters, so list or dict values are never shared with the caller or with
+    the filters handed out by `bind`.
+    """
+
+    __slots__ = ("filters", "telemetry_keys", "encoded_ids", "advanced_filters")
+
+    def __init__(
+        self,
+        filters: Dict[str, Any],
+        telemetry_keys: List[str],
+        encoded_ids: Dict[str, str],
+        advanced_filters: bool,
+    ):
+        self.filters = filters
+        self.telemetry_keys = telemetry_keys
+        self.encoded_ids = encoded_ids
+        self.advanced_filters = advanced_filters
+
+    @classmethod
+    def compile(
+        cls,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> "SearchPlan":
+        # Imported lazily to avoid a circular import with mem0.memory.main
+        from mem0.memory.main import _build_filters_and_metadata
+
+        filters = deepcopy(filters)
+        _, effective_filters = _build_filters_and_metadata(
+            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
+        )
+
+        if not any(key in effective_filters for key in SESSION_ID_KEYS):
+            raise ValueError("At least one of 'user_id', 'agent_id', or 'run_id' must be specified.")
+
+        advanced_filters = bool(filters) and has_advanced_operators(filters)
+        if advanced_filters:
+            effective_filters.update(process_metadata_filters(filters))
+        elif filters:
+            # Simple filters, merge directly
+            effective_filters.update(filters)
+
+        keys, encoded_ids = process_telemetry_filters(effective_filters)
+        return cls(effective_filters, keys, encoded_ids, advanced_filters)
+
+    def bind(self) -> Dict[str, Any]:
+        """Return a filters dict that callers and vector stores are free to mutate."""
+        return deepcopy(self.filters)
+
+
+class SearchPlanCache:
+    """Thread-safe LRU cache of :class:`SearchPlan` objects keyed by tenant and filter shape."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._plans: "OrderedDict[Hashable, SearchPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> SearchPlan:
+        try:
+            key: Optional[Tuple] = (user_id, agent_id, run_id, _freeze(filters) if filters else None)
+        except TypeError:
+            # Unhashable filter values (e.g. sets of dicts); compile without caching
+            key = None
+
+        if key is not None and self.maxsize > 0:
+            with self._lock:
+                plan = self._plans.get(key)
+                if plan is not None:
+                    self._plans.move_to_end(key)
+                    return plan
+
+        plan = SearchPlan.compile(user_id=user_id, agent_id=agent_id, run_id=run_id, filters=filters)
+
+        if key is not None and self.maxsize > 0:
+            with self._lock:
+                self._plans[key] = plan
+                self._plans.move_to_end(key)
+                while len(self._plans) > self.maxsize:
+                    self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
@@ -8,13 +8,33 @@ logger = logging.getLogger(__name__)
 
 
 class SQLiteManager:
-    def __init__(self, db_path: str = ":memory:"):
+    def __init__(self, db_path: str = ":memory:", timeout: float = 30.0):
+        """
+        Args:
+            db_path: Path of the history database, or ":memory:".
+            timeout: Seconds to wait for a lock held by another connection (e.g. another
+                server worker process sharing the same file) before failing.
+        """
         self.db_path = db_path
-        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False, timeout=timeout)
         self._lock = threading.Lock()
+        if self.db_path != ":memory:":
+            self._enable_wal()
         self._migrate_history_table()
         self._create_history_table()
 
+    def _enable_wal(self) -> None:
+        """
+        Use write-ahead logging so several processes can share the file: readers no longer
+        block the writer, and writers wait for each other up to the busy timeout.
+        """
+        try:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.DatabaseError as e:
+            # e.g. filesystems without shared-memory support; keep the default rollback journal
+            logger.warning(f"Could not enable WAL mode for history database {self.db_path}: {e}")
+
     def _migrate_history_table(self) -> None:
         """
         If a pre-existing history table had the old group-chat columns,
@@ -23,8 +43,9 @@ class SQLiteManager:
         """
         with self._lock:
             try:
-                # Start a transaction
-                self.connection.execute("BEGIN")
+                # Start a transaction; IMMEDIATE takes the write lock before reading the schema so
+                # workers starting at the same time migrate one after another
+                self.connection.execute("BEGIN IMMEDIATE")
                 cur = self.connection.cursor()
 
                 cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='history'")
@@ -166,6 +187,49 @@ class SQLiteManager:
                 logger.error(f"Failed to add history record: {e}")
                 raise
 
+    def add_history_batch(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Insert many history records in a single transaction.
+
+        Each record is a dict with the same fields accepted by :meth:`add_history`;
+        ``memory_id`` and ``event`` are required.
+        """
+        if not records:
+            return
+        rows = [
+            (
+                str(uuid.uuid4()),
+                record["memory_id"],
+                record.get("old_memory"),
+                record.get("new_memory"),
+                record["event"],
+                record.get("created_at"),
+                record.get("updated_at"),
+                record.get("is_deleted", 0),
+                record.get("actor_id"),
+                record.get("role"),
+            )
+            for record in records
+        ]
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(
+                    """
+                    INSERT INTO history (
+                        id, memory_id, old_memory, new_memory, event,
+                        created_at, updated_at, is_deleted, actor_id, role
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to add history records: {e}")
+                raise
+
     def get_history(self, memory_id: str) -> List[Dict[str, Any]]:
         with self._lock:
             cur = self.connection.execute(
@@ -1,5 +1,8 @@
+import asyncio
 import hashlib
+import inspect
 import re
+import threading
 
 from mem0.configs.prompts import (
     FACT_RETRIEVAL_PROMPT,
@@ -206,3 +209,101 @@ def sanitize_relationship_for_cypher(relationship) -> str:
 
     return re.sub(r"_+", "_", sanitized).strip("_")
 
+
+
+PROMOTED_PAYLOAD_KEYS = ("user_id", "agent_id", "run_id", "actor_id", "role")
+CORE_AND_PROMOTED_KEYS = frozenset({"data", "hash", "created_at", "updated_at", "id", *PROMOTED_PAYLOAD_KEYS})
+
+
+def format_memory_item(mem, score=None, include_score: bool = True) -> dict:
+    """
+    Build the public dict representation of a vector store record.
+
+    Produces the same shape as ``MemoryItem(...).model_dump()`` without paying for
+    pydantic validation on every result row.
+
+    Args:
+        mem: Vector store record exposing ``id`` and ``payload``.
+        score (float, optional): Similarity score to report for search results.
+        include_score (bool): Whether to include the ``score`` key (excluded for listings).
+
+    Returns:
+        dict: Memory item with promoted session keys and any extra payload under ``metadata``.
+    """
+    payload = mem.payload or {}
+    item = {
+        "id": mem.id,
+        "memory": payload.get("data", ""),
+        "hash": payload.get("hash"),
+        "metadata": None,
+    }
+    if include_score:
+        item["score"] = score
+    item["created_at"] = payload.get("created_at")
+    item["updated_at"] = payload.get("updated_at")
+
+    for key in PROMOTED_PAYLOAD_KEYS:
+        if key in payload:
+            item[key] = payload[key]
+
+    additional_metadata = {k: v for k, v in payload.items() if k not in CORE_AND_PROMOTED_KEYS}
+    if additional_metadata:
+        item["metadata"] = additional_metadata
+
+    return item
+
+
+async def call_async(provider, method: str, *args, **kwargs):
+    """
+    Call a provider method without blocking the event loop.
+
+    Uses the provider's native ``async_<method>`` coroutine when it defines one and
+    falls back to running the synchronous ``<method>`` in a worker thread otherwise.
+    """
+    native = getattr(provider, f"async_{method}", None)
+    if asyncio.iscoroutinefunction(native):
+        return await native(*args, **kwargs)
+    return await asyncio.to_thread(getattr(provider, method), *args, **kwargs)
+
+
+class LoopLocal:
+    """
+    A value created lazily for each running event loop.
+
+    Async clients, locks and connection pools belong to the event loop they were first
+    used on and stop working once that loop is closed. ``asyncio.run`` starts a new loop on
+    every call, so a client cached on the first call cannot serve the next one. ``get``
+    returns the value for the running loop, creating it with ``factory`` on first use;
+    values of loops that have since been closed are dropped.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def get(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            value = self._values.get(loop)
+            if value is None:
+                for closed in [other for other in self._values if other.is_closed()]:
+                    del self._values[closed]
+                value = self._values[loop] = self._factory()
+        return value
+
+    async def aclose(self, close=None):
+        """
+        Close the running loop's value, if it was created, with ``close(value)`` (its
+        ``close()`` method by default) and forget the values of every loop; those of other
+        loops cannot be closed from this one.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            value = self._values.pop(loop, None)
+            self._values.clear()
+        if value is None:
+            return
+        result = close(value) if close is not None else value.close()
+        if inspect.isawaitable(result):
+            await result
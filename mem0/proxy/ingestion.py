@@ -0,0 +1,267 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class _Turn:
+    __slots__ = ("key", "messages", "metadata", "filters", "enqueued_at")
+
+    def __init__(self, key, messages, metadata, filters):
+        self.key = key
+        self.messages = list(messages)
+        self.metadata = metadata
+        self.filters = filters
+        self.enqueued_at = time.monotonic()
+
+
+def merge_messages(previous: List[dict], current: List[dict]) -> List[dict]:
+    """
+    Combine two consecutive turns of the same conversation into one message list.
+
+    Chat completion requests resend the conversation so far, so the newer turn usually
+    starts with (a suffix of) the older one. The longest suffix of ``previous`` that is a
+    prefix of ``current`` is only kept once; unrelated turns are simply concatenated.
+    """
+    for overlap in range(min(len(previous), len(current)), 0, -1):
+        if previous[-overlap:] == current[:overlap]:
+            return previous + current[overlap:]
+    return previous + current
+
+
+def _close_at_exit(ref) -> None:
+    ingestion = ref()
+    if ingestion is not None:
+        ingestion.close()
+
+
+class IngestionQueue:
+    """
+    Bounded background worker pool that writes chat turns to memory.
+
+    Each turn is routed to a worker by its ``(user_id, agent_id, run_id)`` scope, so turns
+    from one user are added in the order they arrived while different users proceed in
+    parallel. A worker waits up to ``merge_window_ms`` after the first queued turn and folds
+    consecutive turns of the same scope into a single ``add()`` call. When the queue is full,
+    ``submit`` blocks for up to ``enqueue_timeout`` seconds (not at all with ``block=False``,
+    as used from event loops) and then drops the turn, counting it in ``stats()["dropped"]``. Queued turns are flushed by ``close()``, which also runs at
+    interpreter exit.
+    """
+
+    def __init__(
+        self,
+        mem0_client,
+        num_workers: int = 4,
+        max_queue_size: int = 1000,
+        merge_window_ms: float = 200.0,
+        max_merged_turns: int = 32,
+        enqueue_timeout: Optional[float] = 1.0,
+        shutdown_timeout: Optional[float] = 30.0,
+    ):
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        self.mem0_client = mem0_client
+        self.num_workers = num_workers
+        self.merge_window = max(0.0, merge_window_ms) / 1000.0
+        self.max_merged_turns = max(1, max_merged_turns)
+        self.enqueue_timeout = enqueue_timeout
+        self.shutdown_timeout = shutdown_timeout
+
+        # The queue bound is shared across workers
+        per_worker = max(1, max_queue_size // num_workers)
+        self._queues: List["queue.Queue"] = [queue.Queue(maxsize=per_worker) for _ in range(num_workers)]
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._closed = False
+        self._pending = 0
+
+        self._submitted = 0
+        self._dropped = 0
+        self._merged = 0
+        self._add_calls = 0
+        self._failed = 0
+        self._max_depth = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+
+        atexit.register(_close_at_exit, weakref.ref(self))
+
+    def submit(
+        self,
+        messages: List[dict],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        metadata: Optional[dict] = None,
+        filters: Optional[dict] = None,
+        block: bool = True,
+    ) -> bool:
+        """
+        Queue a turn for ingestion. Returns False if it was dropped because the queue stayed full.
+
+        With ``block=False`` a full queue drops the turn immediately instead of waiting up to
+        ``enqueue_timeout``, so the call never blocks an event loop.
+        """
+        turn = _Turn((user_id, agent_id, run_id), messages, metadata, filters)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Ingestion queue is closed")
+            if not self._workers:
+                self._start_workers()
+            self._pending += 1
+            self._submitted += 1
+            self._max_depth = max(self._max_depth, self._pending)
+
+        try:
+            self._queues[hash(turn.key) % self.num_workers].put(turn, block=block, timeout=self.enqueue_timeout)
+        except queue.Full:
+            logger.warning(
+                f"Memory ingestion queue is full, dropping turn for user_id={user_id} agent_id={agent_id} run_id={run_id}"
+            )
+            with self._lock:
+                self._dropped += 1
+                self._finish(1)
+            return False
+        return True
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued turn has been written. Returns False if ``timeout`` expired first."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop accepting turns, flush everything already queued and stop the workers.
+
+        Returns False if the queue could not be drained within ``timeout`` (defaults to
+        ``shutdown_timeout``); the remaining turns are then lost with a warning.
+        """
+        timeout = self.shutdown_timeout if timeout is None else timeout
+        with self._lock:
+            if self._closed:
+                return True
+            self._closed = True
+            workers = list(self._workers)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for q in self._queues[: len(workers)]:
+            try:
+                q.put(_STOP, timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                pass
+        for worker in workers:
+            worker.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+        with self._lock:
+            pending = self._pending
+        if pending:
+            logger.warning(f"Memory ingestion queue closed with {pending} turn(s) still pending")
+        return pending == 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and gauges describing the queue, suitable for exporting as metrics."""
+        with self._lock:
+            return {
+                "queue_depth": sum(q.qsize() for q in self._queues),
+                "pending": self._pending,
+                "max_pending": self._max_depth,
+                "submitted": self._submitted,
+                "dropped": self._dropped,
+                "merged": self._merged,
+                "add_calls": self._add_calls,
+                "failed": self._failed,
+                "last_lag_seconds": self._last_lag,
+                "max_lag_seconds": self._max_lag,
+                "workers": len(self._workers),
+            }
+
+    def _start_workers(self) -> None:
+        for i, q in enumerate(self._queues):
+            worker = threading.Thread(target=self._run, args=(q,), name=f"mem0-proxy-ingest-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _finish(self, count: int) -> None:
+        # Caller holds self._lock
+        self._pending -= count
+        if self._pending == 0:
+            self._idle.notify_all()
+
+    def _run(self, q: "queue.Queue") -> None:
+        while True:
+            item = q.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            # Closing: flush what is queued without waiting for more turns
+            deadline = item.enqueued_at + (0.0 if self._closed else self.merge_window)
+            stopping = False
+            while len(batch) < self.max_merged_turns:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = q.get(timeout=remaining) if remaining > 0 else q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            for turns in self._group(batch):
+                self._ingest(turns)
+            if stopping:
+                return
+
+    @staticmethod
+    def _group(batch: List[_Turn]) -> List[List[_Turn]]:
+        """Group turns so that consecutive turns of one scope with equal metadata and filters share an add()."""
+        groups: List[List[_Turn]] = []
+        last_for_key: Dict[Tuple, List[_Turn]] = {}
+        for turn in batch:
+            group = last_for_key.get(turn.key)
+            if group is not None and group[-1].metadata == turn.metadata and group[-1].filters == turn.filters:
+                group.append(turn)
+            else:
+                group = [turn]
+                groups.append(group)
+                last_for_key[turn.key] = group
+        return groups
+
+    def _ingest(self, turns: List[_Turn]) -> None:
+        messages = turns[0].messages
+        for turn in turns[1:]:
+            messages = merge_messages(messages, turn.messages)
+        user_id, agent_id, run_id = turns[0].key
+
+        lag = time.monotonic() - turns[0].enqueued_at
+        try:
+            logger.debug(f"Adding {len(turns)} turn(s) to memory for user_id={user_id}")
+            self.mem0_client.add(
+                messages=messages,
+                user_id=user_id,
+                agent_id=agent_id,
+                run_id=run_id,
+                metadata=turns[0].metadata,
+                filters=turns[0].filters,
+            )
+            failed = 0
+        except Exception:
+            logger.exception(f"Failed to add {len(turns)} turn(s) to memory for user_id={user_id}")
+            failed = 1
+
+        with self._lock:
+            self._add_calls += 1
+            self._failed += failed
+            self._merged += len(turns) - 1
+            self._last_lag = lag
+            self._max_lag = max(self._max_lag, lag)
+            self._finish(len(turns))
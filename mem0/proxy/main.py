@@ -1,7 +1,9 @@
+import asyncio
 import logging
 import subprocess
 import sys
 import threading
+from collections import OrderedDict
 from typing import List, Optional, Union
 
 import httpx
@@ -21,9 +23,13 @@ except ImportError:
 from mem0 import Memory, MemoryClient
 from mem0.configs.prompts import MEMORY_ANSWER_PROMPT
 from mem0.memory.telemetry import capture_client_event, capture_event
+from mem0.proxy.ingestion import IngestionQueue
 
 logger = logging.getLogger(__name__)
 
+# Number of trailing messages used as the memory search query
+SEARCH_QUERY_MESSAGES = 6
+
 
 class Mem0:
     def __init__(
@@ -31,23 +37,69 @@ class Mem0:
         config: Optional[dict] = None,
         api_key: Optional[str] = None,
         host: Optional[str] = None,
+        ingestion: Optional[dict] = None,
     ):
+        """
+        Args:
+            ingestion: Keyword arguments for the background IngestionQueue that writes
+                conversations to memory (e.g. ``num_workers``, ``max_queue_size``,
+                ``merge_window_ms``).
+        """
         if api_key:
             self.mem0_client = MemoryClient(api_key, host)
         else:
             self.mem0_client = Memory.from_config(config) if config else Memory()
 
-        self.chat = Chat(self.mem0_client)
+        self.ingestion = IngestionQueue(self.mem0_client, **(ingestion or {}))
+        self.chat = Chat(self.mem0_client, self.ingestion)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush queued conversation turns to memory and stop the ingestion workers."""
+        return self.ingestion.close(timeout)
 
 
 class Chat:
-    def __init__(self, mem0_client):
-        self.completions = Completions(mem0_client)
+    def __init__(self, mem0_client, ingestion: Optional[IngestionQueue] = None):
+        self.completions = Completions(mem0_client, ingestion)
+
+
+class QueryEmbeddingCache:
+    """
+    Small LRU of search-query embeddings.
+
+    The proxy searches with the last few messages of the conversation, so a retried or
+    regenerated turn produces exactly the same query; its embedding is reused instead of
+    calling the embedding model again.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query: str, embed) -> List[float]:
+        with self._lock:
+            if query in self._entries:
+                self._entries.move_to_end(query)
+                self.hits += 1
+                return self._entries[query]
+            self.misses += 1
+        embedding = embed(query)
+        with self._lock:
+            self._entries[query] = embedding
+            self._entries.move_to_end(query)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return embedding
 
 
 class Completions:
-    def __init__(self, mem0_client):
+    def __init__(self, mem0_client, ingestion: Optional[IngestionQueue] = None):
         self.mem0_client = mem0_client
+        self.ingestion = ingestion or IngestionQueue(mem0_client)
+        self.query_embeddings = QueryEmbeddingCache()
 
     def create(
         self,
@@ -105,7 +157,10 @@ class Completions:
             self._async_add_to_memory(messages, user_id, agent_id, run_id, metadata, filters)
             relevant_memories = self._fetch_relevant_memories(messages, user_id, agent_id, run_id, filters, limit)
             logger.debug(f"Retrieved {len(relevant_memories)} relevant memories")
-            prepared_messages[-1]["content"] = self._format_query_with_memories(messages, relevant_memories)
+            prepared_messages[-1] = {
+                **prepared_messages[-1],
+                "content": self._format_query_with_memories(messages, relevant_memories),
+            }
 
         response = litellm.completion(
             model=model,
@@ -144,38 +199,167 @@ class Completions:
             capture_client_event("mem0.chat.create", self.mem0_client)
         return response
 
+    async def acreate(
+        self,
+        model: str,
+        messages: List = [],
+        # Mem0 arguments
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        metadata: Optional[dict] = None,
+        filters: Optional[dict] = None,
+        limit: Optional[int] = 10,
+        search_timeout: Optional[float] = None,
+        # LLM arguments
+        timeout: Optional[Union[float, str, httpx.Timeout]] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        n: Optional[int] = None,
+        stream: Optional[bool] = None,
+        stream_options: Optional[dict] = None,
+        stop=None,
+        max_tokens: Optional[int] = None,
+        presence_penalty: Optional[float] = None,
+        frequency_penalty: Optional[float] = None,
+        logit_bias: Optional[dict] = None,
+        user: Optional[str] = None,
+        # openai v1.0+ new params
+        response_format: Optional[dict] = None,
+        seed: Optional[int] = None,
+        tools: Optional[List] = None,
+        tool_choice: Optional[Union[str, dict]] = None,
+        logprobs: Optional[bool] = None,
+        top_logprobs: Optional[int] = None,
+        parallel_tool_calls: Optional[bool] = None,
+        deployment_id=None,
+        extra_headers: Optional[dict] = None,
+        # soon to be deprecated params by OpenAI
+        functions: Optional[List] = None,
+        function_call: Optional[str] = None,
+        # set api_base, api_version, api_key
+        base_url: Optional[str] = None,
+        api_version: Optional[str] = None,
+        api_key: Optional[str] = None,
+        model_list: Optional[list] = None,  # pass in a list of api_base,keys, etc.
+    ):
+        """
+        Async variant of `create`.
+
+        The memory search runs in a worker thread while the prompt is assembled and the
+        conversation is queued for ingestion. With `search_timeout` set, a search that takes
+        longer than that many seconds is abandoned and the completion proceeds without
+        memory context. With `stream=True` the litellm async stream is returned as is.
+        """
+        if not any([user_id, agent_id, run_id]):
+            raise ValueError("One of user_id, agent_id, run_id must be provided")
+
+        if not litellm.supports_function_calling(model):
+            raise ValueError(
+                f"Model '{model}' does not support function calling. Please use a model that supports function calling."
+            )
+
+        search = None
+        if messages and messages[-1]["role"] == "user":
+            search = asyncio.ensure_future(
+                asyncio.to_thread(self._fetch_relevant_memories, messages, user_id, agent_id, run_id, filters, limit)
+            )
+            # Never wait for queue space on the event loop; a full queue drops the turn and counts it
+            self._async_add_to_memory(messages, user_id, agent_id, run_id, metadata, filters, block=False)
+
+        prepared_messages = self._prepare_messages(messages)
+        if search is not None:
+            relevant_memories = await self._fetch_relevant_memories_within(search, search_timeout)
+            if relevant_memories is not None:
+                logger.debug(f"Retrieved {len(relevant_memories)} relevant memories")
+                prepared_messages[-1] = {
+                    **prepared_messages[-1],
+                    "content": self._format_query_with_memories(messages, relevant_memories),
+                }
+
+        response = await litellm.acompletion(
+            model=model,
+            messages=prepared_messages,
+            temperature=temperature,
+            top_p=top_p,
+            n=n,
+            timeout=timeout,
+            stream=stream,
+            stream_options=stream_options,
+            stop=stop,
+            max_tokens=max_tokens,
+            presence_penalty=presence_penalty,
+            frequency_penalty=frequency_penalty,
+            logit_bias=logit_bias,
+            user=user,
+            response_format=response_format,
+            seed=seed,
+            tools=tools,
+            tool_choice=tool_choice,
+            logprobs=logprobs,
+            top_logprobs=top_logprobs,
+            parallel_tool_calls=parallel_tool_calls,
+            deployment_id=deployment_id,
+            extra_headers=extra_headers,
+            functions=functions,
+            function_call=function_call,
+            base_url=base_url,
+            api_version=api_version,
+            api_key=api_key,
+            model_list=model_list,
+        )
+        if isinstance(self.mem0_client, Memory):
+            capture_event("mem0.chat.acreate", self.mem0_client)
+        else:
+            capture_client_event("mem0.chat.acreate", self.mem0_client)
+        return response
+
     def _prepare_messages(self, messages: List[dict]) -> List[dict]:
         if not messages or messages[0]["role"] != "system":
             return [{"role": "system", "content": MEMORY_ANSWER_PROMPT}] + messages
-        return messages
-
-    def _async_add_to_memory(self, messages, user_id, agent_id, run_id, metadata, filters):
-        def add_task():
-            logger.debug("Adding to memory asynchronously")
-            self.mem0_client.add(
-                messages=messages,
-                user_id=user_id,
-                agent_id=agent_id,
-                run_id=run_id,
-                metadata=metadata,
-                filters=filters,
-            )
+        # Copy so the memory context is never written into the caller's (or the ingestion queue's) messages
+        return list(messages)
 
-        threading.Thread(target=add_task, daemon=True).start()
+    def _async_add_to_memory(self, messages, user_id, agent_id, run_id, metadata, filters, block=True):
+        logger.debug("Queueing conversation for memory ingestion")
+        self.ingestion.submit(
+            messages,
+            user_id=user_id,
+            agent_id=agent_id,
+            run_id=run_id,
+            metadata=metadata,
+            filters=filters,
+            block=block,
+        )
 
     def _fetch_relevant_memories(self, messages, user_id, agent_id, run_id, filters, limit):
         # Currently, only pass the last 6 messages to the search API to prevent long query
-        message_input = [f"{message['role']}: {message['content']}" for message in messages][-6:]
+        message_input = [f"{message['role']}: {message['content']}" for message in messages][-SEARCH_QUERY_MESSAGES:]
         # TODO: Make it better by summarizing the past conversation
+        query = "\n".join(message_input)
+        search_kwargs = {}
+        if isinstance(self.mem0_client, Memory):
+            # The hosted API embeds server-side; locally an unchanged tail reuses the previous embedding.
+            # Cache misses go through Memory.embed_query so they count against the embedder limit.
+            search_kwargs["query_embedding"] = self.query_embeddings.get(query, self.mem0_client.embed_query)
         return self.mem0_client.search(
-            query="\n".join(message_input),
+            query=query,
             user_id=user_id,
             agent_id=agent_id,
             run_id=run_id,
             filters=filters,
             limit=limit,
+            **search_kwargs,
         )
 
+    async def _fetch_relevant_memories_within(self, search: "asyncio.Future", search_timeout: Optional[float]):
+        """Wait for a memory search started by `acreate`, giving up after `search_timeout` seconds."""
+        try:
+            return await asyncio.wait_for(search, search_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Memory search exceeded {search_timeout}s, answering without memories")
+            return None
+
     def _format_query_with_memories(self, messages, relevant_memories):
         # Check if self.mem0_client is an instance of Memory or MemoryClient
 
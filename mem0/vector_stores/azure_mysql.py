@@ -1,8 +1,15 @@
 import json
 import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from pydantic import BaseModel
 
 try:
@@ -32,6 +39,132 @@ class OutputData(BaseModel):
     payload: Optional[dict]
 
 
+def _decode_vector(raw) -> Optional[np.ndarray]:
+    """Decode a stored vector: packed float32 (BLOB or native VECTOR column) or legacy JSON text."""
+    if raw is None:
+        return None
+    if isinstance(raw, (bytes, bytearray, memoryview)):
+        return np.frombuffer(raw, dtype="<f4")
+    return np.asarray(json.loads(raw), dtype=np.float32)
+
+
+def _decode_payload(raw) -> Dict:
+    return json.loads(raw) if isinstance(raw, (str, bytes)) else (raw or {})
+
+
+class _TenantVectors:
+    """Row-normalised float32 matrix of one filter scope, ready for a single matrix multiply."""
+
+    __slots__ = ("filters", "ids", "id_set", "matrix", "payloads", "loaded_at", "path")
+
+    def __init__(self, filters: Dict, rows: List[Dict], cache_dir: Optional[str] = None):
+        self.filters = filters
+        self.ids = []
+        self.payloads = []
+        vectors = []
+        for row in rows:
+            vec = _decode_vector(row["vector"])
+            if vec is None or not vec.size:
+                continue
+            self.ids.append(row["id"])
+            self.payloads.append(_decode_payload(row["payload"]))
+            vectors.append(vec)
+        self.id_set = set(self.ids)
+        self.loaded_at = time.monotonic()
+        self.path = None
+
+        matrix = np.vstack(vectors).astype(np.float32, copy=False) if vectors else np.empty((0, 0), dtype=np.float32)
+        if matrix.size:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix = matrix / norms
+        if cache_dir and matrix.size:
+            # Keep large tenants off the heap; pages are loaded by the OS on demand
+            fd, self.path = tempfile.mkstemp(prefix="mem0-vectors-", suffix=".npy", dir=cache_dir)
+            os.close(fd)
+            mapped = np.lib.format.open_memmap(self.path, mode="w+", dtype=np.float32, shape=matrix.shape)
+            mapped[:] = matrix
+            mapped.flush()
+            matrix = np.load(self.path, mmap_mode="r")
+        self.matrix = matrix
+
+    def matches(self, payload: Optional[Dict]) -> bool:
+        return payload is not None and all(payload.get(k) == v for k, v in self.filters.items())
+
+    def release(self):
+        if self.path:
+            # Searches holding a reference keep their mapping valid after the file is unlinked
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self.path = None
+
+
+class _VectorCache:
+    """
+    LRU cache of per-tenant vector matrices keyed by the search filters.
+
+    Writes through this process drop the affected entries. Other workers keep their own
+    caches, so the TTL bounds how long writes made by other processes can go unnoticed.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float], cache_dir: Optional[str] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.generation = 0
+        self._entries: "OrderedDict[str, _TenantVectors]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(filters: Optional[Dict]) -> str:
+        return json.dumps(filters or {}, sort_keys=True, default=str)
+
+    def get(self, key: str) -> Optional[_TenantVectors]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.monotonic() - entry.loaded_at > self.ttl:
+                self._entries.pop(key).release()
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: _TenantVectors, generation: int) -> None:
+        with self._lock:
+            # A write landed while the rows were loading; the snapshot may already be stale
+            if generation != self.generation:
+                entry.release()
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                previous.release()
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)[1].release()
+
+    def invalidate(self, ids=(), payloads=()) -> None:
+        """Drop entries that contain any of ``ids`` or whose filters match any of ``payloads``."""
+        with self._lock:
+            self.generation += 1
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if any(i in entry.id_set for i in ids) or any(entry.matches(p) for p in payloads)
+            ]
+            for key in stale:
+                self._entries.pop(key).release()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            for entry in self._entries.values():
+                entry.release()
+            self._entries.clear()
+
+
 class AzureMySQL(VectorStoreBase):
     def __init__(
         self,
@@ -48,6 +181,9 @@ class AzureMySQL(VectorStoreBase):
         minconn: int = 1,
         maxconn: int = 5,
         connection_pool: Optional[Any] = None,
+        vector_cache_size: int = 64,
+        vector_cache_ttl: Optional[float] = 5,
+        vector_cache_dir: Optional[str] = None,
     ):
         """
         Initialize the Azure MySQL vector store.
@@ -66,6 +202,11 @@ class AzureMySQL(VectorStoreBase):
             minconn (int): Minimum number of connections in the pool
             maxconn (int): Maximum number of connections in the pool
             connection_pool (Any, optional): Pre-configured connection pool
+            vector_cache_size (int): Number of filter scopes (tenants) whose vectors are cached for search, 0 disables
+            vector_cache_ttl (float, optional): Seconds before a cached scope is reloaded. The cache lives in this
+                process, so writes made by other workers or processes stay invisible to its searches for up to this
+                long; None keeps a scope until a write through this instance. Defaults to 5.
+            vector_cache_dir (str, optional): Directory for memory-mapped cache files instead of process memory
         """
         self.host = host
         self.port = port
@@ -78,6 +219,13 @@ class AzureMySQL(VectorStoreBase):
         self.ssl_ca = ssl_ca
         self.ssl_disabled = ssl_disabled
         self.connection_pool = connection_pool
+        self._vector_cache = (
+            _VectorCache(vector_cache_size, vector_cache_ttl, vector_cache_dir) if vector_cache_size > 0 else None
+        )
+        # Storage format of the vector column ("blob", "vector" or legacy "json") and server capabilities
+        self._vector_format = "blob"
+        self._supports_vector_type = False
+        self._native_distance = False
 
         # Handle Azure authentication
         if use_azure_credential:
@@ -92,10 +240,14 @@ class AzureMySQL(VectorStoreBase):
         if self.connection_pool is None:
             self._setup_connection_pool(minconn, maxconn)
 
+        self._detect_server_capabilities()
+
         # Create collection if it doesn't exist
         collections = self.list_cols()
         if collection_name not in collections:
             self.create_col(name=collection_name, vector_size=embedding_model_dims, distance="cosine")
+        else:
+            self._vector_format = self._detect_vector_format()
 
     def _setup_azure_auth(self):
         """Setup Azure authentication using DefaultAzureCredential."""
@@ -164,6 +316,77 @@ class AzureMySQL(VectorStoreBase):
             cur.close()
             conn.close()
 
+    def _probe(self, sql: str, params=None) -> Optional[Dict]:
+        """Run a capability query, returning None instead of raising when the server rejects it."""
+        conn = self.connection_pool.connection()
+        cur = conn.cursor()
+        try:
+            cur.execute(sql, params)
+            return cur.fetchone()
+        except Exception as e:
+            logger.debug(f"Capability probe failed: {e}")
+            return None
+        finally:
+            cur.close()
+            conn.close()
+
+    def _detect_server_capabilities(self):
+        """Detect native VECTOR columns (MySQL 9+) and the DISTANCE() function (HeatWave)."""
+        row = self._probe("SELECT VERSION() AS version")
+        version = row.get("version") if isinstance(row, dict) else None
+        try:
+            major = int(str(version).split(".")[0])
+        except (TypeError, ValueError):
+            major = 0
+        self._supports_vector_type = major >= 9
+        if self._supports_vector_type:
+            row = self._probe(
+                "SELECT DISTANCE(STRING_TO_VECTOR('[1,0]'), STRING_TO_VECTOR('[1,0]'), 'COSINE') AS distance"
+            )
+            self._native_distance = isinstance(row, dict) and row.get("distance") is not None
+        logger.info(
+            f"MySQL vector support: VECTOR type={self._supports_vector_type}, DISTANCE()={self._native_distance}"
+        )
+
+    def _detect_vector_format(self, table_name: str = None) -> str:
+        row = self._probe(
+            """
+            SELECT DATA_TYPE AS data_type FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = 'vector'
+            """,
+            (self.database, table_name or self.collection_name),
+        )
+        data_type = str(row.get("data_type", "")).lower() if isinstance(row, dict) else ""
+        if data_type == "json":
+            return "json"
+        if data_type == "vector":
+            return "vector"
+        return "blob"
+
+    def _encode_vector(self, vector: List[float]):
+        if self._vector_format == "json":
+            return json.dumps(vector)
+        if self._vector_format == "vector":
+            return json.dumps([float(v) for v in vector])
+        return np.asarray(vector, dtype="<f4").tobytes()
+
+    @property
+    def _vector_placeholder(self) -> str:
+        return "STRING_TO_VECTOR(%s)" if self._vector_format == "vector" else "%s"
+
+    @staticmethod
+    def _build_filter_clause(filters: Optional[Dict]):
+        filter_conditions = []
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                filter_conditions.append("JSON_EXTRACT(payload, %s) = %s")
+                filter_params.extend([f"$.{k}", json.dumps(v)])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        return filter_clause, filter_params
+
     def create_col(self, name: str = None, vector_size: int = None, distance: str = "cosine"):
         """
         Create a new collection (table in MySQL).
@@ -177,17 +400,22 @@ class AzureMySQL(VectorStoreBase):
         table_name = name or self.collection_name
         dims = vector_size or self.embedding_model_dims
 
+        # Native VECTOR columns where available, otherwise packed little-endian float32
+        column_type = f"VECTOR({dims})" if self._supports_vector_type else "LONGBLOB"
+
         with self._get_cursor(commit=True) as cur:
             # Create table with vector column
             cur.execute(f"""
                 CREATE TABLE IF NOT EXISTS `{table_name}` (
                     id VARCHAR(255) PRIMARY KEY,
-                    vector JSON,
+                    vector {column_type},
                     payload JSON,
                     INDEX idx_payload_keys ((CAST(payload AS CHAR(255)) ARRAY))
                 )
             """)
             logger.info(f"Created collection '{table_name}' with vector dimension {dims}")
+        if table_name == self.collection_name:
+            self._vector_format = self._detect_vector_format(table_name)
 
     def insert(self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None):
         """
@@ -203,41 +431,20 @@ class AzureMySQL(VectorStoreBase):
         if payloads is None:
             payloads = [{}] * len(vectors)
         if ids is None:
-            import uuid
             ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
 
         data = []
         for vector, payload, vec_id in zip(vectors, payloads, ids):
-            data.append((vec_id, json.dumps(vector), json.dumps(payload)))
+            data.append((vec_id, self._encode_vector(vector), json.dumps(payload)))
 
         with self._get_cursor(commit=True) as cur:
             cur.executemany(
-                f"INSERT INTO `{self.collection_name}` (id, vector, payload) VALUES (%s, %s, %s) "
+                f"INSERT INTO `{self.collection_name}` (id, vector, payload) VALUES (%s, {self._vector_placeholder}, %s) "
                 f"ON DUPLICATE KEY UPDATE vector = VALUES(vector), payload = VALUES(payload)",
                 data
             )
-
-    def _cosine_distance(self, vec1_json: str, vec2: List[float]) -> str:
-        """Generate SQL for cosine distance calculation."""
-        # For MySQL, we need to calculate cosine similarity manually
-        # This is a simplified version - in production, you'd use stored procedures or UDFs
-        return """
-            1 - (
-                (SELECT SUM(a.val * b.val) /
-                (SQRT(SUM(a.val * a.val)) * SQRT(SUM(b.val * b.val))))
-                FROM (
-                    SELECT JSON_EXTRACT(vector, CONCAT('$[', idx, ']')) as val
-                    FROM (SELECT @row := @row + 1 as idx FROM (SELECT 0 UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3) t1, (SELECT 0 UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3) t2) indices
-                    WHERE idx < JSON_LENGTH(vector)
-                ) a,
-                (
-                    SELECT JSON_EXTRACT(%s, CONCAT('$[', idx, ']')) as val
-                    FROM (SELECT @row := @row + 1 as idx FROM (SELECT 0 UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3) t1, (SELECT 0 UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3) t2) indices
-                    WHERE idx < JSON_LENGTH(%s)
-                ) b
-                WHERE a.idx = b.idx
-            )
-        """
+        if self._vector_cache is not None:
+            self._vector_cache.invalidate(ids=ids, payloads=payloads)
 
     def search(
         self,
@@ -258,46 +465,78 @@ class AzureMySQL(VectorStoreBase):
         Returns:
             List[OutputData]: Search results
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("JSON_EXTRACT(payload, %s) = %s")
-                filter_params.extend([f"$.{k}", json.dumps(v)])
+        if self._native_distance and self._vector_format == "vector":
+            return self._search_native(vectors, limit, filters)
+
+        tenant = self._load_tenant_vectors(filters)
+        if not tenant.ids:
+            return []
+
+        query_vec = np.asarray(vectors, dtype=np.float32)
+        norm = np.linalg.norm(query_vec)
+        if norm:
+            query_vec = query_vec / norm
+        similarities = tenant.matrix @ query_vec
+
+        k = min(limit, len(similarities))
+        if k <= 0:
+            return []
+        if k < len(similarities):
+            top = np.argpartition(-similarities, k - 1)[:k]
+        else:
+            top = np.arange(len(similarities))
+        top = top[np.argsort(-similarities[top], kind="stable")]
 
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        return [
+            OutputData(id=tenant.ids[i], score=float(1 - similarities[i]), payload=dict(tenant.payloads[i]))
+            for i in top
+        ]
 
-        # For simplicity, we'll compute cosine similarity in Python
-        # In production, you'd want to use MySQL stored procedures or UDFs
+    def _load_tenant_vectors(self, filters: Optional[Dict]) -> _TenantVectors:
+        """Return the vectors matching ``filters``, from the cache when possible."""
+        cache = self._vector_cache
+        key = _VectorCache.key(filters)
+        if cache is not None:
+            entry = cache.get(key)
+            if entry is not None:
+                return entry
+            generation = cache.generation
+
+        filter_clause, filter_params = self._build_filter_clause(filters)
         with self._get_cursor() as cur:
-            query_sql = f"""
+            cur.execute(
+                f"""
                 SELECT id, vector, payload
                 FROM `{self.collection_name}`
                 {filter_clause}
-            """
-            cur.execute(query_sql, filter_params)
-            results = cur.fetchall()
-
-        # Calculate cosine similarity in Python
-        import numpy as np
-        query_vec = np.array(vectors)
-        scored_results = []
-
-        for row in results:
-            vec = np.array(json.loads(row['vector']))
-            # Cosine similarity
-            similarity = np.dot(query_vec, vec) / (np.linalg.norm(query_vec) * np.linalg.norm(vec))
-            distance = 1 - similarity
-            scored_results.append((row['id'], distance, row['payload']))
+                """,
+                filter_params,
+            )
+            rows = cur.fetchall()
 
-        # Sort by distance and limit
-        scored_results.sort(key=lambda x: x[1])
-        scored_results = scored_results[:limit]
+        entry = _TenantVectors(dict(filters or {}), rows, cache.cache_dir if cache is not None else None)
+        if cache is not None:
+            cache.put(key, entry, generation)
+        return entry
 
+    def _search_native(self, vectors: List[float], limit: int, filters: Optional[Dict]) -> List[OutputData]:
+        """Rank rows on the server with the DISTANCE() function."""
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        with self._get_cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT id, DISTANCE(vector, STRING_TO_VECTOR(%s), 'COSINE') AS distance, payload
+                FROM `{self.collection_name}`
+                {filter_clause}
+                ORDER BY distance
+                LIMIT %s
+                """,
+                (json.dumps([float(v) for v in vectors]), *filter_params, limit),
+            )
+            results = cur.fetchall()
         return [
-            OutputData(id=r[0], score=float(r[1]), payload=json.loads(r[2]) if isinstance(r[2], str) else r[2])
-            for r in scored_results
+            OutputData(id=r["id"], score=float(r["distance"]), payload=_decode_payload(r["payload"]))
+            for r in results
         ]
 
     def delete(self, vector_id: str):
@@ -309,6 +548,8 @@ class AzureMySQL(VectorStoreBase):
         """
         with self._get_cursor(commit=True) as cur:
             cur.execute(f"DELETE FROM `{self.collection_name}` WHERE id = %s", (vector_id,))
+        if self._vector_cache is not None:
+            self._vector_cache.invalidate(ids=[vector_id])
 
     def update(
         self,
@@ -327,14 +568,16 @@ class AzureMySQL(VectorStoreBase):
         with self._get_cursor(commit=True) as cur:
             if vector is not None:
                 cur.execute(
-                    f"UPDATE `{self.collection_name}` SET vector = %s WHERE id = %s",
-                    (json.dumps(vector), vector_id),
+                    f"UPDATE `{self.collection_name}` SET vector = {self._vector_placeholder} WHERE id = %s",
+                    (self._encode_vector(vector), vector_id),
                 )
             if payload is not None:
                 cur.execute(
                     f"UPDATE `{self.collection_name}` SET payload = %s WHERE id = %s",
                     (json.dumps(payload), vector_id),
                 )
+        if self._vector_cache is not None:
+            self._vector_cache.invalidate(ids=[vector_id], payloads=[payload] if payload is not None else [])
 
     def get(self, vector_id: str) -> Optional[OutputData]:
         """
@@ -348,7 +591,7 @@ class AzureMySQL(VectorStoreBase):
         """
         with self._get_cursor() as cur:
             cur.execute(
-                f"SELECT id, vector, payload FROM `{self.collection_name}` WHERE id = %s",
+                f"SELECT id, payload FROM `{self.collection_name}` WHERE id = %s",
                 (vector_id,),
             )
             result = cur.fetchone()
@@ -375,6 +618,8 @@ class AzureMySQL(VectorStoreBase):
         """Delete the collection (table)."""
         with self._get_cursor(commit=True) as cur:
             cur.execute(f"DROP TABLE IF EXISTS `{self.collection_name}`")
+        if self._vector_cache is not None:
+            self._vector_cache.clear()
         logger.info(f"Deleted collection '{self.collection_name}'")
 
     def col_info(self) -> Dict[str, Any]:
@@ -418,20 +663,12 @@ class AzureMySQL(VectorStoreBase):
         Returns:
             List[List[OutputData]]: List of vectors
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("JSON_EXTRACT(payload, %s) = %s")
-                filter_params.extend([f"$.{k}", json.dumps(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        filter_clause, filter_params = self._build_filter_clause(filters)
 
         with self._get_cursor() as cur:
             cur.execute(
                 f"""
-                SELECT id, vector, payload
+                SELECT id, payload
                 FROM `{self.collection_name}`
                 {filter_clause}
                 LIMIT %s
@@ -457,6 +694,8 @@ class AzureMySQL(VectorStoreBase):
     def __del__(self):
         """Close the connection pool when the object is deleted."""
         try:
+            if getattr(self, "_vector_cache", None) is not None:
+                self._vector_cache.clear()
             if hasattr(self, 'connection_pool') and self.connection_pool:
                 self.connection_pool.close()
         except Exception:
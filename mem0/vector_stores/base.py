@@ -1,5 +1,9 @@
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
 
 class VectorStoreBase(ABC):
     @abstractmethod
@@ -17,6 +21,18 @@ class VectorStoreBase(ABC):
         """Search for similar vectors."""
         pass
 
+    def search_batch(self, queries, vectors_matrix, limit=5, filters=None):
+        """
+        Search for several query vectors sharing the same filters.
+
+        Providers that can run many queries in one round trip override this; the default
+        calls `search` once per query. Returns one result list per query, in query order.
+        """
+        return [
+            self.search(query=query, vectors=vectors, limit=limit, filters=filters)
+            for query, vectors in zip(queries, vectors_matrix)
+        ]
+
     @abstractmethod
     def delete(self, vector_id):
         """Delete a vector by ID."""
@@ -32,6 +48,46 @@ class VectorStoreBase(ABC):
         """Retrieve a vector by ID."""
         pass
 
+    def get_many(self, vector_ids):
+        """
+        Retrieve several vectors by ID.
+
+        Providers that can fetch many records in one round trip override this; the default
+        calls `get` once per ID. Returns the records that exist, in the order requested.
+        Several providers raise from `get` for a missing ID instead of returning None; such
+        IDs are skipped.
+        """
+        results = []
+        for vector_id in vector_ids:
+            try:
+                record = self.get(vector_id=vector_id)
+            except Exception as e:
+                logger.debug(f"Treating vector {vector_id} as missing: {e}")
+                continue
+            if record is not None:
+                results.append(record)
+        return results
+
+    def update_many(self, vector_ids, vectors, payloads):
+        """
+        Update several vectors and their payloads.
+
+        Providers that can write many records in one round trip override this; the default
+        calls `update` once per ID.
+        """
+        for vector_id, vector, payload in zip(vector_ids, vectors, payloads):
+            self.update(vector_id=vector_id, vector=vector, payload=payload)
+
+    def delete_many(self, vector_ids):
+        """
+        Delete several vectors by ID.
+
+        Providers that can delete many records in one round trip override this; the default
+        calls `delete` once per ID.
+        """
+        for vector_id in vector_ids:
+            self.delete(vector_id=vector_id)
+
     @abstractmethod
     def list_cols(self):
         """List all collections."""
@@ -56,3 +112,47 @@ class VectorStoreBase(ABC):
     def reset(self):
         """Reset by delete the collection and recreate it."""
         pass
+
+    # Async variants. Providers with a native async client override these; the
+    # defaults run the synchronous method in a worker thread.
+
+    async def async_insert(self, vectors, payloads=None, ids=None):
+        """Insert vectors into a collection asynchronously."""
+        return await asyncio.to_thread(self.insert, vectors=vectors, payloads=payloads, ids=ids)
+
+    async def async_search(self, query, vectors, limit=5, filters=None):
+        """Search for similar vectors asynchronously."""
+        return await asyncio.to_thread(self.search, query=query, vectors=vectors, limit=limit, filters=filters)
+
+    async def async_search_batch(self, queries, vectors_matrix, limit=5, filters=None):
+        """Search for several query vectors asynchronously."""
+        return await asyncio.to_thread(
+            self.search_batch, queries=queries, vectors_matrix=vectors_matrix, limit=limit, filters=filters
+        )
+
+    async def async_delete(self, vector_id):
+        """Delete a vector by ID asynchronously."""
+        return await asyncio.to_thread(self.delete, vector_id=vector_id)
+
+    async def async_update(self, vector_id, vector=None, payload=None):
+        """Update a vector and its payload asynchronously."""
+        return await asyncio.to_thread(self.update, vector_id=vector_id, vector=vector, payload=payload)
+
+    async def async_get(self, vector_id):
+        """Retrieve a vector by ID asynchronously."""
+        return await asyncio.to_thread(self.get, vector_id=vector_id)
+
+    async def async_get_many(self, vector_ids):
+        """Retrieve several vectors by ID asynchronously."""
+        return await asyncio.to_thread(self.get_many, vector_ids=vector_ids)
+
+    async def async_list(self, filters=None, limit=None):
+        """List all memories asynchronously."""
+        if limit is None:
+            # Let each provider apply its own default page size
+            return await asyncio.to_thread(self.list, filters=filters)
+        return await asyncio.to_thread(self.list, filters=filters, limit=limit)
+
+    async def async_close(self):
+        """Release the clients or pools opened by the native async variants. No-op by default."""
+        return None
@@ -19,6 +19,11 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Session identifiers stored in their own SAI-indexed columns so equality filters run server-side
+PROMOTED_COLUMNS = ("user_id", "agent_id", "run_id", "actor_id")
+# Extra rows fetched per result when some filters can only be checked against the JSON payload
+POST_FILTER_OVERFETCH = 4
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -39,6 +44,7 @@ class CassandraDB(VectorStoreBase):
         secure_connect_bundle: Optional[str] = None,
         protocol_version: int = 4,
         load_balancing_policy: Optional[Any] = None,
+        sai_index: bool = True,
     ):
         """
         Initialize the Apache Cassandra vector store.
@@ -54,6 +60,9 @@ class CassandraDB(VectorStoreBase):
             secure_connect_bundle (str, optional): Path to secure connect bundle for Astra DB
             protocol_version (int): CQL protocol version (default: 4)
             load_balancing_policy (Any, optional): Custom load balancing policy
+            sai_index (bool): Store vectors in a native vector column with Storage-Attached Indexes and search
+                server-side (requires Cassandra 5.0+ or Astra DB). When False, or when an existing table stores
+                vectors as list<float>, similarity is computed client-side (default: True)
         """
         self.contact_points = contact_points
         self.port = port
@@ -65,6 +74,9 @@ class CassandraDB(VectorStoreBase):
         self.secure_connect_bundle = secure_connect_bundle
         self.protocol_version = protocol_version
         self.load_balancing_policy = load_balancing_policy
+        self.sai_index = sai_index
+        self._native_ann = False
+        self._statements: Dict[str, Any] = {}
 
         # Initialize connection
         self.cluster = None
@@ -132,21 +144,111 @@ class CassandraDB(VectorStoreBase):
 
     def _create_table(self):
         """Create table with vector column if it doesn't exist."""
+        self._native_ann = self._create_table_if_missing(self.collection_name, self.embedding_model_dims)
+        logger.info(f"Table '{self.collection_name}' is ready")
+
+    def _create_table_if_missing(self, table_name: str, dims: int) -> bool:
+        """
+        Create ``table_name`` and its indexes if needed.
+
+        Returns:
+            bool: True when the table has a native vector column searchable with ANN.
+        """
         try:
-            # Create table with vector stored as list<float> and payload as text (JSON)
+            if not self.sai_index:
+                # Create table with vector stored as list<float> and payload as text (JSON)
+                query = f"""
+                    CREATE TABLE IF NOT EXISTS {self.keyspace}.{table_name} (
+                        id text PRIMARY KEY,
+                        vector list<float>,
+                        payload text
+                    )
+                """
+                self.session.execute(query)
+                return False
+
+            promoted = ",\n".join(f"{column} text" for column in PROMOTED_COLUMNS)
             query = f"""
-                CREATE TABLE IF NOT EXISTS {self.keyspace}.{self.collection_name} (
+                CREATE TABLE IF NOT EXISTS {self.keyspace}.{table_name} (
                     id text PRIMARY KEY,
-                    vector list<float>,
-                    payload text
+                    vector vector<float, {dims}>,
+                    payload text,
+                    {promoted}
                 )
             """
             self.session.execute(query)
-            logger.info(f"Table '{self.collection_name}' is ready")
+
+            if not self._has_native_vector_column(table_name):
+                logger.warning(
+                    f"Table '{table_name}' stores vectors as list<float>; similarity search will run client-side. "
+                    "Recreate the collection to enable server-side ANN search."
+                )
+                return False
+
+            self.session.execute(
+                f"""
+                CREATE CUSTOM INDEX IF NOT EXISTS {table_name}_vector_idx
+                ON {self.keyspace}.{table_name} (vector)
+                USING 'StorageAttachedIndex'
+                WITH OPTIONS = {{'similarity_function': 'cosine'}}
+                """
+            )
+            for column in PROMOTED_COLUMNS:
+                self.session.execute(
+                    f"""
+                    CREATE CUSTOM INDEX IF NOT EXISTS {table_name}_{column}_idx
+                    ON {self.keyspace}.{table_name} ({column})
+                    USING 'StorageAttachedIndex'
+                    """
+                )
+            return True
         except Exception as e:
             logger.error(f"Failed to create table: {e}")
             raise
 
+    def _has_native_vector_column(self, table_name: str) -> bool:
+        """Return False if a pre-existing table stores vectors in the legacy list<float> column."""
+        row = self.session.execute(
+            """
+            SELECT type FROM system_schema.columns
+            WHERE keyspace_name = %s AND table_name = %s AND column_name = 'vector'
+            """,
+            (self.keyspace, table_name),
+        ).one()
+        column_type = getattr(row, "type", None)
+        return not (isinstance(column_type, str) and column_type.startswith("list"))
+
+    def _prepare(self, query: str):
+        """Prepare a statement once and reuse it for later calls."""
+        statement = self._statements.get(query)
+        if statement is None:
+            statement = self.session.prepare(query)
+            self._statements[query] = statement
+        return statement
+
+    def _split_filters(self, filters: Optional[Dict]):
+        """
+        Split filters into a CQL WHERE clause over promoted columns and the remainder
+        that has to be matched against the JSON payload.
+        """
+        conditions, params, residual = [], [], {}
+        for key, value in (filters or {}).items():
+            if self._native_ann and key in PROMOTED_COLUMNS and isinstance(value, str) and value != "*":
+                conditions.append(f"{key} = ?")
+                params.append(value)
+            else:
+                residual[key] = value
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return where, params, residual
+
+    @staticmethod
+    def _matches(payload: Dict, filters: Dict) -> bool:
+        return all(payload.get(k) == v for k, v in filters.items())
+
+    @staticmethod
+    def _promoted_values(payload: Dict) -> List[Optional[str]]:
+        return [str(payload[column]) if payload.get(column) is not None else None for column in PROMOTED_COLUMNS]
+
     def create_col(self, name: str = None, vector_size: int = None, distance: str = "cosine"):
         """
         Create a new collection (table in Cassandra).
@@ -160,14 +262,9 @@ class CassandraDB(VectorStoreBase):
         dims = vector_size or self.embedding_model_dims
 
         try:
-            query = f"""
-                CREATE TABLE IF NOT EXISTS {self.keyspace}.{table_name} (
-                    id text PRIMARY KEY,
-                    vector list<float>,
-                    payload text
-                )
-            """
-            self.session.execute(query)
+            native_ann = self._create_table_if_missing(table_name, dims)
+            if table_name == self.collection_name:
+                self._native_ann = native_ann
             logger.info(f"Created collection '{table_name}' with vector dimension {dims}")
         except Exception as e:
             logger.error(f"Failed to create collection: {e}")
@@ -195,17 +292,25 @@ class CassandraDB(VectorStoreBase):
             ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
 
         try:
-            query = f"""
-                INSERT INTO {self.keyspace}.{self.collection_name} (id, vector, payload)
-                VALUES (?, ?, ?)
-            """
-            prepared = self.session.prepare(query)
+            if self._native_ann:
+                columns = ", ".join(PROMOTED_COLUMNS)
+                placeholders = ", ".join("?" for _ in PROMOTED_COLUMNS)
+                query = f"""
+                    INSERT INTO {self.keyspace}.{self.collection_name} (id, vector, payload, {columns})
+                    VALUES (?, ?, ?, {placeholders})
+                """
+            else:
+                query = f"""
+                    INSERT INTO {self.keyspace}.{self.collection_name} (id, vector, payload)
+                    VALUES (?, ?, ?)
+                """
+            prepared = self._prepare(query)
 
             for vector, payload, vec_id in zip(vectors, payloads, ids):
-                self.session.execute(
-                    prepared,
-                    (vec_id, vector, json.dumps(payload))
-                )
+                params = (vec_id, vector, json.dumps(payload))
+                if self._native_ann:
+                    params += tuple(self._promoted_values(payload))
+                self.session.execute(prepared, params)
         except Exception as e:
             logger.error(f"Failed to insert vectors: {e}")
             raise
@@ -220,6 +325,10 @@ class CassandraDB(VectorStoreBase):
         """
         Search for similar vectors using cosine similarity.
 
+        With a native vector column the nearest neighbours and session filters are resolved by
+        Cassandra's SAI indexes; only the returned rows are scored and matched against any
+        filters on payload fields.
+
         Args:
             query (str): Query string (not used in vector search)
             vectors (List[float]): Query vector
@@ -229,6 +338,40 @@ class CassandraDB(VectorStoreBase):
         Returns:
             List[OutputData]: Search results
         """
+        if not self._native_ann:
+            return self._search_client_side(vectors, limit, filters)
+
+        try:
+            where, params, residual = self._split_filters(filters)
+            fetch_limit = limit * POST_FILTER_OVERFETCH if residual else limit
+            query_cql = f"""
+                SELECT id, vector, payload
+                FROM {self.keyspace}.{self.collection_name}
+                {where}
+                ORDER BY vector ANN OF ?
+                LIMIT ?
+            """
+            rows = self.session.execute(self._prepare(query_cql), (*params, vectors, fetch_limit))
+
+            query_vec = np.asarray(vectors, dtype=np.float32)
+            query_norm = np.linalg.norm(query_vec)
+            results = []
+            for row in rows:
+                payload = json.loads(row.payload) if row.payload else {}
+                if residual and not self._matches(payload, residual):
+                    continue
+                vec = np.asarray(row.vector, dtype=np.float32)
+                similarity = np.dot(query_vec, vec) / (query_norm * np.linalg.norm(vec))
+                results.append(OutputData(id=row.id, score=float(1 - similarity), payload=payload))
+
+            results.sort(key=lambda r: r.score)
+            return results[:limit]
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            raise
+
+    def _search_client_side(self, vectors: List[float], limit: int, filters: Optional[Dict]) -> List[OutputData]:
+        """Score every row in Python; used for tables without a native vector column."""
         try:
             # Fetch all vectors (in production, you'd want pagination or filtering)
             query_cql = f"""
@@ -255,8 +398,7 @@ class CassandraDB(VectorStoreBase):
                 if filters:
                     try:
                         payload = json.loads(row.payload) if row.payload else {}
-                        match = all(payload.get(k) == v for k, v in filters.items())
-                        if not match:
+                        if not self._matches(payload, filters):
                             continue
                     except json.JSONDecodeError:
                         continue
@@ -291,7 +433,7 @@ class CassandraDB(VectorStoreBase):
                 DELETE FROM {self.keyspace}.{self.collection_name}
                 WHERE id = ?
             """
-            prepared = self.session.prepare(query)
+            prepared = self._prepare(query)
             self.session.execute(prepared, (vector_id,))
             logger.info(f"Deleted vector with id: {vector_id}")
         except Exception as e:
@@ -319,17 +461,27 @@ class CassandraDB(VectorStoreBase):
                     SET vector = ?
                     WHERE id = ?
                 """
-                prepared = self.session.prepare(query)
+                prepared = self._prepare(query)
                 self.session.execute(prepared, (vector, vector_id))
 
             if payload is not None:
-                query = f"""
-                    UPDATE {self.keyspace}.{self.collection_name}
-                    SET payload = ?
-                    WHERE id = ?
-                """
-                prepared = self.session.prepare(query)
-                self.session.execute(prepared, (json.dumps(payload), vector_id))
+                if self._native_ann:
+                    assignments = ", ".join(f"{column} = ?" for column in PROMOTED_COLUMNS)
+                    query = f"""
+                        UPDATE {self.keyspace}.{self.collection_name}
+                        SET payload = ?, {assignments}
+                        WHERE id = ?
+                    """
+                    params = (json.dumps(payload), *self._promoted_values(payload), vector_id)
+                else:
+                    query = f"""
+                        UPDATE {self.keyspace}.{self.collection_name}
+                        SET payload = ?
+                        WHERE id = ?
+                    """
+                    params = (json.dumps(payload), vector_id)
+                prepared = self._prepare(query)
+                self.session.execute(prepared, params)
 
             logger.info(f"Updated vector with id: {vector_id}")
         except Exception as e:
@@ -348,11 +500,11 @@ class CassandraDB(VectorStoreBase):
         """
         try:
             query = f"""
-                SELECT id, vector, payload
+                SELECT id, payload
                 FROM {self.keyspace}.{self.collection_name}
                 WHERE id = ?
             """
-            prepared = self.session.prepare(query)
+            prepared = self._prepare(query)
             row = self.session.execute(prepared, (vector_id,)).one()
 
             if not row:
@@ -393,6 +545,7 @@ class CassandraDB(VectorStoreBase):
                 DROP TABLE IF EXISTS {self.keyspace}.{self.collection_name}
             """
             self.session.execute(query)
+            self._statements.clear()
             logger.info(f"Deleted collection '{self.collection_name}'")
         except Exception as e:
             logger.error(f"Failed to delete collection: {e}")
@@ -440,32 +593,29 @@ class CassandraDB(VectorStoreBase):
             List[List[OutputData]]: List of vectors
         """
         try:
+            where, params, residual = self._split_filters(filters)
+            fetch_limit = limit * POST_FILTER_OVERFETCH if residual else limit
             query = f"""
-                SELECT id, vector, payload
+                SELECT id, payload
                 FROM {self.keyspace}.{self.collection_name}
-                LIMIT {limit}
+                {where}
+                LIMIT ?
             """
-            rows = self.session.execute(query)
+            rows = self.session.execute(self._prepare(query), (*params, fetch_limit))
 
             results = []
             for row in rows:
-                # Apply filters if provided
-                if filters:
-                    try:
-                        payload = json.loads(row.payload) if row.payload else {}
-                        match = all(payload.get(k) == v for k, v in filters.items())
-                        if not match:
-                            continue
-                    except json.JSONDecodeError:
-                        continue
+                try:
+                    payload = json.loads(row.payload) if row.payload else {}
+                except json.JSONDecodeError:
+                    continue
+                # Apply filters that could not be pushed down to Cassandra
+                if residual and not self._matches(payload, residual):
+                    continue
 
-                results.append(
-                    OutputData(
-                        id=row.id,
-                        score=None,
-                        payload=json.loads(row.payload) if row.payload else {}
-                    )
-                )
+                results.append(OutputData(id=row.id, score=None, payload=payload))
+                if len(results) >= limit:
+                    break
 
             return [results]
         except Exception as e:
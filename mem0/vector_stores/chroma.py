@@ -198,6 +198,21 @@ class ChromaDB(VectorStoreBase):
         result = self.collection.get(ids=[vector_id])
         return self._parse_output(result)[0]
 
+    def get_many(self, vector_ids: List[str]) -> List[OutputData]:
+        """
+        Retrieve several vectors in one request.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to retrieve.
+
+        Returns:
+            List[OutputData]: Retrieved vectors that exist, in the order requested.
+        """
+        if not vector_ids:
+            return []
+        by_id = {record.id: record for record in self._parse_output(self.collection.get(ids=list(vector_ids)))}
+        return [by_id[vector_id] for vector_id in vector_ids if vector_id in by_id]
+
     def list_cols(self) -> List[chromadb.Collection]:
         """
         List all collections.
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -9,6 +9,16 @@ class VectorStoreConfig(BaseModel):
         default="qdrant",
     )
     config: Optional[Dict] = Field(description="Configuration for the specific vector store", default=None)
+    precision: Optional[Literal["float32", "float16", "int8", "binary"]] = Field(
+        description="Vector storage precision, forwarded to providers that support it (faiss, pgvector, qdrant)",
+        default=None,
+    )
+    rescore: Optional[bool] = Field(
+        description="Re-rank quantized candidates at full precision (providers supporting `precision`)", default=None
+    )
+    rescore_multiplier: Optional[int] = Field(
+        description="Candidate oversampling factor used when rescoring", default=None
+    )
 
     _provider_configs: Dict[str, str] = {
         "qdrant": "QdrantConfig",
@@ -53,11 +63,31 @@ class VectorStoreConfig(BaseModel):
         if config is None:
             config = {}
 
+        storage_options = {
+            key: value
+            for key, value in (
+                ("precision", self.precision),
+                ("rescore", self.rescore),
+                ("rescore_multiplier", self.rescore_multiplier),
+            )
+            if value is not None
+        }
+        if storage_options and "precision" not in config_class.model_fields:
+            raise ValueError(f"Vector store provider {provider} does not support the precision option")
+
         if not isinstance(config, dict):
             if not isinstance(config, config_class):
                 raise ValueError(f"Invalid config type for provider {provider}")
+            if storage_options:
+                # Same precedence as dicts: fields set on the provider config win over the top-level options
+                self.config = config_class(
+                    **{**config.model_dump(), **storage_options, **config.model_dump(exclude_unset=True)}
+                )
             return self
 
+        # Provider-level settings take precedence over the top-level storage options
+        config = {**storage_options, **config}
+
         # also check if path in allowed kays for pydantic model, and whether config extra fields are allowed
         if "path" not in config and "path" in config_class.__annotations__:
             config["path"] = f"/tmp/{provider}"
@@ -131,25 +131,50 @@ class ElasticsearchDB(VectorStoreBase):
     def search(
         self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
     ) -> List[OutputData]:
+        """Search for the nearest vectors, using the custom search query when one is configured."""
+        search_query = self._build_search_query(vectors, limit, filters)
+        response = self.client.search(index=self.collection_name, body=search_query)
+        return self._parse_hits(response)
+
+    def search_batch(
+        self, queries: List[str], vectors_matrix: List[List[float]], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """Run one search per query vector in a single _msearch request, returning results in query order."""
+        if not vectors_matrix:
+            return []
+
+        searches = []
+        for vectors in vectors_matrix:
+            searches.append({"index": self.collection_name})
+            searches.append(self._build_search_query(vectors, limit, filters))
+
+        response = self.client.msearch(searches=searches)
+
+        results = []
+        for item in response["responses"]:
+            if "error" in item:
+                raise RuntimeError(f"Elasticsearch multi-search query failed: {item['error']}")
+            results.append(self._parse_hits(item))
+        return results
+
+    def _build_search_query(self, vectors: List[float], limit: int, filters: Optional[Dict]) -> Dict:
         """
-        Search with two options:
+        Build the search body with two options:
         1. Use custom search query if provided
         2. Use KNN search on vectors with pre-filtering if no custom search query is provided
         """
         if self.custom_search_query:
-            search_query = self.custom_search_query(vectors, limit, filters)
-        else:
-            search_query = {
-                "knn": {"field": "vector", "query_vector": vectors, "k": limit, "num_candidates": limit * 2}
-            }
-            if filters:
-                filter_conditions = []
-                for key, value in filters.items():
-                    filter_conditions.append({"term": {f"metadata.{key}": value}})
-                search_query["knn"]["filter"] = {"bool": {"must": filter_conditions}}
+            return self.custom_search_query(vectors, limit, filters)
 
-        response = self.client.search(index=self.collection_name, body=search_query)
+        search_query = {"knn": {"field": "vector", "query_vector": vectors, "k": limit, "num_candidates": limit * 2}}
+        if filters:
+            filter_conditions = []
+            for key, value in filters.items():
+                filter_conditions.append({"term": {f"metadata.{key}": value}})
+            search_query["knn"]["filter"] = {"bool": {"must": filter_conditions}}
+        return search_query
 
+    def _parse_hits(self, response) -> List[OutputData]:
         results = []
         for hit in response["hits"]["hits"]:
             results.append(
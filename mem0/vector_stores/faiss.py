@@ -45,6 +45,9 @@ class FAISS(VectorStoreBase):
         distance_strategy: str = "euclidean",
         normalize_L2: bool = False,
         embedding_model_dims: int = 1536,
+        precision: str = "float32",
+        rescore: bool = False,
+        rescore_multiplier: int = 4,
     ):
         """
         Initialize the FAISS vector store.
@@ -56,15 +59,27 @@ class FAISS(VectorStoreBase):
                 Defaults to "euclidean".
             normalize_L2 (bool, optional): Whether to normalize L2 vectors. Only applicable for euclidean distance.
                 Defaults to False.
+            precision (str, optional): Storage precision of the index: 'float32', 'float16', 'int8' (8-bit scalar
+                quantizer over the [-1, 1] range of normalized embeddings) or 'binary' (sign bits, Hamming search;
+                without rescoring, cosine/inner_product scores are the similarity of the sign vectors).
+                Defaults to "float32".
+            rescore (bool, optional): Keep a full-precision copy of the vectors and re-rank the top
+                `limit * rescore_multiplier` int8/binary candidates with it. Defaults to False.
+            rescore_multiplier (int, optional): Candidate oversampling factor used when rescoring. Defaults to 4.
         """
         self.collection_name = collection_name
         self.path = path or f"/tmp/faiss/{collection_name}"
         self.distance_strategy = distance_strategy
         self.normalize_L2 = normalize_L2
         self.embedding_model_dims = embedding_model_dims
+        self.precision = precision
+        self.rescore = rescore and precision in ("int8", "binary")
+        self.rescore_multiplier = rescore_multiplier
 
         # Initialize storage structures
         self.index = None
+        # Full-precision vectors, row-aligned with `index`, used to rescore quantized candidates
+        self.full_index = None
         self.docstore = {}
         self.index_to_id = {}
 
@@ -89,9 +104,23 @@ class FAISS(VectorStoreBase):
             docstore_path (str): Path to docstore pickle file.
         """
         try:
-            self.index = faiss.read_index(index_path)
+            if self.precision == "binary":
+                self.index = faiss.read_index_binary(index_path)
+            else:
+                self.index = faiss.read_index(index_path)
             with open(docstore_path, "rb") as f:
                 self.docstore, self.index_to_id = pickle.load(f)
+            if self.rescore:
+                full_index_path = self._full_index_path()
+                if os.path.exists(full_index_path):
+                    self.full_index = faiss.read_index(full_index_path)
+                elif self.index.ntotal == 0:
+                    self.full_index = self._create_flat_index()
+                else:
+                    logger.warning(
+                        f"No full-precision vectors stored for {self.collection_name}; rescoring is disabled"
+                    )
+                    self.rescore = False
             logger.info(f"Loaded FAISS index from {index_path} with {self.index.ntotal} vectors")
         except Exception as e:
             logger.warning(f"Failed to load FAISS index: {e}")
@@ -109,12 +138,88 @@ class FAISS(VectorStoreBase):
             index_path = f"{self.path}/{self.collection_name}.faiss"
             docstore_path = f"{self.path}/{self.collection_name}.pkl"
 
-            faiss.write_index(self.index, index_path)
+            if self._is_binary():
+                faiss.write_index_binary(self.index, index_path)
+            else:
+                faiss.write_index(self.index, index_path)
+            if self.full_index is not None:
+                faiss.write_index(self.full_index, self._full_index_path())
             with open(docstore_path, "wb") as f:
                 pickle.dump((self.docstore, self.index_to_id), f)
         except Exception as e:
             logger.warning(f"Failed to save FAISS index: {e}")
 
+    def _full_index_path(self) -> str:
+        return f"{self.path}/{self.collection_name}.full.faiss"
+
+    def _uses_inner_product(self, distance_strategy: Optional[str] = None) -> bool:
+        return (distance_strategy or self.distance_strategy).lower() in ("inner_product", "cosine")
+
+    def _is_binary(self) -> bool:
+        return isinstance(self.index, faiss.IndexBinary)
+
+    def _create_flat_index(self, distance_strategy: Optional[str] = None):
+        if self._uses_inner_product(distance_strategy):
+            return faiss.IndexFlatIP(self.embedding_model_dims)
+        return faiss.IndexFlatL2(self.embedding_model_dims)
+
+    def _create_index(self, distance_strategy: Optional[str] = None):
+        """Build an empty index for the configured storage precision."""
+        dims = self.embedding_model_dims
+        if self.precision == "float32":
+            return self._create_flat_index(distance_strategy)
+        if self.precision == "binary":
+            if dims % 8:
+                raise ValueError(f"Binary precision requires embedding dims divisible by 8, got {dims}")
+            return faiss.IndexBinaryFlat(dims)
+
+        metric = faiss.METRIC_INNER_PRODUCT if self._uses_inner_product(distance_strategy) else faiss.METRIC_L2
+        if self.precision == "float16":
+            return faiss.IndexScalarQuantizer(dims, faiss.ScalarQuantizer.QT_fp16, metric)
+        if self.precision == "int8":
+            index = faiss.IndexScalarQuantizer(dims, faiss.ScalarQuantizer.QT_8bit_uniform, metric)
+            # Normalized embeddings lie in [-1, 1]; a fixed range needs no training data
+            index.train(np.stack([-np.ones(dims), np.ones(dims)]).astype(np.float32))
+            return index
+        raise ValueError(f"Unsupported precision: {self.precision}")
+
+    def _encode(self, vectors_np: np.ndarray) -> np.ndarray:
+        """Convert float32 vectors into the representation the index stores."""
+        if self._is_binary():
+            return np.packbits(vectors_np > 0, axis=1)
+        return vectors_np
+
+    def _search_index(self, query_vectors: np.ndarray, fetch_k: int):
+        """Search the index, re-ranking oversampled candidates at full precision when rescoring."""
+        if not self.rescore or self.full_index is None:
+            scores, indices = self.index.search(self._encode(query_vectors), fetch_k)
+            if self._is_binary() and self._uses_inner_product():
+                # Hamming distance is lower-is-better; map it to the cosine of the sign vectors so that,
+                # like the other inner-product indexes, a higher score means a closer match
+                scores = 1.0 - 2.0 * scores.astype(np.float32) / self.index.d
+            return scores, indices
+
+        _, candidates = self.index.search(self._encode(query_vectors), fetch_k * self.rescore_multiplier)
+        inner_product = self._uses_inner_product()
+        all_scores, all_indices = [], []
+        for query, row in zip(query_vectors, candidates):
+            row = row[row >= 0]
+            if len(row) == 0:
+                all_scores.append(np.empty(0, dtype=np.float32))
+                all_indices.append(row)
+                continue
+            full = self.full_index.reconstruct_batch(row)
+            if inner_product:
+                scores = full @ query
+                order = np.argsort(-scores)
+            else:
+                scores = ((full - query) ** 2).sum(axis=1)
+                order = np.argsort(scores)
+            order = order[:fetch_k]
+            all_scores.append(scores[order])
+            all_indices.append(row[order])
+        return all_scores, all_indices
+
     def _parse_output(self, scores, ids, limit=None) -> List[OutputData]:
         """
         Parse the output data.
@@ -170,11 +275,9 @@ class FAISS(VectorStoreBase):
         """
         distance_strategy = distance or self.distance_strategy
 
-        # Create index based on distance strategy
-        if distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine":
-            self.index = faiss.IndexFlatIP(self.embedding_model_dims)
-        else:
-            self.index = faiss.IndexFlatL2(self.embedding_model_dims)
+        # Create index based on distance strategy and storage precision
+        self.index = self._create_index(distance_strategy)
+        self.full_index = self._create_flat_index(distance_strategy) if self.rescore else None
 
         self.collection_name = name
 
@@ -213,7 +316,9 @@ class FAISS(VectorStoreBase):
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(vectors_np)
 
-        self.index.add(vectors_np)
+        self.index.add(self._encode(vectors_np))
+        if self.full_index is not None:
+            self.full_index.add(vectors_np)
 
         starting_idx = len(self.index_to_id)
         for i, (vector_id, payload) in enumerate(zip(ids, payloads)):
@@ -251,9 +356,42 @@ class FAISS(VectorStoreBase):
             faiss.normalize_L2(query_vectors)
 
         fetch_k = limit * 2 if filters else limit
-        scores, indices = self.index.search(query_vectors, fetch_k)
+        scores, indices = self._search_index(query_vectors, fetch_k)
+
+        return self._filter_results(scores[0], indices[0], limit, filters)
+
+    def search_batch(
+        self, queries: List[str], vectors_matrix: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """
+        Search for several query vectors with a single FAISS matrix search.
+
+        Args:
+            queries (List[str]): Queries (not used, kept for API compatibility).
+            vectors_matrix (List[list]): One query vector per row.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Optional[Dict], optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            List[List[OutputData]]: Search results for each query, in query order.
+        """
+        if self.index is None:
+            raise ValueError("Collection not initialized. Call create_col first.")
+        if len(vectors_matrix) == 0:
+            return []
+
+        query_vectors = np.array(vectors_matrix, dtype=np.float32).reshape(len(vectors_matrix), -1)
+
+        if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+            faiss.normalize_L2(query_vectors)
+
+        fetch_k = limit * 2 if filters else limit
+        scores, indices = self._search_index(query_vectors, fetch_k)
+
+        return [self._filter_results(scores[i], indices[i], limit, filters) for i in range(len(query_vectors))]
 
-        results = self._parse_output(scores[0], indices[0], limit)
+    def _filter_results(self, scores, indices, limit: int, filters: Optional[Dict]) -> List[OutputData]:
+        results = self._parse_output(scores, indices, limit)
 
         if filters:
             filtered_results = []
@@ -376,6 +514,25 @@ class FAISS(VectorStoreBase):
             payload=payload,
         )
 
+    def get_many(self, vector_ids: List[str]) -> List[OutputData]:
+        """
+        Retrieve several vectors from the docstore.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to retrieve.
+
+        Returns:
+            List[OutputData]: Retrieved vectors that exist, in the order requested.
+        """
+        if self.index is None:
+            raise ValueError("Collection not initialized. Call create_col first.")
+
+        return [
+            OutputData(id=vector_id, score=None, payload=self.docstore[vector_id].copy())
+            for vector_id in vector_ids
+            if vector_id in self.docstore
+        ]
+
     def list_cols(self) -> List[str]:
         """
         List all collections.
@@ -409,12 +566,15 @@ class FAISS(VectorStoreBase):
                     os.remove(index_path)
                 if os.path.exists(docstore_path):
                     os.remove(docstore_path)
+                if self.rescore and os.path.exists(self._full_index_path()):
+                    os.remove(self._full_index_path())
 
                 logger.info(f"Deleted collection {self.collection_name}")
             except Exception as e:
                 logger.warning(f"Failed to delete collection: {e}")
 
         self.index = None
+        self.full_index = None
         self.docstore = {}
         self.index_to_id = {}
 
@@ -433,6 +593,7 @@ class FAISS(VectorStoreBase):
             "count": self.index.ntotal,
             "dimension": self.index.d,
             "distance": self.distance_strategy,
+            "precision": self.precision,
         }
 
     def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
@@ -163,6 +163,31 @@ class MilvusDB(VectorStoreBase):
         result = self._parse_output(data=hits[0])
         return result
 
+    def search_batch(self, queries: list, vectors_matrix: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for several query vectors in one request.
+
+        Args:
+            queries (list): Queries, one per vector.
+            vectors_matrix (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            list: Search results for each query, in query order.
+        """
+        if not vectors_matrix:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        hits = self.client.search(
+            collection_name=self.collection_name,
+            data=list(vectors_matrix),
+            limit=limit,
+            filter=query_filter,
+            output_fields=["*"],
+        )
+        return [self._parse_output(data=query_hits) for query_hits in hits]
+
     def delete(self, vector_id):
         """
         Delete a vector by ID.
@@ -1,6 +1,7 @@
+import asyncio
 import json
 import logging
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any, List, Optional
 
 from pydantic import BaseModel
@@ -8,7 +9,7 @@ from pydantic import BaseModel
 # Try to import psycopg (psycopg3) first, then fall back to psycopg2
 try:
     from psycopg.types.json import Json
-    from psycopg_pool import ConnectionPool
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
     PSYCOPG_VERSION = 3
     logger = logging.getLogger(__name__)
     logger.info("Using psycopg (psycopg3) with ConnectionPool for PostgreSQL connections")
@@ -25,6 +26,7 @@ except ImportError:
             "Please install one of them using 'pip install psycopg[pool]' or 'pip install psycopg2'"
         )
 
+from mem0.memory.utils import LoopLocal
 from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
@@ -36,6 +38,18 @@ class OutputData(BaseModel):
     payload: Optional[dict]
 
 
+class _AsyncPoolSlot:
+    """The async connection pool of one event loop, opened on first use under ``lock``."""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.pool = None
+
+    async def close(self) -> None:
+        if self.pool is not None:
+            await self.pool.close()
+
+
 class PGVector(VectorStoreBase):
     def __init__(
         self,
@@ -53,6 +67,9 @@ class PGVector(VectorStoreBase):
         sslmode=None,
         connection_string=None,
         connection_pool=None,
+        precision="float32",
+        rescore=True,
+        rescore_multiplier=4,
     ):
         """
         Initialize the PGVector database.
@@ -72,12 +89,31 @@ class PGVector(VectorStoreBase):
             sslmode (str, optional): SSL mode for PostgreSQL connection (e.g., 'require', 'prefer', 'disable')
             connection_string (str, optional): PostgreSQL connection string (overrides individual connection parameters)
             connection_pool (Any, optional): psycopg2 connection pool object (overrides connection string and individual parameters)
+            precision (str, optional): Storage precision: 'float32' (vector), 'float16' (halfvec column) or
+                'binary' (HNSW index over binary_quantize(vector) with Hamming search)
+            rescore (bool, optional): For binary precision, re-rank the top `limit * rescore_multiplier`
+                Hamming candidates by exact cosine distance
+            rescore_multiplier (int, optional): Candidate oversampling factor used when rescoring
         """
         self.collection_name = collection_name
         self.use_diskann = diskann
         self.use_hnsw = hnsw
         self.embedding_model_dims = embedding_model_dims
+        if precision not in ("float32", "float16", "binary"):
+            raise ValueError(
+                f"Unsupported precision for pgvector: {precision}. pgvector has no int8 vector type; "
+                "use 'float16' or 'binary'"
+            )
+        self.precision = precision
+        self.rescore = rescore
+        self.rescore_multiplier = rescore_multiplier
+        # Column type; binary precision keeps full vectors and quantizes in the index expression
+        self.vector_type = "halfvec" if precision == "float16" else "vector"
         self.connection_pool = None
+        # Settings for the lazily opened psycopg3 async pool used by the async_* methods
+        self._async_conninfo = None
+        self._async_pools = LoopLocal(_AsyncPoolSlot)
+        self._async_pool_size = (minconn, maxconn)
 
         # Connection setup with priority: connection_pool > connection_string > individual parameters
         if connection_pool is not None:
@@ -102,6 +138,7 @@ class PGVector(VectorStoreBase):
             if PSYCOPG_VERSION == 3:
                 # psycopg3 ConnectionPool
                 self.connection_pool = ConnectionPool(conninfo=connection_string, min_size=minconn, max_size=maxconn, open=True)
+                self._async_conninfo = connection_string
             else:
                 # psycopg2 ThreadedConnectionPool
                 self.connection_pool = ConnectionPool(minconn=minconn, maxconn=maxconn, dsn=connection_string)
@@ -144,6 +181,89 @@ class PGVector(VectorStoreBase):
                 cur.close()
                 self.connection_pool.putconn(conn)
 
+    @staticmethod
+    def _build_filter_clause(filters: Optional[dict]) -> tuple[str, list]:
+        filter_conditions = []
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                filter_conditions.append("payload->>%s = %s")
+                filter_params.extend([k, str(v)])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        return filter_clause, filter_params
+
+    def _nearest_sql(self, query_vector: str, filter_clause: str) -> str:
+        """
+        SQL selecting (id, distance, payload) nearest to `query_vector`, an SQL expression for the query.
+
+        Takes the filter parameters followed by `_limit_params(limit)`.
+        """
+        if self.precision == "binary":
+            hamming = (
+                f"binary_quantize(vector)::bit({self.embedding_model_dims}) "
+                f"<~> binary_quantize({query_vector}::vector)"
+            )
+            if self.rescore:
+                return f"""
+                SELECT id, vector <=> {query_vector}::vector AS distance, payload
+                FROM (
+                    SELECT id, vector, payload
+                    FROM {self.collection_name}
+                    {filter_clause}
+                    ORDER BY {hamming}
+                    LIMIT %s
+                ) candidates
+                ORDER BY distance
+                LIMIT %s
+                """
+            return f"""
+                SELECT id, {hamming} AS distance, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                ORDER BY distance
+                LIMIT %s
+                """
+        return f"""
+                SELECT id, vector <=> {query_vector}::{self.vector_type} AS distance, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                ORDER BY distance
+                LIMIT %s
+                """
+
+    def _limit_params(self, limit: int) -> tuple:
+        if self.precision == "binary" and self.rescore:
+            return (limit * self.rescore_multiplier, limit)
+        return (limit,)
+
+    def _build_search_batch_query(
+        self, vectors_matrix: List[List[float]], limit: int, filters: Optional[dict]
+    ) -> tuple[str, tuple]:
+        """
+        Build a query running one nearest-neighbour scan per query vector via a LATERAL join.
+
+        Query vectors are sent as a text array of vector literals and unnested with their
+        1-based position so rows can be grouped back per query.
+        """
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        vector_literals = ["[" + ",".join(str(float(x)) for x in vector) + "]" for vector in vectors_matrix]
+        sql = f"""
+            SELECT q.ord, m.id, m.distance, m.payload
+            FROM unnest(%s::text[]) WITH ORDINALITY AS q(vec, ord)
+            CROSS JOIN LATERAL ({self._nearest_sql("q.vec", filter_clause)}) m
+            ORDER BY q.ord, m.distance
+            """
+        return sql, (vector_literals, *filter_params, *self._limit_params(limit))
+
+    @staticmethod
+    def _group_search_batch_rows(rows, num_queries: int) -> List[List[OutputData]]:
+        grouped = [[] for _ in range(num_queries)]
+        for ord_, vector_id, distance, payload in rows:
+            grouped[int(ord_) - 1].append(OutputData(id=str(vector_id), score=float(distance), payload=payload))
+        return grouped
+
     def create_col(self) -> None:
         """
         Create a new collection (table in PostgreSQL).
@@ -155,12 +275,12 @@ class PGVector(VectorStoreBase):
                 f"""
                 CREATE TABLE IF NOT EXISTS {self.collection_name} (
                     id UUID PRIMARY KEY,
-                    vector vector({self.embedding_model_dims}),
+                    vector {self.vector_type}({self.embedding_model_dims}),
                     payload JSONB
                 );
                 """
             )
-            if self.use_diskann and self.embedding_model_dims < 2000:
+            if self.use_diskann and self.embedding_model_dims < 2000 and self.precision == "float32":
                 cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
                 if cur.fetchone():
                     # Create DiskANN index if extension is installed for faster search
@@ -172,11 +292,15 @@ class PGVector(VectorStoreBase):
                         """
                     )
             elif self.use_hnsw:
+                if self.precision == "binary":
+                    indexed = f"(binary_quantize(vector)::bit({self.embedding_model_dims})) bit_hamming_ops"
+                else:
+                    indexed = f"vector {self.vector_type}_cosine_ops"
                 cur.execute(
                     f"""
                     CREATE INDEX IF NOT EXISTS {self.collection_name}_hnsw_idx
                     ON {self.collection_name}
-                    USING hnsw (vector vector_cosine_ops)
+                    USING hnsw ({indexed})
                     """
                 )
 
@@ -218,31 +342,47 @@ class PGVector(VectorStoreBase):
         Returns:
             list: Search results.
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        if self.precision == "binary":
+            # The binary query references the vector twice; reuse the batch form
+            return self.search_batch([query], [vectors], limit=limit, filters=filters)[0]
+        filter_clause, filter_params = self._build_filter_clause(filters)
 
         with self._get_cursor() as cur:
             cur.execute(
-                f"""
-                SELECT id, vector <=> %s::vector AS distance, payload
-                FROM {self.collection_name}
-                {filter_clause}
-                ORDER BY distance
-                LIMIT %s
-                """,
+                self._nearest_sql("%s", filter_clause),
                 (vectors, *filter_params, limit),
             )
 
             results = cur.fetchall()
         return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
+    def search_batch(
+        self,
+        queries: List[str],
+        vectors_matrix: List[List[float]],
+        limit: Optional[int] = 5,
+        filters: Optional[dict] = None,
+    ) -> List[List[OutputData]]:
+        """
+        Search for several query vectors in one round trip.
+
+        Args:
+            queries (List[str]): Queries, one per vector.
+            vectors_matrix (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            list: Search results for each query, in query order.
+        """
+        if not vectors_matrix:
+            return []
+        sql, params = self._build_search_batch_query(vectors_matrix, limit, filters)
+        with self._get_cursor() as cur:
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+        return self._group_search_batch_rows(rows, len(vectors_matrix))
+
     def delete(self, vector_id: str) -> None:
         """
         Delete a vector by ID.
@@ -309,6 +449,31 @@ class PGVector(VectorStoreBase):
                 return None
             return OutputData(id=str(result[0]), score=None, payload=result[2])
 
+    def get_many(self, vector_ids: List[str]) -> List[OutputData]:
+        """
+        Retrieve several vectors in one query.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to retrieve.
+
+        Returns:
+            List[OutputData]: Retrieved vectors that exist, in the order requested.
+        """
+        if not vector_ids:
+            return []
+        with self._get_cursor() as cur:
+            cur.execute(
+                f"SELECT id, payload FROM {self.collection_name} WHERE id = ANY(%s::uuid[])",
+                ([str(vector_id) for vector_id in vector_ids],),
+            )
+            rows = cur.fetchall()
+        return self._order_rows_by_ids(rows, vector_ids)
+
+    @staticmethod
+    def _order_rows_by_ids(rows, vector_ids: List[str]) -> List[OutputData]:
+        by_id = {str(row[0]): OutputData(id=str(row[0]), score=None, payload=row[1]) for row in rows}
+        return [by_id[str(vector_id)] for vector_id in vector_ids if str(vector_id) in by_id]
+
     def list_cols(self) -> List[str]:
         """
         List all collections.
@@ -362,15 +527,7 @@ class PGVector(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        filter_clause, filter_params = self._build_filter_clause(filters)
 
         query = f"""
             SELECT id, vector, payload
@@ -402,3 +559,159 @@ class PGVector(VectorStoreBase):
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
         self.create_col()
+
+    async def _get_async_pool(self):
+        """Open the running event loop's psycopg3 async pool on first use, or return None when it is unavailable."""
+        if self._async_conninfo is None:
+            return None
+        slot = self._async_pools.get()
+        if slot.pool is None:
+            async with slot.lock:
+                if slot.pool is None:
+                    minconn, maxconn = self._async_pool_size
+                    pool = AsyncConnectionPool(conninfo=self._async_conninfo, min_size=minconn, max_size=maxconn, open=False)
+                    await pool.open()
+                    slot.pool = pool
+        return slot.pool
+
+    @asynccontextmanager
+    async def _get_async_cursor(self, pool, commit: bool = False):
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                try:
+                    yield cur
+                    if commit:
+                        await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    logger.error("Error in async cursor context (psycopg3)", exc_info=True)
+                    raise
+
+    async def async_insert(self, vectors: List[List[float]], payloads=None, ids=None) -> None:
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await super().async_insert(vectors, payloads=payloads, ids=ids)
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        data = [(id, vector, json.dumps(payload)) for id, vector, payload in zip(ids, vectors, payloads)]
+        async with self._get_async_cursor(pool, commit=True) as cur:
+            await cur.executemany(
+                f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES (%s, %s, %s)",
+                data,
+            )
+
+    async def async_search(
+        self,
+        query: str,
+        vectors: List[float],
+        limit: Optional[int] = 5,
+        filters: Optional[dict] = None,
+    ) -> List[OutputData]:
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await super().async_search(query, vectors, limit=limit, filters=filters)
+        if self.precision == "binary":
+            return (await self.async_search_batch([query], [vectors], limit=limit, filters=filters))[0]
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        async with self._get_async_cursor(pool) as cur:
+            await cur.execute(
+                self._nearest_sql("%s", filter_clause),
+                (vectors, *filter_params, limit),
+            )
+            results = await cur.fetchall()
+        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
+
+    async def async_search_batch(
+        self,
+        queries: List[str],
+        vectors_matrix: List[List[float]],
+        limit: Optional[int] = 5,
+        filters: Optional[dict] = None,
+    ) -> List[List[OutputData]]:
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await super().async_search_batch(queries, vectors_matrix, limit=limit, filters=filters)
+        if not vectors_matrix:
+            return []
+        sql, params = self._build_search_batch_query(vectors_matrix, limit, filters)
+        async with self._get_async_cursor(pool) as cur:
+            await cur.execute(sql, params)
+            rows = await cur.fetchall()
+        return self._group_search_batch_rows(rows, len(vectors_matrix))
+
+    async def async_delete(self, vector_id: str) -> None:
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await super().async_delete(vector_id)
+        async with self._get_async_cursor(pool, commit=True) as cur:
+            await cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
+
+    async def async_update(
+        self,
+        vector_id: str,
+        vector: Optional[List[float]] = None,
+        payload: Optional[dict] = None,
+    ) -> None:
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await super().async_update(vector_id, vector=vector, payload=payload)
+        async with self._get_async_cursor(pool, commit=True) as cur:
+            if vector:
+                await cur.execute(
+                    f"UPDATE {self.collection_name} SET vector = %s WHERE id = %s",
+                    (vector, vector_id),
+                )
+            if payload:
+                await cur.execute(
+                    f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s",
+                    (Json(payload), vector_id),
+                )
+
+    async def async_get(self, vector_id: str) -> OutputData:
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await super().async_get(vector_id)
+        async with self._get_async_cursor(pool) as cur:
+            await cur.execute(
+                f"SELECT id, vector, payload FROM {self.collection_name} WHERE id = %s",
+                (vector_id,),
+            )
+            result = await cur.fetchone()
+        if not result:
+            return None
+        return OutputData(id=str(result[0]), score=None, payload=result[2])
+
+    async def async_get_many(self, vector_ids: List[str]) -> List[OutputData]:
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await super().async_get_many(vector_ids)
+        if not vector_ids:
+            return []
+        async with self._get_async_cursor(pool) as cur:
+            await cur.execute(
+                f"SELECT id, payload FROM {self.collection_name} WHERE id = ANY(%s::uuid[])",
+                ([str(vector_id) for vector_id in vector_ids],),
+            )
+            rows = await cur.fetchall()
+        return self._order_rows_by_ids(rows, vector_ids)
+
+    async def async_list(self, filters: Optional[dict] = None, limit: Optional[int] = 100) -> List[OutputData]:
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await super().async_list(filters=filters, limit=limit)
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        async with self._get_async_cursor(pool) as cur:
+            await cur.execute(
+                f"""
+                SELECT id, vector, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                LIMIT %s
+                """,
+                (*filter_params, limit),
+            )
+            results = await cur.fetchall()
+        return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
+
+    async def async_close(self) -> None:
+        """Close the async connection pool if it was opened."""
+        await self._async_pools.aclose()
@@ -2,18 +2,28 @@ import logging
 import os
 import shutil
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Datatype,
     Distance,
     FieldCondition,
     Filter,
     MatchValue,
     PointIdsList,
     PointStruct,
+    QuantizationSearchParams,
+    QueryRequest,
     Range,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
     VectorParams,
 )
 
+from mem0.memory.utils import LoopLocal
 from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
@@ -31,6 +41,9 @@ class Qdrant(VectorStoreBase):
         url: str = None,
         api_key: str = None,
         on_disk: bool = False,
+        precision: str = "float32",
+        rescore: bool = True,
+        rescore_multiplier: int = 4,
     ):
         """
         Initialize the Qdrant vector store.
@@ -45,7 +58,18 @@ class Qdrant(VectorStoreBase):
             url (str, optional): Full URL for Qdrant server. Defaults to None.
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
+            precision (str, optional): Storage precision: 'float32', 'float16' (FLOAT16 datatype), 'int8' (scalar
+                quantization) or 'binary' (binary quantization). Quantized vectors are kept in RAM and the
+                originals on the configured storage. int8/binary are also applied to an existing collection;
+                float16 only takes effect when the collection is created. Defaults to "float32".
+            rescore (bool, optional): For int8/binary, re-rank oversampled candidates with the original vectors.
+                Defaults to True.
+            rescore_multiplier (int, optional): Candidate oversampling factor used when rescoring. Defaults to 4.
         """
+        # Native async client; None when using an injected client or local storage, in which
+        # case the async methods fall back to running the sync client in a thread.
+        self._async_client = None
+
         if client:
             self.client = client
             self.is_local = False
@@ -67,12 +91,17 @@ class Qdrant(VectorStoreBase):
                         shutil.rmtree(path)
             else:
                 self.is_local = False
+                async_params = dict(params)
+                self._async_client = LoopLocal(lambda: AsyncQdrantClient(**async_params))
 
             self.client = QdrantClient(**params)
 
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.on_disk = on_disk
+        self.precision = precision
+        self.rescore = rescore
+        self.rescore_multiplier = rescore_multiplier
         self.create_col(embedding_model_dims, on_disk)
 
     def create_col(self, vector_size: int, on_disk: bool, distance: Distance = Distance.COSINE):
@@ -89,15 +118,93 @@ class Qdrant(VectorStoreBase):
         for collection in response.collections:
             if collection.name == self.collection_name:
                 logger.debug(f"Collection {self.collection_name} already exists. Skipping creation.")
+                self._sync_precision()
                 self._create_filter_indexes()
                 return
 
+        vector_params = {"size": vector_size, "distance": distance, "on_disk": on_disk}
+        if self.precision == "float16":
+            vector_params["datatype"] = Datatype.FLOAT16
+        collection_params = {}
+        quantization_config = self._quantization_config()
+        if quantization_config is not None:
+            collection_params["quantization_config"] = quantization_config
+
         self.client.create_collection(
             collection_name=self.collection_name,
-            vectors_config=VectorParams(size=vector_size, distance=distance, on_disk=on_disk),
+            vectors_config=VectorParams(**vector_params),
+            **collection_params,
         )
         self._create_filter_indexes()
 
+    def _quantization_config(self):
+        if self.precision == "int8":
+            return ScalarQuantization(scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True))
+        if self.precision == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return None
+
+    def _sync_precision(self):
+        """
+        Bring an existing collection's quantization in line with ``precision``.
+
+        Quantization can be added or swapped on a live collection, so a mismatch is fixed with
+        ``update_collection``. The vector datatype cannot be changed, so a float16 mismatch is only
+        logged. When the update fails and the collection is not quantized, ``precision`` falls back
+        to the collection's own so searches do not send rescore parameters it cannot use.
+        """
+        try:
+            config = self.client.get_collection(collection_name=self.collection_name).config
+        except Exception as e:
+            logger.debug(f"Could not read config of collection {self.collection_name}: {e}")
+            return
+
+        vectors = config.params.vectors
+        datatype = getattr(vectors, "datatype", None)
+        stored_precision = "float16" if datatype == Datatype.FLOAT16 else "float32"
+        if (self.precision == "float16") != (stored_precision == "float16"):
+            logger.warning(
+                f"Collection {self.collection_name} stores {stored_precision} vectors but precision is "
+                f"{self.precision!r}; the vector datatype of an existing collection cannot be changed."
+            )
+
+        existing = config.quantization_config
+        requested = self._quantization_config()
+        if requested is None:
+            if existing is not None:
+                logger.warning(
+                    f"Collection {self.collection_name} is quantized ({type(existing).__name__}) but precision "
+                    f"is {self.precision!r}; leaving its quantization in place."
+                )
+            return
+        if type(existing) is type(requested):
+            return
+
+        try:
+            self.client.update_collection(collection_name=self.collection_name, quantization_config=requested)
+            logger.info(f"Updated quantization of collection {self.collection_name} to {self.precision}")
+        except Exception as e:
+            logger.warning(
+                f"Could not apply {self.precision} quantization to existing collection {self.collection_name}: {e}"
+            )
+            if existing is None:
+                self.precision = stored_precision
+
+    def _search_params(self):
+        """Search parameters for quantized collections; None keeps the server defaults."""
+        if self.precision not in ("int8", "binary"):
+            return None
+        return SearchParams(
+            quantization=QuantizationSearchParams(
+                rescore=self.rescore,
+                oversampling=float(self.rescore_multiplier) if self.rescore else None,
+            )
+        )
+
+    def _search_kwargs(self) -> dict:
+        search_params = self._search_params()
+        return {"search_params": search_params} if search_params is not None else {}
+
     def _create_filter_indexes(self):
         """Create indexes for commonly used filter fields to enable filtering."""
         # Only create payload indexes for remote Qdrant servers
@@ -128,7 +235,11 @@ class Qdrant(VectorStoreBase):
             ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
         """
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
-        points = [
+        points = self._build_points(vectors, payloads, ids)
+        self.client.upsert(collection_name=self.collection_name, points=points)
+
+    def _build_points(self, vectors: list, payloads: list = None, ids: list = None) -> list:
+        return [
             PointStruct(
                 id=idx if ids is None else ids[idx],
                 vector=vector,
@@ -136,7 +247,6 @@ class Qdrant(VectorStoreBase):
             )
             for idx, vector in enumerate(vectors)
         ]
-        self.client.upsert(collection_name=self.collection_name, points=points)
 
     def _create_filter(self, filters: dict) -> Filter:
         """
@@ -178,9 +288,39 @@ class Qdrant(VectorStoreBase):
             query=vectors,
             query_filter=query_filter,
             limit=limit,
+            **self._search_kwargs(),
         )
         return hits.points
 
+    def _build_query_requests(self, vectors_matrix: list, limit: int, filters: dict = None) -> list:
+        query_filter = self._create_filter(filters) if filters else None
+        search_params = self._search_params()
+        return [
+            QueryRequest(query=vector, filter=query_filter, limit=limit, with_payload=True, params=search_params)
+            for vector in vectors_matrix
+        ]
+
+    def search_batch(self, queries: list, vectors_matrix: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for several query vectors in one request.
+
+        Args:
+            queries (list): Queries, one per vector.
+            vectors_matrix (list): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            list: Search results for each query, in query order.
+        """
+        if not vectors_matrix:
+            return []
+        responses = self.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=self._build_query_requests(vectors_matrix, limit, filters),
+        )
+        return [response.points for response in responses]
+
     def delete(self, vector_id: int):
         """
         Delete a vector by ID.
@@ -220,6 +360,27 @@ class Qdrant(VectorStoreBase):
         result = self.client.retrieve(collection_name=self.collection_name, ids=[vector_id], with_payload=True)
         return result[0] if result else None
 
+    def get_many(self, vector_ids: list) -> list:
+        """
+        Retrieve several vectors in one request.
+
+        Args:
+            vector_ids (list): IDs of the vectors to retrieve.
+
+        Returns:
+            list: Retrieved points that exist, in the order requested.
+        """
+        if not vector_ids:
+            return []
+        points = self.client.retrieve(collection_name=self.collection_name, ids=list(vector_ids), with_payload=True)
+        return self._order_by_ids(points, vector_ids)
+
+    @staticmethod
+    def _order_by_ids(points: list, vector_ids: list) -> list:
+        # Qdrant does not guarantee that retrieve returns points in request order
+        by_id = {str(point.id): point for point in points}
+        return [by_id[str(vector_id)] for vector_id in vector_ids if str(vector_id) in by_id]
+
     def list_cols(self) -> list:
         """
         List all collections.
@@ -268,3 +429,98 @@ class Qdrant(VectorStoreBase):
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
         self.create_col(self.embedding_model_dims, self.on_disk)
+
+    def _get_async_client(self):
+        return self._async_client.get() if self._async_client is not None else None
+
+    async def async_insert(self, vectors: list, payloads: list = None, ids: list = None):
+        """Insert vectors into a collection using the async Qdrant client."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().async_insert(vectors, payloads=payloads, ids=ids)
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        points = self._build_points(vectors, payloads, ids)
+        await client.upsert(collection_name=self.collection_name, points=points)
+
+    async def async_search(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """Search for similar vectors using the async Qdrant client."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().async_search(query, vectors, limit=limit, filters=filters)
+        query_filter = self._create_filter(filters) if filters else None
+        hits = await client.query_points(
+            collection_name=self.collection_name,
+            query=vectors,
+            query_filter=query_filter,
+            limit=limit,
+            **self._search_kwargs(),
+        )
+        return hits.points
+
+    async def async_search_batch(self, queries: list, vectors_matrix: list, limit: int = 5, filters: dict = None) -> list:
+        """Search for several query vectors in one request using the async Qdrant client."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().async_search_batch(queries, vectors_matrix, limit=limit, filters=filters)
+        if not vectors_matrix:
+            return []
+        responses = await client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=self._build_query_requests(vectors_matrix, limit, filters),
+        )
+        return [response.points for response in responses]
+
+    async def async_delete(self, vector_id: int):
+        """Delete a vector by ID using the async Qdrant client."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().async_delete(vector_id)
+        await client.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(points=[vector_id]),
+        )
+
+    async def async_update(self, vector_id: int, vector: list = None, payload: dict = None):
+        """Update a vector and its payload using the async Qdrant client."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().async_update(vector_id, vector=vector, payload=payload)
+        point = PointStruct(id=vector_id, vector=vector, payload=payload)
+        await client.upsert(collection_name=self.collection_name, points=[point])
+
+    async def async_get(self, vector_id: int) -> dict:
+        """Retrieve a vector by ID using the async Qdrant client."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().async_get(vector_id)
+        result = await client.retrieve(collection_name=self.collection_name, ids=[vector_id], with_payload=True)
+        return result[0] if result else None
+
+    async def async_get_many(self, vector_ids: list) -> list:
+        """Retrieve several vectors in one request using the async Qdrant client."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().async_get_many(vector_ids)
+        if not vector_ids:
+            return []
+        points = await client.retrieve(collection_name=self.collection_name, ids=list(vector_ids), with_payload=True)
+        return self._order_by_ids(points, vector_ids)
+
+    async def async_list(self, filters: dict = None, limit: int = 100) -> list:
+        """List vectors in a collection using the async Qdrant client."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().async_list(filters=filters, limit=limit)
+        query_filter = self._create_filter(filters) if filters else None
+        return await client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=query_filter,
+            limit=limit,
+            with_payload=True,
+            with_vectors=False,
+        )
+
+    async def async_close(self) -> None:
+        """Close the async Qdrant client if it was opened."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
@@ -1,7 +1,9 @@
 import json
 import logging
+import threading
 from datetime import datetime
 from functools import reduce
+from typing import Dict
 
 import numpy as np
 import pytz
@@ -10,6 +12,7 @@ from redis.commands.search.query import Query
 from redisvl.index import SearchIndex
 from redisvl.query import VectorQuery
 from redisvl.query.filter import Tag
+from redisvl.redis.utils import convert_bytes
 
 from mem0.memory.utils import extract_json
 from mem0.vector_stores.base import VectorStoreBase
@@ -37,6 +40,23 @@ DEFAULT_FIELDS = [
 
 excluded_keys = {"user_id", "agent_id", "run_id", "hash", "data", "created_at", "updated_at"}
 
+# Number of commands queued on a pipeline before it is flushed in bulk writes and reads
+PIPELINE_BATCH_SIZE = 500
+
+# Clients are thread-safe and own a connection pool, so every store pointing at the
+# same URL shares one instead of opening a pool per collection.
+_shared_clients: Dict[str, redis.Redis] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(redis_url: str) -> redis.Redis:
+    with _shared_clients_lock:
+        client = _shared_clients.get(redis_url)
+        if client is None:
+            client = redis.Redis.from_url(redis_url)
+            _shared_clients[redis_url] = client
+        return client
+
 
 class MemoryResult:
     def __init__(self, id: str, payload: dict, score: float = None):
@@ -71,7 +91,7 @@ class RedisDB(VectorStoreBase):
 
         self.schema = {"index": index_schema, "fields": fields}
 
-        self.client = redis.Redis.from_url(redis_url)
+        self.client = _get_shared_client(redis_url)
         self.index = SearchIndex.from_dict(self.schema)
         self.index.set_client(self.client)
         self.index.create(overwrite=True)
@@ -119,28 +139,33 @@ class RedisDB(VectorStoreBase):
 
         return index
 
+    def _build_entry(self, vector_id, vector, payload, include_updated_at=False):
+        entry = {
+            "memory_id": vector_id,
+            "hash": payload["hash"],
+            "memory": payload["data"],
+            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
+            "embedding": np.array(vector, dtype=np.float32).tobytes(),
+        }
+        if include_updated_at:
+            entry["updated_at"] = int(datetime.fromisoformat(payload["updated_at"]).timestamp())
+
+        # Conditionally add optional fields
+        for field in ["agent_id", "run_id", "user_id"]:
+            if field in payload:
+                entry[field] = payload[field]
+
+        # Add metadata excluding specific keys
+        entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+        return entry
+
+    def _key(self, vector_id):
+        return f"{self.schema['index']['prefix']}:{vector_id}"
+
     def insert(self, vectors: list, payloads: list = None, ids: list = None):
-        data = []
-        for vector, payload, id in zip(vectors, payloads, ids):
-            # Start with required fields
-            entry = {
-                "memory_id": id,
-                "hash": payload["hash"],
-                "memory": payload["data"],
-                "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                "embedding": np.array(vector, dtype=np.float32).tobytes(),
-            }
-
-            # Conditionally add optional fields
-            for field in ["agent_id", "run_id", "user_id"]:
-                if field in payload:
-                    entry[field] = payload[field]
-
-            # Add metadata excluding specific keys
-            entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-
-            data.append(entry)
-        self.index.load(data, id_field="memory_id")
+        data = [self._build_entry(id, vector, payload) for vector, payload, id in zip(vectors, payloads, ids)]
+        # redisvl writes through a non-transactional pipeline flushed every batch_size entries
+        self.index.load(data, id_field="memory_id", batch_size=PIPELINE_BATCH_SIZE)
 
     def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
         conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
@@ -183,27 +208,29 @@ class RedisDB(VectorStoreBase):
         ]
 
     def delete(self, vector_id):
-        self.index.drop_keys(f"{self.schema['index']['prefix']}:{vector_id}")
+        self.index.drop_keys(self._key(vector_id))
 
-    def update(self, vector_id=None, vector=None, payload=None):
-        data = {
-            "memory_id": vector_id,
-            "hash": payload["hash"],
-            "memory": payload["data"],
-            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-            "updated_at": int(datetime.fromisoformat(payload["updated_at"]).timestamp()),
-            "embedding": np.array(vector, dtype=np.float32).tobytes(),
-        }
+    def delete_many(self, vector_ids: list):
+        if vector_ids:
+            self.index.drop_keys([self._key(vector_id) for vector_id in vector_ids])
 
-        for field in ["agent_id", "run_id", "user_id"]:
-            if field in payload:
-                data[field] = payload[field]
+    def update(self, vector_id=None, vector=None, payload=None):
+        data = self._build_entry(vector_id, vector, payload, include_updated_at=True)
+        self.index.load(data=[data], keys=[self._key(vector_id)], id_field="memory_id")
 
-        data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-        self.index.load(data=[data], keys=[f"{self.schema['index']['prefix']}:{vector_id}"], id_field="memory_id")
+    def update_many(self, vector_ids: list, vectors: list, payloads: list):
+        data = [
+            self._build_entry(vector_id, vector, payload, include_updated_at=True)
+            for vector_id, vector, payload in zip(vector_ids, vectors, payloads)
+        ]
+        self.index.load(
+            data=data,
+            keys=[self._key(vector_id) for vector_id in vector_ids],
+            id_field="memory_id",
+            batch_size=PIPELINE_BATCH_SIZE,
+        )
 
-    def get(self, vector_id):
-        result = self.index.fetch(vector_id)
+    def _to_memory_result(self, result):
         payload = {
             "hash": result["hash"],
             "data": result["memory"],
@@ -225,6 +252,19 @@ class RedisDB(VectorStoreBase):
 
         return MemoryResult(id=result["memory_id"], payload=payload)
 
+    def get(self, vector_id):
+        return self._to_memory_result(self.index.fetch(vector_id))
+
+    def get_many(self, vector_ids: list) -> list:
+        """Fetch several memories with pipelined HGETALLs, skipping missing IDs and keeping the requested order."""
+        results = []
+        for start in range(0, len(vector_ids), PIPELINE_BATCH_SIZE):
+            pipe = self.client.pipeline(transaction=False)
+            for vector_id in vector_ids[start : start + PIPELINE_BATCH_SIZE]:
+                pipe.hgetall(self._key(vector_id))
+            results.extend(self._to_memory_result(convert_bytes(raw)) for raw in pipe.execute() if raw)
+        return results
+
     def list_cols(self):
         return self.index.listall()
 
@@ -1,7 +1,8 @@
 import json
 import logging
+import threading
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
 
 import numpy as np
 import pytz
@@ -34,6 +35,23 @@ DEFAULT_FIELDS = [
 
 excluded_keys = {"user_id", "agent_id", "run_id", "hash", "data", "created_at", "updated_at"}
 
+# Number of commands queued on a pipeline before it is flushed in bulk writes and reads
+PIPELINE_BATCH_SIZE = 500
+
+# Clients are thread-safe and own a connection pool, so every store pointing at the
+# same URL shares one instead of opening a pool per collection.
+_shared_clients: Dict[str, "valkey.Valkey"] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(valkey_url: str):
+    with _shared_clients_lock:
+        client = _shared_clients.get(valkey_url)
+        if client is None:
+            client = valkey.from_url(valkey_url)
+            _shared_clients[valkey_url] = client
+        return client
+
 
 class OutputData(BaseModel):
     id: str
@@ -81,7 +99,7 @@ class ValkeyDB(VectorStoreBase):
 
         # Connect to Valkey
         try:
-            self.client = valkey.from_url(valkey_url)
+            self.client = _get_shared_client(valkey_url)
             logger.debug(f"Successfully connected to Valkey at {valkey_url}")
         except Exception as e:
             logger.exception(f"Failed to connect to Valkey at {valkey_url}: {e}")
@@ -274,45 +292,65 @@ class ValkeyDB(VectorStoreBase):
             payloads (list, optional): List of payloads corresponding to the vectors.
             ids (list, optional): List of IDs for the vectors.
         """
-        for vector, payload, id in zip(vectors, payloads, ids):
+        for start in range(0, len(ids), PIPELINE_BATCH_SIZE):
+            batch = zip(
+                vectors[start : start + PIPELINE_BATCH_SIZE],
+                payloads[start : start + PIPELINE_BATCH_SIZE],
+                ids[start : start + PIPELINE_BATCH_SIZE],
+            )
+            # Non-transactional pipeline: one round trip per batch without MULTI/EXEC overhead
+            pipe = self.client.pipeline(transaction=False)
+            for vector, payload, id in batch:
+                try:
+                    pipe.hset(f"{self.prefix}:{id}", mapping=self._build_hash_data(id, vector, payload))
+                except KeyError as e:
+                    logger.error(f"Error inserting vector with ID {id}: Missing required field {e}")
+                except Exception as e:
+                    logger.exception(f"Error inserting vector with ID {id}: {e}")
+                    raise
             try:
-                # Create the key for the hash
-                key = f"{self.prefix}:{id}"
-
-                # Check for required fields and provide defaults if missing
-                if "data" not in payload:
-                    # Silently use default value for missing 'data' field
-                    pass
-
-                # Ensure created_at is present
-                if "created_at" not in payload:
-                    payload["created_at"] = datetime.now(pytz.timezone(self.timezone)).isoformat()
-
-                # Prepare the hash data
-                hash_data = {
-                    "memory_id": id,
-                    "hash": payload.get("hash", f"hash_{id}"),  # Use a default hash if not provided
-                    "memory": payload.get("data", f"data_{id}"),  # Use a default data if not provided
-                    "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                    "embedding": np.array(vector, dtype=np.float32).tobytes(),
-                }
+                pipe.execute()
+            except Exception as e:
+                logger.exception(f"Error inserting vectors: {e}")
+                raise
+            logger.debug(f"Successfully inserted batch of vectors starting at offset {start}")
 
-                # Add optional fields
-                for field in ["agent_id", "run_id", "user_id"]:
-                    if field in payload:
-                        hash_data[field] = payload[field]
+    def _build_hash_data(self, vector_id, vector, payload, include_updated_at=False):
+        """
+        Build the hash stored for a vector.
 
-                # Add metadata
-                hash_data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+        Args:
+            vector_id (str): ID of the vector.
+            vector (list): Vector data.
+            payload (dict): Payload data. ``created_at`` is filled in when missing.
+            include_updated_at (bool, optional): Store ``updated_at`` when present in the payload.
 
-                # Store in Valkey
-                self.client.hset(key, mapping=hash_data)
-                logger.debug(f"Successfully inserted vector with ID {id}")
-            except KeyError as e:
-                logger.error(f"Error inserting vector with ID {id}: Missing required field {e}")
-            except Exception as e:
-                logger.exception(f"Error inserting vector with ID {id}: {e}")
-                raise
+        Returns:
+            dict: Field mapping for HSET.
+        """
+        # Ensure created_at is present
+        if "created_at" not in payload:
+            payload["created_at"] = datetime.now(pytz.timezone(self.timezone)).isoformat()
+
+        hash_data = {
+            "memory_id": vector_id,
+            "hash": payload.get("hash", f"hash_{vector_id}"),  # Use a default hash if not provided
+            "memory": payload.get("data", f"data_{vector_id}"),  # Use a default data if not provided
+            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
+            "embedding": np.array(vector, dtype=np.float32).tobytes(),
+        }
+
+        if include_updated_at and "updated_at" in payload:
+            hash_data["updated_at"] = int(datetime.fromisoformat(payload["updated_at"]).timestamp())
+
+        # Add optional fields
+        for field in ["agent_id", "run_id", "user_id"]:
+            if field in payload:
+                hash_data[field] = payload[field]
+
+        # Add metadata
+        hash_data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+        return hash_data
 
     def _build_search_query(self, knn_part, filters=None):
         """
@@ -464,6 +502,26 @@ class ValkeyDB(VectorStoreBase):
             logger.exception(f"Error deleting vector with ID {vector_id}: {e}")
             raise
 
+    def delete_many(self, vector_ids: list):
+        """
+        Delete several vectors, issuing one multi-key DEL per pipeline batch.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+        """
+        if not vector_ids:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for start in range(0, len(vector_ids), PIPELINE_BATCH_SIZE):
+                keys = [f"{self.prefix}:{vector_id}" for vector_id in vector_ids[start : start + PIPELINE_BATCH_SIZE]]
+                pipe.delete(*keys)
+            pipe.execute()
+            logger.debug(f"Successfully deleted {len(vector_ids)} vectors")
+        except Exception as e:
+            logger.exception(f"Error deleting vectors: {e}")
+            raise
+
     def update(self, vector_id=None, vector=None, payload=None):
         """
         Update a vector in the index.
@@ -475,39 +533,7 @@ class ValkeyDB(VectorStoreBase):
         """
         try:
             key = f"{self.prefix}:{vector_id}"
-
-            # Check for required fields and provide defaults if missing
-            if "data" not in payload:
-                # Silently use default value for missing 'data' field
-                pass
-
-            # Ensure created_at is present
-            if "created_at" not in payload:
-                payload["created_at"] = datetime.now(pytz.timezone(self.timezone)).isoformat()
-
-            # Prepare the hash data
-            hash_data = {
-                "memory_id": vector_id,
-                "hash": payload.get("hash", f"hash_{vector_id}"),  # Use a default hash if not provided
-                "memory": payload.get("data", f"data_{vector_id}"),  # Use a default data if not provided
-                "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                "embedding": np.array(vector, dtype=np.float32).tobytes(),
-            }
-
-            # Add updated_at if available
-            if "updated_at" in payload:
-                hash_data["updated_at"] = int(datetime.fromisoformat(payload["updated_at"]).timestamp())
-
-            # Add optional fields
-            for field in ["agent_id", "run_id", "user_id"]:
-                if field in payload:
-                    hash_data[field] = payload[field]
-
-            # Add metadata
-            hash_data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-
-            # Update in Valkey
-            self.client.hset(key, mapping=hash_data)
+            self.client.hset(key, mapping=self._build_hash_data(vector_id, vector, payload, include_updated_at=True))
             logger.debug(f"Successfully updated vector with ID {vector_id}")
         except KeyError as e:
             logger.error(f"Error updating vector with ID {vector_id}: Missing required field {e}")
@@ -515,6 +541,34 @@ class ValkeyDB(VectorStoreBase):
             logger.exception(f"Error updating vector with ID {vector_id}: {e}")
             raise
 
+    def update_many(self, vector_ids: list, vectors: list, payloads: list):
+        """
+        Update several vectors, pipelining the writes.
+
+        Args:
+            vector_ids (list): IDs of the vectors to update.
+            vectors (list): New vector data, aligned with ``vector_ids``.
+            payloads (list): New payload data, aligned with ``vector_ids``.
+        """
+        for start in range(0, len(vector_ids), PIPELINE_BATCH_SIZE):
+            pipe = self.client.pipeline(transaction=False)
+            for vector_id, vector, payload in zip(
+                vector_ids[start : start + PIPELINE_BATCH_SIZE],
+                vectors[start : start + PIPELINE_BATCH_SIZE],
+                payloads[start : start + PIPELINE_BATCH_SIZE],
+            ):
+                try:
+                    hash_data = self._build_hash_data(vector_id, vector, payload, include_updated_at=True)
+                except KeyError as e:
+                    logger.error(f"Error updating vector with ID {vector_id}: Missing required field {e}")
+                    continue
+                pipe.hset(f"{self.prefix}:{vector_id}", mapping=hash_data)
+            try:
+                pipe.execute()
+            except Exception as e:
+                logger.exception(f"Error updating vectors: {e}")
+                raise
+
     def _format_timestamp(self, timestamp, timezone=None):
         """
         Format a timestamp with the specified timezone.
@@ -652,6 +706,33 @@ class ValkeyDB(VectorStoreBase):
             logger.exception(f"Error getting vector with ID {vector_id}: {e}")
             raise
 
+    def get_many(self, vector_ids: list) -> List[OutputData]:
+        """
+        Get several vectors by ID, fetching them with pipelined HGETALLs.
+
+        Args:
+            vector_ids (list): IDs of the vectors to get.
+
+        Returns:
+            list: OutputData for the IDs that exist, in the order requested.
+        """
+        results: List[OutputData] = []
+        try:
+            for start in range(0, len(vector_ids), PIPELINE_BATCH_SIZE):
+                batch_ids = vector_ids[start : start + PIPELINE_BATCH_SIZE]
+                pipe = self.client.pipeline(transaction=False)
+                for vector_id in batch_ids:
+                    pipe.hgetall(f"{self.prefix}:{vector_id}")
+                for vector_id, result in zip(batch_ids, pipe.execute()):
+                    if not result:
+                        continue
+                    payload, memory_id = self._process_document_fields(self._convert_bytes(result), vector_id)
+                    results.append(OutputData(id=memory_id, payload=payload, score=0.0))
+        except Exception as e:
+            logger.exception(f"Error getting vectors: {e}")
+            raise
+        return results
+
     def list_cols(self):
         """
         List all collections (indices) in Valkey.
@@ -0,0 +1,63 @@
+"""add_memory_access_rollups
+
+Revision ID: add_memory_access_rollups
+Revises: add_memory_fulltext_index
+Create Date: 2025-07-08 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_memory_access_rollups"
+down_revision: Union[str, None] = "add_memory_fulltext_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Hourly access counts per memory and app."""
+    op.create_table(
+        "memory_access_rollups",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("memory_id", sa.UUID(), nullable=False),
+        sa.Column("app_id", sa.UUID(), nullable=False),
+        sa.Column("access_type", sa.String(), nullable=False),
+        sa.Column("hour", sa.DateTime(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("first_accessed_at", sa.DateTime(), nullable=False),
+        sa.Column("last_accessed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["app_id"],
+            ["apps.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["memory_id"],
+            ["memories.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_rollup_bucket", "memory_access_rollups", ["memory_id", "app_id", "access_type", "hour"], unique=True
+    )
+    op.create_index("idx_rollup_app_hour", "memory_access_rollups", ["app_id", "hour"], unique=False)
+    op.create_index(
+        op.f("ix_memory_access_rollups_access_type"), "memory_access_rollups", ["access_type"], unique=False
+    )
+    op.create_index(op.f("ix_memory_access_rollups_app_id"), "memory_access_rollups", ["app_id"], unique=False)
+    op.create_index(op.f("ix_memory_access_rollups_hour"), "memory_access_rollups", ["hour"], unique=False)
+    op.create_index(op.f("ix_memory_access_rollups_memory_id"), "memory_access_rollups", ["memory_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the access rollups."""
+    op.drop_index(op.f("ix_memory_access_rollups_memory_id"), table_name="memory_access_rollups")
+    op.drop_index(op.f("ix_memory_access_rollups_hour"), table_name="memory_access_rollups")
+    op.drop_index(op.f("ix_memory_access_rollups_app_id"), table_name="memory_access_rollups")
+    op.drop_index(op.f("ix_memory_access_rollups_access_type"), table_name="memory_access_rollups")
+    op.drop_index("idx_rollup_app_hour", table_name="memory_access_rollups")
+    op.drop_index("idx_rollup_bucket", table_name="memory_access_rollups")
+    op.drop_table("memory_access_rollups")
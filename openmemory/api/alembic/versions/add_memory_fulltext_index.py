@@ -0,0 +1,88 @@
+"""add_memory_fulltext_index
+
+Revision ID: add_memory_fulltext_index
+Revises: afd00efbd06b
+Create Date: 2025-07-01 10:00:00.000000
+
+"""
+
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+
+logger = logging.getLogger(__name__)
+
+# revision identifiers, used by Alembic.
+revision: str = "add_memory_fulltext_index"
+down_revision: Union[str, None] = "afd00efbd06b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index memory content for list/filter search."""
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+    if dialect == "sqlite":
+        # The trigram tokenizer needs SQLite 3.34; older versions keep the unindexed ILIKE search
+        version = bind.exec_driver_sql("SELECT sqlite_version()").scalar()
+        if tuple(int(part) for part in version.split(".")[:2]) < (3, 34):
+            logger.warning(f"SQLite {version} has no FTS5 trigram tokenizer, memory search will not use an index")
+            return
+        # memories is keyed by a UUID and VACUUM may renumber its implicit rowids, so the
+        # contentless FTS5 table takes stable integer keys from memories_fts_keys
+        op.execute(
+            "CREATE TABLE IF NOT EXISTS memories_fts_keys (fts_rowid INTEGER PRIMARY KEY, memory_id TEXT NOT NULL UNIQUE)"
+        )
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(content, content='', tokenize='trigram')"
+        )
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_fts_ai AFTER INSERT ON memories BEGIN
+                INSERT INTO memories_fts_keys(memory_id) VALUES (new.id);
+                INSERT INTO memories_fts(rowid, content)
+                    SELECT fts_rowid, new.content FROM memories_fts_keys WHERE memory_id = new.id;
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_fts_ad AFTER DELETE ON memories BEGIN
+                INSERT INTO memories_fts(memories_fts, rowid, content)
+                    SELECT 'delete', fts_rowid, old.content FROM memories_fts_keys WHERE memory_id = old.id;
+                DELETE FROM memories_fts_keys WHERE memory_id = old.id;
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_fts_au AFTER UPDATE OF content ON memories BEGIN
+                INSERT INTO memories_fts(memories_fts, rowid, content)
+                    SELECT 'delete', fts_rowid, old.content FROM memories_fts_keys WHERE memory_id = old.id;
+                INSERT INTO memories_fts(rowid, content)
+                    SELECT fts_rowid, new.content FROM memories_fts_keys WHERE memory_id = new.id;
+            END
+        """)
+        # Index existing rows
+        op.execute("INSERT OR IGNORE INTO memories_fts_keys(memory_id) SELECT id FROM memories")
+        op.execute("""
+            INSERT INTO memories_fts(rowid, content)
+                SELECT k.fts_rowid, m.content FROM memories m JOIN memories_fts_keys k ON k.memory_id = m.id
+        """)
+    elif dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX IF NOT EXISTS idx_memory_content_trgm ON memories USING gin (content gin_trgm_ops)")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_memory_content_tsv ON memories USING gin (to_tsvector('simple', content))"
+        )
+
+
+def downgrade() -> None:
+    """Drop the memory content indexes."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS memories_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS memories_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS memories_fts_ai")
+        op.execute("DROP TABLE IF EXISTS memories_fts")
+        op.execute("DROP TABLE IF EXISTS memories_fts_keys")
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS idx_memory_content_tsv")
+        op.execute("DROP INDEX IF EXISTS idx_memory_content_trgm")
@@ -11,6 +11,7 @@ Key features:
 - Lazy memory client initialization
 - Graceful error handling for unavailable dependencies
 - Fallback to database-only mode when vector store is unavailable
+- Blocking memory and database work runs in bounded executors, off the event loop
 - Proper logging for debugging connection issues
 - Environment variable parsing for API keys
 """
@@ -23,9 +24,11 @@ import uuid
 
 from app.database import SessionLocal
 from app.models import Memory, MemoryAccessLog, MemoryState, MemoryStatusHistory
+from app.utils.access_log import access_log
+from app.utils.concurrency import run_read, run_write
 from app.utils.db import get_user_and_app
 from app.utils.memory import get_memory_client
-from app.utils.permissions import check_memory_access_permissions
+from app.utils.permissions import check_memory_access_permissions, memory_access_filter
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.routing import APIRouter
@@ -67,6 +70,10 @@ async def add_memories(text: str) -> str:
     if not client_name:
         return "Error: client_name not provided"
 
+    return await run_write(_add_memories, uid, client_name, text)
+
+
+def _add_memories(uid: str, client_name: str, text: str) -> str:
     # Get memory client safely
     memory_client = get_memory_client_safe()
     if not memory_client:
@@ -150,6 +157,10 @@ async def search_memory(query: str) -> str:
     if not client_name:
         return "Error: client_name not provided"
 
+    return await run_read(_search_memory, uid, client_name, query)
+
+
+def _search_memory(uid: str, client_name: str, query: str) -> str:
     # Get memory client safely
     memory_client = get_memory_client_safe()
     if not memory_client:
@@ -162,8 +173,10 @@ async def search_memory(query: str) -> str:
             user, app = get_user_and_app(db, user_id=uid, app_id=client_name)
 
             # Get accessible memory IDs based on ACL
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
+            accessible_memory_ids = [
+                memory_id
+                for (memory_id,) in db.query(Memory.id).filter(Memory.user_id == user.id, memory_access_filter(app.id))
+            ]
 
             filters = {
                 "user_id": uid
@@ -198,18 +211,16 @@ async def search_memory(query: str) -> str:
 
             for r in results: 
                 if r.get("id"): 
-                    access_log = MemoryAccessLog(
-                        memory_id=uuid.UUID(r["id"]),
-                        app_id=app.id,
-                        access_type="search",
-                        metadata_={
+                    access_log.record(
+                        uuid.UUID(r["id"]),
+                        app.id,
+                        "search",
+                        metadata={
                             "query": query,
                             "score": r.get("score"),
                             "hash": r.get("hash"),
                         },
                     )
-                    db.add(access_log)
-            db.commit()
 
             return json.dumps({"results": results}, indent=2)
         finally:
@@ -228,6 +239,10 @@ async def list_memories() -> str:
     if not client_name:
         return "Error: client_name not provided"
 
+    return await run_read(_list_memories, uid, client_name)
+
+
+def _list_memories(uid: str, client_name: str) -> str:
     # Get memory client safely
     memory_client = get_memory_client_safe()
     if not memory_client:
@@ -244,42 +259,26 @@ async def list_memories() -> str:
             filtered_memories = []
 
             # Filter memories based on permissions
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
+            accessible_memory_ids = [
+                memory_id
+                for (memory_id,) in db.query(Memory.id).filter(Memory.user_id == user.id, memory_access_filter(app.id))
+            ]
             if isinstance(memories, dict) and 'results' in memories:
                 for memory_data in memories['results']:
                     if 'id' in memory_data:
                         memory_id = uuid.UUID(memory_data['id'])
                         if memory_id in accessible_memory_ids:
                             # Create access log entry
-                            access_log = MemoryAccessLog(
-                                memory_id=memory_id,
-                                app_id=app.id,
-                                access_type="list",
-                                metadata_={
-                                    "hash": memory_data.get('hash')
-                                }
-                            )
-                            db.add(access_log)
+                            access_log.record(memory_id, app.id, "list", metadata={"hash": memory_data.get('hash')})
                             filtered_memories.append(memory_data)
-                db.commit()
             else:
                 for memory in memories:
                     memory_id = uuid.UUID(memory['id'])
                     memory_obj = db.query(Memory).filter(Memory.id == memory_id).first()
                     if memory_obj and check_memory_access_permissions(db, memory_obj, app.id):
                         # Create access log entry
-                        access_log = MemoryAccessLog(
-                            memory_id=memory_id,
-                            app_id=app.id,
-                            access_type="list",
-                            metadata_={
-                                "hash": memory.get('hash')
-                            }
-                        )
-                        db.add(access_log)
+                        access_log.record(memory_id, app.id, "list", metadata={"hash": memory.get('hash')})
                         filtered_memories.append(memory)
-                db.commit()
             return json.dumps(filtered_memories, indent=2)
         finally:
             db.close()
@@ -297,6 +296,10 @@ async def delete_memories(memory_ids: list[str]) -> str:
     if not client_name:
         return "Error: client_name not provided"
 
+    return await run_write(_delete_memories, uid, client_name, memory_ids)
+
+
+def _delete_memories(uid: str, client_name: str, memory_ids: list[str]) -> str:
     # Get memory client safely
     memory_client = get_memory_client_safe()
     if not memory_client:
@@ -310,8 +313,10 @@ async def delete_memories(memory_ids: list[str]) -> str:
 
             # Convert string IDs to UUIDs and filter accessible ones
             requested_ids = [uuid.UUID(mid) for mid in memory_ids]
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
+            accessible_memory_ids = [
+                memory_id
+                for (memory_id,) in db.query(Memory.id).filter(Memory.user_id == user.id, memory_access_filter(app.id))
+            ]
 
             # Only delete memories that are both requested and accessible
             ids_to_delete = [mid for mid in requested_ids if mid in accessible_memory_ids]
@@ -345,13 +350,13 @@ async def delete_memories(memory_ids: list[str]) -> str:
                     db.add(history)
 
                     # Create access log entry
-                    access_log = MemoryAccessLog(
+                    log_entry = MemoryAccessLog(
                         memory_id=memory_id,
                         app_id=app.id,
                         access_type="delete",
                         metadata_={"operation": "delete_by_id"}
                     )
-                    db.add(access_log)
+                    db.add(log_entry)
 
             db.commit()
             return f"Successfully deleted {len(ids_to_delete)} memories"
@@ -371,6 +376,10 @@ async def delete_all_memories() -> str:
     if not client_name:
         return "Error: client_name not provided"
 
+    return await run_write(_delete_all_memories, uid, client_name)
+
+
+def _delete_all_memories(uid: str, client_name: str) -> str:
     # Get memory client safely
     memory_client = get_memory_client_safe()
     if not memory_client:
@@ -382,8 +391,10 @@ async def delete_all_memories() -> str:
             # Get or create user and app
             user, app = get_user_and_app(db, user_id=uid, app_id=client_name)
 
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
+            accessible_memory_ids = [
+                memory_id
+                for (memory_id,) in db.query(Memory.id).filter(Memory.user_id == user.id, memory_access_filter(app.id))
+            ]
 
             # delete the accessible memories only
             for memory_id in accessible_memory_ids:
@@ -410,13 +421,13 @@ async def delete_all_memories() -> str:
                 db.add(history)
 
                 # Create access log entry
-                access_log = MemoryAccessLog(
+                log_entry = MemoryAccessLog(
                     memory_id=memory_id,
                     app_id=app.id,
                     access_type="delete_all",
                     metadata_={"operation": "bulk_delete"}
                 )
-                db.add(access_log)
+                db.add(log_entry)
 
             db.commit()
             return "Successfully deleted all memories"
@@ -187,6 +187,23 @@ class MemoryAccessLog(Base):
         Index('idx_access_app_time', 'app_id', 'accessed_at'),
     )
 
+
+class MemoryAccessRollup(Base):
+    __tablename__ = "memory_access_rollups"
+    id = Column(UUID, primary_key=True, default=lambda: uuid.uuid4())
+    memory_id = Column(UUID, ForeignKey("memories.id"), nullable=False, index=True)
+    app_id = Column(UUID, ForeignKey("apps.id"), nullable=False, index=True)
+    access_type = Column(String, nullable=False, index=True)
+    hour = Column(DateTime, nullable=False, index=True)
+    count = Column(Integer, nullable=False, default=0)
+    first_accessed_at = Column(DateTime, nullable=False)
+    last_accessed_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('idx_rollup_bucket', 'memory_id', 'app_id', 'access_type', 'hour', unique=True),
+        Index('idx_rollup_app_hour', 'app_id', 'hour'),
+    )
+
 def categorize_memory(memory: Memory, db: Session) -> None:
     """Categorize a memory using OpenAI and store the categories in the database."""
     try:
@@ -2,7 +2,8 @@ from typing import Optional
 from uuid import UUID
 
 from app.database import get_db
-from app.models import App, Memory, MemoryAccessLog, MemoryState
+from app.models import App, Memory, MemoryAccessLog, MemoryAccessRollup, MemoryState
+from app.utils.access_log import access_log
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import desc, func
 from sqlalchemy.orm import Session, joinedload
@@ -18,7 +19,7 @@ def get_app_or_404(db: Session, app_id: UUID) -> App:
 
 # List all apps with filtering
 @router.get("/")
-async def list_apps(
+def list_apps(
     name: Optional[str] = None,
     is_active: Optional[bool] = None,
     sort_by: str = 'name',
@@ -35,11 +36,12 @@ async def list_apps(
         Memory.state.in_([MemoryState.active, MemoryState.paused, MemoryState.archived])
     ).group_by(Memory.app_id).subquery()
 
-    # Create a subquery for access counts
+    # Create a subquery for access counts (per-hit logs may be sampled, rollups are exact)
+    access_source = MemoryAccessRollup if access_log.rollups else MemoryAccessLog
     access_counts = db.query(
-        MemoryAccessLog.app_id,
-        func.count(func.distinct(MemoryAccessLog.memory_id)).label('access_count')
-    ).group_by(MemoryAccessLog.app_id).subquery()
+        access_source.app_id,
+        func.count(func.distinct(access_source.memory_id)).label('access_count')
+    ).group_by(access_source.app_id).subquery()
 
     # Base query
     query = db.query(
@@ -99,18 +101,25 @@ async def list_apps(
 
 # Get app details
 @router.get("/{app_id}")
-async def get_app_details(
+def get_app_details(
     app_id: UUID,
     db: Session = Depends(get_db)
 ):
     app = get_app_or_404(db, app_id)
 
     # Get memory access statistics
-    access_stats = db.query(
-        func.count(MemoryAccessLog.id).label("total_memories_accessed"),
-        func.min(MemoryAccessLog.accessed_at).label("first_accessed"),
-        func.max(MemoryAccessLog.accessed_at).label("last_accessed")
-    ).filter(MemoryAccessLog.app_id == app_id).first()
+    if access_log.rollups:
+        access_stats = db.query(
+            func.sum(MemoryAccessRollup.count).label("total_memories_accessed"),
+            func.min(MemoryAccessRollup.first_accessed_at).label("first_accessed"),
+            func.max(MemoryAccessRollup.last_accessed_at).label("last_accessed")
+        ).filter(MemoryAccessRollup.app_id == app_id).first()
+    else:
+        access_stats = db.query(
+            func.count(MemoryAccessLog.id).label("total_memories_accessed"),
+            func.min(MemoryAccessLog.accessed_at).label("first_accessed"),
+            func.max(MemoryAccessLog.accessed_at).label("last_accessed")
+        ).filter(MemoryAccessLog.app_id == app_id).first()
 
     return {
         "is_active": app.is_active,
@@ -124,7 +133,7 @@ async def get_app_details(
 
 # List memories created by app
 @router.get("/{app_id}/memories")
-async def list_app_memories(
+def list_app_memories(
     app_id: UUID,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
@@ -160,7 +169,7 @@ async def list_app_memories(
 
 # List memories accessed by app
 @router.get("/{app_id}/accessed")
-async def list_app_accessed_memories(
+def list_app_accessed_memories(
     app_id: UUID,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
@@ -168,14 +177,20 @@ async def list_app_accessed_memories(
 ):
     
     # Get memories with access counts
+    if access_log.rollups:
+        access_count = func.sum(MemoryAccessRollup.count)
+        access_source = MemoryAccessRollup
+    else:
+        access_count = func.count(MemoryAccessLog.id)
+        access_source = MemoryAccessLog
     query = db.query(
         Memory,
-        func.count(MemoryAccessLog.id).label("access_count")
+        access_count.label("access_count")
     ).join(
-        MemoryAccessLog,
-        Memory.id == MemoryAccessLog.memory_id
+        access_source,
+        Memory.id == access_source.memory_id
     ).filter(
-        MemoryAccessLog.app_id == app_id
+        access_source.app_id == app_id
     ).group_by(
         Memory.id
     ).order_by(
@@ -212,7 +227,7 @@ async def list_app_accessed_memories(
 
 
 @router.put("/{app_id}")
-async def update_app_details(
+def update_app_details(
     app_id: UUID,
     is_active: bool,
     db: Session = Depends(get_db)
@@ -1,28 +1,41 @@
 from datetime import UTC, datetime
-import io 
-import json 
-import gzip 
+import io
+import json
+import gzip
 import zipfile
-from typing import Optional, List, Dict, Any
+from itertools import islice
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Form
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy.orm import Session
+from sqlalchemy import insert, select, update
 
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.models import (
-    User, App, Memory, MemoryState, Category, memory_categories, 
+    User, App, Memory, MemoryState, Category, memory_categories,
     MemoryStatusHistory, AccessControl
 )
+from app.utils.categories import category_cache
 from app.utils.memory import get_memory_client
 
 from uuid import uuid4
 
 router = APIRouter(prefix="/api/v1/backup", tags=["backup"])
 
+# Records checked against the vector store per bulk lookup (and embedded together) during import
+VECTOR_IMPORT_BATCH_SIZE = 256
+# Rows fetched per server-side cursor round trip during export
+EXPORT_BATCH_SIZE = 1000
+# Rows written per INSERT/UPDATE batch (and commit) during import
+IMPORT_BATCH_SIZE = 500
+# Compressed bytes buffered before a chunk of the export zip is sent
+EXPORT_CHUNK_SIZE = 1 << 20
+# Characters read from memories.json per refill while stream-parsing it
+IMPORT_READ_SIZE = 1 << 16
+
 class ExportRequest(BaseModel):
     user_id: str
     app_id: Optional[UUID] = None
@@ -30,11 +43,28 @@ class ExportRequest(BaseModel):
     to_date: Optional[int] = None
     include_vectors: bool = True
 
-def _iso(dt: Optional[datetime]) -> Optional[str]: 
-    if isinstance(dt, datetime): 
-        try: 
+def _existing_vector_ids(vector_store, ids: List[str]) -> set:
+    """Return the subset of ``ids`` already present in the vector store."""
+    get_many = getattr(vector_store, "get_many", None)
+    if callable(get_many):
+        try:
+            return {str(record.id) for record in get_many(ids)}
+        except Exception:
+            pass
+    existing = set()
+    for vector_id in ids:
+        try:
+            if vector_store.get(vector_id):
+                existing.add(vector_id)
+        except Exception:
+            pass
+    return existing
+
+def _iso(dt: Optional[datetime]) -> Optional[str]:
+    if isinstance(dt, datetime):
+        try:
             return dt.astimezone(UTC).isoformat()
-        except: 
+        except:
             return dt.replace(tzinfo=UTC).isoformat()
     return None
 
@@ -49,142 +79,188 @@ def _parse_iso(dt: Optional[str]) -> Optional[datetime]:
         except Exception:
             return None
 
-def _export_sqlite(db: Session, req: ExportRequest) -> Dict[str, Any]: 
-    user = db.query(User).filter(User.user_id == req.user_id).first()
-    if not user: 
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    time_filters = []
-    if req.from_date: 
-        time_filters.append(Memory.created_at >= datetime.fromtimestamp(req.from_date, tz=UTC))
-    if req.to_date: 
-        time_filters.append(Memory.created_at <= datetime.fromtimestamp(req.to_date, tz=UTC))
-
-    mem_q = (
-        db.query(Memory)
-        .options(joinedload(Memory.categories), joinedload(Memory.app))
-        .filter(
-            Memory.user_id == user.id, 
-            *(time_filters or []), 
-            * ( [Memory.app_id == req.app_id] if req.app_id else [] ),
-        )
-    )
-
-    memories = mem_q.all()
-    memory_ids = [m.id for m in memories]
-
-    app_ids = sorted({m.app_id for m in memories if m.app_id})
-    apps = db.query(App).filter(App.id.in_(app_ids)).all() if app_ids else []
-
-    cats = sorted({c for m in memories for c in m.categories}, key = lambda c: str(c.id))
-
-    mc_rows = db.execute(
-        memory_categories.select().where(memory_categories.c.memory_id.in_(memory_ids))
-    ).fetchall() if memory_ids else []
-
-    history = db.query(MemoryStatusHistory).filter(MemoryStatusHistory.memory_id.in_(memory_ids)).all() if memory_ids else []
+def _parse_state(value: Optional[str]) -> MemoryState:
+    try:
+        return MemoryState(value or "active")
+    except ValueError:
+        return MemoryState.active
+
+def _batched(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+def _memory_filters(user: User, app_id: Optional[UUID], from_date: Optional[int], to_date: Optional[int]) -> list:
+    filters = [Memory.user_id == user.id]
+    if from_date:
+        filters.append(Memory.created_at >= datetime.fromtimestamp(from_date, tz=UTC))
+    if to_date:
+        filters.append(Memory.created_at <= datetime.fromtimestamp(to_date, tz=UTC))
+    if app_id:
+        filters.append(Memory.app_id == app_id)
+    return filters
+
+def _stream(db: Session, stmt, scalars: bool = True) -> Iterator[list]:
+    """Yield result rows in EXPORT_BATCH_SIZE partitions from a server-side cursor."""
+    result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    return (result.scalars() if scalars else result).partitions()
+
+def _categories_by_memory(db: Session, memory_ids: List[UUID]) -> Dict[UUID, List[Tuple[UUID, str]]]:
+    rows = db.execute(
+        select(memory_categories.c.memory_id, Category.id, Category.name)
+        .join(Category, Category.id == memory_categories.c.category_id)
+        .where(memory_categories.c.memory_id.in_(memory_ids))
+    ).all()
+    by_memory: Dict[UUID, List[Tuple[UUID, str]]] = {}
+    for memory_id, category_id, name in rows:
+        by_memory.setdefault(memory_id, []).append((category_id, name))
+    return by_memory
+
+def _iter_memories(db: Session, filters: list) -> Iterator[Tuple[Memory, List[Tuple[UUID, str]]]]:
+    """Memories matching ``filters`` with their (category id, name) pairs, one cursor batch at a time."""
+    for batch in _stream(db, select(Memory).where(*filters)):
+        categories = _categories_by_memory(db, [m.id for m in batch])
+        for m in batch:
+            yield m, categories.get(m.id, [])
+
+def _json_array(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    yield "["
+    separator = "\n"
+    for record in records:
+        yield separator + json.dumps(record)
+        separator = ",\n"
+    yield "\n]"
+
+def _iter_sqlite_json(db: Session, user: User, req: ExportRequest) -> Iterator[str]:
+    """
+    Stream memories.json piece by piece.
 
+    Same document as before (user, apps, categories, memories, memory_categories,
+    status_history, access_controls, export_meta), but the large arrays are written
+    from server-side cursors instead of being built in memory first.
+    """
+    filters = _memory_filters(user, req.app_id, req.from_date, req.to_date)
+    memory_ids = select(Memory.id).where(*filters)
+
+    apps = db.query(App).filter(App.id.in_(select(Memory.app_id).where(*filters))).all()
+    app_ids = [a.id for a in apps]
+    cats = (
+        db.query(Category)
+        .filter(Category.id.in_(
+            select(memory_categories.c.category_id).where(memory_categories.c.memory_id.in_(memory_ids))
+        ))
+        .order_by(Category.id)
+        .all()
+    )
     acls = db.query(AccessControl).filter(
-        AccessControl.subject_type == "app", 
-        AccessControl.subject_id.in_(app_ids) if app_ids else False
+        AccessControl.subject_type == "app",
+        AccessControl.subject_id.in_(app_ids)
     ).all() if app_ids else []
 
-    return {
-        "user": {
-            "id": str(user.id), 
-            "user_id": user.user_id, 
-            "name": user.name, 
-            "email": user.email, 
-            "metadata": user.metadata_, 
-            "created_at": _iso(user.created_at), 
-            "updated_at": _iso(user.updated_at)
-        }, 
-        "apps": [
-            {
-                "id": str(a.id), 
-                "owner_id": str(a.owner_id), 
-                "name": a.name, 
-                "description": a.description, 
-                "metadata": a.metadata_, 
-                "is_active": a.is_active, 
-                "created_at": _iso(a.created_at), 
-                "updated_at": _iso(a.updated_at),
-            }
-            for a in apps
-        ], 
-        "categories": [
-            {
-                "id": str(c.id), 
-                "name": c.name, 
-                "description": c.description, 
-                "created_at": _iso(c.created_at), 
-                "updated_at": _iso(c.updated_at), 
-            }
-            for c in cats
-        ], 
-        "memories": [
-            {
-                "id": str(m.id), 
-                "user_id": str(m.user_id), 
-                "app_id": str(m.app_id) if m.app_id else None, 
-                "content": m.content, 
-                "metadata": m.metadata_, 
-                "state": m.state.value,
-                "created_at": _iso(m.created_at), 
-                "updated_at": _iso(m.updated_at), 
-                "archived_at": _iso(m.archived_at), 
-                "deleted_at": _iso(m.deleted_at), 
-                "category_ids": [str(c.id) for c in m.categories], #TODO: figure out a way to add category names simply to this
-            }
-            for m in memories
-        ], 
-        "memory_categories": [
-            {"memory_id": str(r.memory_id), "category_id": str(r.category_id)}
-            for r in mc_rows
-        ], 
-        "status_history": [
-            {
-                "id": str(h.id), 
-                "memory_id": str(h.memory_id), 
-                "changed_by": str(h.changed_by), 
-                "old_state": h.old_state.value, 
-                "new_state": h.new_state.value, 
-                "changed_at": _iso(h.changed_at), 
-            }
-            for h in history
-        ], 
-        "access_controls": [
-            {
-                "id": str(ac.id), 
-                "subject_type": ac.subject_type, 
-                "subject_id": str(ac.subject_id) if ac.subject_id else None, 
-                "object_type": ac.object_type, 
-                "object_id": str(ac.object_id) if ac.object_id else None, 
-                "effect": ac.effect, 
-                "created_at": _iso(ac.created_at), 
-            }
-            for ac in acls
-        ], 
-        "export_meta": {
-            "app_id_filter": str(req.app_id) if req.app_id else None,
-            "from_date": req.from_date,
-            "to_date": req.to_date,
-            "version": "1",
-            "generated_at": datetime.now(UTC).isoformat(),
-        },
-    }
+    yield '{"user": ' + json.dumps({
+        "id": str(user.id),
+        "user_id": user.user_id,
+        "name": user.name,
+        "email": user.email,
+        "metadata": user.metadata_,
+        "created_at": _iso(user.created_at),
+        "updated_at": _iso(user.updated_at)
+    })
+    yield ',\n"apps": ' + json.dumps([
+        {
+            "id": str(a.id),
+            "owner_id": str(a.owner_id),
+            "name": a.name,
+            "description": a.description,
+            "metadata": a.metadata_,
+            "is_active": a.is_active,
+            "created_at": _iso(a.created_at),
+            "updated_at": _iso(a.updated_at),
+        }
+        for a in apps
+    ])
+    yield ',\n"categories": ' + json.dumps([
+        {
+            "id": str(c.id),
+            "name": c.name,
+            "description": c.description,
+            "created_at": _iso(c.created_at),
+            "updated_at": _iso(c.updated_at),
+        }
+        for c in cats
+    ])
+
+    yield ',\n"memories": '
+    yield from _json_array(
+        {
+            "id": str(m.id),
+            "user_id": str(m.user_id),
+            "app_id": str(m.app_id) if m.app_id else None,
+            "content": m.content,
+            "metadata": m.metadata_,
+            "state": m.state.value,
+            "created_at": _iso(m.created_at),
+            "updated_at": _iso(m.updated_at),
+            "archived_at": _iso(m.archived_at),
+            "deleted_at": _iso(m.deleted_at),
+            "category_ids": [str(category_id) for category_id, _ in categories], #TODO: figure out a way to add category names simply to this
+        }
+        for m, categories in _iter_memories(db, filters)
+    )
+
+    yield ',\n"memory_categories": '
+    yield from _json_array(
+        {"memory_id": str(r.memory_id), "category_id": str(r.category_id)}
+        for batch in _stream(db, select(memory_categories).where(memory_categories.c.memory_id.in_(memory_ids)), scalars=False)
+        for r in batch
+    )
 
-def _export_logical_memories_gz(
-        db: Session, 
-        *, 
-        user_id: str, 
-        app_id: Optional[UUID] = None, 
-        from_date: Optional[int] = None, 
-        to_date: Optional[int] = None
-) -> bytes: 
+    yield ',\n"status_history": '
+    yield from _json_array(
+        {
+            "id": str(h.id),
+            "memory_id": str(h.memory_id),
+            "changed_by": str(h.changed_by),
+            "old_state": h.old_state.value,
+            "new_state": h.new_state.value,
+            "changed_at": _iso(h.changed_at),
+        }
+        for batch in _stream(db, select(MemoryStatusHistory).where(MemoryStatusHistory.memory_id.in_(memory_ids)))
+        for h in batch
+    )
+
+    yield ',\n"access_controls": ' + json.dumps([
+        {
+            "id": str(ac.id),
+            "subject_type": ac.subject_type,
+            "subject_id": str(ac.subject_id) if ac.subject_id else None,
+            "object_type": ac.object_type,
+            "object_id": str(ac.object_id) if ac.object_id else None,
+            "effect": ac.effect,
+            "created_at": _iso(ac.created_at),
+        }
+        for ac in acls
+    ])
+    yield ',\n"export_meta": ' + json.dumps({
+        "app_id_filter": str(req.app_id) if req.app_id else None,
+        "from_date": req.from_date,
+        "to_date": req.to_date,
+        "version": "1",
+        "generated_at": datetime.now(UTC).isoformat(),
+    }) + "}\n"
+
+def _iter_logical_memories(db: Session, user: User, req: ExportRequest) -> Iterator[bytes]:
     """
     Export a provider-agnostic backup of memories so they can be restored to any vector DB
-    by re-embedding content. One JSON object per line, gzip-compressed.
+    by re-embedding content. One JSON object per line (gzip-compressed in the zip).
 
     Schema (per line):
     {
@@ -198,251 +274,352 @@ def _export_logical_memories_gz(
       "categories": ["catA", "catB", ...]
     }
     """
+    filters = _memory_filters(user, req.app_id, req.from_date, req.to_date)
+    app_names = {
+        app_id: name
+        for app_id, name in db.execute(
+            select(App.id, App.name).where(App.id.in_(select(Memory.app_id).where(*filters)))
+        ).all()
+    }
+    for m, categories in _iter_memories(db, filters):
+        record = {
+            "id": str(m.id),
+            "content": m.content,
+            "metadata": m.metadata_ or {},
+            "created_at": _iso(m.created_at),
+            "updated_at": _iso(m.updated_at),
+            "state": m.state.value,
+            "app": app_names.get(m.app_id),
+            "categories": [name for _, name in categories],
+        }
+        yield (json.dumps(record) + "\n").encode("utf-8")
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable write target that collects the zip output until it is drained."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
+def _stream_export_zip(user_pk: UUID, req: ExportRequest) -> Iterator[bytes]:
+    """
+    Write the export zip incrementally and yield it in ~EXPORT_CHUNK_SIZE pieces.
 
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if not user: 
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    time_filters = []
-    if from_date: 
-        time_filters.append(Memory.created_at >= datetime.fromtimestamp(from_date, tz=UTC))
-    if to_date: 
-        time_filters.append(Memory.created_at <= datetime.fromtimestamp(to_date, tz=UTC))
-    
-    q = (
-        db.query(Memory)
-        .options(joinedload(Memory.categories), joinedload(Memory.app))
-        .filter(
-            Memory.user_id == user.id,
-            *(time_filters or []),
-        )
-    )
-    if app_id:
-        q = q.filter(Memory.app_id == app_id)
-
-    buf = io.BytesIO()
-    with gzip.GzipFile(fileobj=buf, mode="wb") as gz: 
-        for m in q.all(): 
-            record = {
-                "id": str(m.id),
-                "content": m.content,
-                "metadata": m.metadata_ or {},
-                "created_at": _iso(m.created_at),
-                "updated_at": _iso(m.updated_at),
-                "state": m.state.value,
-                "app": m.app.name if m.app else None,
-                "categories": [c.name for c in m.categories],
-            }
-            gz.write((json.dumps(record) + "\n").encode("utf-8"))
-    return buf.getvalue()
+    Entries are written with data descriptors (the sink cannot seek), so only one cursor
+    batch and one output chunk are held in memory at a time.
+    """
+    # The request-scoped session is closed before the response body is sent
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.id == user_pk).one()
+        sink = _ChunkSink()
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            with zf.open("memories.json", "w", force_zip64=True) as entry:
+                for piece in _iter_sqlite_json(db, user, req):
+                    entry.write(piece.encode("utf-8"))
+                    if sink.size >= EXPORT_CHUNK_SIZE:
+                        yield sink.drain()
+
+            #TODO: add vector store specific exports in future for speed
+            with zf.open("memories.jsonl.gz", "w", force_zip64=True) as entry:
+                with gzip.GzipFile(fileobj=entry, mode="wb") as gz:
+                    for line in _iter_logical_memories(db, user, req):
+                        gz.write(line)
+                        if sink.size >= EXPORT_CHUNK_SIZE:
+                            yield sink.drain()
+        yield sink.drain()
+    finally:
+        db.close()
 
 @router.post("/export")
-async def export_backup(req: ExportRequest, db: Session = Depends(get_db)): 
-    sqlite_payload = _export_sqlite(db=db, req=req)
-    memories_blob = _export_logical_memories_gz(
-        db=db, 
-        user_id=req.user_id, 
-        app_id=req.app_id, 
-        from_date=req.from_date, 
-        to_date=req.to_date,
-
-    )
-
-    #TODO: add vector store specific exports in future for speed 
+def export_backup(req: ExportRequest, db: Session = Depends(get_db)):
+    user = db.query(User).filter(User.user_id == req.user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
 
-    zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, "w", compression=zipfile.ZIP_DEFLATED) as zf: 
-        zf.writestr("memories.json", json.dumps(sqlite_payload, indent=2))
-        zf.writestr("memories.jsonl.gz", memories_blob)
-        
-    zip_buf.seek(0)
     return StreamingResponse(
-        zip_buf, 
-        media_type="application/zip", 
+        _stream_export_zip(user.id, req),
+        media_type="application/zip",
         headers={"Content-Disposition": f'attachment; filename="memories_export_{req.user_id}.zip"'},
     )
 
-@router.post("/import")
-async def import_backup(
-    file: UploadFile = File(..., description="Zip with memories.json and memories.jsonl.gz"), 
-    user_id: str = Form(..., description="Import memories into this user_id"),
-    mode: str = Query("overwrite"), 
-    db: Session = Depends(get_db)
-): 
-    if not file.filename.endswith(".zip"): 
-        raise HTTPException(status_code=400, detail="Expected a zip file.")
-    
-    if mode not in {"skip", "overwrite"}:
-        raise HTTPException(status_code=400, detail="Invalid mode. Must be 'skip' or 'overwrite'.")
-    
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if not user: 
-        raise HTTPException(status_code=404, detail="User not found")
 
-    content = await file.read()
-    try:
-        with zipfile.ZipFile(io.BytesIO(content), "r") as zf:
-            names = zf.namelist()
-
-            def find_member(filename: str) -> Optional[str]:
-                for name in names:
-                    # Skip directory entries
-                    if name.endswith('/'):
-                        continue
-                    if name.rsplit('/', 1)[-1] == filename:
-                        return name
-                return None
-
-            sqlite_member = find_member("memories.json")
-            if not sqlite_member:
-                raise HTTPException(status_code=400, detail="memories.json missing in zip")
-
-            memories_member = find_member("memories.jsonl.gz")
-
-            sqlite_data = json.loads(zf.read(sqlite_member))
-            memories_blob = zf.read(memories_member) if memories_member else None
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid zip file")
+# ---------------------------------------------------------------------------
+# Import
+# ---------------------------------------------------------------------------
 
-    default_app = db.query(App).filter(App.owner_id == user.id, App.name == "openmemory").first()
-    if not default_app: 
-        default_app = App(owner_id=user.id, name="openmemory", is_active=True, metadata_={})
-        db.add(default_app)
-        db.commit()
-        db.refresh(default_app)
-
-    cat_id_map: Dict[str, UUID] = {}
-    for c in sqlite_data.get("categories", []): 
-        cat = db.query(Category).filter(Category.name == c["name"]).first()
-        if not cat: 
-            cat = Category(name=c["name"], description=c.get("description"))
-            db.add(cat)
-            db.commit()
-            db.refresh(cat)
-        cat_id_map[c["id"]] = cat.id
-
-    old_to_new_id: Dict[str, UUID] = {}
-    for m in sqlite_data.get("memories", []): 
-        incoming_id = UUID(m["id"])
-        existing = db.query(Memory).filter(Memory.id == incoming_id).first()
-
-        # Cross-user collision: always mint a new UUID and import as a new memory
-        if existing and existing.user_id != user.id:
-            target_id = uuid4()
-        else:
-            target_id = incoming_id
-
-        old_to_new_id[m["id"]] = target_id
-
-        # Same-user collision + skip mode: leave existing row untouched
-        if existing and (existing.user_id == user.id) and mode == "skip": 
-            continue 
-        
-        # Same-user collision + overwrite mode: treat import as ground truth
-        if existing and (existing.user_id == user.id) and mode == "overwrite": 
-            incoming_state = m.get("state", "active")
-            existing.user_id = user.id 
-            existing.app_id = default_app.id
-            existing.content = m.get("content") or ""
-            existing.metadata_ = m.get("metadata") or {}
-            try: 
-                existing.state = MemoryState(incoming_state)
-            except Exception: 
-                existing.state = MemoryState.active
-            # Update state-related timestamps from import (ground truth)
-            existing.archived_at = _parse_iso(m.get("archived_at"))
-            existing.deleted_at = _parse_iso(m.get("deleted_at"))
-            existing.created_at = _parse_iso(m.get("created_at")) or existing.created_at
-            existing.updated_at = _parse_iso(m.get("updated_at")) or existing.updated_at
-            db.add(existing)
-            db.commit()
-            continue
+class _JsonDocumentReader:
+    """
+    Incremental reader for a top-level JSON object such as memories.json.
 
-        new_mem = Memory(
-            id=target_id,
-            user_id=user.id,
-            app_id=default_app.id,
-            content=m.get("content") or "",
-            metadata_=m.get("metadata") or {},
-            state=MemoryState(m.get("state", "active")) if m.get("state") else MemoryState.active,
-            created_at=_parse_iso(m.get("created_at")) or datetime.now(UTC),
-            updated_at=_parse_iso(m.get("updated_at")) or datetime.now(UTC),
-            archived_at=_parse_iso(m.get("archived_at")),
-            deleted_at=_parse_iso(m.get("deleted_at")),
-        )
-        db.add(new_mem)
-        db.commit()
-
-    for link in sqlite_data.get("memory_categories", []): 
-        mid = old_to_new_id.get(link["memory_id"])
-        cid = cat_id_map.get(link["category_id"])
-        if not (mid and cid): 
-            continue
-        exists = db.execute(
-            memory_categories.select().where(
-                (memory_categories.c.memory_id == mid) & (memory_categories.c.category_id == cid)
-            )
-        ).first()
-
-        if not exists: 
-            db.execute(memory_categories.insert().values(memory_id=mid, category_id=cid))
-            db.commit()
+    Yields ``(key, value)`` for plain members and ``(key, item)`` for every element of
+    array members, decoding one element at a time so arrays of any length can be read
+    with bounded memory. Accepts both the streamed export and older pretty-printed ones.
+    """
 
-    for h in sqlite_data.get("status_history", []): 
-        hid = UUID(h["id"])
-        mem_id = old_to_new_id.get(h["memory_id"], UUID(h["memory_id"]))
-        exists = db.query(MemoryStatusHistory).filter(MemoryStatusHistory.id == hid).first()
-        if exists and mode == "skip":
-            continue
-        rec = exists if exists else MemoryStatusHistory(id=hid)
-        rec.memory_id = mem_id
-        rec.changed_by = user.id
-        try:
-            rec.old_state = MemoryState(h.get("old_state", "active"))
-            rec.new_state = MemoryState(h.get("new_state", "active"))
-        except Exception:
-            rec.old_state = MemoryState.active
-            rec.new_state = MemoryState.active
-        rec.changed_at = _parse_iso(h.get("changed_at")) or datetime.now(UTC)
-        db.add(rec)
-        db.commit()
-
-    memory_client = get_memory_client()
-    vector_store = getattr(memory_client, "vector_store", None) if memory_client else None
-
-    if vector_store and memory_client and hasattr(memory_client, "embedding_model"):
-        def iter_logical_records():
-            if memories_blob:
-                gz_buf = io.BytesIO(memories_blob)
-                with gzip.GzipFile(fileobj=gz_buf, mode="rb") as gz:
-                    for raw in gz:
-                        yield json.loads(raw.decode("utf-8"))
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, fp, read_size: int = IMPORT_READ_SIZE):
+        self._fp = fp
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._read_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos} of JSON document")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if self._peek() == "[":
+                self._pos += 1
+                if self._peek() != "]":
+                    while True:
+                        yield key, self._value()
+                        if self._peek() != ",":
+                            break
+                        self._pos += 1
+                self._expect("]")
             else:
-                for m in sqlite_data.get("memories", []):
-                    yield {
-                        "id": m["id"],
-                        "content": m.get("content"),
-                        "metadata": m.get("metadata") or {},
-                        "created_at": m.get("created_at"),
-                        "updated_at": m.get("updated_at"),
-                    }
-
-        for rec in iter_logical_records():
-            old_id = rec["id"]
-            new_id = old_to_new_id.get(old_id, UUID(old_id))
+                yield key, self._value()
+            if self._peek() != ",":
+                break
+            self._pos += 1
+        self._expect("}")
+
+class _BackupImporter:
+    """Applies memories.json members to the database in IMPORT_BATCH_SIZE batches."""
+
+    def __init__(self, db: Session, user: User, default_app: App, mode: str):
+        self.db = db
+        self.user = user
+        self.default_app = default_app
+        self.mode = mode
+        self.cat_id_map: Dict[str, UUID] = {}
+        # Only memories that had to be re-keyed (cross-user id collisions); the rest keep their id
+        self.remapped_ids: Dict[str, UUID] = {}
+        self._pending_key: Optional[str] = None
+        self._pending: List[Dict[str, Any]] = []
+        self._handlers = {
+            "memories": self._import_memories,
+            "memory_categories": self._import_links,
+            "status_history": self._import_history,
+        }
+
+    def memory_id(self, old_id: str) -> UUID:
+        return self.remapped_ids.get(old_id) or UUID(old_id)
+
+    def add(self, key: str, value: Any) -> None:
+        if key == "categories":
+            self._import_category(value)
+            return
+        if key not in self._handlers:
+            return
+        if key != self._pending_key:
+            self.flush()
+            self._pending_key = key
+        self._pending.append(value)
+        if len(self._pending) >= IMPORT_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self._handlers[self._pending_key](batch)
+            self.db.commit()
+
+    def _import_category(self, c: Dict[str, Any]) -> None:
+        cat = self.db.query(Category).filter(Category.name == c["name"]).first()
+        if not cat:
+            cat = Category(name=c["name"], description=c.get("description"))
+            self.db.add(cat)
+            self.db.commit()
+            self.db.refresh(cat)
+        self.cat_id_map[c["id"]] = cat.id
+
+    def _import_memories(self, batch: List[Dict[str, Any]]) -> None:
+        incoming_ids = [UUID(m["id"]) for m in batch]
+        owners = dict(self.db.execute(select(Memory.id, Memory.user_id).where(Memory.id.in_(incoming_ids))).all())
+
+        inserts, updates = [], []
+        for m, incoming_id in zip(batch, incoming_ids):
+            owner = owners.get(incoming_id)
+
+            # Cross-user collision: always mint a new UUID and import as a new memory
+            if owner is not None and owner != self.user.id:
+                target_id = uuid4()
+                self.remapped_ids[m["id"]] = target_id
+                owner = None
+            else:
+                target_id = incoming_id
+
+            if owner is not None:
+                # Same-user collision + skip mode: leave existing row untouched
+                if self.mode == "skip":
+                    continue
+                # Same-user collision + overwrite mode: treat import as ground truth
+                row = {
+                    "id": target_id,
+                    "app_id": self.default_app.id,
+                    "content": m.get("content") or "",
+                    "metadata_": m.get("metadata") or {},
+                    "state": _parse_state(m.get("state")),
+                    "archived_at": _parse_iso(m.get("archived_at")),
+                    "deleted_at": _parse_iso(m.get("deleted_at")),
+                }
+                for column in ("created_at", "updated_at"):
+                    parsed = _parse_iso(m.get(column))
+                    if parsed:
+                        row[column] = parsed
+                updates.append(row)
+                continue
+
+            inserts.append({
+                "id": target_id,
+                "user_id": self.user.id,
+                "app_id": self.default_app.id,
+                "content": m.get("content") or "",
+                "metadata_": m.get("metadata") or {},
+                "state": _parse_state(m.get("state")),
+                "created_at": _parse_iso(m.get("created_at")) or datetime.now(UTC),
+                "updated_at": _parse_iso(m.get("updated_at")) or datetime.now(UTC),
+                "archived_at": _parse_iso(m.get("archived_at")),
+                "deleted_at": _parse_iso(m.get("deleted_at")),
+            })
+
+        # Bulk statements skip the per-row categorization hooks; categories come from the backup
+        if inserts:
+            self.db.execute(insert(Memory), inserts)
+        if updates:
+            self.db.execute(update(Memory), updates)
+
+    def _import_links(self, batch: List[Dict[str, Any]]) -> None:
+        links = set()
+        for link in batch:
+            cid = self.cat_id_map.get(link["category_id"])
+            if cid:
+                links.add((self.memory_id(link["memory_id"]), cid))
+        if not links:
+            return
+
+        memory_ids = {mid for mid, _ in links}
+        own_memories = set(self.db.execute(
+            select(Memory.id).where(Memory.id.in_(memory_ids), Memory.user_id == self.user.id)
+        ).scalars())
+        existing = set(self.db.execute(
+            select(memory_categories.c.memory_id, memory_categories.c.category_id)
+            .where(memory_categories.c.memory_id.in_(memory_ids))
+        ).tuples())
+        rows = [
+            {"memory_id": mid, "category_id": cid}
+            for mid, cid in links
+            if mid in own_memories and (mid, cid) not in existing
+        ]
+        if rows:
+            self.db.execute(memory_categories.insert(), rows)
+
+    def _import_history(self, batch: List[Dict[str, Any]]) -> None:
+        ids = [UUID(h["id"]) for h in batch]
+        existing = set(self.db.execute(select(MemoryStatusHistory.id).where(MemoryStatusHistory.id.in_(ids))).scalars())
+        inserts, updates = [], []
+        for h, hid in zip(batch, ids):
+            if hid in existing and self.mode == "skip":
+                continue
+            row = {
+                "id": hid,
+                "memory_id": self.memory_id(h["memory_id"]),
+                "changed_by": self.user.id,
+                "old_state": _parse_state(h.get("old_state")),
+                "new_state": _parse_state(h.get("new_state")),
+                "changed_at": _parse_iso(h.get("changed_at")) or datetime.now(UTC),
+            }
+            (updates if hid in existing else inserts).append(row)
+        if inserts:
+            self.db.execute(insert(MemoryStatusHistory), inserts)
+        if updates:
+            self.db.execute(update(MemoryStatusHistory), updates)
+
+def _embed_texts(embedding_model, texts: List[str]) -> List[list]:
+    embed_batch = getattr(embedding_model, "embed_batch", None)
+    if callable(embed_batch):
+        return embed_batch(texts, "add")
+    return [embedding_model.embed(text, "add") for text in texts]
+
+def _import_vectors(memory_client, records: Iterable[Dict[str, Any]], importer: _BackupImporter, user_id: str, mode: str) -> None:
+    """Re-embed and upsert memories into the vector store, one batch per embedding call and insert."""
+    vector_store = memory_client.vector_store
+    for batch in _batched(records, VECTOR_IMPORT_BATCH_SIZE):
+        batch_ids = [str(importer.memory_id(rec["id"])) for rec in batch]
+        # One bulk lookup per batch instead of a vector store round trip per record
+        existing_ids = _existing_vector_ids(vector_store, batch_ids) if mode == "skip" else set()
+
+        texts, payloads, ids = [], [], []
+        for rec, new_id in zip(batch, batch_ids):
+            if new_id in existing_ids:
+                continue
+
             content = rec.get("content") or ""
             metadata = rec.get("metadata") or {}
             created_at = rec.get("created_at")
             updated_at = rec.get("updated_at")
 
-            if mode == "skip":
-                try:
-                    get_fn = getattr(vector_store, "get", None)
-                    if callable(get_fn) and vector_store.get(str(new_id)):
-                        continue
-                except Exception:
-                    pass
-
             payload = dict(metadata)
             payload["data"] = content
             if created_at:
@@ -452,48 +629,109 @@ async def import_backup(
             payload["user_id"] = user_id
             payload.setdefault("source_app", "openmemory")
 
-            try:
-                vec = memory_client.embedding_model.embed(content, "add")
-                vector_store.insert(vectors=[vec], payloads=[payload], ids=[str(new_id)])
-            except Exception as e:
-                print(f"Vector upsert failed for memory {new_id}: {e}")
-                continue
-
-        return {"message": f'Import completed into user "{user_id}"'}
-
-    return {"message": f'Import completed into user "{user_id}"'}
-
-
-    
-            
-        
- 
-
-
-    
-
-    
-
-
-
-
-
-
-    
-
-    
-
+            texts.append(content)
+            payloads.append(payload)
+            ids.append(new_id)
 
+        if not ids:
+            continue
+        try:
+            vectors = _embed_texts(memory_client.embedding_model, texts)
+            vector_store.insert(vectors=vectors, payloads=payloads, ids=ids)
+        except Exception as e:
+            print(f"Batched vector upsert failed ({e}), retrying {len(ids)} memories one by one")
+            for content, payload, new_id in zip(texts, payloads, ids):
+                try:
+                    vec = memory_client.embedding_model.embed(content, "add")
+                    vector_store.insert(vectors=[vec], payloads=[payload], ids=[new_id])
+                except Exception as e:
+                    print(f"Vector upsert failed for memory {new_id}: {e}")
 
+@router.post("/import")
+def import_backup(
+    file: UploadFile = File(..., description="Zip with memories.json and memories.jsonl.gz"),
+    user_id: str = Form(..., description="Import memories into this user_id"),
+    mode: str = Query("overwrite"),
+    db: Session = Depends(get_db)
+):
+    if not file.filename.endswith(".zip"):
+        raise HTTPException(status_code=400, detail="Expected a zip file.")
 
+    if mode not in {"skip", "overwrite"}:
+        raise HTTPException(status_code=400, detail="Invalid mode. Must be 'skip' or 'overwrite'.")
 
+    user = db.query(User).filter(User.user_id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
 
+    # The upload is spooled to disk; members are read from it lazily instead of loading the zip
+    try:
+        zf = zipfile.ZipFile(file.file, "r")
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid zip file")
 
+    with zf:
+        names = zf.namelist()
 
+        def find_member(filename: str) -> Optional[str]:
+            for name in names:
+                # Skip directory entries
+                if name.endswith('/'):
+                    continue
+                if name.rsplit('/', 1)[-1] == filename:
+                    return name
+            return None
 
+        sqlite_member = find_member("memories.json")
+        if not sqlite_member:
+            raise HTTPException(status_code=400, detail="memories.json missing in zip")
 
- 
+        memories_member = find_member("memories.jsonl.gz")
 
+        def iter_sqlite_members():
+            with zf.open(sqlite_member) as raw:
+                yield from _JsonDocumentReader(io.TextIOWrapper(raw, encoding="utf-8"))
 
+        default_app = db.query(App).filter(App.owner_id == user.id, App.name == "openmemory").first()
+        if not default_app:
+            default_app = App(owner_id=user.id, name="openmemory", is_active=True, metadata_={})
+            db.add(default_app)
+            db.commit()
+            db.refresh(default_app)
 
+        importer = _BackupImporter(db, user, default_app, mode)
+        try:
+            for key, value in iter_sqlite_members():
+                importer.add(key, value)
+            importer.flush()
+        except (ValueError, KeyError, TypeError, zipfile.BadZipFile) as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=f"Invalid memories.json: {e}")
+        finally:
+            # Category links were inserted directly, bypassing the Memory change events
+            category_cache.invalidate(user.id)
+
+        memory_client = get_memory_client()
+        vector_store = getattr(memory_client, "vector_store", None) if memory_client else None
+
+        if vector_store and memory_client and hasattr(memory_client, "embedding_model"):
+            def iter_logical_records():
+                if memories_member:
+                    with zf.open(memories_member) as raw, gzip.GzipFile(fileobj=raw, mode="rb") as gz:
+                        for line in gz:
+                            if line.strip():
+                                yield json.loads(line.decode("utf-8"))
+                else:
+                    for key, m in iter_sqlite_members():
+                        if key == "memories":
+                            yield {
+                                "id": m["id"],
+                                "content": m.get("content"),
+                                "metadata": m.get("metadata") or {},
+                                "created_at": m.get("created_at"),
+                                "updated_at": m.get("updated_at"),
+                            }
+
+            _import_vectors(memory_client, iter_logical_records(), importer, user_id, mode)
 
+    return {"message": f'Import completed into user "{user_id}"'}
@@ -15,8 +15,10 @@ from app.models import (
     User,
 )
 from app.schemas import MemoryResponse
+from app.utils.categories import get_user_categories
 from app.utils.memory import get_memory_client
-from app.utils.permissions import check_memory_access_permissions
+from app.utils.permissions import memory_access_filter
+from app.utils.search import apply_text_search, get_vector_scores
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate as sqlalchemy_paginate
@@ -73,6 +75,10 @@ def get_accessible_memory_ids(db: Session, app_id: UUID) -> Set[UUID]:
     if not app_access:
         return None
 
+    # A blanket deny wins over any allow rule, regardless of rule order
+    if any(rule.effect == "deny" and not rule.object_id for rule in app_access):
+        return set()
+
     # Initialize sets for allowed and denied memory IDs
     allowed_memory_ids = set()
     denied_memory_ids = set()
@@ -97,9 +103,21 @@ def get_accessible_memory_ids(db: Session, app_id: UUID) -> Set[UUID]:
     return allowed_memory_ids
 
 
+def _semantic_scores(search_query: str, user_id: str) -> dict:
+    """Vector-search scores for blending into text search; empty when the memory client is unavailable."""
+    try:
+        memory_client = get_memory_client()
+    except Exception as client_error:
+        logging.warning(f"Memory client unavailable for semantic search: {client_error}")
+        return {}
+    if not memory_client:
+        return {}
+    return get_vector_scores(memory_client, search_query, user_id)
+
+
 # List all memories with filtering
 @router.get("/", response_model=Page[MemoryResponse])
-async def list_memories(
+def list_memories(
     user_id: str,
     app_id: Optional[UUID] = None,
     from_date: Optional[int] = Query(
@@ -115,6 +133,7 @@ async def list_memories(
     categories: Optional[str] = None,
     params: Params = Depends(),
     search_query: Optional[str] = None,
+    semantic: bool = Query(False, description="Blend vector-search similarity into the search ranking"),
     sort_column: Optional[str] = Query(None, description="Column to sort by (memory, categories, app_name, created_at)"),
     sort_direction: Optional[str] = Query(None, description="Sort direction (asc or desc)"),
     db: Session = Depends(get_db)
@@ -123,12 +142,10 @@ async def list_memories(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Build base query
+    # Build base query; access rules are applied here so every page is full
     query = db.query(Memory).filter(
         Memory.user_id == user.id,
-        Memory.state != MemoryState.deleted,
-        Memory.state != MemoryState.archived,
-        Memory.content.ilike(f"%{search_query}%") if search_query else True
+        memory_access_filter(app_id),
     )
 
     # Apply filters
@@ -143,26 +160,30 @@ async def list_memories(
         to_datetime = datetime.fromtimestamp(to_date, tz=UTC)
         query = query.filter(Memory.created_at <= to_datetime)
 
-    # Add joins for app and categories after filtering
-    query = query.outerjoin(App, Memory.app_id == App.id)
-    query = query.outerjoin(Memory.categories)
-
-    # Apply category filter if provided
+    # Apply category filter if provided (EXISTS keeps one row per memory)
     if categories:
         category_list = [c.strip() for c in categories.split(",")]
-        query = query.filter(Category.name.in_(category_list))
+        query = query.filter(Memory.categories.any(Category.name.in_(category_list)))
+
+    # Full-text search, ranked by relevance
+    relevance = None
+    if search_query:
+        vector_scores = _semantic_scores(search_query, user_id) if semantic else None
+        query, relevance = apply_text_search(query, db, search_query, vector_scores)
 
     # Apply sorting if specified
     if sort_column:
         sort_field = getattr(Memory, sort_column, None)
         if sort_field:
             query = query.order_by(sort_field.desc()) if sort_direction == "desc" else query.order_by(sort_field.asc())
+    elif relevance is not None:
+        query = query.order_by(relevance.desc(), Memory.created_at.desc())
 
     # Add eager loading for app and categories
     query = query.options(
         joinedload(Memory.app),
         joinedload(Memory.categories)
-    ).distinct(Memory.id)
+    )
 
     # Get paginated results with transformer
     return sqlalchemy_paginate(
@@ -180,14 +201,13 @@ async def list_memories(
                 metadata_=memory.metadata_
             )
             for memory in items
-            if check_memory_access_permissions(db, memory, app_id)
         ]
     )
 
 
 # Get all categories
 @router.get("/categories")
-async def get_categories(
+def get_categories(
     user_id: str,
     db: Session = Depends(get_db)
 ):
@@ -195,17 +215,12 @@ async def get_categories(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Get unique categories associated with the user's memories
-    # Get all memories
-    memories = db.query(Memory).filter(Memory.user_id == user.id, Memory.state != MemoryState.deleted, Memory.state != MemoryState.archived).all()
-    # Get all categories from memories
-    categories = [category for memory in memories for category in memory.categories]
-    # Get unique categories
-    unique_categories = list(set(categories))
+    # One aggregate query (cached per user) instead of loading every memory and its categories
+    categories = get_user_categories(db, user.id)
 
     return {
-        "categories": unique_categories,
-        "total": len(unique_categories)
+        "categories": categories,
+        "total": len(categories)
     }
 
 
@@ -219,7 +234,7 @@ class CreateMemoryRequest(BaseModel):
 
 # Create new memory
 @router.post("/")
-async def create_memory(
+def create_memory(
     request: CreateMemoryRequest,
     db: Session = Depends(get_db)
 ):
@@ -330,7 +345,7 @@ async def create_memory(
 
 # Get memory by ID
 @router.get("/{memory_id}")
-async def get_memory(
+def get_memory(
     memory_id: UUID,
     db: Session = Depends(get_db)
 ):
@@ -353,7 +368,7 @@ class DeleteMemoriesRequest(BaseModel):
 
 # Delete multiple memories
 @router.delete("/")
-async def delete_memories(
+def delete_memories(
     request: DeleteMemoriesRequest,
     db: Session = Depends(get_db)
 ):
@@ -392,7 +407,7 @@ async def delete_memories(
 
 # Archive memories
 @router.post("/actions/archive")
-async def archive_memories(
+def archive_memories(
     memory_ids: List[UUID],
     user_id: UUID,
     db: Session = Depends(get_db)
@@ -413,7 +428,7 @@ class PauseMemoriesRequest(BaseModel):
 
 # Pause access to memories
 @router.post("/actions/pause")
-async def pause_memories(
+def pause_memories(
     request: PauseMemoriesRequest,
     db: Session = Depends(get_db)
 ):
@@ -486,7 +501,7 @@ async def pause_memories(
 
 # Get memory access logs
 @router.get("/{memory_id}/access-log")
-async def get_memory_access_log(
+def get_memory_access_log(
     memory_id: UUID,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
@@ -515,7 +530,7 @@ class UpdateMemoryRequest(BaseModel):
 
 # Update a memory
 @router.put("/{memory_id}")
-async def update_memory(
+def update_memory(
     memory_id: UUID,
     request: UpdateMemoryRequest,
     db: Session = Depends(get_db)
@@ -534,6 +549,7 @@ class FilterMemoriesRequest(BaseModel):
     page: int = 1
     size: int = 10
     search_query: Optional[str] = None
+    semantic: bool = False
     app_ids: Optional[List[UUID]] = None
     category_ids: Optional[List[UUID]] = None
     sort_column: Optional[str] = None
@@ -543,7 +559,7 @@ class FilterMemoriesRequest(BaseModel):
     show_archived: Optional[bool] = False
 
 @router.post("/filter", response_model=Page[MemoryResponse])
-async def filter_memories(
+def filter_memories(
     request: FilterMemoriesRequest,
     db: Session = Depends(get_db)
 ):
@@ -562,21 +578,21 @@ async def filter_memories(
         query = query.filter(Memory.state != MemoryState.archived)
 
     # Apply search filter
+    relevance = None
     if request.search_query:
-        query = query.filter(Memory.content.ilike(f"%{request.search_query}%"))
+        vector_scores = _semantic_scores(request.search_query, request.user_id) if request.semantic else None
+        query, relevance = apply_text_search(query, db, request.search_query, vector_scores)
 
     # Apply app filter
     if request.app_ids:
         query = query.filter(Memory.app_id.in_(request.app_ids))
 
-    # Add joins for app and categories
+    # Add join for app (used for sorting by app name)
     query = query.outerjoin(App, Memory.app_id == App.id)
 
-    # Apply category filter
+    # Apply category filter (EXISTS keeps one row per memory)
     if request.category_ids:
-        query = query.join(Memory.categories).filter(Category.id.in_(request.category_ids))
-    else:
-        query = query.outerjoin(Memory.categories)
+        query = query.filter(Memory.categories.any(Category.id.in_(request.category_ids)))
 
     # Apply date filters
     if request.from_date:
@@ -607,14 +623,18 @@ async def filter_memories(
             query = query.order_by(sort_field.desc())
         else:
             query = query.order_by(sort_field.asc())
+    elif relevance is not None:
+        # Best matches first when searching
+        query = query.order_by(relevance.desc(), Memory.created_at.desc())
     else:
         # Default sorting
         query = query.order_by(Memory.created_at.desc())
 
-    # Add eager loading for categories and make the query distinct
+    # Add eager loading for app and categories
     query = query.options(
+        joinedload(Memory.app),
         joinedload(Memory.categories)
-    ).distinct(Memory.id)
+    )
 
     # Use fastapi-pagination's paginate function
     return sqlalchemy_paginate(
@@ -637,7 +657,7 @@ async def filter_memories(
 
 
 @router.get("/{memory_id}/related", response_model=Page[MemoryResponse])
-async def get_related_memories(
+def get_related_memories(
     memory_id: UUID,
     user_id: str,
     params: Params = Depends(),
@@ -0,0 +1,269 @@
+"""
+Buffered, append-only writer for memory access logs.
+
+MCP searches and listings record one access per returned memory. Instead of
+adding ``MemoryAccessLog`` objects to the request's session, accesses are
+buffered in memory and written by a background thread with one bulk
+``INSERT ... VALUES`` every ACCESS_LOG_FLUSH_ROWS rows or
+ACCESS_LOG_FLUSH_INTERVAL_MS milliseconds, whichever comes first.
+
+Two knobs reduce the volume further:
+
+* ACCESS_LOG_SAMPLE_RATE (0..1) keeps only that fraction of the per-hit
+  rows in ``memory_access_logs``; 0 disables them.
+* ACCESS_LOG_ROLLUPS=true aggregates every hit into
+  ``memory_access_rollups`` (count per memory, app, access type and hour),
+  upserted on flush. Rollups are exact regardless of sampling, and the app
+  statistics read from them when they are enabled.
+
+Buffered accesses are flushed on shutdown. When a flush fails its rows and
+rollups are put back in the buffer and retried with the next flush. While the
+database is unreachable the buffer is capped at ACCESS_LOG_MAX_BUFFERED_ROWS
+rows (and as many rollups); further rows and rollups are dropped and counted.
+"""
+
+import atexit
+import datetime
+import logging
+import os
+import random
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.database import engine as default_engine
+from app.models import MemoryAccessLog, MemoryAccessRollup
+from sqlalchemy import case, insert, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+
+ACCESS_LOG_FLUSH_ROWS = int(os.getenv("ACCESS_LOG_FLUSH_ROWS", "500"))
+ACCESS_LOG_FLUSH_INTERVAL_MS = float(os.getenv("ACCESS_LOG_FLUSH_INTERVAL_MS", "1000"))
+ACCESS_LOG_SAMPLE_RATE = float(os.getenv("ACCESS_LOG_SAMPLE_RATE", "1.0"))
+ACCESS_LOG_ROLLUPS = os.getenv("ACCESS_LOG_ROLLUPS", "false").lower() in ("1", "true", "yes")
+ACCESS_LOG_MAX_BUFFERED_ROWS = int(os.getenv("ACCESS_LOG_MAX_BUFFERED_ROWS", "50000"))
+
+_UPSERT_DIALECTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+RollupKey = Tuple[UUID, UUID, str, datetime.datetime]
+
+
+def _hour(ts: datetime.datetime) -> datetime.datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def _close_at_exit(ref) -> None:
+    writer = ref()
+    if writer is not None:
+        writer.close()
+
+
+class AccessLogWriter:
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        flush_rows: int = ACCESS_LOG_FLUSH_ROWS,
+        flush_interval_ms: float = ACCESS_LOG_FLUSH_INTERVAL_MS,
+        sample_rate: float = ACCESS_LOG_SAMPLE_RATE,
+        rollups: bool = ACCESS_LOG_ROLLUPS,
+        max_buffered_rows: int = ACCESS_LOG_MAX_BUFFERED_ROWS,
+    ):
+        self.engine = engine or default_engine
+        self.flush_rows = max(1, flush_rows)
+        self.flush_interval = max(0.01, flush_interval_ms / 1000.0)
+        self.sample_rate = min(1.0, max(0.0, sample_rate))
+        self.rollups = rollups
+        self.max_buffered_rows = max(self.flush_rows, max_buffered_rows)
+
+        self._rows: List[Dict[str, Any]] = []
+        self._rollups: Dict[RollupKey, List[Any]] = {}
+        self._lock = threading.Lock()
+        # Serializes flushes from the background thread and explicit flush()/close() calls
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self._recorded = 0
+        self._sampled_out = 0
+        self._dropped = 0
+        self._dropped_rollups = 0
+        self._rows_written = 0
+        self._rollups_written = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+
+        atexit.register(_close_at_exit, weakref.ref(self))
+
+    def record(self, memory_id: UUID, app_id: UUID, access_type: str, metadata: Optional[dict] = None) -> None:
+        """Buffer one access; never touches the database on the caller's thread."""
+        now = datetime.datetime.now(datetime.UTC)
+        keep_row = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+        with self._lock:
+            if self._closed:
+                return
+            if self._thread is None:
+                self._start()
+            self._recorded += 1
+
+            if self.rollups:
+                key = (memory_id, app_id, access_type, _hour(now))
+                bucket = self._rollups.get(key)
+                if bucket is None:
+                    if len(self._rollups) >= self.max_buffered_rows:
+                        self._dropped_rollups += 1
+                    else:
+                        self._rollups[key] = [1, now, now]
+                else:
+                    bucket[0] += 1
+                    bucket[2] = now
+
+            if not keep_row:
+                self._sampled_out += 1
+            elif len(self._rows) >= self.max_buffered_rows:
+                self._dropped += 1
+            else:
+                self._rows.append(
+                    {
+                        "memory_id": memory_id,
+                        "app_id": app_id,
+                        "access_type": access_type,
+                        "accessed_at": now,
+                        "metadata": metadata or {},
+                    }
+                )
+                if len(self._rows) >= self.flush_rows:
+                    self._wakeup.set()
+
+    def flush(self) -> None:
+        """Write everything buffered so far."""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+                rollups, self._rollups = self._rollups, {}
+            if not rows and not rollups:
+                return
+            try:
+                with self.engine.begin() as conn:
+                    if rows:
+                        conn.execute(MemoryAccessLog.__table__.insert(), rows)
+                    if rollups:
+                        self._upsert_rollups(conn, rollups)
+            except Exception as e:
+                logging.warning(
+                    f"Keeping {len(rows)} access log rows and {len(rollups)} rollups for retry after failed flush: {e}"
+                )
+                with self._lock:
+                    self._failed_flushes += 1
+                    self._rebuffer(rows, rollups)
+                return
+            with self._lock:
+                self._flushes += 1
+                self._rows_written += len(rows)
+                self._rollups_written += len(rollups)
+
+    def close(self) -> None:
+        """Stop the background thread and flush what is still buffered."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "buffered_rows": len(self._rows),
+                "buffered_rollups": len(self._rollups),
+                "recorded": self._recorded,
+                "sampled_out": self._sampled_out,
+                "dropped": self._dropped,
+                "dropped_rollups": self._dropped_rollups,
+                "rows_written": self._rows_written,
+                "rollups_written": self._rollups_written,
+                "flushes": self._flushes,
+                "failed_flushes": self._failed_flushes,
+            }
+
+    def _rebuffer(self, rows: List[Dict[str, Any]], rollups: Dict[RollupKey, List[Any]]) -> None:
+        # Caller holds self._lock. Failed rows go back in front of the ones recorded since.
+        rows.extend(self._rows)
+        self._dropped += max(0, len(rows) - self.max_buffered_rows)
+        self._rows = rows[: self.max_buffered_rows]
+
+        for key, (count, first, last) in rollups.items():
+            bucket = self._rollups.get(key)
+            if bucket is not None:
+                bucket[0] += count
+                bucket[1] = min(bucket[1], first)
+                bucket[2] = max(bucket[2], last)
+            elif len(self._rollups) >= self.max_buffered_rows:
+                self._dropped_rollups += 1
+            else:
+                self._rollups[key] = [count, first, last]
+
+    def _start(self) -> None:
+        # Caller holds self._lock
+        self._thread = threading.Thread(target=self._run, name="openmemory-access-log", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    @staticmethod
+    def _upsert_rollups(conn: Connection, rollups: Dict[RollupKey, List[Any]]) -> None:
+        table = MemoryAccessRollup.__table__
+        rows = [
+            {
+                "memory_id": memory_id,
+                "app_id": app_id,
+                "access_type": access_type,
+                "hour": hour,
+                "count": count,
+                "first_accessed_at": first,
+                "last_accessed_at": last,
+            }
+            for (memory_id, app_id, access_type, hour), (count, first, last) in rollups.items()
+        ]
+
+        dialect_insert = _UPSERT_DIALECTS.get(conn.dialect.name)
+        if dialect_insert is not None:
+            stmt = dialect_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["memory_id", "app_id", "access_type", "hour"],
+                set_={
+                    "count": table.c.count + stmt.excluded.count,
+                    "last_accessed_at": case(
+                        (stmt.excluded.last_accessed_at > table.c.last_accessed_at, stmt.excluded.last_accessed_at),
+                        else_=table.c.last_accessed_at,
+                    ),
+                },
+            )
+            conn.execute(stmt, rows)
+            return
+
+        for row in rows:
+            result = conn.execute(
+                update(table)
+                .where(
+                    table.c.memory_id == row["memory_id"],
+                    table.c.app_id == row["app_id"],
+                    table.c.access_type == row["access_type"],
+                    table.c.hour == row["hour"],
+                )
+                .values(count=table.c.count + row["count"], last_accessed_at=row["last_accessed_at"])
+            )
+            if result.rowcount == 0:
+                conn.execute(insert(table), [row])
+
+
+access_log = AccessLogWriter()
@@ -0,0 +1,112 @@
+"""
+Per-user category listing with an in-process cache.
+
+The dashboard requests the category list on every load, so the aggregate is
+cached per user. Entries are dropped when one of the user's memories is
+inserted, updated (content, state or categories) or deleted, once more when
+that transaction commits, and otherwise expire after CATEGORY_CACHE_TTL
+seconds. The TTL also bounds staleness when several API processes each hold
+their own cache.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.models import Category, Memory, MemoryState, memory_categories
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session, object_session
+
+CATEGORY_CACHE_TTL = float(os.getenv("CATEGORY_CACHE_TTL", "300"))
+
+_PENDING_KEY = "category_cache_users"
+
+
+class CategoryCache:
+    def __init__(self, ttl: float = CATEGORY_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[UUID, Tuple[float, List[dict]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID) -> Optional[List[dict]]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, categories = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            return categories
+
+    def set(self, user_id: UUID, categories: List[dict]) -> None:
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, categories)
+
+    def invalidate(self, user_id: Optional[UUID] = None) -> None:
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+
+category_cache = CategoryCache()
+
+
+def get_user_categories(db: Session, user_id: UUID) -> List[dict]:
+    """Distinct categories of the user's non-deleted, non-archived memories with per-category memory counts."""
+    categories = category_cache.get(user_id)
+    if categories is not None:
+        return categories
+
+    rows = (
+        db.query(Category, func.count(memory_categories.c.memory_id))
+        .join(memory_categories, memory_categories.c.category_id == Category.id)
+        .join(Memory, Memory.id == memory_categories.c.memory_id)
+        .filter(
+            Memory.user_id == user_id,
+            Memory.state != MemoryState.deleted,
+            Memory.state != MemoryState.archived,
+        )
+        .group_by(Category.id)
+        .order_by(Category.name)
+        .all()
+    )
+    categories = [
+        {
+            "id": category.id,
+            "name": category.name,
+            "description": category.description,
+            "created_at": category.created_at,
+            "updated_at": category.updated_at,
+            "count": count,
+        }
+        for category, count in rows
+    ]
+    category_cache.set(user_id, categories)
+    return categories
+
+
+@event.listens_for(Memory, "after_insert")
+@event.listens_for(Memory, "after_update")
+@event.listens_for(Memory, "after_delete")
+def _invalidate_on_memory_change(mapper, connection, target):
+    """Drop the owner's cached categories; categorization runs in the same flush, so again on commit."""
+    category_cache.invalidate(target.user_id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        category_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
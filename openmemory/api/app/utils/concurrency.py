@@ -0,0 +1,48 @@
+"""
+Bounded executors for blocking work started from the event loop.
+
+The mem0 client and the SQLAlchemy session are synchronous, and a single
+``Memory.add`` spends seconds in LLM and embedding calls. Async handlers (the
+MCP tools) hand that work to one of two thread pools instead of running it on
+the event loop: writes (add/delete, LLM-bound) and reads (search/list,
+embedding-bound) are sized separately so that slow adds can never occupy the
+workers that searches need. Pool sizes come from MEMORY_WRITE_WORKERS and
+MEMORY_READ_WORKERS.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+MEMORY_WRITE_WORKERS = int(os.getenv("MEMORY_WRITE_WORKERS", "4"))
+MEMORY_READ_WORKERS = int(os.getenv("MEMORY_READ_WORKERS", "8"))
+
+write_executor = ThreadPoolExecutor(max_workers=MEMORY_WRITE_WORKERS, thread_name_prefix="openmemory-write")
+read_executor = ThreadPoolExecutor(max_workers=MEMORY_READ_WORKERS, thread_name_prefix="openmemory-read")
+
+
+async def _run(executor: ThreadPoolExecutor, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    # Context variables (user_id, client_name) stay visible inside the worker
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+
+async def run_write(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking memory write (mem0 add/delete and its database bookkeeping) off the event loop."""
+    return await _run(write_executor, func, *args, **kwargs)
+
+
+async def run_read(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking memory read (vector search, listing, database queries) off the event loop."""
+    return await _run(read_executor, func, *args, **kwargs)
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    write_executor.shutdown(wait=wait)
+    read_executor.shutdown(wait=wait)
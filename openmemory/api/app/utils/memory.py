@@ -31,14 +31,31 @@ import hashlib
 import json
 import os
 import socket
+import threading
+import time
 
 from app.database import SessionLocal
 from app.models import Config as ConfigModel
 
 from mem0 import Memory
 
-_memory_client = None
-_config_hash = None
+# How often the stored configuration is re-read to pick up changes made by other processes
+CONFIG_RECHECK_SECONDS = float(os.environ.get("MEMORY_CONFIG_RECHECK_SECONDS", "30"))
+# How long a failed client construction is remembered before the next attempt
+CLIENT_RETRY_SECONDS = float(os.environ.get("MEMORY_CLIENT_RETRY_SECONDS", "5"))
+# How long a replaced client is kept open for requests that still hold it
+CLIENT_DRAIN_SECONDS = float(os.environ.get("MEMORY_CLIENT_DRAIN_SECONDS", "60"))
+
+# Client registry: one client per custom_instructions value, tagged with the config version it was built for
+_clients = {}
+_config_version = 0
+_registry_lock = threading.Lock()
+# Single-flight construction: only one thread builds a client at a time
+_build_lock = threading.Lock()
+_failed_builds = {}
+_retired_clients = []
+_built_db_config_hash = None
+_last_config_check = 0.0
 
 
 def _get_config_hash(config_dict):
@@ -127,10 +144,85 @@ def _fix_ollama_urls(config_section):
 
 
 def reset_memory_client():
-    """Reset the global memory client to force reinitialization with new config."""
-    global _memory_client, _config_hash
-    _memory_client = None
-    _config_hash = None
+    """Mark the configuration as changed so the next get_memory_client call builds a new client."""
+    global _config_version
+    with _registry_lock:
+        _config_version += 1
+        _failed_builds.clear()
+
+
+def get_config_version():
+    """Version of the memory configuration, bumped whenever it changes."""
+    return _config_version
+
+
+def _check_stored_config():
+    """
+    Bump the config version if the stored configuration differs from the one the clients were built from.
+
+    Config routes call reset_memory_client in the process that handled the update; this catches
+    updates made through other processes, at most once every CONFIG_RECHECK_SECONDS.
+    """
+    global _last_config_check, _config_version
+    now = time.monotonic()
+    if now - _last_config_check < CONFIG_RECHECK_SECONDS:
+        return
+    _last_config_check = now
+    try:
+        db = SessionLocal()
+        try:
+            row = db.query(ConfigModel.value).filter(ConfigModel.key == "main").first()
+        finally:
+            db.close()
+    except Exception as e:
+        print(f"Warning: Could not check stored configuration: {e}")
+        return
+    stored_hash = _get_config_hash(row[0] if row else None)
+    with _registry_lock:
+        if _built_db_config_hash is not None and stored_hash != _built_db_config_hash:
+            _config_version += 1
+            _failed_builds.clear()
+
+
+def _retire(client):
+    _retired_clients.append((time.monotonic(), client))
+
+
+def _close_client(client):
+    close = getattr(client, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception as e:
+            print(f"Warning: Error closing retired memory client: {e}")
+
+
+def _reap_retired_clients(force=False):
+    """Close replaced clients once they have had CLIENT_DRAIN_SECONDS to finish in-flight work."""
+    now = time.monotonic()
+    with _registry_lock:
+        expired = [c for retired_at, c in _retired_clients if force or now - retired_at >= CLIENT_DRAIN_SECONDS]
+        _retired_clients[:] = [(t, c) for t, c in _retired_clients if not (force or now - t >= CLIENT_DRAIN_SECONDS)]
+    for client in expired:
+        _close_client(client)
+
+
+def close_memory_clients():
+    """Close every client held by the registry (application shutdown)."""
+    with _registry_lock:
+        for _, client in _clients.values():
+            _retire(client)
+        _clients.clear()
+    _reap_retired_clients(force=True)
+
+
+def warm_up_memory_client(background=True):
+    """Build the default client ahead of the first request, in a background thread unless ``background`` is False."""
+    if not background:
+        return get_memory_client()
+    thread = threading.Thread(target=get_memory_client, name="openmemory-client-warmup", daemon=True)
+    thread.start()
+    return thread
 
 
 def get_default_memory_config():
@@ -286,100 +378,133 @@ def _parse_environment_variables(config_dict):
     return config_dict
 
 
+def _build_config(custom_instructions: str = None):
+    """
+    Assemble the client configuration from the defaults, the stored configuration and the environment.
+
+    Returns the config dict and the hash of the stored configuration it was built from.
+    """
+    # Start with default configuration
+    config = get_default_memory_config()
+    
+    # Variable to track custom instructions
+    db_custom_instructions = None
+    db_config_hash = _get_config_hash(None)
+    
+    # Load configuration from database
+    try:
+        db = SessionLocal()
+        db_config = db.query(ConfigModel).filter(ConfigModel.key == "main").first()
+        
+        if db_config:
+            json_config = db_config.value
+            db_config_hash = _get_config_hash(json_config)
+            
+            # Extract custom instructions from openmemory settings
+            if "openmemory" in json_config and "custom_instructions" in json_config["openmemory"]:
+                db_custom_instructions = json_config["openmemory"]["custom_instructions"]
+            
+            # Override defaults with configurations from the database
+            if "mem0" in json_config:
+                mem0_config = json_config["mem0"]
+                
+                # Update LLM configuration if available
+                if "llm" in mem0_config and mem0_config["llm"] is not None:
+                    config["llm"] = mem0_config["llm"]
+                    
+                    # Fix Ollama URLs for Docker if needed
+                    if config["llm"].get("provider") == "ollama":
+                        config["llm"] = _fix_ollama_urls(config["llm"])
+                
+                # Update Embedder configuration if available
+                if "embedder" in mem0_config and mem0_config["embedder"] is not None:
+                    config["embedder"] = mem0_config["embedder"]
+                    
+                    # Fix Ollama URLs for Docker if needed
+                    if config["embedder"].get("provider") == "ollama":
+                        config["embedder"] = _fix_ollama_urls(config["embedder"])
+
+                if "vector_store" in mem0_config and mem0_config["vector_store"] is not None:
+                    config["vector_store"] = mem0_config["vector_store"]
+        else:
+            print("No configuration found in database, using defaults")
+                
+        db.close()
+                        
+    except Exception as e:
+        print(f"Warning: Error loading configuration from database: {e}")
+        print("Using default configuration")
+        # Continue with default configuration if database config can't be loaded
+
+    # Use custom_instructions parameter first, then fall back to database value
+    instructions_to_use = custom_instructions or db_custom_instructions
+    if instructions_to_use:
+        config["custom_fact_extraction_prompt"] = instructions_to_use
+
+    # ALWAYS parse environment variables in the final config
+    # This ensures that even default config values like "env:OPENAI_API_KEY" get parsed
+    print("Parsing environment variables in final config...")
+    config = _parse_environment_variables(config)
+    return config, db_config_hash
+
+
 def get_memory_client(custom_instructions: str = None):
     """
     Get or initialize the Mem0 client.
 
+    Clients are cached per configuration version. The configuration is only re-read when
+    the version changes (reset_memory_client, or a stored-config change noticed by
+    _check_stored_config); construction is single-flight, so concurrent callers wait for
+    one build instead of each creating a client. A replaced client is closed after
+    CLIENT_DRAIN_SECONDS so requests still using it can finish.
+
     Args:
         custom_instructions: Optional instructions for the memory project.
 
     Returns:
         Initialized Mem0 client instance or None if initialization fails.
-
-    Raises:
-        Exception: If required API keys are not set or critical configuration is missing.
     """
-    global _memory_client, _config_hash
+    global _built_db_config_hash
 
     try:
-        # Start with default configuration
-        config = get_default_memory_config()
-        
-        # Variable to track custom instructions
-        db_custom_instructions = None
-        
-        # Load configuration from database
-        try:
-            db = SessionLocal()
-            db_config = db.query(ConfigModel).filter(ConfigModel.key == "main").first()
-            
-            if db_config:
-                json_config = db_config.value
-                
-                # Extract custom instructions from openmemory settings
-                if "openmemory" in json_config and "custom_instructions" in json_config["openmemory"]:
-                    db_custom_instructions = json_config["openmemory"]["custom_instructions"]
-                
-                # Override defaults with configurations from the database
-                if "mem0" in json_config:
-                    mem0_config = json_config["mem0"]
-                    
-                    # Update LLM configuration if available
-                    if "llm" in mem0_config and mem0_config["llm"] is not None:
-                        config["llm"] = mem0_config["llm"]
-                        
-                        # Fix Ollama URLs for Docker if needed
-                        if config["llm"].get("provider") == "ollama":
-                            config["llm"] = _fix_ollama_urls(config["llm"])
-                    
-                    # Update Embedder configuration if available
-                    if "embedder" in mem0_config and mem0_config["embedder"] is not None:
-                        config["embedder"] = mem0_config["embedder"]
-                        
-                        # Fix Ollama URLs for Docker if needed
-                        if config["embedder"].get("provider") == "ollama":
-                            config["embedder"] = _fix_ollama_urls(config["embedder"])
+        _check_stored_config()
 
-                    if "vector_store" in mem0_config and mem0_config["vector_store"] is not None:
-                        config["vector_store"] = mem0_config["vector_store"]
-            else:
-                print("No configuration found in database, using defaults")
-                    
-            db.close()
-                            
-        except Exception as e:
-            print(f"Warning: Error loading configuration from database: {e}")
-            print("Using default configuration")
-            # Continue with default configuration if database config can't be loaded
-
-        # Use custom_instructions parameter first, then fall back to database value
-        instructions_to_use = custom_instructions or db_custom_instructions
-        if instructions_to_use:
-            config["custom_fact_extraction_prompt"] = instructions_to_use
-
-        # ALWAYS parse environment variables in the final config
-        # This ensures that even default config values like "env:OPENAI_API_KEY" get parsed
-        print("Parsing environment variables in final config...")
-        config = _parse_environment_variables(config)
-
-        # Check if config has changed by comparing hashes
-        current_config_hash = _get_config_hash(config)
-        
-        # Only reinitialize if config changed or client doesn't exist
-        if _memory_client is None or _config_hash != current_config_hash:
-            print(f"Initializing memory client with config hash: {current_config_hash}")
+        # Fast path: a client for the current version already exists
+        entry = _clients.get(custom_instructions)
+        if entry is not None and entry[0] == _config_version:
+            return entry[1]
+
+        with _build_lock:
+            version = _config_version
+            entry = _clients.get(custom_instructions)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+
+            failed_at = _failed_builds.get((version, custom_instructions))
+            if failed_at is not None and time.monotonic() - failed_at < CLIENT_RETRY_SECONDS:
+                return None
+
+            config, db_config_hash = _build_config(custom_instructions)
+            print(f"Initializing memory client for config version {version}")
             try:
-                _memory_client = Memory.from_config(config_dict=config)
-                _config_hash = current_config_hash
-                print("Memory client initialized successfully")
+                client = Memory.from_config(config_dict=config)
             except Exception as init_error:
                 print(f"Warning: Failed to initialize memory client: {init_error}")
                 print("Server will continue running with limited memory functionality")
-                _memory_client = None
-                _config_hash = None
+                with _registry_lock:
+                    _failed_builds[(version, custom_instructions)] = time.monotonic()
                 return None
-        
-        return _memory_client
+            print("Memory client initialized successfully")
+
+            with _registry_lock:
+                if entry is not None:
+                    _retire(entry[1])
+                _clients[custom_instructions] = (version, client)
+                _built_db_config_hash = db_config_hash
+                _failed_builds.pop((version, custom_instructions), None)
+
+        _reap_retired_clients()
+        return client
         
     except Exception as e:
         print(f"Warning: Exception occurred while initializing memory client: {e}")
@@ -1,7 +1,8 @@
 from typing import Optional
 from uuid import UUID
 
-from app.models import App, Memory, MemoryState
+from app.models import AccessControl, App, Memory, MemoryState
+from sqlalchemy import and_, exists, or_, select, true
 from sqlalchemy.orm import Session
 
 
@@ -51,3 +52,44 @@ def check_memory_access_permissions(
 
     # Check if memory is in the accessible set
     return memory.id in accessible_memory_ids
+
+
+def memory_access_filter(app_id: Optional[UUID] = None):
+    """
+    SQL equivalent of `check_memory_access_permissions`, for filtering a `Memory` query.
+
+    Applying it before pagination keeps page sizes exact and replaces the per-row
+    permission queries with correlated EXISTS/IN subqueries on `apps` and
+    `access_controls`.
+
+    Args:
+        app_id: Optional app ID to check permissions for
+
+    Returns:
+        A boolean SQL expression over `Memory`
+    """
+    is_active = Memory.state == MemoryState.active
+    if not app_id:
+        return is_active
+
+    app_is_active = exists().where(App.id == app_id, App.is_active == true())
+
+    rules = select(AccessControl.object_id).where(
+        AccessControl.subject_type == "app",
+        AccessControl.subject_id == app_id,
+        AccessControl.object_type == "memory",
+    )
+    has_rules = rules.exists()
+    allow_all = rules.where(AccessControl.effect == "allow", AccessControl.object_id.is_(None)).exists()
+    deny_all = rules.where(AccessControl.effect == "deny", AccessControl.object_id.is_(None)).exists()
+    allowed = Memory.id.in_(rules.where(AccessControl.effect == "allow", AccessControl.object_id.isnot(None)))
+    denied = Memory.id.in_(rules.where(AccessControl.effect == "deny", AccessControl.object_id.isnot(None)))
+
+    return and_(
+        is_active,
+        app_is_active,
+        or_(
+            ~has_rules,
+            and_(~deny_all, or_(allow_all, and_(allowed, ~denied))),
+        ),
+    )
@@ -0,0 +1,222 @@
+"""
+Full-text search over memory content.
+
+SQLite uses a contentless FTS5 table (``memories_fts``) with the trigram
+tokenizer, kept in sync with ``memories`` by triggers, so substring searches
+behave like the old ``ILIKE '%query%'`` but are answered from the index.
+``memories`` is keyed by a UUID and its implicit rowids may be renumbered by
+``VACUUM``, so the FTS rowids come from ``memories_fts_keys``, which maps a
+stable integer key to each memory id.
+Postgres uses a ``pg_trgm`` GIN index (which serves ``ILIKE``) plus a
+``tsvector`` expression index for word matches. The index objects are created
+by the ``add_memory_fulltext_index`` migration and, for databases created with
+``create_all``, by ``ensure_fulltext_index`` at startup. When neither is
+available the search falls back to an unindexed ``ILIKE``.
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from app.models import Memory
+from sqlalchemy import case, func, literal, literal_column, or_, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import table
+from sqlalchemy.sql.expression import ColumnElement
+
+FTS_TABLE = "memories_fts"
+# The trigram tokenizer cannot match queries shorter than one trigram
+MIN_FTS_QUERY_LENGTH = 3
+# Weight of the vector-search similarity when blending it with text relevance
+VECTOR_SCORE_WEIGHT = 0.5
+
+FTS_KEYS_TABLE = "memories_fts_keys"
+
+SQLITE_FTS_DDL = [
+    f"CREATE TABLE IF NOT EXISTS {FTS_KEYS_TABLE} (fts_rowid INTEGER PRIMARY KEY, memory_id TEXT NOT NULL UNIQUE)",
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(content, content='', tokenize='trigram')",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON memories BEGIN
+        INSERT INTO {FTS_KEYS_TABLE}(memory_id) VALUES (new.id);
+        INSERT INTO {FTS_TABLE}(rowid, content)
+            SELECT fts_rowid, new.content FROM {FTS_KEYS_TABLE} WHERE memory_id = new.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON memories BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content)
+            SELECT 'delete', fts_rowid, old.content FROM {FTS_KEYS_TABLE} WHERE memory_id = old.id;
+        DELETE FROM {FTS_KEYS_TABLE} WHERE memory_id = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF content ON memories BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content)
+            SELECT 'delete', fts_rowid, old.content FROM {FTS_KEYS_TABLE} WHERE memory_id = old.id;
+        INSERT INTO {FTS_TABLE}(rowid, content)
+            SELECT fts_rowid, new.content FROM {FTS_KEYS_TABLE} WHERE memory_id = new.id;
+    END""",
+]
+
+# Index rows written before the FTS table existed
+SQLITE_FTS_POPULATE = [
+    f"INSERT OR IGNORE INTO {FTS_KEYS_TABLE}(memory_id) SELECT id FROM memories",
+    f"""INSERT INTO {FTS_TABLE}(rowid, content)
+        SELECT k.fts_rowid, m.content FROM memories m JOIN {FTS_KEYS_TABLE} k ON k.memory_id = m.id""",
+]
+
+# The first version keyed the FTS table on memories.rowid; its objects are replaced
+SQLITE_FTS_DROP = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    f"DROP TABLE IF EXISTS {FTS_KEYS_TABLE}",
+]
+
+POSTGRES_TRGM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_memory_content_trgm ON memories USING gin (content gin_trgm_ops)",
+]
+
+POSTGRES_TSVECTOR_DDL = [
+    "CREATE INDEX IF NOT EXISTS idx_memory_content_tsv ON memories USING gin (to_tsvector('simple', content))",
+]
+
+# Per-dialect search backend detected by ensure_fulltext_index: "fts5", "pg_trgm", "tsvector" or "like"
+_backends: Dict[str, str] = {}
+
+
+def ensure_fulltext_index(engine: Engine) -> str:
+    """Create the full-text index objects if they are missing and return the backend in use."""
+    dialect = engine.dialect.name
+    backend = "like"
+    try:
+        if dialect == "sqlite":
+            with engine.begin() as conn:
+                tables = {
+                    name
+                    for (name,) in conn.execute(
+                        text("SELECT name FROM sqlite_master WHERE type = 'table' AND name IN (:fts, :keys)"),
+                        {"fts": FTS_TABLE, "keys": FTS_KEYS_TABLE},
+                    )
+                }
+                if tables != {FTS_TABLE, FTS_KEYS_TABLE}:
+                    for statement in SQLITE_FTS_DROP:
+                        conn.execute(text(statement))
+                for statement in SQLITE_FTS_DDL:
+                    conn.execute(text(statement))
+                if tables != {FTS_TABLE, FTS_KEYS_TABLE}:
+                    for statement in SQLITE_FTS_POPULATE:
+                        conn.execute(text(statement))
+            backend = "fts5"
+        elif dialect == "postgresql":
+            with engine.begin() as conn:
+                for statement in POSTGRES_TSVECTOR_DDL:
+                    conn.execute(text(statement))
+            backend = "tsvector"
+            try:
+                with engine.begin() as conn:
+                    for statement in POSTGRES_TRGM_DDL:
+                        conn.execute(text(statement))
+                backend = "pg_trgm"
+            except Exception as e:
+                logging.warning(f"pg_trgm is unavailable, substring search will not use an index: {e}")
+    except Exception as e:
+        logging.warning(f"Full-text index unavailable on {dialect}, falling back to ILIKE search: {e}")
+    _backends[dialect] = backend
+    return backend
+
+
+def get_fulltext_backend(db: Session) -> str:
+    dialect = db.get_bind().dialect.name
+    if dialect not in _backends:
+        ensure_fulltext_index(db.get_bind())
+    return _backends[dialect]
+
+
+def _fts5_phrase(search_query: str) -> str:
+    # A quoted phrase matches the query as a substring under the trigram tokenizer
+    return '"' + search_query.replace('"', '""') + '"'
+
+
+def _text_matches(db: Session, search_query: str):
+    """Subquery of (memory key, relevance) for memories matching ``search_query`` and the join condition."""
+    backend = get_fulltext_backend(db)
+
+    if backend == "fts5" and len(search_query) >= MIN_FTS_QUERY_LENGTH:
+        fts = table(FTS_TABLE)
+        keys = table(FTS_KEYS_TABLE)
+        matches = (
+            select(
+                literal_column(f"{FTS_KEYS_TABLE}.memory_id").label("key"),
+                (-literal_column(f"bm25({FTS_TABLE})")).label("score"),
+            )
+            .select_from(fts)
+            .join(keys, literal_column(f"{FTS_KEYS_TABLE}.fts_rowid") == literal_column(f"{FTS_TABLE}.rowid"))
+            .where(literal_column(FTS_TABLE).op("MATCH")(_fts5_phrase(search_query)))
+            .subquery("text_matches")
+        )
+        return matches, matches.c.key == literal_column("memories.id")
+
+    pattern = f"%{search_query}%"
+    if backend in ("pg_trgm", "tsvector"):
+        document = func.to_tsvector("simple", Memory.content)
+        ts_query = func.websearch_to_tsquery("simple", search_query)
+        score = func.ts_rank_cd(document, ts_query)
+        if backend == "pg_trgm":
+            score = score + func.similarity(Memory.content, search_query)
+        condition = or_(Memory.content.ilike(pattern), document.op("@@")(ts_query))
+    else:
+        score = literal(1.0)
+        condition = Memory.content.ilike(pattern)
+
+    matches = select(Memory.id.label("key"), score.label("score")).where(condition).subquery("text_matches")
+    return matches, matches.c.key == Memory.id
+
+
+def apply_text_search(
+    query: Query,
+    db: Session,
+    search_query: str,
+    vector_scores: Optional[Dict[UUID, float]] = None,
+) -> Tuple[Query, ColumnElement]:
+    """
+    Restrict a ``Memory`` query to rows matching ``search_query``.
+
+    Returns the filtered query and a relevance expression (higher is better) to
+    order by. Text relevance is normalized to [0, 1] within the result set. When
+    ``vector_scores`` (memory id -> similarity from the mem0 client) is given,
+    memories found only by vector search are included as well and the two scores
+    are blended with ``VECTOR_SCORE_WEIGHT``.
+    """
+    matches, on_clause = _text_matches(db, search_query)
+    text_score = matches.c.score / func.nullif(func.max(matches.c.score).over(), 0)
+
+    if not vector_scores:
+        return query.join(matches, on_clause), func.coalesce(text_score, 1.0)
+
+    top_score = max(vector_scores.values()) or 1.0
+    vector_score = case(
+        {memory_id: score / top_score for memory_id, score in vector_scores.items()},
+        value=Memory.id,
+        else_=0.0,
+    )
+    query = query.outerjoin(matches, on_clause).filter(
+        or_(matches.c.key.isnot(None), Memory.id.in_(list(vector_scores)))
+    )
+    relevance = (1 - VECTOR_SCORE_WEIGHT) * func.coalesce(text_score, 0.0) + VECTOR_SCORE_WEIGHT * vector_score
+    return query, relevance
+
+
+def get_vector_scores(memory_client, search_query: str, user_id: str, limit: int = 100) -> Dict[UUID, float]:
+    """Similarity scores from the mem0 client's vector search, keyed by memory id."""
+    try:
+        results = memory_client.search(search_query, user_id=user_id, limit=limit)
+    except Exception as e:
+        logging.warning(f"Vector search failed, ranking by text relevance only: {e}")
+        return {}
+    hits = results.get("results", []) if isinstance(results, dict) else results
+    scores = {}
+    for hit in hits:
+        try:
+            scores[UUID(str(hit["id"]))] = max(float(hit.get("score") or 0.0), 0.0)
+        except (KeyError, ValueError):
+            continue
+    return scores
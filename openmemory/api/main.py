@@ -1,4 +1,5 @@
 import datetime
+import os
 from uuid import uuid4
 
 from app.config import DEFAULT_APP_ID, USER_ID
@@ -6,6 +7,10 @@ from app.database import Base, SessionLocal, engine
 from app.mcp_server import setup_mcp_server
 from app.models import App, User
 from app.routers import apps_router, backup_router, config_router, memories_router, stats_router
+from app.utils.access_log import access_log
+from app.utils.concurrency import shutdown_executors
+from app.utils.memory import close_memory_clients, warm_up_memory_client
+from app.utils.search import ensure_fulltext_index
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_pagination import add_pagination
@@ -23,6 +28,9 @@ app.add_middleware(
 # Create all tables
 Base.metadata.create_all(bind=engine)
 
+# Full-text index for memory search (no-op when the migration already created it)
+ensure_fulltext_index(engine)
+
 # Check for USER_ID and create default user if needed
 def create_default_user():
     db = SessionLocal()
@@ -75,8 +83,15 @@ def create_default_app():
 create_default_user()
 create_default_app()
 
+# Build the memory client in the background so the first request does not pay for it
+if os.getenv("MEMORY_CLIENT_WARMUP", "true").lower() in ("1", "true", "yes"):
+    warm_up_memory_client()
+
 # Setup MCP server
 setup_mcp_server(app)
+app.add_event_handler("shutdown", shutdown_executors)
+app.add_event_handler("shutdown", access_log.close)
+app.add_event_handler("shutdown", close_memory_clients)
 
 # Include routers
 app.include_router(memories_router)
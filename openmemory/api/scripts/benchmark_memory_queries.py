@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory listing queries against a synthetic OpenMemory database.
+
+Seeds one user with N memories (default 100k) spread over several apps, with a
+mix of states and app-level access rules, then compares paging through the
+memory list with per-row permission checks after pagination (the previous
+behaviour) against applying `memory_access_filter` in SQL before pagination.
+
+Usage:
+    python scripts/benchmark_memory_queries.py [--memories 100000] [--pages 20] [--page-size 10]
+                                               [--database-url sqlite:///./bench.db]
+
+Without --database-url a temporary SQLite database is created and removed afterwards.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", type=int, default=100_000, help="Number of memories to seed")
+    parser.add_argument("--pages", type=int, default=20, help="Pages to fetch per scenario")
+    parser.add_argument("--page-size", type=int, default=10, help="Requested page size")
+    parser.add_argument("--database-url", default=None, help="Database to seed (default: temporary SQLite file)")
+    return parser.parse_args()
+
+
+args = parse_args()
+tmp_dir = None
+if args.database_url:
+    os.environ["DATABASE_URL"] = args.database_url
+else:
+    tmp_dir = tempfile.mkdtemp(prefix="openmemory-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+# Categorization is never triggered (rows are inserted with Core), but the client is built at import time
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models import AccessControl, App, Memory, MemoryState, User  # noqa: E402
+from app.utils.permissions import check_memory_access_permissions, memory_access_filter  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+STATES = [MemoryState.active] * 8 + [MemoryState.paused, MemoryState.archived]
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+def seed(n_memories):
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        user = User(id=uuid.uuid4(), user_id=f"bench-{uuid.uuid4().hex[:8]}")
+        apps = {
+            name: App(id=uuid.uuid4(), owner_id=user.id, name=name, is_active=name != "paused")
+            for name in ("open", "allow-list", "deny-all", "paused")
+        }
+        db.add(user)
+        db.add_all(apps.values())
+        db.commit()
+
+        now = datetime.now(UTC)
+        app_ids = [app.id for app in apps.values()]
+        memory_ids = []
+        for start in range(0, n_memories, 10_000):
+            rows = []
+            for i in range(start, min(start + 10_000, n_memories)):
+                memory_id = uuid.uuid4()
+                memory_ids.append(memory_id)
+                rows.append(
+                    {
+                        "id": memory_id,
+                        "user_id": user.id,
+                        "app_id": app_ids[i % len(app_ids)],
+                        "content": f"benchmark memory {i}",
+                        "metadata": {},
+                        "state": STATES[i % len(STATES)],
+                        "created_at": now - timedelta(seconds=i),
+                        "updated_at": now - timedelta(seconds=i),
+                    }
+                )
+            db.execute(Memory.__table__.insert(), rows)
+        db.commit()
+
+        # "allow-list" may read every third memory except every 30th; "deny-all" has a blanket deny
+        rules = [
+            {
+                "id": uuid.uuid4(),
+                "subject_type": "app",
+                "subject_id": apps["allow-list"].id,
+                "object_type": "memory",
+                "object_id": memory_id,
+                "effect": "allow" if i % 30 else "deny",
+            }
+            for i, memory_id in enumerate(memory_ids)
+            if i % 3 == 0
+        ]
+        rules.append(
+            {
+                "id": uuid.uuid4(),
+                "subject_type": "app",
+                "subject_id": apps["deny-all"].id,
+                "object_type": "memory",
+                "object_id": None,
+                "effect": "deny",
+            }
+        )
+        for start in range(0, len(rules), 10_000):
+            db.execute(AccessControl.__table__.insert(), rules[start : start + 10_000])
+        db.commit()
+        return user.id, {name: app.id for name, app in apps.items()}
+    finally:
+        db.close()
+
+
+def page_after_filtering(db, user_id, app_id, page, size):
+    """Previous behaviour: paginate, then drop rows the app may not see."""
+    items = (
+        db.query(Memory)
+        .filter(Memory.user_id == user_id, Memory.state != MemoryState.deleted, Memory.state != MemoryState.archived)
+        .order_by(Memory.created_at.desc())
+        .offset((page - 1) * size)
+        .limit(size)
+        .all()
+    )
+    return [memory for memory in items if check_memory_access_permissions(db, memory, app_id)]
+
+
+def page_with_sql_acl(db, user_id, app_id, page, size):
+    """Access rules applied in SQL before pagination."""
+    return (
+        db.query(Memory)
+        .filter(Memory.user_id == user_id, memory_access_filter(app_id))
+        .order_by(Memory.created_at.desc())
+        .offset((page - 1) * size)
+        .limit(size)
+        .all()
+    )
+
+
+def run(fetch, user_id, app_id, pages, size):
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    latencies, sizes = [], []
+    try:
+        for page in range(1, pages + 1):
+            db = SessionLocal()
+            try:
+                start = time.perf_counter()
+                rows = fetch(db, user_id, app_id, page, size)
+                latencies.append((time.perf_counter() - start) * 1000)
+                sizes.append(len(rows))
+            finally:
+                db.close()
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+    return {
+        "p50_ms": statistics.median(latencies),
+        "max_ms": max(latencies),
+        "avg_rows": statistics.mean(sizes),
+        "queries_per_page": counter.count / pages,
+    }
+
+
+def main():
+    print(f"Seeding {args.memories:,} memories into {os.environ['DATABASE_URL']} ...")
+    start = time.perf_counter()
+    user_id, apps = seed(args.memories)
+    print(f"Seeded in {time.perf_counter() - start:.1f}s\n")
+
+    header = f"{'app':<12} {'approach':<22} {'p50 ms':>9} {'max ms':>9} {'rows/page':>10} {'queries/page':>13}"
+    print(header)
+    print("-" * len(header))
+    for name, app_id in [("(none)", None)] + list(apps.items()):
+        for label, fetch in (
+            ("paginate, then check", page_after_filtering),
+            ("SQL ACL, then paginate", page_with_sql_acl),
+        ):
+            stats = run(fetch, user_id, app_id, args.pages, args.page_size)
+            print(
+                f"{name:<12} {label:<22} {stats['p50_ms']:>9.2f} {stats['max_ms']:>9.2f} "
+                f"{stats['avg_rows']:>10.1f} {stats['queries_per_page']:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Load test for the MCP tools: do searches keep progressing while an add is in flight?
+
+Starts one `add_memories` call whose (simulated) LLM step takes --add-latency
+seconds, then issues --searches `search_memory` calls with --concurrency in
+flight at a time, and reports how many searches finished while the add was
+still running, their latency, and the worst event-loop stall seen by a 10 ms
+ticker. The memory client is replaced by one that sleeps instead of calling
+an LLM/embedder, so the numbers isolate the server's scheduling.
+
+`--blocking` calls the tool bodies directly on the event loop, which is how
+the tools ran before they were moved onto executors, for comparison.
+
+Usage:
+    python scripts/load_test_mcp.py [--searches 50] [--concurrency 10] [--add-latency 3.0]
+                                    [--search-latency 0.05] [--blocking]
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--searches", type=int, default=50, help="Number of searches to issue")
+    parser.add_argument("--concurrency", type=int, default=10, help="Searches in flight at a time")
+    parser.add_argument("--add-latency", type=float, default=3.0, help="Seconds the simulated add spends in the LLM")
+    parser.add_argument(
+        "--search-latency", type=float, default=0.05, help="Seconds the simulated query embedding takes"
+    )
+    parser.add_argument("--blocking", action="store_true", help="Run tool bodies on the event loop (old behaviour)")
+    return parser.parse_args()
+
+
+args = parse_args()
+tmp_dir = tempfile.mkdtemp(prefix="openmemory-load-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'load.db')}"
+os.environ.setdefault("OPENAI_API_KEY", "load-test")
+
+from app import mcp_server  # noqa: E402
+from app.database import Base, engine  # noqa: E402
+
+
+class SimulatedEmbedder:
+    def embed(self, text, memory_action=None):
+        time.sleep(args.search_latency)
+        return [0.0] * 8
+
+
+class SimulatedVectorStore:
+    def search(self, query, vectors, limit=5, filters=None):
+        return []
+
+
+class SimulatedMemoryClient:
+    """Blocks like the real client would, without any network calls."""
+
+    embedding_model = SimulatedEmbedder()
+    vector_store = SimulatedVectorStore()
+
+    def add(self, text, user_id=None, metadata=None, **kwargs):
+        time.sleep(args.add_latency)
+        return {"results": []}
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+async def main():
+    Base.metadata.create_all(bind=engine)
+    mcp_server.get_memory_client_safe = SimulatedMemoryClient
+    mcp_server.user_id_var.set("load-test-user")
+    mcp_server.client_name_var.set("load-test")
+
+    if args.blocking:
+
+        async def add(text):
+            return mcp_server._add_memories("load-test-user", "load-test", text)
+
+        async def search(query):
+            return mcp_server._search_memory("load-test-user", "load-test", query)
+    else:
+        add, search = mcp_server.add_memories, mcp_server.search_memory
+
+    # Create the user and app up front so the add does not race the searches for them
+    await search("warm-up")
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop))
+    start = time.perf_counter()
+    add_done_at = None
+
+    async def run_add():
+        nonlocal add_done_at
+        await add("I prefer window seats")
+        add_done_at = time.perf_counter() - start
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    finished, latencies = [], []
+
+    async def run_search(i):
+        async with semaphore:
+            t = time.perf_counter()
+            await search(f"seat preference {i}")
+            latencies.append(time.perf_counter() - t)
+            finished.append(time.perf_counter() - start)
+
+    add_task = asyncio.create_task(run_add())
+    await asyncio.sleep(0)  # let the add start first
+    await asyncio.gather(*(run_search(i) for i in range(args.searches)))
+    await add_task
+    stop.set()
+    worst_lag = await lag_task
+
+    during_add = sum(1 for t in finished if t < add_done_at)
+    mode = "blocking (on event loop)" if args.blocking else "executors"
+    print(f"mode:                      {mode}")
+    print(f"add finished after:        {add_done_at:.2f}s")
+    print(f"searches done during add:  {during_add}/{args.searches}")
+    print(
+        f"search latency p50 / p95:  {statistics.median(latencies) * 1000:.1f} / "
+        f"{statistics.quantiles(latencies, n=20)[-1] * 1000:.1f} ms"
+    )
+    print(f"worst event-loop stall:    {worst_lag * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
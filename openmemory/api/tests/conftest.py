@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# app.database builds its engine at import time; point it at a throwaway file
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='openmemory-tests-'), 'test.db')}"
+)
+# The categorization client is created at import time but never called (see no_categorization)
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from app import models  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models import App, Memory, MemoryState, User  # noqa: E402
+from app.utils.search import ensure_fulltext_index  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def no_categorization(monkeypatch):
+    """Memory insert/update events would otherwise ask the LLM for categories."""
+    monkeypatch.setattr(models, "get_categories_for_memory", lambda content: [])
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'openmemory.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    ensure_fulltext_index(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = Session(bind=engine)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def user(db):
+    user = User(id=uuid.uuid4(), user_id=f"user-{uuid.uuid4().hex[:8]}")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def make_app(db, user):
+    def make_app(name="openmemory", is_active=True):
+        app = App(id=uuid.uuid4(), owner_id=user.id, name=name, is_active=is_active)
+        db.add(app)
+        db.commit()
+        return app
+
+    return make_app
+
+
+@pytest.fixture
+def make_memory(db, user, make_app):
+    default_app = {}
+
+    def make_memory(content, app=None, state=MemoryState.active):
+        if app is None:
+            if "app" not in default_app:
+                default_app["app"] = make_app()
+            app = default_app["app"]
+        memory = Memory(id=uuid.uuid4(), user_id=user.id, app_id=app.id, content=content, state=state)
+        db.add(memory)
+        db.commit()
+        return memory
+
+    return make_memory
@@ -0,0 +1,93 @@
+from unittest.mock import Mock
+
+from app.models import MemoryAccessLog, MemoryAccessRollup
+from app.utils import access_log as access_log_module
+from app.utils.access_log import AccessLogWriter
+
+
+def test_module_level_writer_is_importable():
+    assert isinstance(access_log_module.access_log, AccessLogWriter)
+
+
+def test_record_then_flush_writes_rows(engine, db, make_memory):
+    memory = make_memory("likes tea")
+    writer = AccessLogWriter(engine=engine, flush_interval_ms=60_000)
+    try:
+        writer.record(memory.id, memory.app_id, "search", metadata={"query": "tea"})
+        writer.record(memory.id, memory.app_id, "list")
+        writer.flush()
+
+        rows = db.query(MemoryAccessLog).order_by(MemoryAccessLog.access_type).all()
+        assert [(r.access_type, r.metadata_) for r in rows] == [("list", {}), ("search", {"query": "tea"})]
+        assert writer.stats()["rows_written"] == 2
+    finally:
+        writer.close()
+
+
+def test_rollups_accumulate_across_flushes_with_sampling_disabled(engine, db, make_memory):
+    memory = make_memory("likes coffee")
+    writer = AccessLogWriter(engine=engine, flush_interval_ms=60_000, sample_rate=0.0, rollups=True)
+    try:
+        writer.record(memory.id, memory.app_id, "search")
+        writer.record(memory.id, memory.app_id, "search")
+        writer.flush()
+        writer.record(memory.id, memory.app_id, "search")
+        writer.flush()
+
+        assert db.query(MemoryAccessLog).count() == 0
+        rollups = db.query(MemoryAccessRollup).all()
+        assert len(rollups) == 1
+        assert rollups[0].count == 3
+        assert writer.stats()["sampled_out"] == 3
+    finally:
+        writer.close()
+
+
+def test_close_flushes_buffered_rows(engine, db, make_memory):
+    memory = make_memory("likes juice")
+    writer = AccessLogWriter(engine=engine, flush_interval_ms=60_000)
+    writer.record(memory.id, memory.app_id, "search")
+    writer.close()
+
+    assert db.query(MemoryAccessLog).count() == 1
+
+
+def test_failed_flush_is_retried_with_the_next_flush(engine, db, make_memory):
+    memory = make_memory("likes soup")
+    writer = AccessLogWriter(engine=engine, flush_interval_ms=60_000, rollups=True)
+    try:
+        writer.record(memory.id, memory.app_id, "search")
+        writer.engine = Mock(begin=Mock(side_effect=RuntimeError("database is down")))
+        writer.flush()
+        assert writer.stats()["buffered_rows"] == 1
+        assert writer.stats()["buffered_rollups"] == 1
+
+        writer.engine = engine
+        writer.record(memory.id, memory.app_id, "search")
+        writer.flush()
+
+        assert db.query(MemoryAccessLog).count() == 2
+        assert db.query(MemoryAccessRollup).one().count == 2
+        stats = writer.stats()
+        assert (stats["failed_flushes"], stats["dropped"], stats["dropped_rollups"]) == (1, 0, 0)
+    finally:
+        writer.close()
+
+
+def test_failed_flush_rebuffers_up_to_the_cap(engine, make_memory):
+    memories = [make_memory(f"memory {i}") for i in range(3)]
+    writer = AccessLogWriter(engine=engine, flush_interval_ms=60_000, flush_rows=2, max_buffered_rows=2, rollups=True)
+    try:
+        writer.engine = Mock(begin=Mock(side_effect=RuntimeError("database is down")))
+        writer.record(memories[0].id, memories[0].app_id, "search")
+        writer.record(memories[1].id, memories[1].app_id, "search")
+        writer.flush()
+        writer.record(memories[2].id, memories[2].app_id, "search")
+        writer.flush()
+
+        stats = writer.stats()
+        assert (stats["buffered_rows"], stats["dropped"]) == (2, 1)
+        assert (stats["buffered_rollups"], stats["dropped_rollups"]) == (2, 1)
+    finally:
+        writer.engine = engine
+        writer.close()
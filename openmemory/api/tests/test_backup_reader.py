@@ -0,0 +1,64 @@
+import io
+import json
+
+import pytest
+from app.routers.backup import _json_array, _JsonDocumentReader
+
+DOCUMENT = {
+    "user": {"id": "u1", "user_id": "alice", "name": None},
+    "apps": [],
+    "memories": [
+        {"id": f"m{i}", "content": f'memory {i} with "quotes", [brackets] and {{braces}}', "score": i * 1234.5678}
+        for i in range(25)
+    ],
+    "memory_categories": [{"memory_id": "m1", "category_id": "c1"}],
+    "export_meta": {"version": "1", "count": 25},
+}
+
+
+def _flatten(document):
+    for key, value in document.items():
+        if isinstance(value, list):
+            for item in value:
+                yield key, item
+        else:
+            yield key, value
+
+
+def _streamed(document):
+    """Same layout as the streaming exporter: scalar members dumped whole, arrays element by element."""
+    parts = []
+    for key, value in document.items():
+        if isinstance(value, list):
+            parts.append(json.dumps(key) + ": " + "".join(_json_array(value)))
+        else:
+            parts.append(json.dumps(key) + ": " + json.dumps(value))
+    return "{" + ",\n".join(parts) + "}"
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 1 << 16])
+@pytest.mark.parametrize(
+    "text",
+    [json.dumps(DOCUMENT, indent=2), json.dumps(DOCUMENT), _streamed(DOCUMENT)],
+    ids=["pretty", "compact", "streamed"],
+)
+def test_reads_every_member_and_array_element(text, read_size):
+    reader = _JsonDocumentReader(io.StringIO(text), read_size=read_size)
+
+    assert list(reader) == list(_flatten(DOCUMENT))
+
+
+def test_number_split_across_chunks():
+    text = '{"count": 1234567890, "ratio": 0.125}'
+
+    assert list(_JsonDocumentReader(io.StringIO(text), read_size=14)) == [("count", 1234567890), ("ratio", 0.125)]
+
+
+def test_empty_document():
+    assert list(_JsonDocumentReader(io.StringIO(" { } "))) == []
+
+
+@pytest.mark.parametrize("text", ['{"memories": [{"id": "m1"}', '{"memories": [{"id": "m1"} {"id": "m2"}]}', "[]"])
+def test_malformed_documents_raise(text):
+    with pytest.raises(ValueError):
+        list(_JsonDocumentReader(io.StringIO(text), read_size=4))
@@ -0,0 +1,65 @@
+import uuid
+
+import pytest
+from app import models
+from app.models import Memory, MemoryState, User
+from app.utils.categories import CategoryCache, category_cache, get_user_categories
+
+
+@pytest.fixture(autouse=True)
+def categorize_by_content(monkeypatch):
+    """Categories are the comma-separated words after '#' in the memory content."""
+    monkeypatch.setattr(
+        models,
+        "get_categories_for_memory",
+        lambda content: content.split("#", 1)[1].split(",") if "#" in content else [],
+    )
+    category_cache.invalidate()
+    yield
+    category_cache.invalidate()
+
+
+def _counts(db, user):
+    return [(category["name"], category["count"]) for category in get_user_categories(db, user.id)]
+
+
+def test_counts_exclude_archived_deleted_and_other_users(db, user, make_memory):
+    make_memory("Likes tea #food,drinks")
+    make_memory("Likes pasta #food")
+    make_memory("Used to like coffee #drinks", state=MemoryState.archived)
+    make_memory("Old address #places", state=MemoryState.deleted)
+
+    stranger = User(id=uuid.uuid4(), user_id="stranger")
+    db.add(stranger)
+    db.commit()
+    db.add(Memory(id=uuid.uuid4(), user_id=stranger.id, app_id=user.apps[0].id, content="Likes rice #food"))
+    db.commit()
+
+    assert _counts(db, user) == [("drinks", 1), ("food", 2)]
+    assert _counts(db, stranger) == [("food", 1)]
+
+
+def test_result_is_cached_until_a_memory_changes(db, user, make_memory):
+    memory = make_memory("Likes tea #drinks")
+    first = get_user_categories(db, user.id)
+
+    assert get_user_categories(db, user.id) is first
+
+    pasta = make_memory("Likes pasta #food")
+    assert _counts(db, user) == [("drinks", 1), ("food", 1)]
+
+    memory.state = MemoryState.archived
+    db.commit()
+    assert _counts(db, user) == [("food", 1)]
+
+    db.delete(pasta)
+    db.commit()
+    assert _counts(db, user) == []
+
+
+def test_entries_expire_after_ttl():
+    cache = CategoryCache(ttl=0)
+    user_id = uuid.uuid4()
+    cache.set(user_id, [{"name": "food"}])
+
+    assert cache.get(user_id) is None
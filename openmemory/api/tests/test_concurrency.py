@@ -0,0 +1,57 @@
+import asyncio
+import contextvars
+import threading
+
+import pytest
+from app.utils.concurrency import read_executor, run_read, run_write, write_executor
+
+request_user = contextvars.ContextVar("request_user", default=None)
+
+
+@pytest.mark.asyncio
+async def test_blocking_calls_run_off_the_event_loop():
+    release = threading.Event()
+    loop_thread = threading.get_ident()
+
+    def blocking_write():
+        release.wait(5)
+        return threading.get_ident()
+
+    write = asyncio.ensure_future(run_write(blocking_write))
+    # The loop stays responsive while the write blocks its worker
+    await asyncio.sleep(0.01)
+    assert not write.done()
+    release.set()
+
+    assert await write != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_reads_and_writes_use_separate_pools():
+    def thread_name():
+        return threading.current_thread().name
+
+    assert (await run_write(thread_name)).startswith("openmemory-write")
+    assert (await run_read(thread_name)).startswith("openmemory-read")
+    assert read_executor is not write_executor
+
+
+@pytest.mark.asyncio
+async def test_slow_writes_do_not_delay_reads():
+    release = threading.Event()
+    writes = [asyncio.ensure_future(run_write(release.wait, 5)) for _ in range(write_executor._max_workers + 1)]
+    try:
+        assert await asyncio.wait_for(run_read(lambda: "read"), timeout=2) == "read"
+    finally:
+        release.set()
+        await asyncio.gather(*writes)
+
+
+@pytest.mark.asyncio
+async def test_context_variables_and_arguments_are_passed_through():
+    request_user.set("alice")
+
+    def describe(prefix, suffix=""):
+        return f"{prefix}{request_user.get()}{suffix}"
+
+    assert await run_read(describe, "user=", suffix="!") == "user=alice!"
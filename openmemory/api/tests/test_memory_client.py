@@ -0,0 +1,98 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from app.utils import memory as memory_module
+from app.utils.memory import get_memory_client, reset_memory_client
+
+
+class FakeMemory:
+    builds = []
+
+    def __init__(self, config):
+        self.config = config
+        self.close = Mock()
+
+    @classmethod
+    def from_config(cls, config_dict):
+        # Slow enough that concurrent callers overlap with the build
+        time.sleep(0.05)
+        client = cls(config_dict)
+        cls.builds.append(client)
+        return client
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    FakeMemory.builds = []
+    monkeypatch.setattr(memory_module, "Memory", FakeMemory)
+    monkeypatch.setattr(
+        memory_module,
+        "_build_config",
+        lambda custom_instructions=None: ({"custom_fact_extraction_prompt": custom_instructions}, "stored-hash"),
+    )
+    monkeypatch.setattr(memory_module, "_check_stored_config", lambda: None)
+    monkeypatch.setattr(memory_module, "_clients", {})
+    monkeypatch.setattr(memory_module, "_failed_builds", {})
+    monkeypatch.setattr(memory_module, "_retired_clients", [])
+    yield
+    memory_module.close_memory_clients()
+
+
+def test_concurrent_callers_share_one_build():
+    barrier = threading.Barrier(8)
+    results = []
+
+    def call():
+        barrier.wait()
+        results.append(get_memory_client())
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(FakeMemory.builds) == 1
+    assert all(client is FakeMemory.builds[0] for client in results)
+
+
+def test_clients_are_cached_per_custom_instructions():
+    default = get_memory_client()
+    custom = get_memory_client("Only remember food preferences")
+
+    assert default is not custom
+    assert get_memory_client() is default
+    assert custom.config["custom_fact_extraction_prompt"] == "Only remember food preferences"
+    assert len(FakeMemory.builds) == 2
+
+
+def test_reset_rebuilds_and_closes_replaced_client_after_drain(monkeypatch):
+    monkeypatch.setattr(memory_module, "CLIENT_DRAIN_SECONDS", 0)
+    old = get_memory_client()
+
+    reset_memory_client()
+    new = get_memory_client()
+
+    assert new is not old
+    old.close.assert_called_once()
+    new.close.assert_not_called()
+
+
+def test_failed_build_is_not_retried_immediately(monkeypatch):
+    attempts = []
+
+    def failing_from_config(config_dict):
+        attempts.append(config_dict)
+        raise RuntimeError("vector store unreachable")
+
+    monkeypatch.setattr(FakeMemory, "from_config", failing_from_config)
+
+    assert get_memory_client() is None
+    assert get_memory_client() is None
+    assert len(attempts) == 1
+
+    reset_memory_client()
+    assert get_memory_client() is None
+    assert len(attempts) == 2
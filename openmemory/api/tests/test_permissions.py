@@ -0,0 +1,76 @@
+import pytest
+from app.models import AccessControl, Memory, MemoryState
+from app.utils.permissions import check_memory_access_permissions, memory_access_filter
+
+# Rules as (effect, target); target is the index of a memory or None for a blanket rule
+RULE_SETS = {
+    "no rules": ([], {0, 1, 2}),
+    "allow one": ([("allow", 0)], {0}),
+    "deny one only": ([("deny", 0)], set()),
+    "allow two deny one": ([("allow", 0), ("allow", 1), ("deny", 1)], {0}),
+    "allow all with a deny": ([("allow", None), ("deny", 0)], {0, 1, 2}),
+    "deny then allow all": ([("deny", 0), ("allow", None)], {0, 1, 2}),
+    "deny all with an allow": ([("allow", 0), ("deny", None)], set()),
+    "deny all and allow all": ([("allow", None), ("deny", None)], set()),
+}
+
+
+@pytest.fixture
+def memories(make_app, make_memory):
+    owner = make_app("owner")
+    active = [make_memory(f"memory {i}", app=owner) for i in range(3)]
+    archived = make_memory("archived memory", app=owner, state=MemoryState.archived)
+    return active, archived
+
+
+def _add_rules(db, app, rules, memories):
+    for effect, target in rules:
+        db.add(
+            AccessControl(
+                subject_type="app",
+                subject_id=app.id,
+                object_type="memory",
+                object_id=None if target is None else memories[target].id,
+                effect=effect,
+            )
+        )
+    db.commit()
+
+
+def _sql_accessible(db, user, app_id):
+    query = db.query(Memory.id).filter(Memory.user_id == user.id, memory_access_filter(app_id))
+    return {memory_id for (memory_id,) in query}
+
+
+def _python_accessible(db, user, app_id):
+    return {
+        memory.id
+        for memory in db.query(Memory).filter(Memory.user_id == user.id)
+        if check_memory_access_permissions(db, memory, app_id)
+    }
+
+
+@pytest.mark.parametrize("rules,expected", list(RULE_SETS.values()), ids=list(RULE_SETS))
+def test_sql_filter_matches_python_check(db, user, make_app, memories, rules, expected):
+    active, _ = memories
+    reader = make_app("reader")
+    _add_rules(db, reader, rules, active)
+
+    accessible = _sql_accessible(db, user, reader.id)
+
+    assert accessible == _python_accessible(db, user, reader.id)
+    assert accessible == {active[i].id for i in expected}
+
+
+def test_paused_app_sees_nothing(db, user, make_app, memories):
+    reader = make_app("reader", is_active=False)
+
+    assert _sql_accessible(db, user, reader.id) == set()
+    assert _python_accessible(db, user, reader.id) == set()
+
+
+def test_without_app_only_state_is_checked(db, user, memories):
+    active, _ = memories
+
+    assert _sql_accessible(db, user, None) == {memory.id for memory in active}
+    assert _python_accessible(db, user, None) == {memory.id for memory in active}
@@ -0,0 +1,92 @@
+from app.models import Memory
+from app.utils.search import FTS_TABLE, apply_text_search, ensure_fulltext_index, get_fulltext_backend
+from sqlalchemy import text
+
+
+def _search(db, user, search_query, vector_scores=None):
+    query = db.query(Memory).filter(Memory.user_id == user.id)
+    query, relevance = apply_text_search(query, db, search_query, vector_scores)
+    return [memory.content for memory in query.order_by(relevance.desc(), Memory.content)]
+
+
+def test_sqlite_uses_fts5(db):
+    assert get_fulltext_backend(db) == "fts5"
+
+
+def test_substring_match(db, user, make_memory):
+    make_memory("Prefers green tea in the morning")
+    make_memory("Lives in Paris")
+
+    assert _search(db, user, "een te") == ["Prefers green tea in the morning"]
+    assert _search(db, user, "PARIS") == ["Lives in Paris"]
+    assert _search(db, user, "berlin") == []
+
+
+def test_short_query_falls_back_to_like(db, user, make_memory):
+    make_memory("Plays Go on weekends")
+    make_memory("Reads novels")
+
+    assert _search(db, user, "go") == ["Plays Go on weekends"]
+
+
+def test_quotes_in_query_are_literal(db, user, make_memory):
+    make_memory('Nickname is "Bear"')
+
+    assert _search(db, user, '"Bear"') == ['Nickname is "Bear"']
+
+
+def test_index_follows_updates_and_deletes(db, user, make_memory):
+    memory = make_memory("Works at Acme")
+    other = make_memory("Works at Initech")
+
+    memory.content = "Works at Globex"
+    db.commit()
+    db.delete(other)
+    db.commit()
+
+    assert _search(db, user, "Acme") == []
+    assert _search(db, user, "Initech") == []
+    assert _search(db, user, "Globex") == ["Works at Globex"]
+
+
+def test_vector_scores_add_semantic_matches(db, user, make_memory):
+    text_match = make_memory("Enjoys hiking")
+    semantic_match = make_memory("Climbed Kilimanjaro last year")
+    make_memory("Owns a cat")
+
+    results = _search(db, user, "hiking", vector_scores={semantic_match.id: 0.9, text_match.id: 0.2})
+
+    assert results == ["Enjoys hiking", "Climbed Kilimanjaro last year"]
+
+
+def test_index_does_not_depend_on_memory_rowids(engine, db, user, make_memory):
+    make_memory("Speaks French")
+    make_memory("Speaks German")
+
+    # memories is keyed by a UUID; VACUUM or the table copies of batch migrations may renumber its rowids
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE memories SET rowid = -rowid"))
+        conn.execute(text("UPDATE memories SET rowid = rowid + 3"))
+
+    assert _search(db, user, "German") == ["Speaks German"]
+    assert _search(db, user, "French") == ["Speaks French"]
+
+
+def test_rowid_keyed_index_is_replaced(engine, db, user, make_memory):
+    make_memory("Drinks espresso")
+    with engine.begin() as conn:
+        for trigger in ("ai", "ad", "au"):
+            conn.execute(text(f"DROP TRIGGER {FTS_TABLE}_{trigger}"))
+        conn.execute(text(f"DROP TABLE {FTS_TABLE}"))
+        conn.execute(text("DROP TABLE memories_fts_keys"))
+        conn.execute(
+            text(
+                f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+                "content, content='memories', content_rowid='rowid', tokenize='trigram')"
+            )
+        )
+
+    assert ensure_fulltext_index(engine) == "fts5"
+    make_memory("Drinks matcha")
+
+    assert sorted(_search(db, user, "Drinks")) == ["Drinks espresso", "Drinks matcha"]
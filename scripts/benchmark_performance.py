@@ -8,18 +8,21 @@ Mem0Evomem 性能基準測試
 - ChromaDB 查詢性能
 - 記憶體使用監控
 - Docker 容器資源使用
+- PyTorch / ONNX (fp32, int8) 後端比較: 延遲、吞吐量、與 PyTorch 輸出的餘弦一致性
+  (python scripts/benchmark_performance.py --compare-backends [--onnx-threads N])
 
 Author: EvoMem Team
 License: Apache 2.0
 """
 
+import argparse
 import time
 import statistics
 import psutil
 import json
 import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 # 添加項目根目錄到 sys.path
@@ -33,7 +36,7 @@ from mem0.embeddings.bge_m3 import BGEM3Embedding
 class PerformanceBenchmark:
     """性能基準測試工具"""
 
-    def __init__(self):
+    def __init__(self, use_fp16: bool = True):
         """初始化測試環境"""
         self.results: Dict[str, Any] = {
             "timestamp": datetime.now().isoformat(),
@@ -46,7 +49,7 @@ class PerformanceBenchmark:
         config = BaseEmbedderConfig(
             model="BAAI/bge-m3",
             model_kwargs={
-                "use_fp16": True,
+                "use_fp16": use_fp16,
                 "device": "cpu",
                 "max_length": 8192
             }
@@ -341,6 +344,99 @@ class PerformanceBenchmark:
 
         return result
 
+    def compare_backends(
+        self,
+        onnx_threads: Optional[int] = None,
+        iterations: int = 50,
+        batch_size: int = 100
+    ) -> Dict[str, Any]:
+        """
+        比較 PyTorch 與 ONNX (fp32 / int8) 後端
+
+        Args:
+            onnx_threads: onnxruntime intra-op 線程數 (默認自動)
+            iterations: 單文本延遲測試次數 (默認 50)
+            batch_size: 吞吐量測試的文本數 (默認 100)
+
+        Returns:
+            每個後端的延遲、吞吐量、冷啟動時間，以及與 PyTorch 向量的餘弦一致性
+        """
+        print(f"📊 後端比較: torch vs onnx-fp32 vs onnx-int8 (onnx_threads={onnx_threads or 'auto'})")
+
+        import numpy as np
+
+        texts = [
+            "人工智慧正在改變世界",
+            "機器學習是人工智慧的一個重要分支",
+            "向量數據庫是 AI 應用的重要基礎設施",
+            "The quick brown fox jumps over the lazy dog.",
+            "使用者偏好在週末早上喝拿鐵，並且對花生過敏。" * 8,
+        ]
+        batch_texts = [f"{texts[i % len(texts)]} 編號: {i}" for i in range(batch_size)]
+
+        embedders = {"torch": (self.embedder, None)}
+        for name, quantize in (("onnx-fp32", False), ("onnx-int8", True)):
+            print(f"  載入 {name} (首次會匯出並快取模型)...")
+            start_time = time.perf_counter()
+            embedder = BGEM3Embedding(BaseEmbedderConfig(
+                model="BAAI/bge-m3",
+                model_kwargs={
+                    "backend": "onnx",
+                    "quantize": quantize,
+                    "onnx_threads": onnx_threads,
+                    "max_length": 8192
+                }
+            ))
+            embedders[name] = (embedder, round(time.perf_counter() - start_time, 2))
+
+        reference = np.array(self.embedder.batch_embed(texts + batch_texts))
+        results = {}
+        for name, (embedder, load_time_s) in embedders.items():
+            latencies = []
+            for i in range(iterations):
+                start_time = time.perf_counter()
+                _ = embedder.embed(texts[i % len(texts)])
+                latencies.append((time.perf_counter() - start_time) * 1000)
+            latencies.sort()
+
+            start_time = time.perf_counter()
+            _ = embedder.batch_embed(batch_texts)
+            elapsed_s = time.perf_counter() - start_time
+
+            vectors = np.array(embedder.batch_embed(texts + batch_texts))
+            cosine = np.sum(vectors * reference, axis=1) / (
+                np.linalg.norm(vectors, axis=1) * np.linalg.norm(reference, axis=1)
+            )
+
+            results[name] = {
+                "load_time_s": load_time_s,
+                "p50_ms": round(latencies[int(len(latencies) * 0.50)], 2),
+                "p95_ms": round(latencies[int(len(latencies) * 0.95)], 2),
+                "throughput_texts_per_s": round(batch_size / elapsed_s, 2),
+                "cosine_vs_torch_mean": round(float(np.mean(cosine)), 5),
+                "cosine_vs_torch_min": round(float(np.min(cosine)), 5),
+                "memory_rss_mb": self._measure_memory_usage()["rss_mb"]
+            }
+            print(
+                f"  ✅ {name}: P50={results[name]['p50_ms']}ms, "
+                f"吞吐量={results[name]['throughput_texts_per_s']} texts/s, "
+                f"餘弦一致性(min)={results[name]['cosine_vs_torch_min']}"
+            )
+
+        print()
+        self.results["tests"]["backend_comparison"] = results
+        return results
+
+    def generate_comparison_report(self, output_file: str = "data/benchmarks/backend_comparison.json"):
+        """生成後端比較報告"""
+        import os
+
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(self.results, f, indent=2, ensure_ascii=False)
+
+        print(f"✅ 報告已生成: {output_file}")
+
     def run_all_tests(self) -> Dict[str, Any]:
         """執行所有測試"""
         print("=" * 60)
@@ -388,6 +484,18 @@ class PerformanceBenchmark:
 
 def main():
     """主函數"""
+    parser = argparse.ArgumentParser(description="Mem0Evomem 性能基準測試")
+    parser.add_argument("--compare-backends", action="store_true", help="比較 PyTorch 與 ONNX (fp32/int8) 後端")
+    parser.add_argument("--onnx-threads", type=int, default=None, help="onnxruntime intra-op 線程數")
+    args = parser.parse_args()
+
+    if args.compare_backends:
+        # 以 CPU FP32 PyTorch 輸出作為餘弦一致性的基準
+        benchmark = PerformanceBenchmark(use_fp16=False)
+        benchmark.compare_backends(onnx_threads=args.onnx_threads)
+        benchmark.generate_comparison_report()
+        return
+
     benchmark = PerformanceBenchmark()
     benchmark.run_all_tests()
     benchmark.generate_report()
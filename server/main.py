@@ -1,13 +1,22 @@
+import asyncio
+import copy
+import hashlib
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from pydantic import BaseModel, Field
+from starlette.routing import Match
 
-from mem0 import Memory
+from mem0 import AsyncMemory
+from mem0.configs.base import MemoryConfig
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -32,6 +41,16 @@ MEMGRAPH_PASSWORD = os.environ.get("MEMGRAPH_PASSWORD", "mem0graph")
 
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 HISTORY_DB_PATH = os.environ.get("HISTORY_DB_PATH", "/app/history/history.db")
+# Configuration set through POST /configure is only shared by all worker processes (and kept
+# across restarts) when persistence is switched on; otherwise the environment configuration wins
+PERSIST_CONFIG = os.environ.get("MEM0_PERSIST_CONFIG", "false").lower() in ("1", "true", "yes")
+CONFIG_PATH = os.environ.get("MEM0_CONFIG_PATH", os.path.join(os.path.dirname(HISTORY_DB_PATH), "config.json"))
+# Configuration keys that are never written to CONFIG_PATH
+SECRET_KEY_SUFFIXES = ("api_key", "access_key", "password", "secret", "_token", "credentials")
+# Number of differently-configured Memory instances kept per worker
+MEMORY_POOL_SIZE = int(os.environ.get("MEMORY_POOL_SIZE", "4"))
+# Seconds an evicted Memory instance is kept open for the requests still using it
+MEMORY_DRAIN_SECONDS = float(os.environ.get("MEMORY_DRAIN_SECONDS", "30"))
 
 DEFAULT_CONFIG = {
     "version": "v1.1",
@@ -56,15 +75,243 @@ DEFAULT_CONFIG = {
 }
 
 
-MEMORY_INSTANCE = Memory.from_config(DEFAULT_CONFIG)
+class MemoryPool:
+    """
+    AsyncMemory instances keyed by a hash of their configuration.
+
+    Each configuration is built once (concurrent requests for a key that is still being
+    built wait for the same construction, which runs in a thread so the event loop keeps
+    serving) and the least recently used instance is evicted beyond ``max_size``. Evicted
+    instances are closed after ``drain_seconds`` so that requests still using them can
+    finish; :meth:`close` closes everything at shutdown.
+    """
+
+    def __init__(self, max_size: int = MEMORY_POOL_SIZE, drain_seconds: float = MEMORY_DRAIN_SECONDS):
+        self.max_size = max(1, max_size)
+        self.drain_seconds = drain_seconds
+        self._instances: "OrderedDict[str, AsyncMemory]" = OrderedDict()
+        self._building: Dict[str, asyncio.Future] = {}
+        self._draining: Dict[asyncio.Future, AsyncMemory] = {}
+
+    @staticmethod
+    def config_key(config: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()
+
+    async def get(self, config: Dict[str, Any]) -> AsyncMemory:
+        key = self.config_key(config)
+        instance = self._instances.get(key)
+        if instance is not None:
+            self._instances.move_to_end(key)
+            return instance
+
+        task = self._building.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._build(key, config))
+            self._building[key] = task
+            task.add_done_callback(lambda _: self._building.pop(key, None))
+        # Shielded so that one cancelled request does not abort the build for the others
+        return await asyncio.shield(task)
+
+    async def _build(self, key: str, config: Dict[str, Any]) -> AsyncMemory:
+        config = AsyncMemory._process_config(copy.deepcopy(config))
+        instance = await asyncio.to_thread(AsyncMemory, MemoryConfig(**config))
+        self._instances[key] = instance
+        while len(self._instances) > self.max_size:
+            _, evicted = self._instances.popitem(last=False)
+            task = asyncio.ensure_future(self._close_after_drain(evicted))
+            self._draining[task] = evicted
+            task.add_done_callback(lambda done: self._draining.pop(done, None))
+        return instance
+
+    async def _close_after_drain(self, instance: AsyncMemory) -> None:
+        await asyncio.sleep(self.drain_seconds)
+        await self._close_instance(instance)
+
+    @staticmethod
+    async def _close_instance(instance: AsyncMemory) -> None:
+        try:
+            await instance.aclose()
+        except Exception:
+            logging.exception("Error closing Mem0 instance")
+
+    async def close(self) -> None:
+        """Close every pooled instance, including evicted ones that are still draining."""
+        instances = list(self._instances.values())
+        self._instances.clear()
+        for task, instance in list(self._draining.items()):
+            task.cancel()
+            instances.append(instance)
+        await asyncio.gather(*self._draining, return_exceptions=True)
+        await asyncio.gather(*(self._close_instance(instance) for instance in instances))
+
+
+def _is_secret(key: str) -> bool:
+    key = key.lower()
+    return key == "token" or key.endswith(SECRET_KEY_SUFFIXES)
+
+
+def _without_secrets(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _without_secrets(v) for k, v in value.items() if not _is_secret(k)}
+    if isinstance(value, list):
+        return [_without_secrets(v) for v in value]
+    return value
+
+
+def _with_default_secrets(value: Any, default: Any) -> Any:
+    """Fill the secrets stripped from ``value`` in from ``default`` where both configure the same provider."""
+    if not isinstance(value, dict) or not isinstance(default, dict):
+        return value
+    if value.get("provider", default.get("provider")) != default.get("provider"):
+        return value
+    merged = {k: _with_default_secrets(v, default.get(k)) for k, v in value.items()}
+    for k, v in default.items():
+        if _is_secret(k) and k not in merged:
+            merged[k] = v
+    return merged
+
+
+class ActiveConfig:
+    """
+    The configuration requests are served with.
+
+    By default POST /configure only applies to the worker that received it and the
+    configuration built from the environment is used again after a restart. With
+    ``persist`` switched on, the configuration is written to ``path`` so that every worker
+    picks it up; each request only stats the file and re-reads it when it changed. API
+    keys, passwords and other secrets are never written: workers reading the file take
+    them from their own environment configuration (or the providers' environment
+    variables). When the file cannot be written (no shared volume) the configuration
+    only applies to the current process.
+    """
+
+    def __init__(self, path: str, default: Dict[str, Any], persist: bool = PERSIST_CONFIG):
+        self.path = path
+        self.default = default
+        self.persist = persist
+        self._config = default
+        self._mtime: Optional[int] = None
+
+    def get(self) -> Dict[str, Any]:
+        if not self.persist:
+            return self._config
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return self._config
+        if mtime != self._mtime:
+            try:
+                with open(self.path) as f:
+                    self._config = _with_default_secrets(json.load(f), self.default)
+                self._mtime = mtime
+            except (OSError, ValueError) as e:
+                logging.warning(f"Could not read shared configuration from {self.path}: {e}")
+        return self._config
+
+    def set(self, config: Dict[str, Any]) -> None:
+        self._config = config
+        if not self.persist:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(_without_secrets(config), f)
+            os.replace(tmp_path, self.path)
+            self._mtime = os.stat(self.path).st_mtime_ns
+        except OSError as e:
+            logging.warning(f"Could not share configuration through {self.path}, applying it to this worker only: {e}")
+
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyMetrics:
+    """Per-endpoint request latency histograms in the Prometheus text format."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._series: Dict[Tuple[str, str, str], List[float]] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        key = (method, route, str(status))
+        # Per-bucket counts, then total count and sum
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [0] * (len(self.buckets) + 2)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                series[i] += 1
+        series[-2] += 1
+        series[-1] += seconds
+
+    def render(self) -> str:
+        # Each worker process keeps its own histograms; the worker label keeps the series apart
+        worker = os.getpid()
+        lines = [
+            "# HELP mem0_request_duration_seconds Request latency by endpoint.",
+            "# TYPE mem0_request_duration_seconds histogram",
+        ]
+        for (method, route, status), series in sorted(self._series.items()):
+            labels = f'method="{method}",route="{route}",status="{status}",worker="{worker}"'
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'mem0_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'mem0_request_duration_seconds_bucket{{{labels},le="+Inf"}} {series[-2]}')
+            lines.append(f"mem0_request_duration_seconds_count{{{labels}}} {series[-2]}")
+            lines.append(f"mem0_request_duration_seconds_sum{{{labels}}} {series[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+MEMORY_POOL = MemoryPool()
+ACTIVE_CONFIG = ActiveConfig(CONFIG_PATH, DEFAULT_CONFIG)
+METRICS = LatencyMetrics()
+
+
+async def get_memory_instance() -> AsyncMemory:
+    return await MEMORY_POOL.get(ACTIVE_CONFIG.get())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Each worker builds its own instance after forking, so no connections are shared between processes
+    try:
+        await get_memory_instance()
+    except Exception:
+        logging.exception("Failed to initialize Mem0 at startup; retrying on first request")
+    yield
+    await MEMORY_POOL.close()
+
 
 app = FastAPI(
     title="Mem0 REST APIs",
     description="A REST API for managing and searching memories for your AI Agents and Apps.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
+def _route_template(request: Request) -> str:
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, "path", "unmatched")
+    return "unmatched"
+
+
+@app.middleware("http")
+async def record_latency(request: Request, call_next):
+    route = _route_template(request)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        METRICS.observe(request.method, route, status, time.perf_counter() - start)
+
+
 class Message(BaseModel):
     role: str = Field(..., description="Role of the message (user or assistant).")
     content: str = Field(..., description="Message content.")
@@ -87,22 +334,24 @@ class SearchRequest(BaseModel):
 
 
 @app.post("/configure", summary="Configure Mem0")
-def set_config(config: Dict[str, Any]):
+async def set_config(config: Dict[str, Any]):
     """Set memory configuration."""
-    global MEMORY_INSTANCE
-    MEMORY_INSTANCE = Memory.from_config(config)
+    # Build first so an invalid configuration is rejected before other workers pick it up
+    await MEMORY_POOL.get(config)
+    ACTIVE_CONFIG.set(config)
     return {"message": "Configuration set successfully"}
 
 
 @app.post("/memories", summary="Create memories")
-def add_memory(memory_create: MemoryCreate):
+async def add_memory(memory_create: MemoryCreate):
     """Store new memories."""
     if not any([memory_create.user_id, memory_create.agent_id, memory_create.run_id]):
         raise HTTPException(status_code=400, detail="At least one identifier (user_id, agent_id, run_id) is required.")
 
     params = {k: v for k, v in memory_create.model_dump().items() if v is not None and k != "messages"}
     try:
-        response = MEMORY_INSTANCE.add(messages=[m.model_dump() for m in memory_create.messages], **params)
+        memory = await get_memory_instance()
+        response = await memory.add(messages=[m.model_dump() for m in memory_create.messages], **params)
         return JSONResponse(content=response)
     except Exception as e:
         logging.exception("Error in add_memory:")  # This will log the full traceback
@@ -110,7 +359,7 @@ def add_memory(memory_create: MemoryCreate):
 
 
 @app.get("/memories", summary="Get memories")
-def get_all_memories(
+async def get_all_memories(
     user_id: Optional[str] = None,
     run_id: Optional[str] = None,
     agent_id: Optional[str] = None,
@@ -122,35 +371,38 @@ def get_all_memories(
         params = {
             k: v for k, v in {"user_id": user_id, "run_id": run_id, "agent_id": agent_id}.items() if v is not None
         }
-        return MEMORY_INSTANCE.get_all(**params)
+        memory = await get_memory_instance()
+        return await memory.get_all(**params)
     except Exception as e:
         logging.exception("Error in get_all_memories:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/memories/{memory_id}", summary="Get a memory")
-def get_memory(memory_id: str):
+async def get_memory(memory_id: str):
     """Retrieve a specific memory by ID."""
     try:
-        return MEMORY_INSTANCE.get(memory_id)
+        memory = await get_memory_instance()
+        return await memory.get(memory_id)
     except Exception as e:
         logging.exception("Error in get_memory:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/search", summary="Search memories")
-def search_memories(search_req: SearchRequest):
+async def search_memories(search_req: SearchRequest):
     """Search for memories based on a query."""
     try:
         params = {k: v for k, v in search_req.model_dump().items() if v is not None and k != "query"}
-        return MEMORY_INSTANCE.search(query=search_req.query, **params)
+        memory = await get_memory_instance()
+        return await memory.search(query=search_req.query, **params)
     except Exception as e:
         logging.exception("Error in search_memories:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.put("/memories/{memory_id}", summary="Update a memory")
-def update_memory(memory_id: str, updated_memory: Dict[str, Any]):
+async def update_memory(memory_id: str, updated_memory: Dict[str, Any]):
     """Update an existing memory with new content.
     
     Args:
@@ -161,27 +413,30 @@ def update_memory(memory_id: str, updated_memory: Dict[str, Any]):
         dict: Success message indicating the memory was updated
     """
     try:
-        return MEMORY_INSTANCE.update(memory_id=memory_id, data=updated_memory)
+        memory = await get_memory_instance()
+        return await memory.update(memory_id=memory_id, data=updated_memory)
     except Exception as e:
         logging.exception("Error in update_memory:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/memories/{memory_id}/history", summary="Get memory history")
-def memory_history(memory_id: str):
+async def memory_history(memory_id: str):
     """Retrieve memory history."""
     try:
-        return MEMORY_INSTANCE.history(memory_id=memory_id)
+        memory = await get_memory_instance()
+        return await memory.history(memory_id=memory_id)
     except Exception as e:
         logging.exception("Error in memory_history:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.delete("/memories/{memory_id}", summary="Delete a memory")
-def delete_memory(memory_id: str):
+async def delete_memory(memory_id: str):
     """Delete a specific memory by ID."""
     try:
-        MEMORY_INSTANCE.delete(memory_id=memory_id)
+        memory = await get_memory_instance()
+        await memory.delete(memory_id=memory_id)
         return {"message": "Memory deleted successfully"}
     except Exception as e:
         logging.exception("Error in delete_memory:")
@@ -189,7 +444,7 @@ def delete_memory(memory_id: str):
 
 
 @app.delete("/memories", summary="Delete all memories")
-def delete_all_memories(
+async def delete_all_memories(
     user_id: Optional[str] = None,
     run_id: Optional[str] = None,
     agent_id: Optional[str] = None,
@@ -201,7 +456,8 @@ def delete_all_memories(
         params = {
             k: v for k, v in {"user_id": user_id, "run_id": run_id, "agent_id": agent_id}.items() if v is not None
         }
-        MEMORY_INSTANCE.delete_all(**params)
+        memory = await get_memory_instance()
+        await memory.delete_all(**params)
         return {"message": "All relevant memories deleted"}
     except Exception as e:
         logging.exception("Error in delete_all_memories:")
@@ -209,16 +465,23 @@ def delete_all_memories(
 
 
 @app.post("/reset", summary="Reset all memories")
-def reset_memory():
+async def reset_memory():
     """Completely reset stored memories."""
     try:
-        MEMORY_INSTANCE.reset()
+        memory = await get_memory_instance()
+        await memory.reset()
         return {"message": "All memories reset"}
     except Exception as e:
         logging.exception("Error in reset_memory:")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/metrics", summary="Request latency metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Per-endpoint latency histograms of this worker in the Prometheus text format."""
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/", summary="Redirect to the OpenAPI documentation", include_in_schema=False)
 def home():
     """Redirect to the OpenAPI documentation."""
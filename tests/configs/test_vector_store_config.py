@@ -0,0 +1,41 @@
+import pytest
+
+from mem0.configs.vector_stores.faiss import FAISSConfig
+from mem0.vector_stores.configs import VectorStoreConfig
+
+
+def test_precision_is_forwarded_to_provider_config():
+    config = VectorStoreConfig(provider="faiss", precision="int8", rescore=True, config={"embedding_model_dims": 64})
+
+    assert config.config.precision == "int8"
+    assert config.config.rescore is True
+
+
+def test_provider_level_precision_wins():
+    config = VectorStoreConfig(provider="faiss", precision="int8", config={"precision": "float16"})
+
+    assert config.config.precision == "float16"
+
+
+def test_provider_level_precision_wins_for_config_objects():
+    provider_config = FAISSConfig(precision="float16", embedding_model_dims=64)
+
+    config = VectorStoreConfig.model_construct(
+        provider="faiss", precision="int8", rescore=True, config=provider_config
+    ).validate_and_create_config()
+
+    assert config.config.precision == "float16"
+    assert config.config.rescore is True
+    assert config.config.embedding_model_dims == 64
+
+
+def test_precision_rejected_for_unsupported_provider_or_value():
+    with pytest.raises(ValueError, match="does not support the precision option"):
+        VectorStoreConfig(provider="redis", precision="float16", config={"embedding_model_dims": 8})
+
+    with pytest.raises(ValueError):
+        VectorStoreConfig(
+            provider="pgvector",
+            precision="int8",
+            config={"user": "u", "password": "p", "host": "localhost", "port": 5432},
+        )
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.batching import RateLimiter, embed_in_batches, estimate_tokens, plan_batches
+
+
+class LoopEmbedding(EmbeddingBase):
+    def embed(self, text, memory_action=None):
+        return [float(len(text))]
+
+
+class ChunkEmbedding(EmbeddingBase):
+    max_batch_inputs = 3
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.chunks = []
+        self.lock = threading.Lock()
+
+    def embed(self, text, memory_action=None):
+        raise AssertionError("batch path should not fall back to embed()")
+
+    def _embed_chunk(self, texts, memory_action=None):
+        with self.lock:
+            self.chunks.append((list(texts), memory_action))
+        return [[float(len(text))] for text in texts]
+
+
+def test_plan_batches_respects_item_and_token_limits():
+    texts = ["a" * 40, "b" * 40, "c" * 400, "d", "e", "f", "g"]
+
+    batches = plan_batches(texts, max_items=3, max_tokens=estimate_tokens("a" * 40) * 2)
+
+    assert batches == [["a" * 40, "b" * 40], ["c" * 400], ["d", "e", "f"], ["g"]]
+    assert [t for batch in batches for t in batch] == texts
+
+
+def test_embed_in_batches_keeps_input_order_under_concurrency():
+    def slow_first(chunk):
+        if chunk[0] == "0":
+            time.sleep(0.05)
+        return [[int(text)] for text in chunk]
+
+    batches = [["0", "1"], ["2", "3"], ["4"]]
+    assert embed_in_batches(batches, slow_first, concurrency=3) == [[0], [1], [2], [3], [4]]
+
+
+def test_embed_in_batches_caps_concurrency_on_the_shared_pool():
+    active = 0
+    peak = 0
+    threads = set()
+    lock = threading.Lock()
+
+    def slow(chunk):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+            threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return [[len(text)] for text in chunk]
+
+    batches = [["a"], ["bb"], ["ccc"], ["dddd"], ["eeeee"], ["ffffff"]]
+    for _ in range(2):
+        assert embed_in_batches(batches, slow, concurrency=2) == [[1], [2], [3], [4], [5], [6]]
+
+    assert peak == 2
+    assert all(name.startswith("mem0-embed") for name in threads)
+
+
+def test_embed_in_batches_propagates_chunk_errors():
+    def failing(chunk):
+        raise RuntimeError("provider unavailable")
+
+    with pytest.raises(RuntimeError, match="provider unavailable"):
+        embed_in_batches([["a"], ["b"], ["c"]], failing, concurrency=2)
+
+
+def test_embed_in_batches_rejects_short_responses():
+    with pytest.raises(ValueError):
+        embed_in_batches([["a", "b"]], lambda chunk: [[1.0]])
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(requests_per_minute=600)  # one slot every 100ms
+    with patch("mem0.embeddings.batching.time.sleep") as sleep:
+        for _ in range(3):
+            limiter.acquire()
+    delays = [c.args[0] for c in sleep.call_args_list]
+    assert len(delays) == 2
+    assert delays[0] == pytest.approx(0.1, abs=0.02)
+    assert delays[1] == pytest.approx(0.2, abs=0.02)
+
+
+def test_base_embed_batch_falls_back_to_loop():
+    assert LoopEmbedding().embed_batch(["ab", "abc"]) == [[2.0], [3.0]]
+    assert LoopEmbedding().embed_batch([]) == []
+
+
+def test_native_embed_batch_chunks_and_honours_configured_size():
+    embedder = ChunkEmbedding(BaseEmbedderConfig(embedding_batch_size=2, embedding_batch_concurrency=2))
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    assert embedder.embed_batch(texts, "add") == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert sorted(chunk for chunk, _ in embedder.chunks) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert {action for _, action in embedder.chunks} == {"add"}
+
+
+def test_async_embed_batch_uses_chunks():
+    embedder = ChunkEmbedding()
+    result = asyncio.run(embedder.async_embed_batch(["a", "bb", "ccc", "dddd"], "search"))
+
+    assert result == [[1.0], [2.0], [3.0], [4.0]]
+    assert sorted(len(chunk) for chunk, _ in embedder.chunks) == [1, 3]
+
+
+def test_rate_limit_is_configured_from_embedder_config():
+    embedder = ChunkEmbedding(BaseEmbedderConfig(embedding_requests_per_minute=120))
+    assert embedder._rate_limiter.interval == pytest.approx(0.5)
+    assert ChunkEmbedding()._rate_limiter is None
@@ -0,0 +1,62 @@
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+
+try:
+    from mem0.embeddings.bge_m3 import BGEM3Embedding
+except ImportError:
+    pytest.skip("FlagEmbedding not installed", allow_module_level=True)
+
+
+@pytest.fixture
+def mock_bge_model():
+    with patch("mem0.embeddings.bge_m3.BGEM3FlagModel") as mock_model_cls:
+        model = Mock()
+        model.tokenizer = None  # character-count length estimate
+        model.encode.side_effect = lambda texts, batch_size, max_length: {
+            "dense_vecs": np.array([[float(len(t))] for t in texts])
+        }
+        mock_model_cls.return_value = model
+        yield model
+
+
+def test_embed_accepts_memory_action_and_caps_max_length(mock_bge_model):
+    embedder = BGEM3Embedding(BaseEmbedderConfig())
+
+    assert embedder.embed("短句", "search") == [2.0]
+    mock_bge_model.encode.assert_called_once_with(["短句"], batch_size=1, max_length=4)
+
+
+def test_batch_embed_buckets_by_length_and_restores_order(mock_bge_model):
+    embedder = BGEM3Embedding(BaseEmbedderConfig(embedding_batch_max_tokens=100))
+    texts = ["x" * 60, "a", "bb", "y" * 30, "c"]
+
+    assert embedder.batch_embed(texts) == [[60.0], [1.0], [2.0], [30.0], [1.0]]
+
+    calls = [(c.args[0], c.kwargs["max_length"]) for c in mock_bge_model.encode.call_args_list]
+    # Short texts share a bucket padded to their own maximum, long ones get their own
+    assert calls == [(["a", "c", "bb"], 4), (["y" * 30], 32), (["x" * 60], 62)]
+
+
+def test_bucket_max_length_never_exceeds_configured_limit(mock_bge_model):
+    embedder = BGEM3Embedding(BaseEmbedderConfig(model_kwargs={"max_length": 16}))
+
+    embedder.batch_embed(["z" * 100, "a"])
+
+    assert all(c.kwargs["max_length"] <= 16 for c in mock_bge_model.encode.call_args_list)
+
+
+def test_token_lengths_come_from_tokenizer_when_available(mock_bge_model):
+    mock_bge_model.tokenizer = Mock(return_value={"input_ids": [[0, 5, 2], [0, 5, 6, 7, 2]]})
+    embedder = BGEM3Embedding(BaseEmbedderConfig())
+
+    assert embedder._estimate_token_lengths(["ab", "abcd"]) == [3, 5]
+
+
+def test_embed_batch_delegates_to_batch_embed(mock_bge_model):
+    embedder = BGEM3Embedding(BaseEmbedderConfig())
+    assert embedder.embed_batch(["a", "bbb"], "add") == [[1.0], [3.0]]
+    assert mock_bge_model.encode.call_count == 1
@@ -0,0 +1,96 @@
+import os
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig  # noqa: E402
+from mem0.embeddings import bge_m3_onnx  # noqa: E402
+from mem0.embeddings.bge_m3 import BGEM3Embedding  # noqa: E402
+from mem0.embeddings.bge_m3_onnx import BGEM3OnnxModel, export_dense_model  # noqa: E402
+
+
+def _write_model(model_name, target_dir):
+    with open(os.path.join(target_dir, bge_m3_onnx.MODEL_FILE), "w") as f:
+        f.write("onnx")
+
+
+def test_export_is_cached_on_disk(tmp_path):
+    with patch.object(bge_m3_onnx, "_export_fp32", side_effect=_write_model) as export:
+        first = export_dense_model("BAAI/bge-m3", quantize=False, cache_dir=str(tmp_path))
+        second = export_dense_model("BAAI/bge-m3", quantize=False, cache_dir=str(tmp_path))
+
+    assert first == second == str(tmp_path / "BAAI--bge-m3" / "fp32" / "model.onnx")
+    assert os.path.exists(first)
+    export.assert_called_once()
+    # No half-written export directories are left behind
+    assert sorted(os.listdir(tmp_path / "BAAI--bge-m3")) == ["fp32"]
+
+
+def test_quantized_export_builds_on_fp32(tmp_path):
+    def quantize(source_dir, target_dir):
+        assert os.path.exists(os.path.join(source_dir, bge_m3_onnx.MODEL_FILE))
+        _write_model(None, target_dir)
+
+    with (
+        patch.object(bge_m3_onnx, "_export_fp32", side_effect=_write_model),
+        patch.object(bge_m3_onnx, "_quantize_int8", side_effect=quantize) as quantize_mock,
+    ):
+        path = export_dense_model("BAAI/bge-m3", quantize=True, cache_dir=str(tmp_path))
+
+    assert path.endswith(os.path.join("int8", "model.onnx"))
+    quantize_mock.assert_called_once()
+
+
+def test_encode_runs_session_per_batch():
+    tokenizer = Mock(
+        side_effect=lambda texts, **kwargs: {
+            "input_ids": np.ones((len(texts), 3), dtype=np.int32),
+            "attention_mask": np.ones((len(texts), 3), dtype=np.int32),
+        }
+    )
+    session = MagicMock()
+    session.run.side_effect = lambda names, feeds: [np.full((len(feeds["input_ids"]), 2), 0.5)]
+
+    with (
+        patch.object(bge_m3_onnx, "export_dense_model", return_value="/cache/model.onnx"),
+        patch.object(bge_m3_onnx, "_load_tokenizer", return_value=tokenizer),
+        patch("onnxruntime.InferenceSession", return_value=session) as session_cls,
+    ):
+        model = BGEM3OnnxModel("BAAI/bge-m3", num_threads=3)
+        result = model.encode(["a", "b", "c"], batch_size=2, max_length=16)
+
+    assert session_cls.call_args.kwargs["sess_options"].intra_op_num_threads == 3
+    assert result["dense_vecs"].shape == (3, 2)
+    assert result["dense_vecs"].dtype == np.float32
+    assert session.run.call_count == 2
+    assert tokenizer.call_args.kwargs["max_length"] == 16
+    assert session.run.call_args.args[1]["input_ids"].dtype == np.int64
+
+
+def test_embedder_selects_onnx_backend_from_model_kwargs():
+    with (
+        patch("mem0.embeddings.bge_m3.BGEM3OnnxModel") as onnx_cls,
+        patch("mem0.embeddings.bge_m3.BGEM3FlagModel") as torch_cls,
+    ):
+        embedder = BGEM3Embedding(
+            BaseEmbedderConfig(model_kwargs={"backend": "onnx", "quantize": False, "onnx_threads": 2})
+        )
+
+    onnx_cls.assert_called_once_with("BAAI/bge-m3", quantize=False, num_threads=2, cache_dir=None)
+    torch_cls.assert_not_called()
+    assert embedder.backend == "onnx"
+
+
+def test_cpu_torch_backend_defaults_to_fp32():
+    with patch("mem0.embeddings.bge_m3.BGEM3FlagModel") as torch_cls:
+        BGEM3Embedding(BaseEmbedderConfig())
+
+    assert torch_cls.call_args.kwargs["use_fp16"] is False
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        BGEM3Embedding(BaseEmbedderConfig(model_kwargs={"backend": "tensorrt"}))
@@ -58,3 +58,15 @@ def test_config_initialization(config):
     assert embedder.config.api_key == "dummy_api_key"
     assert embedder.config.model == "test_model"
     assert embedder.config.embedding_dims == 786
+
+
+def test_embed_batch_sends_list_of_contents(mock_genai, config):
+    mock_genai.return_value = type(
+        "Response", (), {"embeddings": [type("Embedding", (), {"values": [float(i)]})() for i in range(2)]}
+    )()
+    embedder = GoogleGenAIEmbedding(config)
+
+    result = embedder.embed_batch(["one", "two\nlines"])
+
+    mock_genai.assert_called_once_with(model="test_model", contents=["one", "two lines"], config=ANY)
+    assert result == [[0.0], [1.0]]
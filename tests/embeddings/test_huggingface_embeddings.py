@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -101,3 +102,27 @@ def test_embed_with_huggingface_base_url():
             truncate=True,
         )
         assert result == [0.1, 0.2, 0.3]
+
+
+def test_micro_batching_coalesces_concurrent_embeds(mock_sentence_transformer):
+    mock_sentence_transformer.encode.side_effect = lambda texts, **kwargs: np.array([[float(len(t))] for t in texts])
+    embedder = HuggingFaceEmbedding(BaseEmbedderConfig(embedding_micro_batch_size=8, embedding_micro_batch_wait_ms=20))
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(embedder.embed, ["a" * i for i in range(1, 9)]))
+    finally:
+        embedder.close()
+
+    assert results == [[float(i)] for i in range(1, 9)]
+    assert mock_sentence_transformer.encode.call_count < 8
+    assert all(isinstance(c.args[0], list) for c in mock_sentence_transformer.encode.call_args_list)
+
+
+def test_embed_batch_encodes_chunks(mock_sentence_transformer):
+    mock_sentence_transformer.encode.return_value = np.array([[0.1], [0.2]])
+    embedder = HuggingFaceEmbedding(BaseEmbedderConfig())
+
+    assert embedder.embed_batch(["a", "b"]) == [[0.1], [0.2]]
+    mock_sentence_transformer.encode.assert_called_once_with(["a", "b"], batch_size=2, convert_to_numpy=True)
+
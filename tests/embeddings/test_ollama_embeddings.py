@@ -1,6 +1,7 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from ollama import ResponseError
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.ollama import OllamaEmbedding
@@ -19,13 +20,14 @@ def test_embed_text(mock_ollama_client):
     config = BaseEmbedderConfig(model="nomic-embed-text", embedding_dims=512)
     embedder = OllamaEmbedding(config)
 
-    mock_response = {"embedding": [0.1, 0.2, 0.3, 0.4, 0.5]}
-    mock_ollama_client.embeddings.return_value = mock_response
+    mock_response = {"embeddings": [[0.1, 0.2, 0.3, 0.4, 0.5]]}
+    mock_ollama_client.embed.return_value = mock_response
 
     text = "Sample text to embed."
     embedding = embedder.embed(text)
 
-    mock_ollama_client.embeddings.assert_called_once_with(model="nomic-embed-text", prompt=text)
+    mock_ollama_client.embed.assert_called_once_with(model="nomic-embed-text", input=[text])
+    mock_ollama_client.embeddings.assert_not_called()
 
     assert embedding == [0.1, 0.2, 0.3, 0.4, 0.5]
 
@@ -41,3 +43,36 @@ def test_ensure_model_exists(mock_ollama_client):
     embedder._ensure_model_exists()
 
     mock_ollama_client.pull.assert_called_once_with("nomic-embed-text")
+
+
+def test_embed_batch_uses_embed_endpoint(mock_ollama_client):
+    embedder = OllamaEmbedding(BaseEmbedderConfig(model="nomic-embed-text", embedding_dims=512))
+    mock_ollama_client.embed.return_value = {"embeddings": [[0.1], [0.2]]}
+
+    result = embedder.embed_batch(["first", "second"])
+
+    mock_ollama_client.embed.assert_called_once_with(model="nomic-embed-text", input=["first", "second"])
+    mock_ollama_client.embeddings.assert_not_called()
+    assert result == [[0.1], [0.2]]
+
+
+def test_falls_back_to_single_input_endpoint_on_old_servers(mock_ollama_client):
+    embedder = OllamaEmbedding(BaseEmbedderConfig(model="nomic-embed-text", embedding_dims=512))
+    mock_ollama_client.embed.side_effect = ResponseError("404 page not found", status_code=404)
+    mock_ollama_client.embeddings.side_effect = lambda model, prompt: {
+        "embedding": [3.0, 4.0] if prompt == "a" else [0.0, 2.0]
+    }
+
+    assert embedder.embed_batch(["a", "b"]) == [[0.6, 0.8], [0.0, 1.0]]
+    assert embedder.embed("a") == [0.6, 0.8]
+    # The missing endpoint is only probed once
+    assert mock_ollama_client.embed.call_count == 1
+
+
+def test_unknown_model_is_not_mistaken_for_an_old_server(mock_ollama_client):
+    embedder = OllamaEmbedding(BaseEmbedderConfig(model="nomic-embed-text", embedding_dims=512))
+    mock_ollama_client.embed.side_effect = ResponseError('model "nomic-embed-text" not found', status_code=404)
+
+    with pytest.raises(ResponseError):
+        embedder.embed("a")
+    mock_ollama_client.embeddings.assert_not_called()
@@ -1,4 +1,5 @@
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -88,3 +89,45 @@ def test_embed_uses_environment_api_key(mock_openai_client, monkeypatch):
         input=["Environment key test"], model="text-embedding-3-small", dimensions=1536
     )
     assert result == [1.3, 1.4, 1.5]
+
+
+def test_embed_batch_sends_many_inputs_per_request(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig(embedding_batch_size=2))
+
+    def create(input, model, dimensions):
+        # Return items out of order to check that results are re-sorted by index
+        return Mock(data=[Mock(index=i, embedding=[float(len(text))]) for i, text in reversed(list(enumerate(input)))])
+
+    mock_openai_client.embeddings.create.side_effect = create
+
+    result = embedder.embed_batch(["a", "bb\nb", "ccc"])
+
+    assert result == [[1.0], [4.0], [3.0]]
+    assert mock_openai_client.embeddings.create.call_count == 2
+    inputs = sorted(c.kwargs["input"] for c in mock_openai_client.embeddings.create.call_args_list)
+    assert inputs == [["a", "bb b"], ["ccc"]]
+
+
+def test_async_client_is_created_per_event_loop(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig())
+
+    async def embed_and_close():
+        first = await embedder.async_embed("Hello world")
+        await embedder.async_embed("Hello again")
+        await embedder.async_close()
+        return first
+
+    with patch("mem0.embeddings.openai.AsyncOpenAI") as mock_async_openai:
+        clients = [AsyncMock(), AsyncMock()]
+        for client in clients:
+            client.embeddings.create.return_value = Mock(data=[Mock(embedding=[0.1, 0.2])])
+        mock_async_openai.side_effect = clients
+
+        # Each asyncio.run starts a new loop, which must not reuse the previous loop's client
+        assert asyncio.run(embed_and_close()) == [0.1, 0.2]
+        assert asyncio.run(embed_and_close()) == [0.1, 0.2]
+
+    assert mock_async_openai.call_count == 2
+    for client in clients:
+        assert client.embeddings.create.await_count == 2
+        client.close.assert_awaited_once()
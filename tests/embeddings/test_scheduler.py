@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.scheduler import EmbeddingScheduler
+
+
+class RecordingEncoder:
+    def __init__(self, block_first=False):
+        self.calls = []
+        self.release = threading.Event()
+        self.block_first = block_first
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        if self.block_first and len(self.calls) == 1:
+            self.release.wait(5)
+        return [[float(len(text))] for text in texts]
+
+
+def test_concurrent_calls_are_coalesced():
+    encoder = RecordingEncoder(block_first=True)
+    scheduler = EmbeddingScheduler(encoder, max_batch_size=8, max_wait_ms=50)
+    try:
+        first = scheduler.submit("x")
+        while not encoder.calls:
+            time.sleep(0.001)
+        # The worker is busy with the first batch; these queue up behind it
+        futures = [scheduler.submit("y" * i) for i in range(1, 11)]
+        encoder.release.set()
+
+        assert first.result(5) == [1.0]
+        assert [f.result(5) for f in futures] == [[float(i)] for i in range(1, 11)]
+        assert [len(batch) for batch in encoder.calls] == [1, 8, 2]
+    finally:
+        scheduler.close()
+
+
+def test_embed_from_many_threads_returns_each_callers_vector():
+    encoder = RecordingEncoder()
+    scheduler = EmbeddingScheduler(encoder, max_batch_size=16, max_wait_ms=20)
+    try:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(scheduler.embed, ["a" * i for i in range(1, 33)]))
+    finally:
+        scheduler.close()
+
+    assert results == [[float(i)] for i in range(1, 33)]
+    assert len(encoder.calls) < 32
+    assert all(len(batch) <= 16 for batch in encoder.calls)
+
+
+def test_encode_errors_reach_every_caller_in_the_batch():
+    def fail(texts):
+        raise RuntimeError("model exploded")
+
+    scheduler = EmbeddingScheduler(fail, max_batch_size=4, max_wait_ms=20)
+    try:
+        futures = [scheduler.submit(text) for text in ("a", "b")]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="model exploded"):
+                future.result(5)
+    finally:
+        scheduler.close()
+
+
+def test_async_embed_and_close():
+    encoder = RecordingEncoder()
+    scheduler = EmbeddingScheduler(encoder, max_batch_size=8, max_wait_ms=20)
+
+    async def run():
+        return await asyncio.gather(*(scheduler.async_embed(text) for text in ("a", "bb", "ccc")))
+
+    assert asyncio.run(run()) == [[1.0], [2.0], [3.0]]
+    scheduler.close()
+    with pytest.raises(RuntimeError):
+        scheduler.submit("late")
+
+
+class LocalEmbedding(EmbeddingBase):
+    max_batch_inputs = 64
+    max_batch_concurrency = 1
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.encoder = RecordingEncoder()
+        self._scheduler = self._make_scheduler()
+
+    def embed(self, text, memory_action=None):
+        if self._scheduler is not None:
+            return self._scheduler.embed(text)
+        return self.encoder([text])[0]
+
+    def _embed_chunk(self, texts, memory_action=None):
+        return self.encoder(texts)
+
+
+def test_scheduler_is_opt_in():
+    assert LocalEmbedding()._scheduler is None
+
+    embedder = LocalEmbedding(BaseEmbedderConfig(embedding_micro_batch_size=8, embedding_micro_batch_wait_ms=10))
+    try:
+        assert embedder._scheduler.max_batch_size == 8
+        assert asyncio.run(embedder.async_embed("abcd", "search")) == [4.0]
+    finally:
+        embedder.close()
+
+
+def test_local_embed_batch_runs_chunks_one_at_a_time():
+    embedder = LocalEmbedding(BaseEmbedderConfig(embedding_batch_size=2, embedding_batch_concurrency=4))
+    assert embedder._batch_concurrency() == 1
+    assert embedder.embed_batch(["a", "bb", "ccc"]) == [[1.0], [2.0], [3.0]]
+    assert embedder.encoder.calls == [["a", "bb"], ["ccc"]]
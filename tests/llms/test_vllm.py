@@ -100,6 +100,7 @@ def create_mocked_memory():
 
         mock_embedder = MagicMock()
         mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder.embed_batch.side_effect = lambda texts, memory_action=None: [[0.1, 0.2, 0.3] for _ in texts]
         mock_embedder_factory.return_value = mock_embedder
 
         mock_vector_store = MagicMock()
@@ -126,6 +127,7 @@ def create_mocked_async_memory():
 
         mock_embedder = MagicMock()
         mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder.embed_batch.side_effect = lambda texts, memory_action=None: [[0.1, 0.2, 0.3] for _ in texts]
         mock_embedder_factory.return_value = mock_embedder
 
         mock_vector_store = MagicMock()
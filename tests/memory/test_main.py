@@ -1,15 +1,24 @@
+import concurrent.futures
+import functools
+import json
 import logging
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
+from mem0.configs.base import MemoryConfig
 from mem0.memory.main import AsyncMemory, Memory
+from mem0.memory.utils import call_async
+from mem0.vector_stores.base import VectorStoreBase
 
 
 def _setup_mocks(mocker):
     """Helper to setup common mocks for both sync and async fixtures"""
     mock_embedder = mocker.MagicMock()
     mock_embedder.return_value.embed.return_value = [0.1, 0.2, 0.3]
+    mock_embedder.return_value.embed_batch.side_effect = lambda texts, memory_action=None: [[0.1, 0.2, 0.3] for _ in texts]
     mocker.patch("mem0.utils.factory.EmbedderFactory.create", mock_embedder)
 
     mock_vector_store = mocker.MagicMock()
@@ -127,3 +136,534 @@ class TestAsyncAddToVectorStoreErrors:
         assert result == []
         assert "Empty response from LLM, no memories to extract" in caplog.text
         assert mock_capture_event.call_count == 1
+
+
+class TestMemoryConcurrency:
+    def test_injected_executor_is_used_and_left_running(self, mocker):
+        _setup_mocks(mocker)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+        memory = Memory(executor=executor)
+        assert memory._get_executor() is executor
+
+        memory.close()
+        assert executor.submit(lambda: 42).result() == 42
+        executor.shutdown()
+
+    def test_close_stops_embedder_scheduler(self, mocker):
+        _setup_mocks(mocker)
+        memory = Memory()
+
+        memory.close()
+
+        memory.embedding_model.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_close_releases_async_clients(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.SQLiteManager", mocker.MagicMock())
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = AsyncMemory()
+        providers = (memory.vector_store, memory._telemetry_vector_store, memory.embedding_model, memory.llm)
+        for provider in providers:
+            provider.async_close = mocker.AsyncMock()
+
+        async with memory:
+            pass
+
+        for provider in providers:
+            provider.async_close.assert_awaited_once()
+        memory.embedding_model.close.assert_called_once()
+        memory.db.close.assert_called_once()
+
+    def test_reset_keeps_injected_executor(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.SQLiteManager", mocker.MagicMock())
+        mocker.patch("mem0.memory.main.VectorStoreFactory.reset", side_effect=lambda store: store)
+        mocker.patch("mem0.memory.main.capture_event")
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+        memory = Memory(executor=executor)
+        memory.reset()
+        assert memory._get_executor() is executor
+
+        memory.close()
+        assert executor.submit(lambda: 42).result() == 42
+        executor.shutdown()
+
+    def test_owned_executor_is_bounded_and_shut_down(self, mocker):
+        _setup_mocks(mocker)
+        config = MemoryConfig(concurrency={"max_workers": 3})
+
+        memory = Memory(config)
+        executor = memory._get_executor()
+        assert executor._max_workers == 3
+
+        memory.close()
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+    def test_vector_store_limit_caps_parallel_searches(self, mocker):
+        _setup_mocks(mocker)
+        memory = Memory(MemoryConfig(concurrency={"vector_store": 2}))
+        memory.embedding_model.embed.return_value = [0.1, 0.2, 0.3]
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_search(**kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return []
+
+        memory.vector_store.search.side_effect = slow_search
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: memory.search("q", user_id=f"user-{i}"), range(8)))
+
+        assert peak == 2
+
+    def test_embedder_limit_caps_parallel_query_embeddings(self, mocker):
+        _setup_mocks(mocker)
+        memory = Memory(MemoryConfig(concurrency={"embedder": 1}))
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_embed(text, memory_action=None):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return [0.1, 0.2, 0.3]
+
+        memory.embedding_model.embed.side_effect = slow_embed
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            embeddings = list(pool.map(lambda i: memory.embed_query(f"q{i}"), range(4)))
+
+        assert embeddings == [[0.1, 0.2, 0.3]] * 4
+        assert peak == 1
+
+
+class TestFactSearchBatching:
+    def _memory(self, mocker, memory_cls):
+        _setup_mocks(mocker)
+        memory = memory_cls()
+        memory.config = mocker.MagicMock()
+        memory.config.custom_fact_extraction_prompt = None
+        memory.config.custom_update_memory_prompt = None
+        memory.api_version = "v1.1"
+        memory.llm.generate_response.side_effect = ['{"facts": ["likes tea", "lives in Paris"]}', '{"memory": []}']
+        existing = mocker.MagicMock(id="mem-1", payload={"data": "likes tea"})
+        memory.vector_store.search_batch.return_value = [[existing], [existing]]
+        return memory
+
+    def _assert_single_batched_search(self, memory):
+        memory.vector_store.search.assert_not_called()
+        memory.vector_store.search_batch.assert_called_once()
+        kwargs = memory.vector_store.search_batch.call_args.kwargs
+        assert kwargs["queries"] == ["likes tea", "lives in Paris"]
+        assert len(kwargs["vectors_matrix"]) == 2
+        assert kwargs["filters"] == {"user_id": "u1"}
+        update_prompt = memory.llm.generate_response.call_args_list[1].kwargs["messages"][0]["content"]
+        assert update_prompt.count("likes tea") == 2  # once as the existing memory, once as a new fact
+
+    def test_sync_add_searches_all_facts_at_once(self, mocker):
+        memory = self._memory(mocker, Memory)
+        memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "hi"}], metadata={}, filters={"user_id": "u1"}, infer=True
+        )
+        self._assert_single_batched_search(memory)
+
+    @pytest.mark.asyncio
+    async def test_async_add_searches_all_facts_at_once(self, mocker):
+        memory = self._memory(mocker, AsyncMemory)
+        memory.vector_store.async_search_batch = None  # force the sync fallback path of call_async
+        await memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "hi"}],
+            metadata={},
+            effective_filters={"user_id": "u1"},
+            infer=True,
+        )
+        self._assert_single_batched_search(memory)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("memory_cls", [Memory, AsyncMemory])
+    async def test_repeated_facts_are_searched_once(self, mocker, memory_cls):
+        memory = self._memory(mocker, memory_cls)
+        memory.llm.generate_response.side_effect = [
+            '{"facts": ["likes tea", "lives in Paris", "likes tea"]}',
+            '{"memory": []}',
+        ]
+        memory.vector_store.async_search_batch = None
+        kwargs = {"messages": [{"role": "user", "content": "hi"}], "metadata": {}, "infer": True}
+        if memory_cls is Memory:
+            memory._add_to_vector_store(filters={"user_id": "u1"}, **kwargs)
+        else:
+            await memory._add_to_vector_store(effective_filters={"user_id": "u1"}, **kwargs)
+
+        memory.vector_store.search_batch.assert_called_once()
+        search_kwargs = memory.vector_store.search_batch.call_args.kwargs
+        assert search_kwargs["queries"] == ["likes tea", "lives in Paris"]
+        assert len(search_kwargs["vectors_matrix"]) == 2
+
+
+class TestActionPrefetch:
+    ACTIONS = json.dumps(
+        {
+            "memory": [
+                {"id": "0", "text": "likes green tea", "event": "UPDATE", "old_memory": "likes tea"},
+                {"id": "1", "text": "lives in Paris", "event": "DELETE"},
+                {"id": "2", "text": "works remotely", "event": "NONE"},
+                {"id": "9", "text": "hallucinated", "event": "DELETE"},
+            ]
+        }
+    )
+
+    def _memory(self, mocker, memory_cls):
+        _setup_mocks(mocker)
+        memory = memory_cls()
+        memory.config = mocker.MagicMock()
+        memory.config.custom_fact_extraction_prompt = None
+        memory.config.custom_update_memory_prompt = None
+        memory.api_version = "v1.1"
+        memory.db = mocker.MagicMock()
+        memory.llm.generate_response.side_effect = ['{"facts": ["likes green tea"]}', self.ACTIONS]
+        existing = [
+            mocker.MagicMock(id=f"mem-{i}", payload={"data": text, "user_id": "u1"})
+            for i, text in enumerate(["likes tea", "lives in Paris", "works remotely"])
+        ]
+        memory.vector_store.search_batch.return_value = [existing]
+        memory.vector_store.get_many.return_value = existing
+        return memory
+
+    def _assert_prefetched_once(self, memory):
+        memory.vector_store.get_many.assert_called_once_with(["mem-0", "mem-1", "mem-2"])
+        memory.vector_store.get.assert_not_called()
+        # UPDATE and DELETE go out grouped; NONE only refreshes the session ids of its record
+        memory.vector_store.delete_many.assert_called_once_with(vector_ids=["mem-1"])
+        assert memory.vector_store.update_many.call_args.kwargs["vector_ids"] == ["mem-0"]
+        memory.vector_store.update.assert_called_once()
+        assert memory.vector_store.update.call_args.kwargs["vector_id"] == "mem-2"
+
+    def test_sync_update_delete_and_none_share_one_fetch(self, mocker):
+        memory = self._memory(mocker, Memory)
+        memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "hi"}],
+            metadata={"user_id": "u1", "agent_id": "a1"},
+            filters={"user_id": "u1"},
+            infer=True,
+        )
+        self._assert_prefetched_once(memory)
+
+    @pytest.mark.asyncio
+    async def test_async_update_delete_and_none_share_one_fetch(self, mocker):
+        memory = self._memory(mocker, AsyncMemory)
+        for name in ("async_search_batch", "async_get_many", "async_get", "async_update", "async_delete"):
+            setattr(memory.vector_store, name, None)  # exercise the sync fallback of call_async
+        await memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "hi"}],
+            metadata={"user_id": "u1", "agent_id": "a1"},
+            effective_filters={"user_id": "u1"},
+            infer=True,
+        )
+        self._assert_prefetched_once(memory)
+
+    def test_falls_back_to_single_gets_when_bulk_fetch_fails(self, mocker):
+        memory = self._memory(mocker, Memory)
+        memory.vector_store.get_many.side_effect = RuntimeError("boom")
+        memory.vector_store.get.return_value = mocker.MagicMock(payload={"data": "likes tea"})
+        memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "hi"}], metadata={"user_id": "u1"}, filters={"user_id": "u1"}, infer=True
+        )
+        assert memory.vector_store.get.call_count == 2  # UPDATE and DELETE; NONE needs no session refresh
+
+    def test_facts_and_action_texts_are_embedded_in_batches(self, mocker):
+        memory = self._memory(mocker, Memory)
+        memory.llm.generate_response.side_effect = [
+            '{"facts": ["likes green tea", "walks daily"]}',
+            json.dumps(
+                {
+                    "memory": [
+                        {"id": "0", "text": "likes green tea", "event": "UPDATE", "old_memory": "likes tea"},
+                        {"id": "1", "text": "has a dog", "event": "ADD"},
+                        {"id": "2", "text": "has a cat", "event": "ADD"},
+                    ]
+                }
+            ),
+        ]
+        memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "hi"}], metadata={"user_id": "u1"}, filters={"user_id": "u1"}, infer=True
+        )
+
+        batches = [c.args[0] for c in memory.embedding_model.embed_batch.call_args_list]
+        # Facts in one call, then the ADD texts; the UPDATE reuses the fact embedding
+        assert batches == [["likes green tea", "walks daily"], ["has a dog", "has a cat"]]
+        memory.embedding_model.embed.assert_not_called()
+
+    async def _add(self, memory):
+        kwargs = {"messages": [{"role": "user", "content": "hi"}], "metadata": {"user_id": "u1"}, "infer": True}
+        if isinstance(memory, AsyncMemory):
+            for name in ("async_search_batch", "async_get_many", "async_insert", "async_update_many", "async_delete_many"):
+                setattr(memory.vector_store, name, None)
+            return await memory._add_to_vector_store(effective_filters={"user_id": "u1"}, **kwargs)
+        return memory._add_to_vector_store(filters={"user_id": "u1"}, **kwargs)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("memory_cls", [Memory, AsyncMemory])
+    async def test_writes_are_grouped_by_kind(self, mocker, memory_cls):
+        memory = self._memory(mocker, memory_cls)
+        memory.llm.generate_response.side_effect = [
+            '{"facts": ["likes green tea"]}',
+            json.dumps(
+                {
+                    "memory": [
+                        {"id": "0", "text": "likes green tea", "event": "UPDATE", "old_memory": "likes tea"},
+                        {"id": "1", "text": "lives in Paris", "event": "DELETE"},
+                        {"id": "2", "text": "works remotely", "event": "DELETE"},
+                        {"id": "3", "text": "has a dog", "event": "ADD"},
+                        {"id": "4", "text": "has a cat", "event": "ADD"},
+                    ]
+                }
+            ),
+        ]
+
+        result = await self._add(memory)
+
+        memory.vector_store.insert.assert_called_once()
+        assert len(memory.vector_store.insert.call_args.kwargs["ids"]) == 2
+        memory.vector_store.update_many.assert_called_once()
+        memory.vector_store.delete_many.assert_called_once_with(vector_ids=["mem-1", "mem-2"])
+        memory.vector_store.update.assert_not_called()
+        memory.vector_store.delete.assert_not_called()
+        history = memory.db.add_history_batch.call_args.args[0]
+        assert [record["event"] for record in history] == ["ADD", "ADD", "UPDATE", "DELETE", "DELETE"]
+        assert [item["event"] for item in result] == ["UPDATE", "DELETE", "DELETE", "ADD", "ADD"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("memory_cls", [Memory, AsyncMemory])
+    async def test_failed_grouped_write_is_retried_one_by_one(self, mocker, memory_cls):
+        memory = self._memory(mocker, memory_cls)
+        memory.llm.generate_response.side_effect = [
+            '{"facts": ["likes green tea"]}',
+            json.dumps(
+                {
+                    "memory": [
+                        {"id": "1", "text": "lives in Paris", "event": "DELETE"},
+                        {"id": "2", "text": "works remotely", "event": "DELETE"},
+                    ]
+                }
+            ),
+        ]
+
+        def delete_many(vector_ids):
+            if "mem-2" in vector_ids:
+                raise RuntimeError("store rejected mem-2")
+
+        memory.vector_store.delete_many.side_effect = delete_many
+
+        result = await self._add(memory)
+
+        assert memory.vector_store.delete_many.call_count == 3
+        assert [item["id"] for item in result] == ["mem-1"]
+        history = memory.db.add_history_batch.call_args.args[0]
+        assert [record["memory_id"] for record in history] == ["mem-1"]
+
+
+@pytest.mark.asyncio
+class TestCallAsync:
+    async def test_prefers_native_async_method(self):
+        class Provider:
+            def embed(self, text, memory_action=None):
+                raise AssertionError("sync method should not be used")
+
+            async def async_embed(self, text, memory_action=None):
+                return [len(text)]
+
+        assert await call_async(Provider(), "embed", "abc", "add") == [3]
+
+    async def test_falls_back_to_thread_for_sync_providers(self):
+        provider = MagicMock()
+        provider.search.return_value = ["hit"]
+
+        result = await call_async(provider, "search", query="q", vectors=[0.1], limit=1)
+
+        assert result == ["hit"]
+        provider.search.assert_called_once_with(query="q", vectors=[0.1], limit=1)
+
+
+class TestRawIngestion:
+    @pytest.fixture
+    def memory(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = Memory()
+        memory.db = mocker.MagicMock()
+        memory.embedding_model.embed_batch.side_effect = lambda texts, action: [[float(len(t))] for t in texts]
+        return memory
+
+    def test_batches_embedding_insert_and_history(self, memory):
+        messages = [
+            {"role": "system", "content": "You are helpful"},
+            {"role": "user", "content": "hi", "name": "alice"},
+            {"role": "assistant"},
+            {"role": "assistant", "content": "hello"},
+        ]
+
+        result = memory._add_to_vector_store(messages, {"user_id": "u1"}, {"user_id": "u1"}, infer=False)
+
+        memory.embedding_model.embed_batch.assert_called_once_with(["hi", "hello"], "add")
+        memory.embedding_model.embed.assert_not_called()
+        memory.vector_store.insert.assert_called_once()
+        insert_kwargs = memory.vector_store.insert.call_args.kwargs
+        assert insert_kwargs["vectors"] == [[2.0], [5.0]]
+        assert insert_kwargs["ids"] == [m["id"] for m in result]
+        assert [p["data"] for p in insert_kwargs["payloads"]] == ["hi", "hello"]
+        assert insert_kwargs["payloads"][0]["actor_id"] == "alice"
+        assert "actor_id" not in insert_kwargs["payloads"][1]
+
+        memory.db.add_history_batch.assert_called_once()
+        history = memory.db.add_history_batch.call_args.args[0]
+        assert [h["memory_id"] for h in history] == insert_kwargs["ids"]
+        assert [(m["role"], m["actor_id"]) for m in result] == [("user", "alice"), ("assistant", None)]
+
+    def test_long_inputs_are_chunked(self, memory, mocker):
+        mocker.patch("mem0.memory.main.RAW_INGEST_CHUNK_SIZE", 2)
+        messages = ({"role": "user", "content": f"m{i}"} for i in range(5))
+
+        result = memory._add_to_vector_store(messages, {"user_id": "u1"}, {"user_id": "u1"}, infer=False)
+
+        assert len(result) == 5
+        assert memory.embedding_model.embed_batch.call_count == 3
+        assert [len(c.kwargs["ids"]) for c in memory.vector_store.insert.call_args_list] == [2, 2, 1]
+        assert memory.db.add_history_batch.call_count == 3
+
+
+class TestBulkImport:
+    @pytest.fixture
+    def memory(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = Memory()
+        memory.db = mocker.MagicMock()
+        memory.embedding_model.embed_batch.side_effect = lambda texts, action: [[float(len(t))] for t in texts]
+        return memory
+
+    def test_embeds_only_records_without_vectors(self, memory):
+        records = [
+            {"id": "a", "memory": "likes tea", "vector": [0.5]},
+            {"id": "b", "content": "lives in Paris", "metadata": {"source": "crm"}, "user_id": "bob"},
+        ]
+
+        result = memory.bulk_import(records, user_id="alice")
+
+        assert result == {"imported": 2, "resumed_from": 0}
+        memory.embedding_model.embed_batch.assert_called_once_with(["lives in Paris"], "add")
+        insert_kwargs = memory.vector_store.insert.call_args.kwargs
+        assert insert_kwargs["ids"] == ["a", "b"]
+        assert insert_kwargs["vectors"] == [[0.5], [14.0]]
+        assert insert_kwargs["payloads"][0]["user_id"] == "alice"
+        assert insert_kwargs["payloads"][1]["user_id"] == "bob"
+        assert insert_kwargs["payloads"][1]["source"] == "crm"
+        history = memory.db.add_history_batch.call_args.args[0]
+        assert [h["memory_id"] for h in history] == ["a", "b"]
+
+    def test_requires_session_id(self, memory):
+        with pytest.raises(ValueError, match="user_id"):
+            memory.bulk_import([{"memory": "orphan"}])
+
+    def test_resumes_from_checkpoint(self, memory, tmp_path):
+        source = tmp_path / "memories.jsonl"
+        source.write_text("\n".join(json.dumps({"id": str(i), "memory": f"m{i}"}) for i in range(5)))
+        checkpoint = tmp_path / "import.ckpt"
+        memory.vector_store.insert.side_effect = [None, RuntimeError("store down")]
+
+        with pytest.raises(RuntimeError):
+            memory.bulk_import(source, batch_size=2, user_id="alice", checkpoint_path=str(checkpoint))
+        assert json.loads(checkpoint.read_text()) == {"completed": 2, "submitted": 4}
+
+        memory.vector_store.insert.reset_mock(side_effect=True)
+        memory.vector_store.get_many.return_value = []
+        result = memory.bulk_import(source, batch_size=2, user_id="alice", checkpoint_path=str(checkpoint))
+
+        assert result == {"imported": 3, "resumed_from": 2}
+        inserted = [i for c in memory.vector_store.insert.call_args_list for i in c.kwargs["ids"]]
+        assert inserted == ["2", "3", "4"]
+        memory.vector_store.get_many.assert_called_once_with(["2", "3"])
+        assert json.loads(checkpoint.read_text()) == {"completed": 5, "submitted": 5}
+
+    def test_resume_skips_in_flight_records_that_were_written(self, memory, tmp_path, mocker):
+        source = tmp_path / "memories.jsonl"
+        source.write_text("\n".join(json.dumps({"id": str(i), "memory": f"m{i}"}) for i in range(5)))
+        checkpoint = tmp_path / "import.ckpt"
+        # The second batch reaches the vector store, then its history write fails
+        memory.db.add_history_batch.side_effect = [None, RuntimeError("disk full")]
+
+        with pytest.raises(RuntimeError):
+            memory.bulk_import(source, batch_size=2, user_id="alice", checkpoint_path=str(checkpoint))
+
+        memory.db.add_history_batch.side_effect = None
+        memory.vector_store.insert.reset_mock()
+        memory.vector_store.get_many.return_value = [mocker.MagicMock(id="2")]
+        result = memory.bulk_import(source, batch_size=2, user_id="alice", checkpoint_path=str(checkpoint))
+
+        assert result == {"imported": 2, "resumed_from": 2}
+        inserted = [i for c in memory.vector_store.insert.call_args_list for i in c.kwargs["ids"]]
+        assert inserted == ["3", "4"]
+        # Only the batch that was in flight is looked up
+        memory.vector_store.get_many.assert_called_once_with(["2", "3"])
+
+    def test_resume_tolerates_stores_that_raise_for_missing_ids(self, memory, tmp_path, mocker):
+        source = tmp_path / "memories.jsonl"
+        source.write_text("\n".join(json.dumps({"id": str(i), "memory": f"m{i}"}) for i in range(4)))
+        checkpoint = tmp_path / "import.ckpt"
+        checkpoint.write_text(json.dumps({"completed": 2, "submitted": 4}))
+
+        def get(vector_id):
+            if vector_id == "2":
+                return mocker.MagicMock(id="2")
+            raise IndexError(f"{vector_id} not found")
+
+        memory.vector_store.get.side_effect = get
+        memory.vector_store.get_many = functools.partial(VectorStoreBase.get_many, memory.vector_store)
+
+        result = memory.bulk_import(source, batch_size=2, user_id="alice", checkpoint_path=str(checkpoint))
+
+        assert result == {"imported": 1, "resumed_from": 2}
+        assert memory.vector_store.insert.call_args.kwargs["ids"] == ["3"]
+
+    def test_parallel_workers_import_every_record(self, memory, tmp_path):
+        checkpoint = tmp_path / "import.ckpt"
+        records = ({"memory": f"m{i}", "run_id": "r1"} for i in range(10))
+
+        result = memory.bulk_import(records, batch_size=3, workers=3, checkpoint_path=str(checkpoint))
+
+        assert result["imported"] == 10
+        assert memory.vector_store.insert.call_count == 4
+        assert json.loads(checkpoint.read_text()) == {"completed": 10, "submitted": 10}
+        memory.close()
+
+    def test_reads_parquet_with_precomputed_vectors(self, memory, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        source = tmp_path / "memories.parquet"
+        pq.write_table(
+            pa.table({"id": ["a", "b"], "memory": ["x", "y"], "vector": [[0.1, 0.2], [0.3, 0.4]]}), str(source)
+        )
+
+        result = memory.bulk_import(str(source), agent_id="agent")
+
+        assert result["imported"] == 2
+        memory.embedding_model.embed_batch.assert_not_called()
+        assert memory.vector_store.insert.call_args.kwargs["vectors"] == [[0.1, 0.2], [0.3, 0.4]]
@@ -0,0 +1,121 @@
+from unittest.mock import Mock
+
+import pytest
+
+from mem0.configs.base import MemoryItem
+from mem0.exceptions import ValidationError as Mem0ValidationError
+from mem0.memory.search_plan import SearchPlan, SearchPlanCache, process_metadata_filters
+from mem0.memory.utils import format_memory_item
+
+
+class TestSearchPlan:
+    def test_compile_simple_filters(self):
+        plan = SearchPlan.compile(user_id="alice", filters={"category": "food"})
+
+        assert plan.filters == {"user_id": "alice", "category": "food"}
+        assert plan.advanced_filters is False
+        assert sorted(plan.telemetry_keys) == ["category", "user_id"]
+        assert "user_id" in plan.encoded_ids
+
+    def test_compile_advanced_filters(self):
+        plan = SearchPlan.compile(
+            user_id="alice",
+            filters={"AND": [{"score": {"gte": 3}}, {"tag": "x"}], "OR": [{"a": {"in": [1, 2]}}]},
+        )
+
+        assert plan.advanced_filters is True
+        assert plan.filters["score"] == {"gte": 3}
+        assert plan.filters["tag"] == "x"
+        assert plan.filters["$or"] == [{"a": {"in": [1, 2]}}]
+
+    def test_compile_requires_session_id(self):
+        with pytest.raises(Mem0ValidationError):
+            SearchPlan.compile(filters={"category": "food"})
+
+    def test_unsupported_operator(self):
+        with pytest.raises(ValueError, match="Unsupported metadata filter operator"):
+            process_metadata_filters({"score": {"between": [1, 2]}})
+
+    def test_bind_returns_independent_copy(self):
+        plan = SearchPlan.compile(user_id="alice", filters={"score": {"gte": 3}})
+
+        bound = plan.bind()
+        bound["score"]["gte"] = 10
+        bound["extra"] = True
+
+        assert plan.filters == {"user_id": "alice", "score": {"gte": 3}}
+
+
+class TestSearchPlanCache:
+    def test_reuses_plan_for_same_tenant_and_filters(self):
+        cache = SearchPlanCache()
+
+        first = cache.get(user_id="alice", filters={"category": "food"})
+        second = cache.get(user_id="alice", filters={"category": "food"})
+        other = cache.get(user_id="bob", filters={"category": "food"})
+
+        assert first is second
+        assert other is not first
+        assert len(cache) == 2
+
+    def test_cached_plan_does_not_share_filter_values(self):
+        cache = SearchPlanCache()
+        filters = {"categories": ["food"], "source": {"app": "crm"}}
+
+        bound = cache.get(user_id="alice", filters=filters).bind()
+        filters["categories"].append("travel")
+        filters["source"]["app"] = "mail"
+        bound["categories"].append("sports")
+
+        plan = cache.get(user_id="alice", filters={"categories": ["food"], "source": {"app": "crm"}})
+        assert plan.bind() == {"user_id": "alice", "categories": ["food"], "source": {"app": "crm"}}
+
+    def test_evicts_least_recently_used(self):
+        cache = SearchPlanCache(maxsize=2)
+
+        a = cache.get(user_id="a")
+        cache.get(user_id="b")
+        cache.get(user_id="a")
+        cache.get(user_id="c")
+
+        assert len(cache) == 2
+        assert cache.get(user_id="a") is a
+
+    def test_unhashable_filters_are_not_cached(self):
+        cache = SearchPlanCache()
+
+        plan = cache.get(user_id="alice", filters={"tags": {"in": [{1, 2}]}})
+
+        assert plan.filters["tags"] == {"in": [{1, 2}]}
+        assert len(cache) == 0
+
+
+@pytest.mark.parametrize("include_score", [True, False])
+def test_format_memory_item_matches_model_dump(include_score):
+    mem = Mock(
+        id="1",
+        payload={
+            "data": "Likes tea",
+            "hash": "abc",
+            "created_at": "2024-01-01",
+            "user_id": "alice",
+            "role": "user",
+            "source": "chat",
+        },
+        score=0.5,
+    )
+
+    expected = MemoryItem(
+        id="1",
+        memory="Likes tea",
+        hash="abc",
+        created_at="2024-01-01",
+        updated_at=None,
+        score=0.5 if include_score else None,
+    ).model_dump(exclude=None if include_score else {"score"})
+    expected.update({"user_id": "alice", "role": "user", "metadata": {"source": "chat"}})
+
+    result = format_memory_item(mem, score=mem.score, include_score=include_score)
+
+    assert result == expected
+    assert list(result) == list(expected)
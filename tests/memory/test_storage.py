@@ -1,6 +1,7 @@
 import os
 import sqlite3
 import tempfile
+import threading
 import uuid
 from datetime import datetime
 
@@ -67,6 +68,29 @@ class TestSQLiteManager:
         assert manager.db_path == db_path
         manager.close()
 
+    def test_file_database_uses_wal(self, sqlite_manager):
+        """File-backed history databases use WAL so several processes can share them."""
+        mode = sqlite_manager.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+
+    def test_managers_sharing_file_write_concurrently(self, temp_db_path, sample_data):
+        """Separate connections (as in separate worker processes) can write to one file."""
+        managers = [SQLiteManager(temp_db_path) for _ in range(2)]
+
+        def write(manager):
+            for _ in range(25):
+                manager.add_history(sample_data["memory_id"], None, sample_data["new_memory"], "ADD")
+
+        threads = [threading.Thread(target=write, args=(m,)) for m in managers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(managers[0].get_history(sample_data["memory_id"])) == 50
+        for manager in managers:
+            manager.close()
+
     def test_table_schema_creation(self, sqlite_manager):
         """Test that history table is created with correct schema."""
         cursor = sqlite_manager.connection.cursor()
@@ -248,6 +272,36 @@ class TestSQLiteManager:
             result = sqlite_manager.get_history(memory_id)
             assert len(result) == 1
 
+    def test_add_history_batch(self, sqlite_manager):
+        """Test inserting many records in one transaction."""
+        records = [
+            {"memory_id": f"mem-{i}", "new_memory": f"Batch memory {i}", "event": "ADD", "role": "user"}
+            for i in range(5)
+        ]
+
+        sqlite_manager.add_history_batch(records)
+        sqlite_manager.add_history_batch([])
+
+        cursor = sqlite_manager.connection.cursor()
+        cursor.execute("SELECT COUNT(*) FROM history")
+        assert cursor.fetchone()[0] == 5
+
+        result = sqlite_manager.get_history("mem-3")
+        assert len(result) == 1
+        assert result[0]["new_memory"] == "Batch memory 3"
+        assert result[0]["old_memory"] is None
+        assert result[0]["role"] == "user"
+        assert result[0]["is_deleted"] is False
+
+    def test_add_history_batch_rolls_back_on_error(self, sqlite_manager):
+        """Test that a failing batch leaves no partial rows behind."""
+        records = [{"memory_id": "mem-1", "event": "ADD"}, {"memory_id": "mem-2"}]
+
+        with pytest.raises(KeyError):
+            sqlite_manager.add_history_batch(records)
+
+        assert sqlite_manager.get_history("mem-1") == []
+
     # ========== Tests for Migration, Reset, and Close ==========
 
     def test_explicit_old_schema_migration(self, temp_db_path):
@@ -28,6 +28,7 @@ def memory_instance():
         mock_embedder.create.return_value = Mock()
         mock_vector_store.create.return_value = Mock()
         mock_vector_store.create.return_value.search.return_value = []
+        mock_vector_store.create.return_value.search_batch.return_value = [[], []]
         mock_llm.create.return_value = Mock()
         
         # Create a mock instance that won't try to access config attributes
@@ -52,6 +53,7 @@ def memory_custom_instance():
         mock_embedder.create.return_value = Mock()
         mock_vector_store.create.return_value = Mock()
         mock_vector_store.create.return_value.search.return_value = []
+        mock_vector_store.create.return_value.search_batch.return_value = [[], []]
         mock_llm.create.return_value = Mock()
         
         # Create a mock instance that won't try to access config attributes
@@ -1,8 +1,11 @@
-from unittest.mock import Mock, patch
+import threading
+import time
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from mem0 import Memory, MemoryClient
+from mem0.proxy.ingestion import IngestionQueue, merge_messages
 from mem0.proxy.main import Chat, Completions, Mem0
 
 
@@ -70,6 +73,7 @@ def test_completions_create(mock_memory_client, mock_litellm):
 
     response = completions.create(model="gpt-4.1-nano-2025-04-14", messages=messages, user_id="test_user", temperature=0.7)
 
+    assert completions.ingestion.drain(timeout=5)
     mock_memory_client.add.assert_called_once()
     mock_memory_client.search.assert_called_once()
 
@@ -98,3 +102,174 @@ def test_completions_create_with_system_message(mock_memory_client, mock_litellm
     call_args = mock_litellm.completion.call_args[1]
     assert call_args["messages"][0]["role"] == "system"
     assert call_args["messages"][0]["content"] == "You are a helpful assistant."
+
+
+def test_merge_messages_deduplicates_resent_history():
+    first = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]
+    second = first + [{"role": "user", "content": "I like tea"}]
+    assert merge_messages(first, second) == second
+    assert merge_messages(first, [{"role": "user", "content": "x"}]) == first + [{"role": "user", "content": "x"}]
+
+
+def test_ingestion_merges_adjacent_turns_per_user(mock_memory_client):
+    ingestion = IngestionQueue(mock_memory_client, num_workers=1, merge_window_ms=200)
+    turn1 = [{"role": "user", "content": "I like tea"}]
+    turn2 = turn1 + [{"role": "assistant", "content": "Noted"}, {"role": "user", "content": "And biscuits"}]
+
+    ingestion.submit(turn1, user_id="alice")
+    ingestion.submit([{"role": "user", "content": "I like coffee"}], user_id="bob")
+    ingestion.submit(turn2, user_id="alice")
+    assert ingestion.close(timeout=5)
+
+    calls = {call.kwargs["user_id"]: call.kwargs["messages"] for call in mock_memory_client.add.call_args_list}
+    assert mock_memory_client.add.call_count == 2
+    assert calls["alice"] == turn2
+    stats = ingestion.stats()
+    assert stats["submitted"] == 3
+    assert stats["merged"] == 1
+    assert stats["add_calls"] == 2
+    assert stats["pending"] == 0
+
+
+def test_ingestion_keeps_per_user_order(mock_memory_client):
+    ingestion = IngestionQueue(mock_memory_client, num_workers=4, merge_window_ms=0)
+    seen = []
+    mock_memory_client.add.side_effect = lambda **kwargs: seen.append(kwargs["metadata"]["n"])
+
+    for n in range(20):
+        # Distinct metadata prevents merging so every turn gets its own add()
+        ingestion.submit([{"role": "user", "content": str(n)}], user_id="alice", metadata={"n": n})
+    assert ingestion.drain(timeout=5)
+
+    assert seen == list(range(20))
+    ingestion.close()
+
+
+def test_ingestion_drops_when_full(mock_memory_client):
+    release = threading.Event()
+    mock_memory_client.add.side_effect = lambda **kwargs: release.wait(5)
+    ingestion = IngestionQueue(
+        mock_memory_client, num_workers=1, max_queue_size=1, merge_window_ms=0, enqueue_timeout=0.05
+    )
+
+    results = [ingestion.submit([{"role": "user", "content": str(n)}], user_id=str(n)) for n in range(4)]
+    release.set()
+    ingestion.close(timeout=5)
+
+    assert not all(results)
+    assert ingestion.stats()["dropped"] == results.count(False)
+
+
+def test_ingestion_nonblocking_submit_drops_immediately(mock_memory_client):
+    release = threading.Event()
+    mock_memory_client.add.side_effect = lambda **kwargs: release.wait(5)
+    ingestion = IngestionQueue(
+        mock_memory_client, num_workers=1, max_queue_size=1, merge_window_ms=0, enqueue_timeout=5
+    )
+
+    start = time.monotonic()
+    results = [
+        ingestion.submit([{"role": "user", "content": str(n)}], user_id=str(n), block=False) for n in range(4)
+    ]
+    elapsed = time.monotonic() - start
+    release.set()
+    ingestion.close(timeout=5)
+
+    assert elapsed < 1
+    assert not all(results)
+    assert ingestion.stats()["dropped"] == results.count(False)
+
+
+def test_ingestion_close_drains_and_rejects_new_turns(mock_memory_client):
+    ingestion = IngestionQueue(mock_memory_client, num_workers=2, merge_window_ms=1000)
+    ingestion.submit([{"role": "user", "content": "hello"}], user_id="alice")
+
+    assert ingestion.close(timeout=5)
+    mock_memory_client.add.assert_called_once()
+    with pytest.raises(RuntimeError):
+        ingestion.submit([{"role": "user", "content": "late"}], user_id="alice")
+
+
+def test_ingestion_failure_is_counted(mock_memory_client):
+    mock_memory_client.add.side_effect = RuntimeError("boom")
+    ingestion = IngestionQueue(mock_memory_client, num_workers=1, merge_window_ms=0)
+
+    ingestion.submit([{"role": "user", "content": "hello"}], user_id="alice")
+    assert ingestion.close(timeout=5)
+
+    assert ingestion.stats()["failed"] == 1
+
+
+@pytest.fixture
+def mock_local_memory():
+    mock_client = Mock(spec=Memory)
+    mock_client.embed_query.return_value = [0.1, 0.2]
+    mock_client.search.return_value = {"results": [{"memory": "Likes tea"}]}
+    with patch("mem0.proxy.main.capture_event"):
+        yield mock_client
+
+
+def test_completions_create_does_not_modify_caller_messages(mock_memory_client, mock_litellm):
+    completions = Completions(mock_memory_client)
+    messages = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Hello"}]
+    mock_memory_client.search.return_value = [{"memory": "Some relevant memory"}]
+    mock_litellm.supports_function_calling.return_value = True
+
+    completions.create(model="gpt-4.1-nano-2025-04-14", messages=messages, user_id="test_user")
+
+    assert messages[-1]["content"] == "Hello"
+    assert "Some relevant memory" in mock_litellm.completion.call_args[1]["messages"][-1]["content"]
+
+
+def test_completions_reuse_query_embedding_for_unchanged_tail(mock_local_memory, mock_litellm):
+    completions = Completions(mock_local_memory)
+    messages = [{"role": "user", "content": "What do I like to drink?"}]
+    mock_litellm.supports_function_calling.return_value = True
+
+    completions.create(model="gpt-4.1-nano-2025-04-14", messages=messages, user_id="alice")
+    completions.create(model="gpt-4.1-nano-2025-04-14", messages=messages, user_id="alice")
+
+    mock_local_memory.embed_query.assert_called_once_with("user: What do I like to drink?")
+    assert mock_local_memory.search.call_count == 2
+    assert mock_local_memory.search.call_args.kwargs["query_embedding"] == [0.1, 0.2]
+    assert completions.query_embeddings.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_completions_acreate(mock_local_memory, mock_litellm):
+    completions = Completions(mock_local_memory)
+    mock_litellm.supports_function_calling.return_value = True
+    mock_litellm.acompletion = AsyncMock(return_value={"choices": []})
+
+    response = await completions.acreate(
+        model="gpt-4.1-nano-2025-04-14", messages=[{"role": "user", "content": "Hi"}], user_id="alice", stream=True
+    )
+
+    assert response == {"choices": []}
+    call_args = mock_litellm.acompletion.call_args[1]
+    assert call_args["stream"] is True
+    assert "Likes tea" in call_args["messages"][-1]["content"]
+    assert completions.ingestion.drain(timeout=5)
+    mock_local_memory.add.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_completions_acreate_falls_back_when_search_is_slow(mock_local_memory, mock_litellm):
+    completions = Completions(mock_local_memory)
+    mock_litellm.supports_function_calling.return_value = True
+    mock_litellm.acompletion = AsyncMock(return_value={"choices": []})
+
+    def slow_search(**kwargs):
+        time.sleep(0.5)
+        return {"results": [{"memory": "Likes tea"}]}
+
+    mock_local_memory.search.side_effect = slow_search
+
+    await completions.acreate(
+        model="gpt-4.1-nano-2025-04-14",
+        messages=[{"role": "user", "content": "Hi"}],
+        user_id="alice",
+        search_timeout=0.05,
+    )
+
+    assert mock_litellm.acompletion.call_args[1]["messages"][-1]["content"] == "Hi"
@@ -267,3 +267,99 @@ def test_output_data_model():
     assert data.id == "test_id"
     assert data.score == 0.95
     assert data.payload == {"text": "test"}
+
+
+def _blob(vector):
+    import numpy as np
+
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def test_insert_packs_float32_blobs(azure_mysql_instance):
+    """Test that vectors are stored as packed float32 bytes."""
+    azure_mysql_instance.insert(vectors=[[0.5, 0.25]], payloads=[{"user_id": "alice"}], ids=["id1"])
+
+    cursor = azure_mysql_instance.connection_pool.connection().cursor()
+    sql, data = cursor.executemany.call_args.args
+    assert "VALUES (%s, %s, %s)" in sql
+    assert data[0][1] == _blob([0.5, 0.25])
+
+
+def test_search_ranks_with_cached_matrix(azure_mysql_instance):
+    """Test top-k ranking and that repeated searches reuse the tenant cache until a write."""
+    cursor = azure_mysql_instance.connection_pool.connection().cursor()
+    cursor.execute.reset_mock()
+    cursor.fetchall = Mock(return_value=[
+        {"id": "far", "vector": _blob([0.0, 1.0]), "payload": json.dumps({"user_id": "alice"})},
+        {"id": "near", "vector": _blob([1.0, 0.1]), "payload": json.dumps({"user_id": "alice"})},
+        {"id": "legacy", "vector": json.dumps([0.7, 0.7]), "payload": json.dumps({"user_id": "alice"})},
+    ])
+
+    results = azure_mysql_instance.search(query="q", vectors=[1.0, 0.0], limit=2, filters={"user_id": "alice"})
+    again = azure_mysql_instance.search(query="q", vectors=[0.0, 1.0], limit=1, filters={"user_id": "alice"})
+
+    assert [r.id for r in results] == ["near", "legacy"]
+    assert results[0].score == pytest.approx(1 - 1 / (1.01 ** 0.5), abs=1e-6)
+    assert [r.id for r in again] == ["far"]
+    assert cursor.execute.call_count == 1
+
+    azure_mysql_instance.insert(vectors=[[1.0, 0.0]], payloads=[{"user_id": "bob"}], ids=["other"])
+    azure_mysql_instance.search(query="q", vectors=[1.0, 0.0], limit=1, filters={"user_id": "alice"})
+    assert cursor.execute.call_count == 1
+
+    azure_mysql_instance.delete(vector_id="near")
+    azure_mysql_instance.search(query="q", vectors=[1.0, 0.0], limit=1, filters={"user_id": "alice"})
+    assert cursor.execute.call_count == 3
+
+
+def test_cached_scope_is_reloaded_after_ttl(azure_mysql_instance):
+    """Test that writes from other processes show up once the cache TTL has passed."""
+    cursor = azure_mysql_instance.connection_pool.connection().cursor()
+    cursor.execute.reset_mock()
+    cursor.fetchall = Mock(return_value=[{"id": "id1", "vector": _blob([1.0, 0.0]), "payload": "{}"}])
+
+    with patch("mem0.vector_stores.azure_mysql.time.monotonic", return_value=100.0):
+        azure_mysql_instance.search(query="q", vectors=[1.0, 0.0], limit=1, filters={"user_id": "alice"})
+    with patch("mem0.vector_stores.azure_mysql.time.monotonic", return_value=104.0):
+        azure_mysql_instance.search(query="q", vectors=[1.0, 0.0], limit=1, filters={"user_id": "alice"})
+    assert cursor.execute.call_count == 1
+
+    cursor.fetchall = Mock(return_value=[{"id": "id2", "vector": _blob([1.0, 0.0]), "payload": "{}"}])
+    with patch("mem0.vector_stores.azure_mysql.time.monotonic", return_value=106.0):
+        results = azure_mysql_instance.search(query="q", vectors=[1.0, 0.0], limit=1, filters={"user_id": "alice"})
+    assert cursor.execute.call_count == 2
+    assert results[0].id == "id2"
+
+
+def test_search_uses_native_distance_when_available(azure_mysql_instance):
+    """Test that servers with VECTOR and DISTANCE() rank rows in SQL."""
+    azure_mysql_instance._vector_format = "vector"
+    azure_mysql_instance._native_distance = True
+    cursor = azure_mysql_instance.connection_pool.connection().cursor()
+    cursor.fetchall = Mock(return_value=[{"id": "id1", "distance": 0.1, "payload": json.dumps({"user_id": "alice"})}])
+
+    results = azure_mysql_instance.search(query="q", vectors=[1.0, 0.0], limit=3, filters={"user_id": "alice"})
+
+    sql, params = cursor.execute.call_args.args
+    assert "DISTANCE(vector, STRING_TO_VECTOR(%s), 'COSINE')" in sql
+    assert "ORDER BY distance" in sql
+    assert params == ("[1.0, 0.0]", "$.user_id", '"alice"', 3)
+    assert results[0].id == "id1" and results[0].score == 0.1
+
+
+def test_memory_mapped_cache(azure_mysql_instance, tmp_path):
+    """Test that cached matrices can live in memory-mapped files."""
+    from mem0.vector_stores.azure_mysql import _VectorCache
+
+    azure_mysql_instance._vector_cache = _VectorCache(maxsize=4, ttl=None, cache_dir=str(tmp_path))
+    cursor = azure_mysql_instance.connection_pool.connection().cursor()
+    cursor.fetchall = Mock(return_value=[{"id": "id1", "vector": _blob([3.0, 4.0]), "payload": "{}"}])
+
+    results = azure_mysql_instance.search(query="q", vectors=[3.0, 4.0], limit=1, filters={"run_id": "r1"})
+
+    assert results[0].id == "id1"
+    assert results[0].score == pytest.approx(0.0, abs=1e-6)
+    assert len(list(tmp_path.glob("mem0-vectors-*.npy"))) == 1
+
+    azure_mysql_instance.delete_col()
+    assert list(tmp_path.glob("mem0-vectors-*.npy")) == []
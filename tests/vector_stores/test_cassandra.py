@@ -314,3 +314,62 @@ def test_insert_without_payloads(cassandra_instance):
     assert cassandra_instance.session.prepare.called
     assert cassandra_instance.session.execute.called
 
+
+
+def test_init_creates_sai_indexes(cassandra_instance):
+    """Test that the table uses a native vector column with SAI indexes."""
+    statements = [str(c.args[0]) for c in cassandra_instance.session.execute.call_args_list]
+
+    assert any("vector<float, 128>" in s for s in statements)
+    assert any("test_collection_vector_idx" in s and "StorageAttachedIndex" in s for s in statements)
+    assert any("test_collection_user_id_idx" in s for s in statements)
+    assert cassandra_instance._native_ann is True
+
+
+def test_search_uses_server_side_ann(cassandra_instance):
+    """Test that session filters are pushed down and payload filters applied to ANN results."""
+    mock_row1 = Mock(id='id1', vector=[0.1, 0.2, 0.3], payload=json.dumps({"user_id": "alice", "category": "A"}))
+    mock_row2 = Mock(id='id2', vector=[0.4, 0.5, 0.6], payload=json.dumps({"user_id": "alice", "category": "B"}))
+    cassandra_instance.session.execute = Mock(return_value=[mock_row1, mock_row2])
+
+    results = cassandra_instance.search(
+        query="test", vectors=[0.2, 0.3, 0.4], limit=2, filters={"user_id": "alice", "category": "A"}
+    )
+
+    cql = cassandra_instance.session.prepare.call_args.args[0]
+    assert "WHERE user_id = ?" in cql
+    assert "ORDER BY vector ANN OF ?" in cql
+    params = cassandra_instance.session.execute.call_args.args[1]
+    assert params == ("alice", [0.2, 0.3, 0.4], 2 * 4)
+    assert [r.id for r in results] == ["id1"]
+
+
+def test_insert_populates_promoted_columns(cassandra_instance):
+    """Test that session identifiers are written to their own columns."""
+    cassandra_instance.session.execute = Mock()
+
+    cassandra_instance.insert(vectors=[[0.1, 0.2]], payloads=[{"user_id": "alice", "run_id": "r1"}], ids=["id1"])
+
+    cql = cassandra_instance.session.prepare.call_args.args[0]
+    assert "user_id, agent_id, run_id, actor_id" in cql
+    params = cassandra_instance.session.execute.call_args.args[1]
+    assert params[3:] == ("alice", None, "r1", None)
+
+
+def test_legacy_list_column_falls_back_to_client_side(mock_cluster, mock_session):
+    """Test that tables created with list<float> vectors keep working."""
+    mock_session.execute = Mock(return_value=Mock(one=Mock(return_value=Mock(type="list<float>"))))
+    with patch('mem0.vector_stores.cassandra.Cluster') as mock_cluster_class:
+        mock_cluster_class.return_value = mock_cluster
+        instance = CassandraDB(contact_points=['127.0.0.1'], collection_name='legacy', embedding_model_dims=3)
+
+    assert instance._native_ann is False
+    statements = [str(c.args[0]) for c in mock_session.execute.call_args_list]
+    assert not any("StorageAttachedIndex" in s for s in statements)
+
+    mock_row = Mock(id='id1', vector=[0.1, 0.2, 0.3], payload=json.dumps({"user_id": "alice"}))
+    mock_session.execute = Mock(return_value=[mock_row])
+    results = instance.search(query="test", vectors=[0.1, 0.2, 0.3], limit=5, filters={"user_id": "alice"})
+
+    assert "ANN OF" not in str(mock_session.execute.call_args.args[0])
+    assert [r.id for r in results] == ["id1"]
@@ -136,6 +136,19 @@ def test_update_vector(chromadb_instance):
     )
 
 
+def test_get_many_vectors(chromadb_instance):
+    chromadb_instance.collection.get.return_value = {
+        "ids": ["id2", "id1"],
+        "metadatas": [{"name": "vector2"}, {"name": "vector1"}],
+    }
+
+    results = chromadb_instance.get_many(["id1", "missing", "id2"])
+
+    chromadb_instance.collection.get.assert_called_once_with(ids=["id1", "missing", "id2"])
+    assert [r.id for r in results] == ["id1", "id2"]
+    assert results[1].payload == {"name": "vector2"}
+
+
 def test_get_vector(chromadb_instance):
     mock_result = {
         "ids": [["id1"]],
@@ -212,6 +212,29 @@ class TestElasticsearchDB(unittest.TestCase):
         self.assertEqual(results[0].score, 0.8)
         self.assertEqual(results[0].payload, {"key1": "value1"})
 
+    def test_search_batch_uses_msearch(self):
+        def hit(doc_id):
+            return {"hits": {"hits": [{"_id": doc_id, "_score": 0.5, "_source": {"metadata": {"user_id": "alice"}}}]}}
+
+        self.client_mock.msearch.return_value = {"responses": [hit("id1"), hit("id2")]}
+
+        results = self.es_db.search_batch(
+            queries=["q1", "q2"], vectors_matrix=[[0.1] * 1536, [0.2] * 1536], limit=3, filters={"user_id": "alice"}
+        )
+
+        self.client_mock.msearch.assert_called_once()
+        searches = self.client_mock.msearch.call_args[1]["searches"]
+        self.assertEqual(searches[0], {"index": "test_collection"})
+        self.assertEqual(searches[3]["knn"]["query_vector"], [0.2] * 1536)
+        self.assertEqual(searches[1]["knn"]["filter"], {"bool": {"must": [{"term": {"metadata.user_id": "alice"}}]}})
+        self.assertEqual([[r.id for r in group] for group in results], [["id1"], ["id2"]])
+
+    def test_search_batch_raises_on_failed_query(self):
+        self.client_mock.msearch.return_value = {"responses": [{"error": {"type": "search_phase_execution_exception"}}]}
+
+        with self.assertRaises(RuntimeError):
+            self.es_db.search_batch(queries=["q"], vectors_matrix=[[0.1] * 1536], limit=3)
+
     def test_custom_search_query(self):
         # Mock custom search query
         self.es_db.custom_search_query = Mock()
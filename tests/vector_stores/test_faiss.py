@@ -119,6 +119,25 @@ def test_search(faiss_instance, mock_faiss_index):
             assert results[1].payload == {"name": "vector2"}
 
 
+def test_search_batch_uses_one_matrix_search(faiss_instance, mock_faiss_index):
+    faiss_instance.docstore = {"id1": {"user_id": "alice"}, "id2": {"user_id": "bob"}}
+    faiss_instance.index_to_id = {0: "id1", 1: "id2"}
+    mock_faiss_index.search.return_value = (
+        np.array([[0.1, 0.2, 0.0, 0.0], [0.3, 0.4, 0.0, 0.0]]),
+        np.array([[0, 1, -1, -1], [1, 0, -1, -1]]),
+    )
+
+    results = faiss_instance.search_batch(
+        queries=["a", "b"], vectors_matrix=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], limit=2, filters={"user_id": "bob"}
+    )
+
+    mock_faiss_index.search.assert_called_once()
+    query_matrix, fetch_k = mock_faiss_index.search.call_args[0]
+    assert query_matrix.shape == (2, 3)
+    assert fetch_k == 4
+    assert [[r.id for r in group] for group in results] == [["id2"], ["id2"]]
+
+
 def test_search_with_filters(faiss_instance, mock_faiss_index):
     # Prepare test data
     query_vector = [0.1, 0.2, 0.3]
@@ -217,6 +236,15 @@ def test_get(faiss_instance):
     assert result is None
 
 
+def test_get_many(faiss_instance):
+    faiss_instance.docstore = {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}}
+
+    results = faiss_instance.get_many(["id2", "id3", "id1"])
+
+    assert [r.id for r in results] == ["id2", "id1"]
+    assert results[0].payload == {"name": "vector2"}
+
+
 def test_list(faiss_instance):
     # Setup the docstore
     faiss_instance.docstore = {
@@ -289,3 +317,86 @@ def test_normalize_L2(faiss_instance, mock_faiss_index):
 
             # Verify faiss.normalize_L2 was called
             mock_normalize.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "precision,index_type",
+    [("float16", faiss.IndexScalarQuantizer), ("int8", faiss.IndexScalarQuantizer), ("binary", faiss.IndexBinaryFlat)],
+)
+def test_reduced_precision_indexes(tmp_path, precision, index_type):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(50, 64)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    store = FAISS(
+        collection_name="quantized",
+        path=str(tmp_path / "faiss"),
+        distance_strategy="cosine",
+        embedding_model_dims=64,
+        precision=precision,
+    )
+    store.insert(vectors.tolist(), [{"i": i} for i in range(50)], [str(i) for i in range(50)])
+
+    assert isinstance(store.index, index_type)
+    results = store.search(query="", vectors=vectors[7].tolist(), limit=3)
+    assert results[0].id == "7"
+
+    # The index is persisted and reloaded with the same precision
+    reloaded = FAISS(
+        collection_name="quantized",
+        path=str(tmp_path / "faiss"),
+        distance_strategy="cosine",
+        embedding_model_dims=64,
+        precision=precision,
+    )
+    assert reloaded.index.ntotal == 50
+    assert reloaded.search(query="", vectors=vectors[7].tolist(), limit=1)[0].id == "7"
+
+
+def test_binary_rescoring_returns_full_precision_scores(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(40, 32)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    store = FAISS(
+        collection_name="rescored",
+        path=str(tmp_path / "faiss"),
+        distance_strategy="cosine",
+        embedding_model_dims=32,
+        precision="binary",
+        rescore=True,
+        rescore_multiplier=5,
+    )
+    store.insert(vectors.tolist(), [{} for _ in range(40)], [str(i) for i in range(40)])
+
+    results = store.search_batch(["", ""], vectors[:2].tolist(), limit=4)
+
+    for i, hits in enumerate(results):
+        expected = np.sort(vectors @ vectors[i])[::-1][: len(hits)]
+        assert hits[0].id == str(i)
+        assert [h.score for h in hits] == pytest.approx(expected.tolist(), abs=1e-5)
+    assert store.full_index.ntotal == 40
+
+
+def test_binary_scores_without_rescoring_are_similarities(tmp_path):
+    rng = np.random.default_rng(2)
+    vectors = rng.normal(size=(20, 32)).astype(np.float32)
+    store = FAISS(
+        collection_name="binary",
+        path=str(tmp_path / "faiss"),
+        distance_strategy="cosine",
+        embedding_model_dims=32,
+        precision="binary",
+    )
+    store.insert(vectors.tolist(), [{} for _ in range(20)], [str(i) for i in range(20)])
+
+    results = store.search(query="", vectors=vectors[3].tolist(), limit=5)
+
+    assert results[0].id == "3"
+    assert results[0].score == pytest.approx(1.0)
+    scores = [hit.score for hit in results]
+    assert scores == sorted(scores, reverse=True)
+    assert all(-1.0 <= score <= 1.0 for score in scores)
+
+
+def test_binary_precision_requires_byte_aligned_dims(tmp_path):
+    with pytest.raises(ValueError):
+        FAISS(collection_name="bad", path=str(tmp_path / "faiss"), embedding_model_dims=30, precision="binary")
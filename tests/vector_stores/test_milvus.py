@@ -131,6 +131,23 @@ class TestMilvusDB:
         assert results[0].id == "mem1"
         assert results[0].score == 0.8
 
+    def test_search_batch(self, milvus_db, mock_milvus_client):
+        """All query vectors go to Milvus in one search call and results keep query order."""
+        mock_milvus_client.search.return_value = [
+            [{"id": "mem1", "distance": 0.8, "entity": {"metadata": {"user_id": "alice"}}}],
+            [{"id": "mem2", "distance": 0.6, "entity": {"metadata": {"user_id": "alice"}}}],
+        ]
+
+        results = milvus_db.search_batch(
+            queries=["q1", "q2"], vectors_matrix=[[0.1] * 1536, [0.2] * 1536], limit=5, filters={"user_id": "alice"}
+        )
+
+        mock_milvus_client.search.assert_called_once()
+        call_args = mock_milvus_client.search.call_args[1]
+        assert len(call_args["data"]) == 2
+        assert call_args["filter"] == '(metadata["user_id"] == "alice")'
+        assert [[r.id for r in group] for group in results] == [["mem1"], ["mem2"]]
+
     def test_search_different_user_ids(self, milvus_db, mock_milvus_client):
         """Test that search works with different user_ids (reproduces reported bug)."""
         # This test validates the fix for: "Error with different user_ids"
@@ -2,7 +2,7 @@ import importlib
 import sys
 import unittest
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from mem0.vector_stores.pgvector import PGVector
 
@@ -449,6 +449,78 @@ class TestPGVector(unittest.TestCase):
         self.assertEqual(results[1].id, self.test_ids[1])
         self.assertEqual(results[1].score, 0.2)
 
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_get_many_single_query(self, mock_get_cursor, mock_connection_pool):
+        """get_many fetches every id with one ANY() query and keeps the requested order."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=False,
+        )
+        self.mock_cursor.execute.reset_mock()
+        self.mock_cursor.fetchall.return_value = [
+            (self.test_ids[1], {"key": "value2"}),
+            (self.test_ids[0], {"key": "value1"}),
+        ]
+
+        results = pgvector.get_many([self.test_ids[0], "00000000-0000-0000-0000-000000000000", self.test_ids[1]])
+
+        self.mock_cursor.execute.assert_called_once()
+        sql, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("WHERE id = ANY(%s::uuid[])", sql)
+        self.assertEqual(len(params[0]), 3)
+        self.assertEqual([r.id for r in results], [self.test_ids[0], self.test_ids[1]])
+        self.assertEqual(results[1].payload, {"key": "value2"})
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_search_batch_lateral_join(self, mock_get_cursor, mock_connection_pool):
+        """search_batch runs every query in one LATERAL statement and regroups rows by query position."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=False,
+        )
+        self.mock_cursor.execute.reset_mock()
+        self.mock_cursor.fetchall.return_value = [
+            (1, self.test_ids[0], 0.1, {"key": "value1"}),
+            (3, self.test_ids[1], 0.2, {"key": "value2"}),
+            (3, self.test_ids[0], 0.3, {"key": "value1"}),
+        ]
+
+        results = pgvector.search_batch(
+            ["q1", "q2", "q3"], [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]], limit=2, filters={"user_id": "alice"}
+        )
+
+        self.mock_cursor.execute.assert_called_once()
+        sql, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("CROSS JOIN LATERAL", sql)
+        self.assertIn("WITH ORDINALITY", sql)
+        self.assertEqual(params[0], ["[0.1,0.2,0.3]", "[0.4,0.5,0.6]", "[0.7,0.8,0.9]"])
+        self.assertEqual(params[1:], ("user_id", "alice", 2))
+        self.assertEqual([[r.id for r in group] for group in results], [[self.test_ids[0]], [], [self.test_ids[1], self.test_ids[0]]])
+
     @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 2)
     @patch('mem0.vector_stores.pgvector.ConnectionPool')
     @patch.object(PGVector, '_get_cursor')
@@ -2228,3 +2300,121 @@ class TestPGVector(unittest.TestCase):
     def tearDown(self):
         """Clean up after each test."""
         pass
+
+
+class TestPGVectorAsync(unittest.IsolatedAsyncioTestCase):
+    def _pgvector(self, **kwargs):
+        with patch.object(PGVector, "list_cols", return_value=["test_collection"]):
+            return PGVector(
+                dbname="test_db",
+                collection_name="test_collection",
+                embedding_model_dims=3,
+                user="test_user",
+                password="test_pass",
+                host="localhost",
+                port=5432,
+                diskann=False,
+                hnsw=False,
+                **kwargs,
+            )
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    async def test_async_search_uses_async_pool(self, mock_connection_pool):
+        row_id = str(uuid.uuid4())
+        cursor = AsyncMock()
+        cursor.fetchall.return_value = [(row_id, 0.1, {"user_id": "alice"})]
+        conn = MagicMock()
+        conn.cursor.return_value.__aenter__.return_value = cursor
+        async_pool = MagicMock()
+        async_pool.open = AsyncMock()
+        async_pool.connection.return_value.__aenter__.return_value = conn
+
+        pgvector = self._pgvector()
+        with patch('mem0.vector_stores.pgvector.AsyncConnectionPool', return_value=async_pool) as pool_cls:
+            results = await pgvector.async_search("q", [0.1, 0.2, 0.3], limit=2, filters={"user_id": "alice"})
+            await pgvector.async_search("q", [0.1, 0.2, 0.3], limit=2)
+
+        pool_cls.assert_called_once()
+        async_pool.open.assert_awaited_once()
+        sql, params = cursor.execute.call_args_list[0][0]
+        self.assertIn("payload->>%s = %s", sql)
+        self.assertEqual(params, ([0.1, 0.2, 0.3], "user_id", "alice", 2))
+        self.assertEqual(results[0].id, row_id)
+        self.assertEqual(results[0].score, 0.1)
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    async def test_async_falls_back_with_injected_pool(self):
+        pgvector = self._pgvector(connection_pool=MagicMock())
+
+        with patch('mem0.vector_stores.pgvector.AsyncConnectionPool') as pool_cls, \
+                patch.object(pgvector, "get", return_value="row") as mock_get:
+            result = await pgvector.async_get("1")
+
+        pool_cls.assert_not_called()
+        mock_get.assert_called_once_with(vector_id="1")
+        self.assertEqual(result, "row")
+
+
+class TestPGVectorPrecision(unittest.TestCase):
+    def _pgvector(self, cursor, **kwargs):
+        with patch('mem0.vector_stores.pgvector.ConnectionPool'), \
+                patch.object(PGVector, "list_cols", return_value=[]), \
+                patch.object(PGVector, "_get_cursor") as mock_get_cursor:
+            mock_get_cursor.return_value.__enter__.return_value = cursor
+            pgvector = PGVector(
+                dbname="test_db",
+                collection_name="test_collection",
+                embedding_model_dims=8,
+                user="test_user",
+                password="test_pass",
+                host="localhost",
+                port=5432,
+                diskann=False,
+                hnsw=True,
+                **kwargs,
+            )
+        pgvector._get_cursor = MagicMock()
+        pgvector._get_cursor.return_value.__enter__.return_value = cursor
+        return pgvector
+
+    def test_float16_uses_halfvec_column_and_index(self):
+        cursor = MagicMock()
+        pgvector = self._pgvector(cursor, precision="float16")
+        ddl = " ".join(str(c) for c in cursor.execute.call_args_list)
+        self.assertIn("vector halfvec(8)", ddl)
+        self.assertIn("halfvec_cosine_ops", ddl)
+
+        cursor.execute.reset_mock()
+        cursor.fetchall.return_value = []
+        pgvector.search("q", [0.1] * 8, limit=2)
+        self.assertIn("::halfvec", cursor.execute.call_args[0][0])
+
+    def test_binary_indexes_quantized_expression_and_rescores(self):
+        cursor = MagicMock()
+        pgvector = self._pgvector(cursor, precision="binary", rescore_multiplier=5)
+        ddl = " ".join(str(c) for c in cursor.execute.call_args_list)
+        self.assertIn("vector vector(8)", ddl)
+        self.assertIn("(binary_quantize(vector)::bit(8)) bit_hamming_ops", ddl)
+
+        cursor.execute.reset_mock()
+        row_id = str(uuid.uuid4())
+        cursor.fetchall.return_value = [(1, row_id, 0.2, {"user_id": "alice"})]
+        results = pgvector.search("q", [0.1] * 8, limit=2, filters={"user_id": "alice"})
+
+        sql, params = cursor.execute.call_args[0]
+        self.assertIn("<~> binary_quantize(q.vec::vector)", sql)
+        self.assertIn("vector <=> q.vec::vector AS distance", sql)
+        self.assertEqual(params[1:], ("user_id", "alice", 10, 2))
+        self.assertEqual(results[0].id, row_id)
+
+    def test_binary_without_rescore_orders_by_hamming_distance(self):
+        cursor = MagicMock()
+        pgvector = self._pgvector(cursor, precision="binary", rescore=False)
+        sql, params = pgvector._build_search_batch_query([[0.1] * 8], 3, None)
+        self.assertNotIn("candidates", sql)
+        self.assertEqual(params[1:], (3,))
+
+    def test_int8_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self._pgvector(MagicMock(), precision="int8")
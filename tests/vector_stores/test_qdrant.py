@@ -1,13 +1,17 @@
 import unittest
 import uuid
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    BinaryQuantization,
+    Datatype,
     Distance,
     Filter,
     PointIdsList,
     PointStruct,
+    ScalarQuantization,
+    ScalarType,
     VectorParams,
 )
 
@@ -36,6 +40,77 @@ class TestQdrant(unittest.TestCase):
             collection_name="test_collection", vectors_config=expected_config
         )
 
+    def test_create_col_with_reduced_precision(self):
+        self.client_mock.get_collections.return_value = MagicMock(collections=[])
+
+        self.qdrant.precision = "float16"
+        self.qdrant.create_col(vector_size=128, on_disk=True)
+        kwargs = self.client_mock.create_collection.call_args.kwargs
+        self.assertEqual(kwargs["vectors_config"].datatype, Datatype.FLOAT16)
+        self.assertNotIn("quantization_config", kwargs)
+
+        self.qdrant.precision = "int8"
+        self.qdrant.create_col(vector_size=128, on_disk=True)
+        quantization = self.client_mock.create_collection.call_args.kwargs["quantization_config"]
+        self.assertIsInstance(quantization, ScalarQuantization)
+        self.assertEqual(quantization.scalar.type, ScalarType.INT8)
+
+        self.qdrant.precision = "binary"
+        self.qdrant.create_col(vector_size=128, on_disk=True)
+        quantization = self.client_mock.create_collection.call_args.kwargs["quantization_config"]
+        self.assertIsInstance(quantization, BinaryQuantization)
+
+    def _existing_collection(self, quantization_config=None):
+        self.client_mock.reset_mock()
+        self.client_mock.get_collections.return_value = MagicMock(collections=[MagicMock()])
+        self.client_mock.get_collections.return_value.collections[0].name = "test_collection"
+        self.client_mock.get_collection.return_value = MagicMock(
+            config=MagicMock(
+                params=MagicMock(vectors=VectorParams(size=128, distance=Distance.COSINE)),
+                quantization_config=quantization_config,
+            )
+        )
+
+    def test_existing_collection_gets_requested_quantization(self):
+        self._existing_collection()
+        self.qdrant.precision = "int8"
+
+        self.qdrant.create_col(vector_size=128, on_disk=True)
+
+        self.client_mock.create_collection.assert_not_called()
+        quantization = self.client_mock.update_collection.call_args.kwargs["quantization_config"]
+        self.assertIsInstance(quantization, ScalarQuantization)
+
+        self._existing_collection(quantization_config=quantization)
+        self.qdrant.create_col(vector_size=128, on_disk=True)
+        self.client_mock.update_collection.assert_not_called()
+
+    def test_existing_collection_without_quantization_skips_rescore(self):
+        self._existing_collection()
+        self.client_mock.update_collection.side_effect = RuntimeError("forbidden")
+        self.qdrant.precision = "binary"
+
+        with self.assertLogs("mem0.vector_stores.qdrant", level="WARNING"):
+            self.qdrant.create_col(vector_size=128, on_disk=True)
+
+        self.assertEqual(self.qdrant.precision, "float32")
+        self.assertIsNone(self.qdrant._search_params())
+
+    def test_quantized_search_rescores_with_oversampling(self):
+        self.qdrant.precision = "int8"
+        self.qdrant.rescore_multiplier = 3
+        self.client_mock.query_points.return_value = MagicMock(points=[])
+        self.client_mock.query_batch_points.return_value = [MagicMock(points=[])]
+
+        self.qdrant.search(query="", vectors=[0.1, 0.2], limit=2)
+        self.qdrant.search_batch(["q"], [[0.1, 0.2]], limit=2)
+
+        search_params = self.client_mock.query_points.call_args.kwargs["search_params"]
+        self.assertTrue(search_params.quantization.rescore)
+        self.assertEqual(search_params.quantization.oversampling, 3.0)
+        request = self.client_mock.query_batch_points.call_args.kwargs["requests"][0]
+        self.assertEqual(request.params, search_params)
+
     def test_insert(self):
         vectors = [[0.1, 0.2], [0.3, 0.4]]
         payloads = [{"key": "value1"}, {"key": "value2"}]
@@ -70,6 +145,32 @@ class TestQdrant(unittest.TestCase):
         self.assertEqual(results[0].payload, {"key": "value"})
         self.assertEqual(results[0].score, 0.95)
 
+    def test_search_batch(self):
+        first, second = MagicMock(id="a"), MagicMock(id="b")
+        self.client_mock.query_batch_points.return_value = [MagicMock(points=[first]), MagicMock(points=[second])]
+
+        results = self.qdrant.search_batch(
+            queries=["q1", "q2"], vectors_matrix=[[0.1, 0.2], [0.3, 0.4]], limit=3, filters={"user_id": "alice"}
+        )
+
+        self.client_mock.query_batch_points.assert_called_once()
+        requests = self.client_mock.query_batch_points.call_args[1]["requests"]
+        self.assertEqual([r.query for r in requests], [[0.1, 0.2], [0.3, 0.4]])
+        self.assertTrue(all(r.limit == 3 and r.with_payload for r in requests))
+        self.assertEqual(requests[0].filter.must[0].key, "user_id")
+        self.assertEqual(results, [[first], [second]])
+
+    def test_get_many_restores_request_order(self):
+        first, second = MagicMock(id="a"), MagicMock(id="b")
+        self.client_mock.retrieve.return_value = [second, first]
+
+        results = self.qdrant.get_many(["a", "missing", "b"])
+
+        self.client_mock.retrieve.assert_called_once_with(
+            collection_name="test_collection", ids=["a", "missing", "b"], with_payload=True
+        )
+        self.assertEqual(results, [first, second])
+
     def test_search_with_filters(self):
         """Test search with agent_id and run_id filters."""
         vectors = [[0.1, 0.2]]
@@ -298,3 +399,39 @@ class TestQdrant(unittest.TestCase):
 
     def tearDown(self):
         del self.qdrant
+
+
+class TestQdrantAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client_mock = MagicMock(spec=QdrantClient)
+        self.client_mock.get_collections.return_value = MagicMock(collections=[])
+
+    def _remote_qdrant(self):
+        with patch("mem0.vector_stores.qdrant.QdrantClient", return_value=self.client_mock):
+            return Qdrant(collection_name="test_collection", embedding_model_dims=128, url="http://localhost:6333")
+
+    async def test_async_search_uses_async_client(self):
+        qdrant = self._remote_qdrant()
+        async_client = AsyncMock()
+        async_client.query_points.return_value = MagicMock(points=["hit"])
+
+        with patch("mem0.vector_stores.qdrant.AsyncQdrantClient", return_value=async_client) as client_cls:
+            results = await qdrant.async_search(query="", vectors=[0.1, 0.2], limit=3, filters={"user_id": "alice"})
+            await qdrant.async_delete(vector_id="1")
+
+        client_cls.assert_called_once_with(url="http://localhost:6333")
+        self.assertEqual(results, ["hit"])
+        self.assertIsInstance(async_client.query_points.call_args[1]["query_filter"], Filter)
+        async_client.delete.assert_awaited_once()
+        self.client_mock.query_points.assert_not_called()
+
+    async def test_async_falls_back_to_sync_client_when_injected(self):
+        qdrant = Qdrant(collection_name="test_collection", embedding_model_dims=128, client=self.client_mock)
+        self.client_mock.retrieve.return_value = ["point"]
+
+        with patch("mem0.vector_stores.qdrant.AsyncQdrantClient") as client_cls:
+            result = await qdrant.async_get(vector_id="1")
+
+        client_cls.assert_not_called()
+        self.assertEqual(result, "point")
+        self.client_mock.retrieve.assert_called_once_with(collection_name="test_collection", ids=["1"], with_payload=True)
@@ -0,0 +1,106 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytz
+
+import mem0.vector_stores.redis as redis_module
+from mem0.vector_stores.redis import RedisDB
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_clients():
+    redis_module._shared_clients.clear()
+    yield
+    redis_module._shared_clients.clear()
+
+
+@pytest.fixture
+def mock_redis_client():
+    with patch("redis.Redis.from_url") as mock_from_url:
+        client = MagicMock()
+        client.pipeline.return_value = client
+        mock_from_url.return_value = client
+        yield mock_from_url
+
+
+@pytest.fixture
+def redis_db(mock_redis_client):
+    with patch("mem0.vector_stores.redis.SearchIndex") as mock_index_cls:
+        mock_index_cls.from_dict.return_value = MagicMock()
+        yield RedisDB(redis_url="redis://localhost:6379", collection_name="test", embedding_model_dims=4)
+
+
+def _payload(data, **extra):
+    now = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+    return {"hash": f"hash_{data}", "data": data, "created_at": now, "updated_at": now, **extra}
+
+
+def test_instances_share_client_per_url(mock_redis_client):
+    with patch("mem0.vector_stores.redis.SearchIndex"):
+        first = RedisDB(redis_url="redis://localhost:6379", collection_name="a", embedding_model_dims=4)
+        second = RedisDB(redis_url="redis://localhost:6379", collection_name="b", embedding_model_dims=4)
+
+    assert first.client is second.client
+    mock_redis_client.assert_called_once_with("redis://localhost:6379")
+
+
+def test_insert_loads_in_pipeline_batches(redis_db):
+    redis_db.insert(
+        vectors=[[0.1] * 4, [0.2] * 4], payloads=[_payload("a"), _payload("b", user_id="u")], ids=["1", "2"]
+    )
+
+    data = redis_db.index.load.call_args.args[0]
+    assert [entry["memory_id"] for entry in data] == ["1", "2"]
+    assert data[1]["user_id"] == "u"
+    assert redis_db.index.load.call_args.kwargs["batch_size"] == redis_module.PIPELINE_BATCH_SIZE
+
+
+def test_update_many(redis_db):
+    redis_db.update_many(["1", "2"], [[0.1] * 4, [0.2] * 4], [_payload("a"), _payload("b")])
+
+    kwargs = redis_db.index.load.call_args.kwargs
+    assert kwargs["keys"] == ["mem0:test:1", "mem0:test:2"]
+    assert [entry["memory"] for entry in kwargs["data"]] == ["a", "b"]
+    assert all("updated_at" in entry for entry in kwargs["data"])
+
+
+def test_delete_many(redis_db):
+    redis_db.delete_many(["1", "2"])
+    redis_db.index.drop_keys.assert_called_once_with(["mem0:test:1", "mem0:test:2"])
+
+    redis_db.index.drop_keys.reset_mock()
+    redis_db.delete_many([])
+    redis_db.index.drop_keys.assert_not_called()
+
+
+def test_get_many_pipelines_and_skips_missing(redis_db):
+    created_at = str(int(datetime.now().timestamp()))
+    redis_db.client.execute.return_value = [
+        {
+            b"memory_id": b"2",
+            b"hash": b"h",
+            b"memory": b"second",
+            b"created_at": created_at.encode(),
+            b"metadata": b"{}",
+        },
+        {},
+        {
+            b"memory_id": b"1",
+            b"hash": b"h",
+            b"memory": b"first",
+            b"created_at": created_at.encode(),
+            b"metadata": b"{}",
+        },
+    ]
+
+    results = redis_db.get_many(["2", "missing", "1"])
+
+    redis_db.client.pipeline.assert_called_once_with(transaction=False)
+    assert [c.args[0] for c in redis_db.client.hgetall.call_args_list] == [
+        "mem0:test:2",
+        "mem0:test:missing",
+        "mem0:test:1",
+    ]
+    assert [r.id for r in results] == ["2", "1"]
+    assert [r.payload["data"] for r in results] == ["second", "first"]
@@ -7,9 +7,18 @@ import pytest
 import pytz
 from valkey.exceptions import ResponseError
 
+import mem0.vector_stores.valkey as valkey_module
 from mem0.vector_stores.valkey import ValkeyDB
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_clients():
+    """Each test builds its own mock client, so don't let one leak through the shared client cache."""
+    valkey_module._shared_clients.clear()
+    yield
+    valkey_module._shared_clients.clear()
+
+
 @pytest.fixture
 def mock_valkey_client():
     """Create a mock Valkey client."""
@@ -21,6 +30,8 @@ def mock_valkey_client():
         mock_client.return_value.hset = MagicMock()
         mock_client.return_value.hgetall = MagicMock()
         mock_client.return_value.delete = MagicMock()
+        # Pipelined commands are recorded on the client mock itself
+        mock_client.return_value.pipeline = MagicMock(return_value=mock_client.return_value)
         yield mock_client.return_value
 
 
@@ -204,6 +215,78 @@ def test_update_handles_missing_created_at(valkey_db, mock_valkey_client):
     assert "created_at" in kwargs["mapping"]  # Should be added automatically
 
 
+def test_insert_batches_through_non_transactional_pipeline(valkey_db, mock_valkey_client, monkeypatch):
+    """Bulk inserts are queued on MULTI-less pipelines and flushed once per batch."""
+    monkeypatch.setattr(valkey_module, "PIPELINE_BATCH_SIZE", 2)
+    ids = [f"id{i}" for i in range(5)]
+    vectors = [[0.1] * 1536 for _ in ids]
+    payloads = [{"hash": f"h{i}", "data": f"d{i}"} for i in range(5)]
+
+    valkey_db.insert(vectors=vectors, payloads=payloads, ids=ids)
+
+    mock_valkey_client.pipeline.assert_called_with(transaction=False)
+    assert mock_valkey_client.pipeline.call_count == 3
+    assert mock_valkey_client.execute.call_count == 3
+    assert [c.args[0] for c in mock_valkey_client.hset.call_args_list] == [f"mem0:test_collection:{i}" for i in ids]
+
+
+def test_update_many(valkey_db, mock_valkey_client):
+    """Several updates share one pipeline round trip."""
+    now = datetime.now(pytz.timezone("UTC")).isoformat()
+    payloads = [{"hash": "h", "data": "a", "updated_at": now}, {"hash": "h", "data": "b", "updated_at": now}]
+
+    valkey_db.update_many(["a", "b"], [[0.1] * 1536, [0.2] * 1536], payloads)
+
+    assert mock_valkey_client.execute.call_count == 1
+    mappings = [c.kwargs["mapping"] for c in mock_valkey_client.hset.call_args_list]
+    assert [m["memory"] for m in mappings] == ["a", "b"]
+    assert all("updated_at" in m for m in mappings)
+
+
+def test_delete_many(valkey_db, mock_valkey_client, monkeypatch):
+    """Deletes are issued as multi-key DELs in one pipeline."""
+    monkeypatch.setattr(valkey_module, "PIPELINE_BATCH_SIZE", 2)
+
+    valkey_db.delete_many(["a", "b", "c"])
+
+    assert [c.args for c in mock_valkey_client.delete.call_args_list] == [
+        ("mem0:test_collection:a", "mem0:test_collection:b"),
+        ("mem0:test_collection:c",),
+    ]
+    mock_valkey_client.execute.assert_called_once()
+
+
+def test_get_many_keeps_order_and_skips_missing(valkey_db, mock_valkey_client):
+    """get_many pipelines HGETALLs and drops IDs that do not exist."""
+    created_at = str(int(datetime.now().timestamp()))
+    mock_valkey_client.execute.return_value = [
+        {b"memory_id": b"b", b"hash": b"h", b"memory": b"second", b"created_at": created_at.encode()},
+        {},
+        {b"memory_id": b"a", b"hash": b"h", b"memory": b"first", b"created_at": created_at.encode()},
+    ]
+
+    results = valkey_db.get_many(["b", "missing", "a"])
+
+    assert [c.args[0] for c in mock_valkey_client.hgetall.call_args_list] == [
+        "mem0:test_collection:b",
+        "mem0:test_collection:missing",
+        "mem0:test_collection:a",
+    ]
+    assert [r.id for r in results] == ["b", "a"]
+    assert [r.payload["data"] for r in results] == ["second", "first"]
+
+
+def test_instances_share_client_per_url():
+    """Stores pointing at the same URL reuse one client and connection pool."""
+    with patch("valkey.from_url") as mock_from_url:
+        mock_from_url.return_value.ft.return_value.info.return_value = {}
+        first = ValkeyDB(valkey_url="valkey://localhost:6379", collection_name="a", embedding_model_dims=4)
+        second = ValkeyDB(valkey_url="valkey://localhost:6379", collection_name="b", embedding_model_dims=4)
+
+    assert first.client is second.client
+    mock_from_url.assert_called_once_with("valkey://localhost:6379")
+
+
 def test_get(valkey_db, mock_valkey_client):
     """Test getting a vector."""
     # Mock hgetall to return a vector